@@ -0,0 +1,6 @@
+"""
+The fotoobo benchmarks
+
+Here we collect scripts to measure the performance of the hot paths in fotoobo. They are not part of
+the test suite. Run them from the project root with e.g. ``python -m benchmarks.parser``.
+"""
@@ -0,0 +1,71 @@
+"""
+Benchmark parsing FortiGate configurations with big multiline values
+
+Compares parsing configurations with many certificates (and a long script) with the values as
+strings to parsing them with the values as lazy references into the configuration file.
+"""
+
+import logging
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+
+CONFIGS = {
+    "100 certificates": (100, 0),
+    "500 certificates": (500, 0),
+    "1 script with 20k lines": (0, 20000),
+    "1 script with 80k lines": (0, 80000),
+}
+
+
+def write_blob_config(file: Path, certificates: int, script_lines: int) -> Path:
+    """Write a configuration with certificates and a long script"""
+    write_config(file, 0, 100, 100, certificates)
+    if script_lines:
+        with file.open("a", encoding="UTF-8") as config_file:
+            config_file.write('config system auto-script\n    edit "script"\n')
+            config_file.write('        set script "' + "\n".join(["show"] * script_lines) + '"\n')
+            config_file.write("    next\nend\n")
+
+    return file
+
+
+def memory(file: Path, blobs: bool) -> float:
+    """Measure the memory of the parsed configuration in MB"""
+    tracemalloc.start()
+    config = FortiGateConfig.parse_configuration_file(file, blobs=blobs)
+    size = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    del config
+    return size
+
+
+def benchmark(name: str, file: Path) -> None:
+    """Run the benchmark on a file and print the results"""
+    strings = measure(lambda: FortiGateConfig.parse_configuration_file(file))
+    blobs = measure(lambda: FortiGateConfig.parse_configuration_file(file, blobs=True))
+    print_row(
+        name,
+        f"{strings:.3f}",
+        f"{blobs:.3f}",
+        f"{memory(file, False):.1f}",
+        f"{memory(file, True):.1f}",
+    )
+
+
+def main() -> None:
+    """Run the multiline value benchmark"""
+    logging.getLogger("fotoobo").setLevel(logging.INFO)
+    with tempfile.TemporaryDirectory() as directory:
+        print_row("configuration", "strings [s]", "blobs [s]", "strings [MB]", "blobs [MB]")
+        for name, (certificates, script_lines) in CONFIGS.items():
+            file = write_blob_config(Path(directory) / "fortigate.conf", certificates, script_lines)
+            benchmark(name, file)
+
+
+if __name__ == "__main__":
+    main()
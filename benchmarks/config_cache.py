@@ -0,0 +1,53 @@
+"""
+Benchmark the FortiGate configuration cache
+
+Compares parsing a configuration to loading it from the FortiGate configuration cache.
+"""
+
+import tempfile
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_cache import FortiGateConfigCache
+
+CONFIGS = {
+    "single vdom, 1k policies": (0, 1000, 1000),
+    "single vdom, 20k policies": (0, 20000, 20000),
+    "10 vdoms, 5k policies each": (10, 5000, 5000),
+}
+
+
+def benchmark(name: str, file: Path, cache: FortiGateConfigCache) -> None:
+    """
+    Compare parsing a configuration file to loading it from the cache.
+
+    Args:
+        name:  The name of the benchmark
+        file:  The configuration file
+        cache: The configuration cache
+    """
+
+    def cache_miss() -> None:
+        cache.clear()
+        cache.parse_configuration_file(file)
+
+    parse = measure(lambda: FortiGateConfig.parse_configuration_file(file))
+    miss = measure(cache_miss)
+    hit = measure(lambda: cache.parse_configuration_file(file))
+    print_row(name, f"{parse:.3f}", f"{miss:.3f}", f"{hit:.3f}", f"{parse / hit:.2f}x")
+
+
+def main() -> None:
+    """Run the cache benchmark"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = FortiGateConfigCache(Path(directory) / "cache")
+        print_row("configuration", "parse [s]", "cache miss [s]", "cache hit [s]", "speedup")
+        for name, (vdoms, policies, addresses) in CONFIGS.items():
+            file = write_config(Path(directory) / "fortigate.conf", vdoms, policies, addresses)
+            benchmark(name, file, cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark the FortiGate configuration check
+
+Runs "fgt config check" over a directory of generated configurations with a growing number of
+worker processes.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.helpers.files import save_yaml_file
+from fotoobo.tools.fgt.config import check
+
+FILES = 32
+CHECKS = [
+    {
+        "type": "value",
+        "scope": "global",
+        "path": "/system/global",
+        "checks": {"admin-sport": 443, "timezone": "Europe/Zurich"},
+    },
+    {"type": "count", "scope": "vdom", "path": "/firewall/policy", "checks": {"lt": 100000}},
+    {"type": "exist", "scope": "vdom", "path": "/system/settings", "checks": {"comments": True}},
+]
+
+
+def main() -> None:
+    """Run the config check benchmark"""
+    with tempfile.TemporaryDirectory() as directory:
+        bundle = Path(directory) / "checks.yaml"
+        save_yaml_file(bundle, CHECKS)
+        configs = Path(directory) / "configs"
+        configs.mkdir()
+        for number in range(FILES):
+            write_config(configs / f"fortigate_{number}.conf", policies=2000, addresses=2000)
+
+        workers = 1
+        sequential = measure(lambda: check(configs, bundle), repeat=1)
+        print_row(f"check {FILES} files", "workers", "time [s]", "speedup")
+        print_row("", 1, f"{sequential:.3f}", "1.00x")
+        while workers < (os.cpu_count() or 1):
+            workers = min(workers * 2, os.cpu_count() or 1)
+            parallel = measure(lambda: check(configs, bundle, workers), repeat=1)
+            print_row("", workers, f"{parallel:.3f}", f"{sequential / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark the structural diff of FortiGate configurations
+
+Compares two parsed configurations with growing policy tables where a few policies are inserted,
+removed and changed. The time to compare two equal configurations is shown as well.
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+
+POLICIES = (10000, 50000, 100000)
+
+
+def benchmark(file: Path, policies: int) -> None:
+    """Run the benchmark on a file and print the results"""
+    old = FortiGateConfig.parse_configuration_file(file)
+    new = FortiGateConfig.parse_configuration_file(file)
+    equal = measure(lambda: old.diff(new))
+
+    policy_table = new.vdom_config["root"]["firewall"]["policy"]
+    policy_table.insert(policies // 2, {"id": policies + 1, "name": "inserted"})
+    del policy_table[policies // 4]
+    policy_table[-1]["name"] = "changed"
+    changed = measure(lambda: old.diff(new))
+    print_row(str(policies), f"{equal:.3f}", f"{changed:.3f}", str(len(old.diff(new).lines())))
+
+
+def main() -> None:
+    """Run the diff benchmark"""
+    logging.getLogger("fotoobo").setLevel(logging.INFO)
+    with tempfile.TemporaryDirectory() as directory:
+        print_row("policies", "equal [s]", "changed [s]", "differences")
+        for policies in POLICIES:
+            file = write_config(Path(directory) / "fortigate.conf", 0, policies, 1000)
+            benchmark(file, policies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark the export of the FortiGate configuration check findings
+
+Compares rendering the failures of a fleet check as styled messages (FleetCheckResult.to_result())
+to saving them as structured findings to a csv and a json lines file. The configurations are
+parsed and checked before the measurement.
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_finding import save_findings
+from fotoobo.fortinet.fortigate_config_fleet_check import FortiGateConfigFleetCheck
+
+HOSTS = (100, 1000)
+# checks which fail for every host and VDOM
+CHECKS = [
+    {
+        "name": "global settings",
+        "type": "value",
+        "scope": "global",
+        "path": "/system/global",
+        "checks": {"admin-sport": 8443, "timezone": "UTC", "hostname": "other", "missing": 1},
+    },
+    {
+        "name": "settings",
+        "type": "exist",
+        "scope": "vdom",
+        "path": "/system/settings",
+        "checks": {"missing_1": True, "missing_2": True, "missing_3": True},
+    },
+    {"type": "count", "scope": "vdom", "path": "/firewall/policy", "checks": {"eq": 0}},
+]
+
+
+def benchmark(file: Path, hosts: int, directory: Path) -> None:
+    """Check a fleet of configurations and measure the rendering and saving of the failures"""
+    fleet_check = FortiGateConfigFleetCheck(CHECKS)
+    config = FortiGateConfig.parse_configuration_file(file)
+    values = FortiGateConfigFleetCheck.extract(fleet_check.bundle, config)
+    for number in range(hosts):
+        fleet_check.add_values(f"fortigate_{number}", values)
+
+    fleet_result = fleet_check.evaluate()
+    findings = sum(1 for _ in fleet_result.findings())
+    messages = measure(fleet_result.to_result)
+    to_csv = measure(lambda: save_findings(directory / "findings.csv", fleet_result.findings()))
+    to_json = measure(lambda: save_findings(directory / "findings.jsonl", fleet_result.findings()))
+    print_row(f"{hosts} hosts", findings, f"{messages:.3f}", f"{to_csv:.3f}", f"{to_json:.3f}")
+
+
+def main() -> None:
+    """Run the findings benchmark"""
+    # the messages would be logged for every host
+    logging.getLogger("fotoobo").setLevel(logging.ERROR)
+    with tempfile.TemporaryDirectory() as directory:
+        file = write_config(Path(directory) / "fortigate.conf", 4, 200, 200)
+        print_row("fleet", "findings", "messages [s]", "csv [s]", "jsonl [s]")
+        for hosts in HOSTS:
+            benchmark(file, hosts, Path(directory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark the FortiGate configuration fleet check
+
+Compares checking many configurations one after another with FortiGateConfigCheck to extracting
+the values of all the configurations first and evaluating every check over all of them at once with
+FortiGateConfigFleetCheck. The configurations are parsed before the measurement.
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_check import CheckBundle, FortiGateConfigCheck
+from fotoobo.fortinet.fortigate_config_fleet_check import FortiGateConfigFleetCheck
+from fotoobo.helpers.result import Result
+
+HOSTS = (100, 1000)
+CHECKS = [
+    {
+        "type": "value",
+        "scope": "global",
+        "path": "/system/global",
+        "checks": {"admin-sport": 443, "timezone": "Europe/Zurich"},
+    },
+    {"type": "count", "scope": "vdom", "path": "/firewall/policy", "checks": {"lt": 100000}},
+    {"type": "exist", "scope": "vdom", "path": "/system/settings", "checks": {"comments": True}},
+    {
+        "type": "value",
+        "scope": "vdom",
+        "path": "/firewall/address/address_1",
+        "checks": {"subnet": "10.0.0.1 255.255.255.255"},
+    },
+    {
+        "type": "value_in_list",
+        "scope": "vdom",
+        "path": "/firewall/policy",
+        "checks": {"name": "policy_1"},
+    },
+]
+
+
+def check_one_by_one(configs: list[FortiGateConfig], bundle: CheckBundle) -> Result[Any]:
+    """Check every configuration with its own FortiGateConfigCheck"""
+    result = Result[Any]()
+    for config in configs:
+        FortiGateConfigCheck(config, bundle, result).execute_checks()
+
+    return result
+
+
+def check_fleet(configs: list[FortiGateConfig], bundle: CheckBundle) -> Result[Any]:
+    """Check all the configurations with a FortiGateConfigFleetCheck"""
+    fleet_check = FortiGateConfigFleetCheck(bundle)
+    for config in configs:
+        fleet_check.add_configuration(config)
+
+    return fleet_check.evaluate().to_result()
+
+
+def main() -> None:
+    """Run the fleet check benchmark"""
+    # the messages would be logged for every host
+    logging.getLogger("fotoobo").setLevel(logging.ERROR)
+    bundle = CheckBundle.compile(CHECKS)
+    with tempfile.TemporaryDirectory() as directory:
+        file = write_config(Path(directory) / "fortigate.conf", 2, 200, 200)
+        print_row("hosts", "one by one [s]", "fleet [s]", "speedup")
+        for hosts in HOSTS:
+            configs = []
+            for number in range(hosts):
+                config = FortiGateConfig.parse_configuration_file(file)
+                config.info.hostname = f"fortigate_{number}"
+                configs.append(config)
+
+            expected = check_one_by_one(configs, bundle).messages
+            assert check_fleet(configs, bundle).messages == expected, "The messages differ"
+            # pylint: disable=cell-var-from-loop
+            one_by_one = measure(lambda: check_one_by_one(configs, bundle))
+            fleet = measure(lambda: check_fleet(configs, bundle))
+            # pylint: enable=cell-var-from-loop
+            print_row(str(hosts), f"{one_by_one:.3f}", f"{fleet:.3f}", f"{one_by_one / fleet:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
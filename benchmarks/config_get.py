@@ -0,0 +1,81 @@
+"""
+Benchmark the FortiGate configuration get
+
+Compares getting a small part of a configuration from a fully parsed configuration to parsing only
+the requested part of the configuration.
+"""
+
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+
+SECTIONS = [
+    ("global", "/system/global"),
+    ("vdom", "/vdom_0/system/settings"),
+    ("vdom", "/vdom_9/firewall/policy"),
+]
+
+
+def peak_memory(func: Callable[[], Any]) -> float:
+    """
+    Measure the peak memory allocated by a function.
+
+    Args:
+        func: The function to measure (without arguments)
+
+    Returns:
+        The peak memory in MB
+    """
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def benchmark(file: Path, scope: str, path: str) -> None:
+    """
+    Compare the full and the selective parser for a part of the configuration.
+
+    Args:
+        file:  The configuration file
+        scope: The configuration scope
+        path:  The configuration path
+    """
+
+    def full() -> Any:
+        return FortiGateConfig.parse_configuration_file(file).get_configuration(scope, path)
+
+    def selective() -> Any:
+        return FortiGateConfig.parse_configuration_file(file, scope, path).get_configuration(
+            scope, path
+        )
+
+    assert full() == selective()
+    full_time, selective_time = measure(full), measure(selective)
+    print_row(
+        f"{scope} {path}",
+        f"{full_time:.3f}",
+        f"{selective_time:.3f}",
+        f"{peak_memory(full):.1f}",
+        f"{peak_memory(selective):.1f}",
+    )
+
+
+def main() -> None:
+    """Run the get benchmark"""
+    with tempfile.TemporaryDirectory() as directory:
+        file = write_config(Path(directory) / "fortigate.conf", 10, 5000, 5000)
+        print(f"10 vdoms with 5k policies each ({file.stat().st_size / 2**20:.1f} MB)")
+        print_row("section", "full [s]", "selective [s]", "full [MB]", "selective [MB]")
+        for scope, path in SECTIONS:
+            benchmark(file, scope, path)
+
+
+if __name__ == "__main__":
+    main()
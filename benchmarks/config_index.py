@@ -0,0 +1,59 @@
+"""
+Benchmark the path index of the FortiGate configuration
+
+Compares getting configurations by walking the nested configuration to getting them from the path
+index and shows how long it takes to build the index.
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+
+CONFIGS = {
+    "single vdom, 20k policies": (0, 20000, 20000),
+    "10 vdoms, 5k policies each": (10, 5000, 5000),
+}
+LOOKUPS = 100000
+
+
+def get_configurations(config: FortiGateConfig, paths: list[tuple[str, str]]) -> None:
+    """Get the configurations at the given paths until LOOKUPS configurations are fetched"""
+    for _ in range(LOOKUPS // len(paths)):
+        for scope, path in paths:
+            config.get_configuration(scope, path)
+
+
+def benchmark(name: str, file: Path) -> None:
+    """Run the benchmark on a file and print the results"""
+    config = FortiGateConfig.parse_configuration_file(file)
+    paths = [("global", "/system/global"), ("global", "/system/global/hostname")]
+    for vdom in config.get_vdoms() or ["root"]:
+        paths += [
+            ("vdom", f"/{vdom}/firewall/policy"),
+            ("vdom", f"/{vdom}/system/settings/comments"),
+            ("vdom", f"/{vdom}/firewall/address/address_1/subnet"),
+        ]
+
+    walk = measure(lambda: get_configurations(config, paths))
+    build = measure(config.build_index)
+    indexed = measure(lambda: get_configurations(config, paths))
+    print_row(name, f"{walk:.3f}", f"{build:.3f}", f"{indexed:.3f}")
+
+
+def main() -> None:
+    """Run the path index benchmark"""
+    # the debug messages of get_configuration() would dominate the measurements
+    logging.getLogger("fotoobo").setLevel(logging.INFO)
+    with tempfile.TemporaryDirectory() as directory:
+        print_row(f"{LOOKUPS} lookups", "walk [s]", "build [s]", "indexed [s]")
+        for name, (vdoms, policies, addresses) in CONFIGS.items():
+            file = write_config(Path(directory) / "fortigate.conf", vdoms, policies, addresses)
+            benchmark(name, file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark saving and loading FortiGate configurations as json
+
+Compares the indented json files of the json module to compact json files (with orjson if it is
+installed) with and without compression.
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.helpers.files import orjson, zstd
+
+FORMATS = {
+    "indented": ("config.json", False),
+    "compact": ("config.json", True),
+    "compact, gzip": ("config.json.gz", True),
+    "compact, zstd": ("config.json.zst", True),
+}
+ARCHIVE_CONFIGS = 100
+
+
+def benchmark(config: FortiGateConfig, name: str, file: Path, compact: bool) -> None:
+    """Save and load the configuration in one format and print the results"""
+    if file.suffix == ".zst" and zstd is None:
+        print_row(name, "zstandard is not installed")
+        return
+
+    save = measure(lambda: config.save_configuration_file(file, compact))
+    load = measure(lambda: FortiGateConfig.load_configuration_file(file))
+    size = file.stat().st_size / 2**20
+    print_row(name, f"{save:.3f}", f"{load:.3f}", f"{size:.1f}")
+
+
+def benchmark_archive(config: FortiGateConfig, directory: Path) -> None:
+    """Save many configurations to a compressed json lines archive and load them again"""
+    file = directory / "configs.jsonl.gz"
+    save = measure(
+        lambda: FortiGateConfig.save_configuration_files([config] * ARCHIVE_CONFIGS, file), 1
+    )
+    load = measure(lambda: list(FortiGateConfig.load_configuration_files(file)), 1)
+    size = file.stat().st_size / 2**20
+    print_row(f"{ARCHIVE_CONFIGS} configs, jsonl gzip", f"{save:.3f}", f"{load:.3f}", f"{size:.1f}")
+
+
+def main() -> None:
+    """Run the json benchmark"""
+    logging.getLogger("fotoobo").setLevel(logging.INFO)
+    print(f"orjson: {'installed' if orjson else 'not installed'}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = Path(temp_dir)
+        file = write_config(directory / "fortigate.conf", 2, 10000, 10000)
+        config = FortiGateConfig.parse_configuration_file(file)
+        print_row("2 vdoms, 10k policies each", "save [s]", "load [s]", "size [MB]")
+        for name, (filename, compact) in FORMATS.items():
+            benchmark(config, name, directory / filename, compact)
+
+        benchmark_archive(config, directory)
+
+
+if __name__ == "__main__":
+    main()
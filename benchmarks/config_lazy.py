@@ -0,0 +1,46 @@
+"""
+Benchmark the lazy VDOM parsing of FortiGate configurations
+
+Compares parsing a configuration with many VDOMs as a whole to parsing it lazily and accessing
+only one of its VDOMs.
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+
+CONFIGS = {
+    "10 vdoms, 2k policies each": (10, 2000, 2000),
+    "50 vdoms, 1k policies each": (50, 1000, 1000),
+}
+
+
+def parse_lazy(file: Path) -> None:
+    """Parse the configuration lazily and access its first VDOM"""
+    config = FortiGateConfig.parse_configuration_file(file, lazy=True)
+    config.get_configuration("vdom", f"/{config.get_vdoms()[0]}/firewall/policy")
+
+
+def benchmark(name: str, file: Path) -> None:
+    """Run the benchmark on a file and print the results"""
+    full = measure(lambda: FortiGateConfig.parse_configuration_file(file), repeat=1)
+    lazy = measure(lambda: parse_lazy(file), repeat=1)
+    print_row(name, f"{full:.3f}", f"{lazy:.3f}", f"{full / lazy:.1f}x")
+
+
+def main() -> None:
+    """Run the lazy parser benchmark"""
+    logging.getLogger("fotoobo").setLevel(logging.INFO)
+    with tempfile.TemporaryDirectory() as directory:
+        print_row("configuration", "full [s]", "1 vdom [s]", "speedup")
+        for name, (vdoms, policies, addresses) in CONFIGS.items():
+            file = write_config(Path(directory) / "fortigate.conf", vdoms, policies, addresses)
+            benchmark(name, file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark the memory of parsed FortiGate configurations
+
+Compares the memory used by the plain dicts of the parser to the compact representation (see
+FortiGateConfig.compact()) and the time to get configurations from both of them.
+"""
+
+import gc
+import logging
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+
+CONFIGS = {
+    "single vdom, 20k policies": (0, 20000, 20000),
+    "10 vdoms, 5k policies each": (10, 5000, 5000),
+}
+LOOKUPS = 100000
+
+
+def parse(file: Path, compact: bool) -> tuple[FortiGateConfig, float]:
+    """Parse the configuration and return it with the memory it uses in MB"""
+    gc.collect()
+    tracemalloc.start()
+    config = FortiGateConfig.parse_configuration_file(file)
+    if compact:
+        config.compact()
+
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    return config, size
+
+
+def get_configurations(config: FortiGateConfig) -> None:
+    """Get the subnet of a firewall address LOOKUPS times"""
+    vdom = (config.get_vdoms() or ["root"])[0]
+    for _ in range(LOOKUPS):
+        config.get_configuration("vdom", f"/{vdom}/firewall/address/address_1/subnet")
+
+
+def benchmark(name: str, file: Path) -> None:
+    """Run the benchmark on a file and print the results"""
+    config, dict_size = parse(file, False)
+    dict_time = measure(lambda: get_configurations(config))
+    config, compact_size = parse(file, True)
+    compact_time = measure(lambda: get_configurations(config))
+    print_row(
+        name, f"{dict_size:.1f}", f"{compact_size:.1f}", f"{dict_time:.3f}", f"{compact_time:.3f}"
+    )
+
+
+def main() -> None:
+    """Run the memory benchmark"""
+    # the debug messages of get_configuration() would dominate the measurements
+    logging.getLogger("fotoobo").setLevel(logging.INFO)
+    with tempfile.TemporaryDirectory() as directory:
+        print_row("configuration", "dict [MB]", "compact [MB]", "dict [s]", "compact [s]")
+        for name, (vdoms, policies, addresses) in CONFIGS.items():
+            file = write_config(Path(directory) / "fortigate.conf", vdoms, policies, addresses)
+            benchmark(name, file)
+
+
+if __name__ == "__main__":
+    main()
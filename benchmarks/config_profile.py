@@ -0,0 +1,44 @@
+"""
+Benchmark the parse profile of FortiGate configurations
+
+Compares parsing a configuration without and with the parse profile (see
+FortiGateConfig.parse_configuration_file(..., profile=True)) and prints the slowest sections.
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_profile import slowest_sections
+
+CONFIGS = {
+    "1 vdom, 10k policies": (1, 10000, 10000),
+    "10 vdoms, 2k policies each": (10, 2000, 2000),
+}
+
+
+def benchmark(name: str, file: Path) -> None:
+    """Run the benchmark on a file and print the results"""
+    plain = measure(lambda: FortiGateConfig.parse_configuration_file(file))
+    profiled = measure(lambda: FortiGateConfig.parse_configuration_file(file, profile=True))
+    print_row(name, f"{plain:.3f}", f"{profiled:.3f}", f"{profiled / plain - 1:+.1%}")
+    profile = FortiGateConfig.parse_configuration_file(file, profile=True).profile
+    for section in slowest_sections([profile] if profile else [], limit=3):
+        print_row(f"  {section['vdom']} {section['section']}", section["lines"], section["seconds"])
+
+
+def main() -> None:
+    """Run the parse profile benchmark"""
+    logging.getLogger("fotoobo").setLevel(logging.INFO)
+    with tempfile.TemporaryDirectory() as directory:
+        print_row("configuration", "plain [s]", "profiled [s]", "overhead")
+        for name, (vdoms, policies, addresses) in CONFIGS.items():
+            file = write_config(Path(directory) / "fortigate.conf", vdoms, policies, addresses)
+            benchmark(name, file)
+
+
+if __name__ == "__main__":
+    main()
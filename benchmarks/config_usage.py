@@ -0,0 +1,73 @@
+"""
+Benchmark the usage index of FortiGate configurations
+
+Compares finding the usages of an object by parsing all the configurations to looking it up in
+the usage index, and measures how long it takes to build and to update the index.
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_usage import extract_usages, FortiGateConfigUsageIndex
+
+CONFIGS = 20
+VDOMS = 2
+POLICIES = 2000
+
+
+def parse_all(files: list[Path]) -> None:
+    """Find the usages of an object by parsing all the configurations"""
+    for file in files:
+        usages = extract_usages(FortiGateConfig.parse_configuration_file(file))
+        _ = [usage for usage in usages if usage[0] == "address_1"]
+
+
+def build(files: list[Path], index_file: Path) -> None:
+    """Build the usage index from scratch"""
+    index_file.unlink(missing_ok=True)
+    index = FortiGateConfigUsageIndex(index_file)
+    index.update(files)
+    index.close()
+
+
+def update(files: list[Path], index_file: Path, touch: Path | None = None) -> None:
+    """Update the usage index (optionally after changing the modification time of a file)"""
+    if touch:
+        os.utime(touch)
+
+    index = FortiGateConfigUsageIndex(index_file)
+    index.update(files)
+    index.close()
+
+
+def main() -> None:
+    """Run the usage index benchmark"""
+    logging.getLogger("fotoobo").setLevel(logging.INFO)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = Path(temp_dir)
+        files = [
+            write_config(directory / f"fortigate_{number}.conf", VDOMS, POLICIES, POLICIES)
+            for number in range(CONFIGS)
+        ]
+        index_file = directory / "usage.sqlite"
+        print_row(f"{CONFIGS} configs, {VDOMS} vdoms, {POLICIES} policies", "time [s]")
+        print_row("parse all and search", f"{measure(lambda: parse_all(files), 1):.3f}")
+        print_row("build index", f"{measure(lambda: build(files, index_file), 1):.3f}")
+        print_row("update index, no changes", f"{measure(lambda: update(files, index_file)):.4f}")
+        print_row(
+            "update index, 1 touched file",
+            f"{measure(lambda: update(files, index_file, files[0])):.4f}",
+        )
+        index = FortiGateConfigUsageIndex(index_file)
+        print_row("lookup", f"{measure(lambda: index.lookup('address_1')):.4f}")
+        print_row("index size [MB]", f"{index_file.stat().st_size / 2**20:.1f}")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
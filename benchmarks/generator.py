@@ -0,0 +1,237 @@
+"""
+Generator for large synthetic FortiGate configurations
+"""
+
+from pathlib import Path
+from random import Random
+
+# the number of physical ports and of custom services per VDOM
+PORTS = 8
+SERVICES = 20
+
+
+def generate_config(
+    vdoms: int = 0,
+    policies: int = 1000,
+    addresses: int = 1000,
+    certificates: int = 0,
+    seed: int = 0,
+) -> str:
+    """
+    Generate a FortiGate configuration in backup file format.
+
+    The generated configuration is deterministic so that it may be used to compare different runs.
+    Besides the given number of objects every VDOM has custom services and address groups (one for
+    every ten addresses). The policies reference them in varying combinations which are drawn from
+    a random generator with the given seed.
+
+    Args:
+        vdoms:        The number of VDOMs. With 0 the configuration is in single VDOM mode.
+        policies:     The number of firewall policies per VDOM
+        addresses:    The number of firewall address objects per VDOM
+        certificates: The number of local certificates (with their private key) per VDOM
+        seed:         The seed of the variations (the same seed gives the same configuration)
+
+    Returns:
+        The FortiGate configuration as text
+    """
+    vdom_mode = "1" if vdoms else "0"
+    lines = [
+        f"#config-version=FGT999-7.2.8-FW-build1639-240313:opmode=0:vdom={vdom_mode}:user=admin",
+        "#conf_file_ver=84659144068220130",
+        "#buildno=1639",
+        "#global_vdom=1",
+    ]
+    system_global = [
+        "config system global",
+        "    set admin-sport 443",
+        '    set alias "FGT999"',
+        '    set hostname "fotoobo-benchmark"',
+        '    set timezone "Europe/Zurich"',
+        "end",
+        *_generate_interfaces(vdoms),
+    ]
+    if vdoms:
+        lines += ["config vdom"]
+        for vdom in range(vdoms):
+            lines += [f"edit vdom_{vdom}", "next"]
+
+        lines += ["end", "", "config global", *system_global, "end", ""]
+        for vdom in range(vdoms):
+            lines += ["config vdom", f"edit vdom_{vdom}"]
+            lines += _generate_vdom(policies, addresses, certificates, Random(seed * 10000 + vdom))
+            lines += ["end", ""]
+
+    else:
+        lines += system_global
+        lines += _generate_vdom(policies, addresses, certificates, Random(seed * 10000))
+
+    return "\n".join(lines) + "\n"
+
+
+def _generate_interfaces(vdoms: int) -> list[str]:
+    """
+    Generate the physical ports and a VLAN interface for every VDOM.
+
+    Args:
+        vdoms: The number of VDOMs (0 for single VDOM mode)
+
+    Returns:
+        The configuration lines
+    """
+    lines = ["config system interface"]
+    for port in range(1, PORTS + 1):
+        lines += [
+            f'    edit "port{port}"',
+            '        set vdom "root"' if not vdoms else f'        set vdom "vdom_{port % vdoms}"',
+            f"        set ip 192.168.{port}.1 255.255.255.0",
+            "        set allowaccess ping https ssh",
+            "        set type physical",
+            "    next",
+        ]
+
+    for vdom in range(vdoms):
+        lines += [
+            f'    edit "vlan_{vdom}"',
+            f'        set vdom "vdom_{vdom}"',
+            f"        set ip 172.16.{vdom % 256}.1 255.255.255.0",
+            '        set interface "port1"',
+            f"        set vlanid {vdom + 100}",
+            "    next",
+        ]
+
+    return lines + ["end"]
+
+
+def _generate_vdom(
+    policies: int, addresses: int, certificates: int = 0, random: Random | None = None
+) -> list[str]:
+    """
+    Generate the configuration of one VDOM.
+
+    Args:
+        policies:     The number of firewall policies
+        addresses:    The number of firewall address objects
+        certificates: The number of local certificates
+        random:       The random generator for the variations of the policies
+
+    Returns:
+        The configuration lines
+    """
+    random = random or Random(0)
+    lines = ["config system settings", '    set comments "benchmark vdom"', "end"]
+    lines += ["config firewall service custom"]
+    for service in range(SERVICES):
+        lines += [
+            f'    edit "service_{service}"',
+            f"        set tcp-portrange {8000 + service}",
+            "    next",
+        ]
+
+    lines += ["end", "config firewall address"]
+    for address in range(addresses):
+        ip_address = f"10.{address // 65536 % 256}.{address // 256 % 256}.{address % 256}"
+        lines += [
+            f'    edit "address_{address}"',
+            f'        set uuid "00000000-0000-0000-0000-{address:012d}"',
+            f"        set subnet {ip_address} 255.255.255.255",
+            "    next",
+        ]
+
+    lines += ["end", "config firewall addrgrp"]
+    groups = addresses // 10
+    for group in range(groups):
+        members = " ".join(f'"address_{group * 10 + member}"' for member in range(5))
+        lines += [f'    edit "group_{group}"', f"        set member {members}", "    next"]
+
+    lines += ["end", "config firewall policy"]
+    services = ['"HTTPS"', '"HTTP"', '"SSH"'] + [
+        f'"service_{number}"' for number in range(SERVICES)
+    ]
+    for policy in range(1, policies + 1):
+        dstaddr = (
+            f'"group_{random.randrange(groups)}"' if groups and random.random() < 0.5 else '"all"'
+        )
+        lines += [
+            f"    edit {policy}",
+            f'        set name "policy_{policy}"',
+            f'        set srcintf "port{random.randint(1, PORTS)}"',
+            f'        set dstintf "port{random.randint(1, PORTS)}"',
+            "        set action deny" if random.random() < 0.1 else "        set action accept",
+            f'        set srcaddr "address_{policy % max(addresses, 1)}"',
+            f"        set dstaddr {dstaddr}",
+            '        set schedule "always"',
+            f"        set service {' '.join(random.sample(services, random.randint(1, 3)))}",
+            "        set logtraffic all",
+            f'        set comments "This policy is\nspread over two lines {policy}"',
+            "    next",
+        ]
+        if random.random() < 0.2:
+            lines.insert(-1, "        set nat enable")
+
+    lines += ["end"]
+    if certificates:
+        lines += ["config vpn certificate local"]
+        for certificate in range(certificates):
+            lines += [
+                f'    edit "certificate_{certificate}"',
+                '        set password ENC "benchmark"',
+                *_generate_pem("set private-key", "ENCRYPTED PRIVATE KEY", certificate, 30),
+                *_generate_pem("set certificate", "CERTIFICATE", certificate, 20),
+                "    next",
+            ]
+
+        lines += ["end"]
+
+    return lines
+
+
+def _generate_pem(statement: str, label: str, number: int, lines: int) -> list[str]:
+    """
+    Generate a multiline "set" statement with a PEM encoded value.
+
+    Args:
+        statement: The start of the statement (e.g. "set certificate")
+        label:     The label of the PEM block (e.g. "CERTIFICATE")
+        number:    A number to make the value unique
+        lines:     The number of base64 lines
+
+    Returns:
+        The lines of the statement
+    """
+    body = [
+        f"{number:08d}".ljust(64, "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[line % 26]) for line in range(lines)
+    ]
+    return [
+        f'        {statement} "-----BEGIN {label}-----',
+        *body,
+        f'-----END {label}-----"',
+    ]
+
+
+def write_config(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    file: Path,
+    vdoms: int = 0,
+    policies: int = 1000,
+    addresses: int = 1000,
+    certificates: int = 0,
+    seed: int = 0,
+) -> Path:
+    """
+    Generate a FortiGate configuration and write it to a file.
+
+    Args:
+        file:         The file to write the configuration to
+        vdoms:        The number of VDOMs. With 0 the configuration is in single VDOM mode.
+        policies:     The number of firewall policies per VDOM
+        addresses:    The number of firewall address objects per VDOM
+        certificates: The number of local certificates (with their private key) per VDOM
+        seed:         The seed of the variations (see generate_config())
+
+    Returns:
+        The file the configuration has been written to
+    """
+    file.write_text(
+        generate_config(vdoms, policies, addresses, certificates, seed), encoding="UTF-8"
+    )
+    return file
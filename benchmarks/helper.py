@@ -0,0 +1,37 @@
+"""
+Some helpers for the benchmarks
+"""
+
+from time import perf_counter
+from typing import Any, Callable
+
+
+def measure(func: Callable[[], Any], repeat: int = 3) -> float:
+    """
+    Measure the best run time of a function.
+
+    Args:
+        func:   The function to measure (without arguments)
+        repeat: How many times the function is run
+
+    Returns:
+        The best run time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+
+    return best
+
+
+def print_row(name: str, *values: Any) -> None:
+    """
+    Print a row of benchmark results in aligned columns.
+
+    Args:
+        name:   The name of the benchmark
+        values: The values to print
+    """
+    print(f"{name:<40}" + "".join(f"{str(value):>16}" for value in values))
@@ -0,0 +1,145 @@
+"""
+Benchmark the FortiGate configuration parser
+
+Compares the iterative parser (FortiGateConfig._parse_to_dict) to the former recursive parser on
+large generated configurations.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, IO
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+
+CONFIGS = {
+    "single vdom, 1k policies": (0, 1000, 1000),
+    "single vdom, 20k policies": (0, 20000, 20000),
+    "10 vdoms, 5k policies each": (10, 5000, 5000),
+}
+
+
+class RecursiveParser:
+    """
+    The recursive parser as it was used before the iterative parser. It is kept here as reference.
+    """
+
+    _config_path: list[str] = []
+
+    @staticmethod
+    def parse(config_file: IO[str]) -> Any:  # pylint: disable=too-many-branches
+        """
+        Parse a FortiGate configuration recursively.
+
+        Args:
+            config_file: FortiGate configuration file object
+
+        Returns:
+            A dict which contains the parsed FortiGate configuration
+        """
+        config: Any = {}
+        multiline: str = ""
+        multiline_key: str = ""
+
+        for line in config_file:
+            line = line.strip()
+            if not line:
+                continue
+
+            if multiline:
+                multiline += f"\n{line}"
+                if line.endswith('"'):
+                    config[multiline_key], multiline = multiline.strip('"'), ""
+
+                continue
+
+            if line.startswith("set ") and line.count('"') % 2 == 1 and not line.endswith('"'):
+                _, multiline_key, value = line.split(maxsplit=2)
+                multiline += value
+                continue
+
+            if line.startswith("set "):
+                _, key, value = line.split(maxsplit=2)
+                config[key] = " ".join(value.replace('"', "").split())
+
+            if line.startswith("config vdom") and len(RecursiveParser._config_path) == 1:
+                continue
+
+            if line.startswith("config "):
+                RecursiveParser._config_path.append(line[7:])
+                if len(line[7:].split(" ")) == 1:
+                    config[line[7:].strip('"')] = RecursiveParser.parse(config_file)
+
+                else:
+                    path = [word.strip('"') for word in line[7:].split()]
+                    # pylint: disable=protected-access
+                    temp_config = FortiGateConfig._get_nested_dict(
+                        path[1:], RecursiveParser.parse(config_file)
+                    )
+                    config[path[0]] = {**config.get(path[0], {}), **temp_config}
+
+            if line.startswith("edit "):
+                RecursiveParser._config_path.append(line[5:])
+                config[line[5:].strip('"')] = RecursiveParser.parse(config_file)
+
+            if line == "end":
+                RecursiveParser._config_path.pop()
+                # pylint: disable=protected-access
+                if FortiGateConfig._config_is_list(config):
+                    config = FortiGateConfig._config_convert_dict_to_list(config)
+
+                return config
+
+            if line == "next":
+                RecursiveParser._config_path.pop()
+                return config
+
+        return config
+
+
+def parse_recursive(file: Path) -> Any:
+    """Parse a file with the recursive parser"""
+    RecursiveParser._config_path = []  # pylint: disable=protected-access
+    with file.open(encoding="UTF-8") as forti_file:
+        return RecursiveParser.parse(forti_file)
+
+
+def parse_iterative(file: Path) -> Any:
+    """Parse a file with the iterative parser"""
+    with file.open(encoding="UTF-8") as forti_file:
+        return FortiGateConfig._parse_to_dict(forti_file)  # pylint: disable=protected-access
+
+
+def main() -> None:
+    """Run the parser benchmark"""
+    with tempfile.TemporaryDirectory() as directory:
+        print_row("configuration", "size [MB]", "recursive [s]", "iterative [s]", "speedup")
+        for name, (vdoms, policies, addresses) in CONFIGS.items():
+            file = write_config(Path(directory) / "fortigate.conf", vdoms, policies, addresses)
+            recursive = measure(lambda: parse_recursive(file))  # pylint: disable=cell-var-from-loop
+            iterative = measure(lambda: parse_iterative(file))  # pylint: disable=cell-var-from-loop
+            expected = parse_recursive(file)
+            actual = parse_iterative(file)
+            actual.pop("info", None)
+            assert actual == expected, "The parsers do not produce the same result"
+            print_row(
+                name,
+                f"{file.stat().st_size / 2**20:.1f}",
+                f"{recursive:.3f}",
+                f"{iterative:.3f}",
+                f"{recursive / iterative:.2f}x",
+            )
+
+        # a deeply nested configuration exceeds the recursion limit of the recursive parser
+        depth = sys.getrecursionlimit() + 100
+        file = Path(directory) / "nested.conf"
+        file.write_text(
+            "config a\n" * depth + "set key value\n" + "end\n" * depth, encoding="UTF-8"
+        )
+        print_row(f"nesting depth {depth}", "", "", f"{measure(lambda: parse_iterative(file)):.3f}")
+
+
+if __name__ == "__main__":
+    main()
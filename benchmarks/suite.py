@@ -0,0 +1,121 @@
+"""
+The benchmark suite of the hot paths
+
+Runs the parser, the configuration lookups, the checks and the json files on generated
+configurations with the pytest plugin pytest-benchmark of the development dependencies (the
+suite is skipped if it is not installed). Save the results as baseline and compare later runs to
+it to find regressions:
+
+    pytest benchmarks/suite.py --benchmark-autosave
+    pytest benchmarks/suite.py --benchmark-compare --benchmark-compare-fail=mean:10%
+
+The file name does not start with "test_", so the suite is not part of the test suite.
+"""
+
+# pylint: disable=redefined-outer-name
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from benchmarks.generator import write_config
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_check import CheckBundle, FortiGateConfigCheck
+from fotoobo.fortinet.fortigate_config_fleet_check import FortiGateConfigFleetCheck
+from fotoobo.helpers.result import Result
+
+pytest.importorskip("pytest_benchmark")
+
+# the configurations as (vdoms, policies, addresses, certificates)
+CONFIGS = {
+    "single_vdom": (0, 10000, 10000, 0),
+    "4_vdoms": (4, 2500, 2500, 10),
+}
+HOSTS = 100
+CHECKS = [
+    {
+        "type": "value",
+        "scope": "global",
+        "path": "/system/global",
+        "checks": {"admin-sport": 443, "timezone": "Europe/Zurich"},
+    },
+    {"type": "count", "scope": "vdom", "path": "/firewall/policy", "checks": {"lt": 100000}},
+    {"type": "exist", "scope": "vdom", "path": "/system/settings", "checks": {"comments": True}},
+    {
+        "type": "value_in_list",
+        "scope": "vdom",
+        "path": "/firewall/policy",
+        "checks": {"name": "policy_1"},
+    },
+]
+
+
+@pytest.fixture(scope="module", params=list(CONFIGS))
+def config_file(request: Any, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Generate the configuration file once for all the benchmarks"""
+    # the messages of the checks would be logged in every round
+    logging.getLogger("fotoobo").setLevel(logging.ERROR)
+    file = tmp_path_factory.mktemp("benchmark") / f"{request.param}.conf"
+    return write_config(file, *CONFIGS[request.param])
+
+
+@pytest.fixture(scope="module")
+def config(config_file: Path) -> FortiGateConfig:
+    """Parse the generated configuration once for all the benchmarks"""
+    return FortiGateConfig.parse_configuration_file(config_file)
+
+
+def test_parse(benchmark: Any, config_file: Path) -> None:
+    """Parse the whole configuration file"""
+    benchmark(FortiGateConfig.parse_configuration_file, config_file)
+
+
+def test_parse_scope(benchmark: Any, config_file: Path) -> None:
+    """Parse only the firewall policies of the configuration file"""
+    benchmark(FortiGateConfig.parse_configuration_file, config_file, "vdom", "/firewall/policy")
+
+
+def test_get_configuration(benchmark: Any, config: FortiGateConfig) -> None:
+    """Get a single policy by its path"""
+    benchmark(config.get_configuration, "vdom", "/firewall/policy/1")
+
+
+def test_query_configuration(benchmark: Any, config: FortiGateConfig) -> None:
+    """Query the action of all the policies with a wildcard path"""
+    benchmark(config.query_configuration, "vdom", "/firewall/policy/*/action")
+
+
+def test_check(benchmark: Any, config: FortiGateConfig) -> None:
+    """Check one configuration"""
+    bundle = CheckBundle.compile(CHECKS)
+    benchmark(lambda: FortiGateConfigCheck(config, bundle, Result[Any]()).execute_checks())
+
+
+def test_fleet_check(benchmark: Any, config: FortiGateConfig) -> None:
+    """Check the same configuration as a fleet of many hosts"""
+    bundle = CheckBundle.compile(CHECKS)
+
+    def check_fleet() -> None:
+        fleet_check = FortiGateConfigFleetCheck(bundle)
+        for _ in range(HOSTS):
+            fleet_check.add_configuration(config)
+
+        fleet_check.evaluate()
+
+    benchmark(check_fleet)
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["indented", "compact"])
+def test_save(benchmark: Any, config: FortiGateConfig, tmp_path: Path, compact: bool) -> None:
+    """Save the parsed configuration as json file"""
+    benchmark(config.save_configuration_file, tmp_path / "config.json", compact)
+
+
+@pytest.mark.parametrize("compact", [False, True], ids=["indented", "compact"])
+def test_load(benchmark: Any, config: FortiGateConfig, tmp_path: Path, compact: bool) -> None:
+    """Load the configuration from a json file"""
+    file = tmp_path / "config.json"
+    config.save_configuration_file(file, compact)
+    benchmark(FortiGateConfig.load_configuration_file, file)
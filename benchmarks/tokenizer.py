@@ -0,0 +1,106 @@
+"""
+Benchmark the FortiGate configuration tokenizer
+
+Compares reading the configuration as text lines, tokenizing it with and without decoding the
+values, counting the firewall policies from the tokens only and parsing the whole configuration.
+"""
+
+import tempfile
+from pathlib import Path
+
+from benchmarks.generator import write_config
+from benchmarks.helper import measure, print_row
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_tokenizer import tokenize_file, TokenType
+
+CONFIGS = {
+    "single vdom, 20k policies": (0, 20000, 20000),
+    "10 vdoms, 5k policies each": (10, 5000, 5000),
+}
+
+
+def read_lines(file: Path) -> int:
+    """Read the stripped text lines of a file like the parser does"""
+    count = 0
+    with file.open(encoding="UTF-8") as forti_file:
+        for line in forti_file:
+            if line.strip():
+                count += 1
+
+    return count
+
+
+def tokenize(file: Path) -> int:
+    """Tokenize a file without decoding the tokens"""
+    count = 0
+    for _ in tokenize_file(file):
+        count += 1
+
+    return count
+
+
+def tokenize_and_decode(file: Path) -> int:
+    """Tokenize a file and decode the arguments of all the tokens"""
+    count = 0
+    for token in tokenize_file(file):
+        count += len(token.text)
+
+    return count
+
+
+def count_policies(file: Path) -> int:
+    """Count the firewall policies of all the VDOMs by only looking at the token types"""
+    count = 0
+    depth = 0
+    policy_depth = -1
+    config, edit, closing = TokenType.CONFIG, TokenType.EDIT, (TokenType.NEXT, TokenType.END)
+    for token_type, _, _, data in tokenize_file(file):
+        if token_type is config:
+            depth += 1
+            if data == b"firewall policy":
+                policy_depth = depth
+
+        elif token_type is edit:
+            depth += 1
+            count += depth == policy_depth + 1
+
+        elif token_type in closing:
+            if depth == policy_depth:
+                policy_depth = -1
+
+            depth -= 1
+
+    return count
+
+
+def benchmark(name: str, file: Path) -> None:
+    """Run the benchmark on a file and print the results"""
+    results = [
+        measure(lambda: read_lines(file)),
+        measure(lambda: tokenize(file)),
+        measure(lambda: tokenize_and_decode(file)),
+        measure(lambda: count_policies(file)),
+        measure(lambda: FortiGateConfig.parse_configuration_file(file)),
+    ]
+    print_row(name, f"{file.stat().st_size / 2**20:.1f}", *(f"{result:.3f}" for result in results))
+
+
+def main() -> None:
+    """Run the tokenizer benchmark"""
+    with tempfile.TemporaryDirectory() as directory:
+        print_row(
+            "configuration",
+            "size [MB]",
+            "lines [s]",
+            "tokens [s]",
+            "decoded [s]",
+            "policies [s]",
+            "parse [s]",
+        )
+        for name, (vdoms, policies, addresses) in CONFIGS.items():
+            file = write_config(Path(directory) / "fortigate.conf", vdoms, policies, addresses)
+            benchmark(name, file)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,18 @@
 The FortiGate get commands
 """
 
+import json
 import logging
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 import typer
+from rich.markup import escape
 
+from fotoobo.fortinet.fortigate_config_profile import ParseProfile, slowest_sections
 from fotoobo.helpers.config import config
+from fotoobo.helpers.result import Result
 from fotoobo.inventory.inventory import Inventory
 from fotoobo.tools import fgt
 
@@ -17,7 +22,7 @@ log = logging.getLogger("fotoobo")
 
 
 @app.command(no_args_is_help=True)
-def check(
+def check(  # pylint: disable=too-many-arguments, too-many-positional-arguments
     configuration: Annotated[
         Path,
         typer.Argument(
@@ -43,12 +48,52 @@ def check(
             show_default=False,
         ),
     ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="The number of processes to parse and check the configuration files with.",
+            min=1,
+        ),
+    ] = 1,
+    matrix: Annotated[
+        bool,
+        typer.Option(
+            "--matrix",
+            "-m",
+            help="Print the number of failures for every host and check as a table.",
+        ),
+    ] = False,
+    state_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--state",
+            help="The file to store the check results in to only check changed files next time.",
+            metavar="[file]",
+            show_default=False,
+        ),
+    ] = None,
+    findings_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--findings",
+            help="The file to save the failed checks in as rows (.csv, .jsonl, .ndjson, .parquet).",
+            metavar="[file]",
+            show_default=False,
+        ),
+    ] = None,
+    profile: Annotated[
+        bool,
+        typer.Option("--profile", help="Print the slowest configuration sections to parse."),
+    ] = False,
 ) -> None:
     """
     Check one or more FortiGate configuration files.
     """
     inventory = Inventory(config.inventory_file)
-    result = fgt.config.check(configuration, bundles)
+    profiles: list[ParseProfile] | None = [] if profile else None
+    result = fgt.config.check(configuration, bundles, workers, state_file, findings_file, profiles)
 
     if smtp_server:
         if smtp_server in inventory.assets:
@@ -61,6 +106,47 @@ def check(
         else:
             log.warning("SMTP server '%s' not in found in inventory.", smtp_server)
 
+    if matrix and result.all_results():
+        # the table only has the failures, so print the messages of fotoobo (e.g. invalid checks)
+        result.print_messages(only_host="fotoobo")
+        result.print_result_as_table(title="Failures per host and check", auto_header=True)
+
+    else:
+        result.print_messages()
+
+    if profiles:
+        _print_profiles(result, profiles)
+
+
+@app.command(no_args_is_help=True)
+def diff(
+    old: Annotated[
+        Path,
+        typer.Argument(
+            help="The old FortiGate configuration file.", metavar="[old]", show_default=False
+        ),
+    ],
+    new: Annotated[
+        Path,
+        typer.Argument(
+            help="The new FortiGate configuration file.", metavar="[new]", show_default=False
+        ),
+    ],
+    scope: Annotated[
+        str,
+        typer.Argument(
+            help="Scope of the configuration ('global' or 'vdom'), both if omitted",
+            metavar="[scope]",
+        ),
+    ] = "",
+    path: Annotated[str, typer.Argument(help="Configuration path", metavar="[path]")] = "/",
+) -> None:
+    """
+    Show the differences between two FortiGate configuration files.
+
+    Added configurations are marked with "+", removed ones with "-" and changed values with "~".
+    """
+    result = fgt.config.diff(old, new, scope, path)
     result.print_messages()
 
 
@@ -99,11 +185,16 @@ def info(
         bool,
         typer.Option("--list", "-l", help="Print the result as a list instead of separate blocks."),
     ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option("--profile", help="Print the slowest configuration sections to parse."),
+    ] = False,
 ) -> None:
     """
     Get the information from one or more FortiGate configuration files.
     """
-    result = fgt.config.info(configuration)
+    profiles: list[ParseProfile] | None = [] if profile else None
+    result = fgt.config.info(configuration, profiles=profiles)
 
     if as_list:
         info_dicts = []
@@ -114,3 +205,125 @@ def info(
 
     else:
         result.print_result_as_table()
+
+    if profiles:
+        _print_profiles(result, profiles)
+
+
+@app.command(no_args_is_help=True)
+def query(
+    configuration: Annotated[
+        Path,
+        typer.Argument(
+            help="The FortiGate configuration file or directory.",
+            metavar="[config]",
+            show_default=False,
+        ),
+    ],
+    scope: Annotated[
+        str,
+        typer.Argument(help="Scope of the configuration ('global' or 'vdom')", metavar="[scope]"),
+    ],
+    path: Annotated[
+        str,
+        typer.Argument(help="Configuration path, '*' matches every key or id", metavar="[path]"),
+    ],
+    predicate: Annotated[
+        str,
+        typer.Argument(
+            help="Only show the values matching '<key> <operator> <value>', the key is optional "
+            "(e.g. '!= 443')",
+            metavar="[predicate]",
+        ),
+    ] = "",
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="The number of processes to parse and query the configuration files with.",
+            min=1,
+        ),
+    ] = 1,
+) -> None:
+    """
+    Query one or more FortiGate configuration files.
+
+    Every match is printed as a line with the hostname, the path and the value separated by tabs.
+
+    The operators of the predicate are "==", "!=", "<", "<=", ">", ">=", "~" and "!~".
+    """
+    for host, match_path, value in fgt.config.query(configuration, scope, path, predicate, workers):
+        if isinstance(value, (Mapping, list)):
+            value = json.dumps(value, default=dict)
+
+        typer.echo(f"{host}\t{match_path}\t{value}")
+
+
+@app.command(no_args_is_help=True)
+def usage(
+    configuration: Annotated[
+        Path,
+        typer.Argument(
+            help="The FortiGate configuration file or directory.",
+            metavar="[config]",
+            show_default=False,
+        ),
+    ],
+    name: Annotated[
+        str,
+        typer.Argument(
+            help="The name of the object (e.g. a firewall address).",
+            metavar="[name]",
+            show_default=False,
+        ),
+    ],
+    index_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--index",
+            help="The file to store the usage index in to only parse changed files next time.",
+            metavar="[file]",
+            show_default=False,
+        ),
+    ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="The number of processes to parse the configuration files with.",
+            min=1,
+        ),
+    ] = 1,
+) -> None:
+    """
+    Show where an object is used in one or more FortiGate configuration files.
+    """
+    result = fgt.config.usage(configuration, name, index_file, workers)
+    usages = [
+        {**object_usage._asdict(), "vdom": object_usage.vdom or "-"}
+        for host_usages in result.all_results().values()
+        for object_usage in host_usages
+    ]
+    if usages:
+        result.print_table_raw(usages, auto_header=True, title=f"Usages of '{escape(name)}'")
+
+    else:
+        result.print_messages()
+
+
+def _print_profiles(result: Result[Any], profiles: list[ParseProfile]) -> None:
+    """
+    Print the slowest configuration sections of the parse profiles as table.
+
+    Args:
+        result:   The result to print the table with
+        profiles: The parse profiles
+    """
+    seconds = sum(parse_profile.seconds for parse_profile in profiles)
+    result.print_table_raw(
+        slowest_sections(profiles),
+        auto_header=True,
+        title=f"Slowest sections of {len(profiles)} file(s) parsed in {seconds:.3f}s",
+    )
@@ -42,7 +42,7 @@ def callback(context: typer.Context) -> None:
 
 
 @app.command()
-def backup(
+def backup(  # pylint: disable=too-many-arguments, too-many-positional-arguments
     host: Annotated[
         str,
         typer.Argument(
@@ -89,6 +89,17 @@ def backup(
             metavar="server",
         ),
     ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="The maximum number of FortiGates to back up at the same time "
+            "(default: setting fleet.workers).",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
 ) -> None:
     """
     Backup one or more FortiGate(s).
@@ -99,7 +110,7 @@ def backup(
         backup_dir = Path.cwd()
 
     create_dir(backup_dir)
-    result = tools.fgt.backup(host, timeout=timeout)
+    result = tools.fgt.backup(host, timeout=timeout, workers=workers)
 
     for name, data in result.all_results().items():
         config_file = backup_dir / Path(name).with_suffix(".conf")
@@ -40,6 +40,17 @@ def version(
             metavar="[host]",
         ),
     ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="The maximum number of FortiGates to query at the same time "
+            "(default: setting fleet.workers).",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
 ) -> None:
     """
     Get the FortiGate(s) version(s).
@@ -48,5 +59,5 @@ def version(
     searches for all devices of type 'fortigate' in the inventory and tries to get their FortiOS
     version.
     """
-    result = fgt.get.version(host)
+    result = fgt.get.version(host, workers)
     result.print_result_as_table(title="FortiGate Versions", headers=["FortiGate", "Version"])
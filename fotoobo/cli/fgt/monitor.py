@@ -42,7 +42,7 @@ def callback(context: typer.Context) -> None:
 
 
 @app.command()
-def hamaster(
+def hamaster(  # pylint: disable=too-many-arguments, too-many-positional-arguments
     host: Annotated[
         str,
         typer.Argument(
@@ -78,6 +78,17 @@ def hamaster(
             metavar="[template]",
         ),
     ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="The maximum number of FortiGate clusters to query at the same time "
+            "(default: setting fleet.workers).",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
 ) -> None:
     """
     Check the FortiGate HA master.
@@ -90,7 +101,7 @@ def hamaster(
     for all devices in the default FortiManager (fmg) in the inventory.
     """
     inventory = Inventory(config.inventory_file)
-    result = fgt.monitor.hamaster(host)
+    result = fgt.monitor.hamaster(host, workers)
     data = {"fotoobo": result.all_results()}
 
     if smtp_server:
@@ -112,7 +112,9 @@ def callback(  # pylint: disable=too-many-arguments, too-many-positional-argumen
         if attr.startswith("_") or attr in ["config", "load_configuration"]:
             continue
 
-        if attr in ["audit_logging", "logging", "vault"] and getattr(config, attr):
+        if attr in ["audit_logging", "fgt_config_cache", "logging", "vault"] and getattr(
+            config, attr
+        ):
             for sub_attr, value in getattr(config, attr).items():
                 if attr == "vault" and sub_attr in ["role_id", "secret_id"]:
                     value = f"{value[:4]}...{value[-4:]}"
@@ -39,8 +39,13 @@ class APIError(GeneralException):
         }
         self.code = 999
         self.message = "unknown"
+        # whether the failed API request has already been retried (see Fortinet.api())
+        self.retried = False
 
-        if isinstance(err, HTTPError):
+        # the HTTP errors of requests and httpx both have the response with its status code
+        if isinstance(err, HTTPError) or isinstance(
+            getattr(getattr(err, "response", None), "status_code", None), int
+        ):
             self.code = err.response.status_code
             message = self.http_status_codes.get(self.code, "General API Error")
             self.message = f"HTTP/{str(self.code)} {message}"
@@ -65,3 +70,24 @@ class GeneralWarning(GeneralException):
     The class does not have any methods as the only one (__init__) is inherited from its parent.
     Raise a GeneralWarning if a part of the program fails but it is safe to do further processing.
     """
+
+
+class APIConnectionError(GeneralError):
+    """
+    Exception for an API request which failed because of the connection to the device.
+
+    It is a GeneralError, as the request did not get any HTTP response (unlike an APIError).
+    """
+
+    def __init__(self, message: str, reason: str) -> None:
+        """
+        init
+
+        Args:
+            message: The message of the error (e.g. "Connection timeout (hostname)")
+            reason:  The reason of the failed connection (e.g. "Connection timeout")
+        """
+        self.reason = reason
+        # whether the failed API request has already been retried (see Fortinet.api())
+        self.retried = False
+        super().__init__(message)
@@ -70,6 +70,35 @@ class FortiGate(Fortinet):
             method, url, payload=payload, params=params, timeout=timeout, headers=headers
         )
 
+    async def api_async(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        method: str,
+        url: str = "",
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+        payload: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Asynchronous native API request to a FortiGate.
+
+        It uses the super.api_async method with the API access token in the headers.
+
+        Args:
+            method:  Request method from [get, post]
+            url:     Rest API URL to request data from
+            headers: Dictionary with headers (if needed)
+            params:  Dictionary with parameters (if needed)
+            payload: JSON body for post requests (if needed)
+            timeout: The requests read timeout
+
+        Returns:
+            Response from the request
+        """
+        headers = {"Authorization": f"Bearer {self.token}", **(headers or {})}
+        return await super().api_async(
+            method, url, payload=payload, params=params, timeout=timeout, headers=headers
+        )
+
     def api_get(self, url: str, vdom: str = "*", timeout: float | None = None) -> list[Any]:
         """Low level GET request to a FortiGate.
 
@@ -125,3 +154,20 @@ class FortiGate(Fortinet):
 
         fgt_version = response.json().get("version", "unknown")
         return fgt_version
+
+    async def get_version_async(self) -> str:
+        """
+        Get FortiGate version with an asynchronous API request
+
+        Returns:
+            FortiGate version
+        """
+        try:
+            response = await self.api_async("get", "monitor/system/status")
+
+        except APIError as err:
+            log.warning("'%s' returned: '%s'", self.hostname, err.message)
+            raise GeneralWarning(f"{self.hostname} returned: {err.message}") from err
+
+        fgt_version: str = response.json().get("version", "unknown")
+        return fgt_version
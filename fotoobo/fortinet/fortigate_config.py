@@ -3,14 +3,30 @@ The FortiGate configuration class represents the whole or parts of a FortiGate c
 """
 
 import logging
+from collections.abc import Mapping, MutableMapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, IO
+from typing import Any, BinaryIO, Callable, cast, Iterable, Iterator, TYPE_CHECKING
 
 from fotoobo.exceptions import GeneralWarning
-from fotoobo.helpers.files import load_json_file, save_json_file
-
+from fotoobo.helpers.files import (
+    load_json_file,
+    load_json_lines_file,
+    save_json_file,
+    save_json_lines_file,
+)
+
+from .fortigate_config_blob import BlobLines
+from .fortigate_config_compact import compact_configuration
+from .fortigate_config_diff import diff_configurations, FortiGateConfigDiff
+from .fortigate_config_lazy import LazyVdomConfig, read_ranges, scan_configuration_file
+from .fortigate_config_profile import ParseProfile
 from .fortigate_info import FortiGateInfo
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .fortigate_config_cache import FortiGateConfigCache
+
 log = logging.getLogger("fotoobo")
 
 
@@ -19,17 +35,23 @@ class FortiGateConfig:
     The FortiGateConfig class represents a FortiGate configuration (or parts of it)
     """
 
-    _config_path: list[str] = []
+    # Increase the PARSER_VERSION whenever the structure of the parsed configuration changes. It is
+    # part of the key of cached configurations and makes sure outdated entries are not used.
+    PARSER_VERSION = "3"
 
     def __init__(
         self,
         global_config: dict[str, Any] | None = None,
-        vdom_config: dict[str, Any] | None = None,
+        vdom_config: MutableMapping[str, Any] | None = None,
         info: dict[str, str] | None = None,
     ) -> None:
         self.global_config = global_config or {}
         self.vdom_config = vdom_config or {}
         self.info = FortiGateInfo(**(info or {}))
+        # the optional path index (see build_index())
+        self._index: dict[tuple[str, str], Any] | None = None
+        # the profile of the parser run (see parse_configuration_file())
+        self.profile: ParseProfile | None = None
         try:
             self.info.hostname = self.global_config["system"]["global"]["hostname"]
 
@@ -55,15 +77,12 @@ class FortiGateConfig:
         """
         log.debug("Getting configuration from scope: '%s'", scope)
         log.debug("Getting configuration from path: '%s'", path)
+        if self._index is not None:
+            return self._get_indexed_configuration(self._index, scope, path)
+
         # split the path by / and remove all empty parts
         path_list: list[str] = [p for p in path.strip("/").split("/") if p]
-        config: Any = {}
-
-        if scope == "global":
-            config = self.global_config
-
-        elif scope == "vdom":
-            config = self.vdom_config
+        config: Any = self._get_scope(scope)
 
         if len(path_list) > 0:
             for key in path_list:
@@ -76,6 +95,133 @@ class FortiGateConfig:
 
         return config
 
+    def query_configuration(self, scope: str = "global", path: str = "/") -> dict[str, Any]:
+        """
+        Return all the config snippets matching a path with wildcards.
+
+        A "*" in the path matches every key of a configuration or every element of a configuration
+        list. Other parts of the path select the key of a configuration or the element with the
+        given id of a configuration list. If the path index is built (see build_index()) the part
+        of the path up to the first wildcard is taken from the index.
+
+        Args:
+            scope: The configuration part to get the configuration from (global|vdom)
+            path:  The path with wildcards
+            Examples:
+            /root/firewall/policy/*/srcaddr  : The source address of every policy in the root vdom
+            /*/firewall/address/*            : Every address of every vdom
+            /system/interface/port1/ip       : A single configuration value
+
+        Returns:
+            The matching config snippets by their path in the scope
+        """
+        log.debug("Querying configuration from scope '%s' with path '%s'", scope, path)
+        path_list: list[str] = [p for p in path.strip("/").split("/") if p]
+        prefix = path_list[: path_list.index("*")] if "*" in path_list else path_list
+        if self._index is not None and (scope, "/".join(prefix)) in self._index:
+            matches = {"/" + "/".join(prefix): self._index[(scope, "/".join(prefix))]}
+            path_list = path_list[len(prefix) :]
+
+        else:
+            matches = {"": self._get_scope(scope)}
+
+        for key in path_list:
+            next_matches: dict[str, Any] = {}
+            for match_path, config in matches.items():
+                if isinstance(config, Mapping):
+                    children = config.items() if key == "*" else [(key, config.get(key))]
+
+                elif isinstance(config, list):
+                    children = [
+                        (str(element.get("id")), element)
+                        for element in config
+                        if isinstance(element, Mapping) and key in ("*", str(element.get("id")))
+                    ]
+
+                else:
+                    continue
+
+                for child_key, child in children:
+                    if child is not None:
+                        next_matches[f"{match_path.rstrip('/')}/{child_key}"] = child
+
+            matches = next_matches
+
+        return {match_path or "/": config for match_path, config in matches.items()}
+
+    def build_index(self) -> None:
+        """
+        Build the path index of the configuration.
+
+        The path index maps the path of every configuration (and not of single values or elements
+        of configuration lists) to the configuration itself. With the path index get_configuration()
+        does not have to walk through the nested configurations on every call. Build it if you
+        access the configuration many times (e.g. to run checks). The index reflects the
+        configuration at the time it is built, so build it again after changing the configuration.
+        """
+        index: dict[tuple[str, str], Any] = {}
+        for scope in ("global", "vdom"):
+            stack: list[tuple[str, Any]] = [("", self._get_scope(scope))]
+            while stack:
+                path, config = stack.pop()
+                index[(scope, path)] = config
+                for key, value in config.items():
+                    if isinstance(value, Mapping):
+                        stack.append((f"{path}/{key}" if path else key, value))
+
+        log.debug("Built path index with '%s' paths", len(index))
+        self._index = index
+
+    def compact(self) -> None:
+        """
+        Convert the configuration into its compact representation.
+
+        The compact representation needs much less memory than the plain dicts of the parser.
+        Repeated keys and short values are stored only once and every configuration with less than
+        MAX_SCHEMA_KEYS keys is stored as a CompactNode which shares its keys with all the other
+        configurations with the same keys. Use it if you keep many or large configurations in
+        memory. The compact configurations are read-only mappings, so get_configuration() and
+        the other methods work the same way. A path index is built again.
+        """
+        self.global_config = compact_configuration(self.global_config)
+        self.vdom_config = compact_configuration(self.vdom_config)
+        if self._index is not None:
+            self.build_index()
+
+    def diff(
+        self, other: "FortiGateConfig", scope: str = "", path: str = "/"
+    ) -> FortiGateConfigDiff:
+        """
+        Compare the configuration with another (e.g. newer) configuration.
+
+        Args:
+            other: The configuration to compare with
+            scope: Only compare the configuration in this scope (global|vdom). If empty, both
+                   scopes are compared.
+            path:  Only compare the configuration at this path in the scope (see
+                   get_configuration() for the format)
+
+        Returns:
+            The configuration parts which are added, removed or changed in the other configuration
+        """
+        diff = FortiGateConfigDiff()
+        for diff_scope in (scope,) if scope else ("global", "vdom"):
+            diff_configurations(
+                self.get_configuration(diff_scope, path),
+                other.get_configuration(diff_scope, path),
+                diff_scope,
+                path,
+                diff,
+            )
+
+        log.debug(
+            "Found '%s' added, '%s' removed and '%s' changed configurations",
+            len(diff.added),
+            len(diff.removed),
+            len(diff.changed),
+        )
+        return diff
+
     def get_vdoms(self) -> list[str]:
         """
         Get the list of configured VDOMs.
@@ -90,34 +236,157 @@ class FortiGateConfig:
 
         return vdoms
 
-    def save_configuration_file(self, configuration_file: Path) -> None:
+    @staticmethod
+    def _get_indexed_configuration(index: dict[tuple[str, str], Any], scope: str, path: str) -> Any:
+        """
+        Return a config snippet from the given configuration path by using the path index.
+
+        Args:
+            index: The path index of the configuration
+            scope: The configuration part to get the configuration from (global|vdom)
+            path:  From where should the configuration come? (see get_configuration())
+
+        Returns:
+            FortiGateConfig configuration value or snippet from the given path.
+        """
+        key = path.strip("/")
+        if "//" in key:
+            key = "/".join(p for p in key.split("/") if p)
+
+        if (scope, key) in index:
+            return index[(scope, key)]
+
+        # single values are not in the index, so get them from their configuration
+        parent_key, _, value_key = key.rpartition("/")
+        parent = index.get((scope, parent_key))
+        if isinstance(parent, Mapping) and value_key in parent:
+            return parent[value_key]
+
+        return {}
+
+    def _get_scope(self, scope: str) -> Mapping[str, Any]:
+        """
+        Return the configuration of a scope.
+
+        Args:
+            scope: The configuration scope (global|vdom)
+
+        Returns:
+            The configuration of the scope or an empty configuration for an unknown scope
+        """
+        if scope == "global":
+            return self.global_config
+
+        if scope == "vdom":
+            return self.vdom_config
+
+        return {}
+
+    def save_configuration_file(self, configuration_file: Path, compact: bool = False) -> None:
         """
         Save the configuration to a json configuration file.
 
         Args:
-            configuration_file: The json file to load the FortiGate configuration from
+            configuration_file: The json file to save the FortiGate configuration to. With the
+                                extension '.gz' or '.zst' the file is compressed.
+            compact:            Save the configuration without indentation (and with orjson if
+                                it is installed)
         """
-        save_json_file(
-            configuration_file,
-            {"global": self.global_config, "vdom": self.vdom_config, "info": self.info.__dict__},
-        )
+        save_json_file(configuration_file, self.to_dict(), compact)
 
     @staticmethod
-    def parse_configuration_file(configuration_file: Path) -> "FortiGateConfig":
+    def save_configuration_files(
+        configs: Iterable["FortiGateConfig"], configuration_file: Path
+    ) -> int:
+        """
+        Save many configurations to a json lines file (one compact configuration per line).
+
+        The configurations are written one after another, so they may be generated (e.g. parsed)
+        while they are saved and do not have to be in memory at the same time.
+
+        Args:
+            configs:            The configurations to save
+            configuration_file: The json lines file to save the FortiGate configurations to. With
+                                the extension '.gz' or '.zst' the file is compressed.
+
+        Returns:
+            The number of configurations saved
+        """
+        return save_json_lines_file(configuration_file, (config.to_dict() for config in configs))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Get the configuration as json serializable data.
+
+        Returns:
+            The global and VDOM configuration and the information
+        """
+        return {"global": self.global_config, "vdom": self.vdom_config, "info": self.info.__dict__}
+
+    @staticmethod
+    def parse_configuration_file(  # pylint: disable=too-many-arguments, too-many-locals
+        configuration_file: Path,
+        scope: str | None = None,
+        path: str = "/",
+        *,
+        lazy: bool = False,
+        blobs: bool = False,
+        profile: bool = False,
+    ) -> "FortiGateConfig":
         """
         Parse the FortiGate configuration from a file into a python object
 
+        If a scope is given only the configuration at the given path (and the system global
+        configuration for the hostname) is parsed. All the other configuration blocks are skipped
+        without building them. Use it if you only need a small part of a big configuration.
+
+        If lazy is set (and no scope is given) the VDOMs of a configuration with VDOMs are parsed
+        only when they are accessed the first time (see LazyVdomConfig). Use it if you do not know
+        in advance which VDOMs you need.
+
+        If blobs is set the big multiline values (e.g. certificates and private keys) are kept as
+        references into the configuration file (see ConfigBlob) instead of strings. They are read
+        from the file when they are used, so the configuration file must not change meanwhile.
+
+        If profile is set the time, the number of lines and the number of nodes of every top level
+        configuration section are recorded in the profile attribute of the configuration (see
+        ParseProfile). Without it the parser is not instrumented at all.
+
         Args:
             configuration_file: The filename of the FortiGate configuration file
+            scope:              Only parse the configuration in this scope (global|vdom)
+            path:               Only parse the configuration at this path in the scope (see
+                                get_configuration() for the format)
+            lazy:               Parse the VDOMs on first access
+            blobs:              Keep the big multiline values as blobs (ignored if lazy is set)
+            profile:            Record the parse profile (ignored if lazy is set)
 
         Returns:
             The parsed FortiGate configuration object
         """
+        if lazy and scope is None:
+            return FortiGateConfig._parse_lazy(configuration_file)
+
         log.debug("Start configuration parser with file '%s'", configuration_file)
 
-        FortiGateConfig._config_path = []
         with configuration_file.open(encoding="UTF-8") as forti_file:
-            parsed_config = FortiGateConfig._parse_to_dict(forti_file)
+            selectors = None
+            if scope is not None:
+                # the VDOM mode is in the first line and needed to know where to find the path
+                header = FortiGateConfig._parse_config_comment({}, forti_file.readline())
+                forti_file.seek(0)
+                selectors = FortiGateConfig._get_selectors(header.get("vdom", "0"), scope, path)
+                log.debug("Only parse configuration at '%s'", selectors)
+
+            blob_lines = (
+                BlobLines(configuration_file, cast(BinaryIO, forti_file.buffer)) if blobs else None
+            )
+            lines: Iterable[str] = forti_file if blob_lines is None else blob_lines
+            parse_profile = ParseProfile(str(configuration_file)) if profile else None
+            if parse_profile is not None:
+                lines = parse_profile.record(lines)
+
+            parsed_config = FortiGateConfig._parse_to_dict(lines, selectors, blob_lines)
 
         global_config: dict[str, Any] = {}
         vdom_config: dict[str, Any] = {}
@@ -125,29 +394,164 @@ class FortiGateConfig:
         if "info" not in parsed_config:
             raise GeneralWarning(f"There is no info in {configuration_file}")
 
-        info = parsed_config["info"]
-        parsed_config.pop("info")
+        info = parsed_config.pop("info")
 
-        if info["vdom"] == "0":
-            global_config["system"] = {}
-            global_config["system"] = parsed_config["system"]
-            parsed_config.pop("system")
-            vdom_config["root"] = {}
+        if info.get("vdom", "0") == "0":
+            global_config["system"] = parsed_config.pop("system", {})
             vdom_config["root"] = parsed_config
 
         else:
-            global_config = parsed_config["global"]
-            vdom_config = parsed_config["vdom"]
+            global_config = parsed_config.get("global", {})
+            vdom_config = parsed_config.get("vdom", {})
+
+        fgt_config = FortiGateConfig(global_config, vdom_config, info)
+        if parse_profile is not None:
+            parse_profile.host = fgt_config.info.hostname
+            fgt_config.profile = parse_profile
+            log.debug("Parsed '%s' in '%.3f' seconds", configuration_file, parse_profile.seconds)
+
+        return fgt_config
 
+    @staticmethod
+    def _parse_lazy(configuration_file: Path) -> "FortiGateConfig":
+        """
+        Parse the FortiGate configuration from a file without parsing its VDOMs.
+
+        The configuration file is scanned for the byte ranges of its VDOMs first. Only the meta
+        information and the global configuration are parsed. A configuration without VDOMs is
+        parsed as a whole.
+
+        Args:
+            configuration_file: The filename of the FortiGate configuration file
+
+        Returns:
+            The FortiGate configuration object with a LazyVdomConfig
+
+        Raises:
+            GeneralWarning: If there is no meta information in the configuration file
+        """
+        log.debug("Start lazy configuration parser with file '%s'", configuration_file)
+        layout = scan_configuration_file(configuration_file)
+        info: dict[str, str] = {}
+        for comment in layout.comments:
+            info = FortiGateConfig._parse_config_comment(info, comment)
+
+        if not info:
+            raise GeneralWarning(f"There is no info in {configuration_file}")
+
+        if info.get("vdom", "0") == "0":
+            return FortiGateConfig.parse_configuration_file(configuration_file)
+
+        global_config = FortiGateConfig._parse_to_dict(
+            read_ranges(configuration_file, layout.global_ranges)
+        ).get("global", {})
+        vdom_config = LazyVdomConfig(
+            configuration_file, layout.vdom_ranges, FortiGateConfig._parse_to_dict
+        )
         return FortiGateConfig(global_config, vdom_config, info)
 
+    @staticmethod
+    def parse_configuration_files(  # pylint: disable=too-many-arguments, too-many-locals
+        configuration_files: Iterable[Path],
+        workers: int = 1,
+        processes: bool = False,
+        skip_invalid: bool = False,
+        cache: "FortiGateConfigCache | None" = None,
+        *,
+        scope: str | None = None,
+        path: str = "/",
+        lazy: bool = False,
+        profile: bool = False,
+    ) -> dict[Path, "FortiGateConfig"]:
+        """
+        Parse many FortiGate configuration files at once.
+
+        The parser does not hold any state outside of a single parser run. So the files may be
+        parsed in parallel on a thread pool or, as parsing is CPU bound, on a process pool.
+
+        Args:
+            configuration_files: The filenames of the FortiGate configuration files
+            workers:             The number of parallel workers. With 1 (default) the files are
+                                 parsed one after another in the current thread.
+            processes:           Use a process pool instead of a thread pool
+            skip_invalid:        Log a warning and skip the files which can not be parsed instead of
+                                 raising the GeneralWarning
+            cache:               Load the configurations from this cache if possible
+            scope:               Only parse the configuration in this scope (global|vdom). It is
+                                 ignored if a cache is given as the cache holds full configurations.
+            path:                Only parse the configuration at this path in the scope
+            lazy:                Parse the VDOMs on first access (see parse_configuration_file()).
+                                 It is ignored if a cache is given.
+            profile:             Record the parse profile of every configuration (see
+                                 parse_configuration_file()). It is ignored if a cache is given.
+
+        Returns:
+            The parsed FortiGate configuration objects in the order of the given files
+
+        Raises:
+            GeneralWarning: If a file can not be parsed (and skip_invalid is not set)
+        """
+        files = list(configuration_files)
+        configs: dict[Path, FortiGateConfig] = {}
+        parse: Callable[[Path], FortiGateConfig] = (
+            cache.parse_configuration_file
+            if cache
+            else partial(
+                FortiGateConfig.parse_configuration_file,
+                scope=scope,
+                path=path,
+                lazy=lazy,
+                profile=profile,
+            )
+        )
+
+        if workers <= 1:
+            for file in files:
+                try:
+                    configs[file] = parse(file)
+
+                except GeneralWarning as warn:
+                    if not skip_invalid:
+                        raise
+
+                    log.warning(warn.message)
+
+            return configs
+
+        executor: Executor = (
+            ProcessPoolExecutor(max_workers=workers)
+            if processes
+            else ThreadPoolExecutor(max_workers=workers)
+        )
+        log.debug("Parse '%s' files with '%s' workers", len(files), workers)
+
+        with executor:
+            futures = [executor.submit(parse, file) for file in files]
+            try:
+                for file, future in zip(files, futures):
+                    try:
+                        configs[file] = future.result()
+
+                    except GeneralWarning as warn:
+                        if not skip_invalid:
+                            raise
+
+                        log.warning(warn.message)
+
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+        return configs
+
     @staticmethod
     def load_configuration_file(configuration_file: Path) -> "FortiGateConfig":
         """
         Create a FortiGateConfig object from a json configuration file.
 
         Args:
-            configuration_file: The json file to load the FortiGate configuration from
+            configuration_file: The json file to load the FortiGate configuration from (may be
+                                compressed, see save_configuration_file())
 
         Returns:
             FortiGate configuration object
@@ -155,6 +559,21 @@ class FortiGateConfig:
         data = load_json_file(configuration_file)
         return FortiGateConfig(data["global"], data["vdom"], data["info"])  # type: ignore
 
+    @staticmethod
+    def load_configuration_files(configuration_file: Path) -> Iterator["FortiGateConfig"]:
+        """
+        Load the FortiGateConfig objects from a json lines file one after another.
+
+        Args:
+            configuration_file: The json lines file to load the FortiGate configurations from (see
+                                save_configuration_files())
+
+        Yields:
+            The FortiGate configuration objects in the order they were saved
+        """
+        for data in load_json_lines_file(configuration_file):
+            yield FortiGateConfig(data["global"], data["vdom"], data["info"])
+
     @staticmethod
     def _config_convert_dict_to_list(config: dict[str, Any]) -> list[Any]:
         """
@@ -217,6 +636,42 @@ class FortiGateConfig:
 
         return dict(out_dict)
 
+    @staticmethod
+    def _get_selectors(vdom_mode: str, scope: str, path: str) -> list[list[str]]:
+        """
+        Get the paths of the configuration blocks to parse for a path in a configuration scope.
+
+        In the configuration file the global and VDOM configuration is at different places,
+        depending on the VDOM mode. The system global configuration is always selected as it holds
+        the hostname.
+
+        Args:
+            vdom_mode: The VDOM mode of the configuration ("0" or "1")
+            scope:     The configuration scope (global|vdom)
+            path:      The configuration path in the scope
+
+        Returns:
+            The list of block paths to parse
+        """
+        path_list = [p for p in path.strip("/").split("/") if p]
+        selectors: list[list[str]] = []
+
+        if vdom_mode == "1":
+            selectors.append(["global", "system", "global"])
+            if scope in ("global", "vdom"):
+                selectors.append([scope] + path_list)
+
+        else:
+            selectors.append(["system", "global"])
+            if scope == "global" and (not path_list or path_list[0] == "system"):
+                selectors.append(path_list or ["system"])
+
+            # in single VDOM mode the VDOM configuration is everything except the system config
+            elif scope == "vdom" and (not path_list or path_list[0] == "root"):
+                selectors.append(path_list[1:])
+
+        return selectors
+
     @staticmethod
     def _parse_config_comment(info: dict[str, Any], line: str) -> dict[str, str]:
         """
@@ -243,23 +698,70 @@ class FortiGateConfig:
         return info
 
     @staticmethod
-    # pylint: disable=too-many-branches
-    def _parse_to_dict(config_file: IO[str]) -> Any:
+    def _attach_config(parent: dict[str, Any], path: list[str], config: Any) -> None:
+        """
+        Attach a parsed configuration block to its parent configuration.
+
+        A block opened with a single word (e.g. "config firewall" or "edit 1") replaces the key in
+        the parent. A block opened with more than one word (e.g. "config system global") is
+        converted to a nested dict and merged into the existing parent key.
+
+        Args:
+            parent: The configuration the block belongs to
+            path:   The path of the block as given in its "config" or "edit" line
+            config: The parsed configuration of the block
+        """
+        if len(path) == 1:
+            parent[path[0]] = config
+
+        else:
+            parent[path[0]] = {
+                **parent.get(path[0], {}),
+                **FortiGateConfig._get_nested_dict(path[1:], config),
+            }
+
+    @staticmethod
+    # pylint: disable=too-many-branches, too-many-locals, too-many-statements
+    def _parse_to_dict(
+        config_file: Iterable[str],
+        selectors: list[list[str]] | None = None,
+        blob_lines: BlobLines | None = None,
+    ) -> Any:
         # should be dict[str, Any] | list[Any]
         """
         Fabric function to create a FortiGateConfig object from a backup configuration file
-        This recursive method parses a FortiGate configuration from a file line by line
+        This method parses a FortiGate configuration from a file line by line. Instead of recursing
+        into every "config" or "edit" block the open blocks are kept on an explicit stack. So there
+        is no python frame per block and the nesting depth is not bound to the recursion limit.
+
+        If selectors are given, only the configuration blocks on the way to or inside of a
+        selected path are built. All the other blocks are skipped by only counting their depth.
+
+        The lines of multiline strings are collected in a list and joined once at their end, so
+        long values (e.g. certificates) are built in linear time. If the BlobLines the lines come
+        from are given the big multiline strings are kept as blobs instead.
 
         Args:
-            config_file: FortiGate configuration file object
+            config_file: FortiGate configuration file object (or any other lines of it)
+            selectors:   The paths of the configuration blocks to parse (default: parse all)
+            blob_lines:  The BlobLines the lines come from (keep the big multiline strings as blobs)
 
         Returns:
             A dict which contains the parsed FortiGate configuration
         """
-        config: Any = {}
+        root: dict[str, Any] = {}
+        config: Any = root
+        # every open block is represented by its parent configuration and its path
+        stack: list[tuple[dict[str, Any], list[str]]] = []
+        # the path of the current block (only maintained if there are selectors)
+        block_path: list[str] = []
+        # the depth of the blocks which are skipped as they are not selected
+        skip: int = 0
         info: dict[str, str] = {}
-        multiline: str = ""
+        multiline: list[str] = []
         multiline_key: str = ""
+        # the byte offset of the current multiline statement if big ones are kept as blobs
+        multiline_start: int = 0
 
         for line in config_file:
             line = line.strip()
@@ -272,64 +774,138 @@ class FortiGateConfig:
             if line.startswith("#"):
                 info = FortiGateConfig._parse_config_comment(info, line)
 
+            # handle skipped blocks by only tracking their depth and their multiline strings
+            if skip:
+                if multiline:
+                    if line.endswith('"'):
+                        multiline = []
+
+                elif line.startswith("set "):
+                    if line.count('"') % 2 == 1 and not line.endswith('"'):
+                        multiline = [line]
+
+                elif line.startswith("config "):
+                    if not (line.startswith("config vdom") and len(stack) + skip == 1):
+                        skip += 1
+
+                elif line.startswith("edit "):
+                    skip += 1
+
+                elif line in ("end", "next"):
+                    skip -= 1
+
+                continue
+
             # handle multiline strings (do that before all the other logic)
             if multiline:
-                multiline += f"\n{line}"
+                multiline.append(line)
                 if line.endswith('"'):
-                    config[multiline_key], multiline = multiline.strip('"'), ""
-
-                continue
+                    blob = blob_lines.blob(multiline_start) if blob_lines else None
+                    config[multiline_key] = blob or "\n".join(multiline).strip('"')
+                    multiline = []
 
-            # check if a multiline string starts. begin with "set" and uneven amount of quotes (")
-            if line.startswith("set ") and line.count('"') % 2 == 1 and not line.endswith('"'):
-                _, multiline_key, value = line.split(maxsplit=2)  # first part is always "set"
-                multiline += value
                 continue
 
-            # handle configuration option
             if line.startswith("set "):
-                _, key, value = line.split(maxsplit=2)  # first part ist always "set"
-                config[key] = " ".join(value.replace('"', "").split())
+                # check if a multiline string starts (uneven amount of quotes)
+                if line.count('"') % 2 == 1 and not line.endswith('"'):
+                    _, multiline_key, first_line = line.split(maxsplit=2)
+                    multiline = [first_line]
+                    multiline_start = blob_lines.start if blob_lines else 0
+
+                # handle configuration option
+                else:
+                    _, key, value = line.split(maxsplit=2)  # first part is always "set"
+                    config[key] = " ".join(value.replace('"', "").split())
 
-            # handle recursion
-            if line.startswith("config vdom") and len(FortiGateConfig._config_path) == 1:
                 continue
 
+            # open a new block
+            path: list[str] = []
             if line.startswith("config "):
+                # the "config vdom" lines between the VDOMs do not open a new block
+                if line.startswith("config vdom") and len(stack) == 1:
+                    continue
+
                 if len(line[7:].split(" ")) == 1:
-                    FortiGateConfig._config_path.append(line[7:])
-                    config[line[7:].strip('"')] = FortiGateConfig._parse_to_dict(config_file)
+                    path = [line[7:].strip('"')]
 
                 else:
-                    FortiGateConfig._config_path.append(line[7:])
-                    config_path = [word.strip('"') for word in line[7:].split()]
-                    temp_config = FortiGateConfig._get_nested_dict(
-                        config_path[1:], FortiGateConfig._parse_to_dict(config_file)
-                    )
+                    path = [word.strip('"') for word in line[7:].split()]
+
+            elif line.startswith("edit "):
+                path = [line[5:].strip('"')]
 
-                    if config_path[0] not in config:
-                        config[config_path[0]] = {}
+            if path:
+                if selectors is not None:
+                    if not FortiGateConfig._is_selected(block_path + path, selectors):
+                        skip = 1
+                        continue
 
-                    config[config_path[0]] = {**config[config_path[0]], **temp_config}
+                    block_path += path
 
-            if line.startswith("edit "):
-                FortiGateConfig._config_path.append(line[5:])
-                config[line[5:].strip('"')] = FortiGateConfig._parse_to_dict(config_file)
+                stack.append((config, path))
+                config = {}
 
             # handle section ends
-            if line == "end":
-                FortiGateConfig._config_path.pop()
+            elif line == "end" and stack:
                 if FortiGateConfig._config_is_list(config):
                     config = FortiGateConfig._config_convert_dict_to_list(config)
 
-                return config
+                config = FortiGateConfig._close_block(stack, block_path, config)
+
+            elif line == "next" and stack:
+                config = FortiGateConfig._close_block(stack, block_path, config)
 
-            if line == "next":
-                FortiGateConfig._config_path.pop()
-                return config
+        # attach all the blocks which are not closed at the end of the file (e.g. "config vdom")
+        while stack:
+            config = FortiGateConfig._close_block(stack, block_path, config)
 
         # append info dict to config if it's set
         if len(info) > 0:
-            config["info"] = info
+            root["info"] = info
 
-        return config
+        return root
+
+    @staticmethod
+    def _close_block(
+        stack: list[tuple[dict[str, Any], list[str]]], block_path: list[str], config: Any
+    ) -> Any:
+        """
+        Close the current block and attach its configuration to the parent configuration.
+
+        Args:
+            stack:      The stack of the open blocks
+            block_path: The path of the current block (empty if it is not maintained)
+            config:     The configuration of the current block
+
+        Returns:
+            The parent configuration
+        """
+        parent, path = stack.pop()
+        FortiGateConfig._attach_config(parent, path, config)
+        if block_path:
+            del block_path[-len(path) :]
+
+        return parent
+
+    @staticmethod
+    def _is_selected(block_path: list[str], selectors: list[list[str]]) -> bool:
+        """
+        Check if a configuration block has to be parsed.
+
+        A block is selected if it is on the way to a selected path or inside of it.
+
+        Args:
+            block_path: The path of the configuration block
+            selectors:  The paths of the configuration blocks to parse
+
+        Returns:
+            Whether the block has to be parsed (True) or not (False)
+        """
+        for selector in selectors:
+            length = min(len(block_path), len(selector))
+            if block_path[:length] == selector[:length]:
+                return True
+
+        return False
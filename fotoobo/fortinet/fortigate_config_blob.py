@@ -0,0 +1,85 @@
+"""
+The FortiGate configuration blobs keep big multiline values as references into the configuration
+file
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from fotoobo.helpers.files import FileText
+
+# Multiline "set" statements with at least this many bytes (e.g. certificates and private keys) are
+# kept as blobs. Smaller ones (e.g. comments over two lines) are kept as strings.
+MIN_BLOB_SIZE = 1024
+
+
+class ConfigBlob(FileText):
+    """
+    A multiline configuration value which is read from the configuration file when it is used
+
+    The blob references the whole "set" statement in the configuration file. When it is read the
+    value is extracted from the statement the same way the parser does it, so str(blob) is equal
+    to the value the parser would return.
+    """
+
+    __slots__ = ()
+
+    def read(self) -> str:
+        """
+        Read the value from the configuration file.
+
+        Returns:
+            The value without the surrounding quotes
+
+        Raises:
+            GeneralWarning: If the configuration file changed since it was parsed
+        """
+        statement = super().read().replace("\r\n", "\n").replace("\r", "\n")
+        lines = [line.strip() for line in statement.split("\n")]
+        lines = [line for line in lines if line]
+        lines[0] = lines[0].split(maxsplit=2)[2]
+        return "\n".join(lines).strip('"')
+
+
+class BlobLines:
+    """
+    The lines of a configuration file with their byte offsets
+
+    Give it to the parser instead of the lines of the configuration file to keep the big multiline
+    values as blobs.
+    """
+
+    def __init__(self, configuration_file: Path, forti_file: BinaryIO) -> None:
+        """
+        Initialize the lines of the configuration file.
+
+        Args:
+            configuration_file: The filename of the FortiGate configuration file
+            forti_file:         The configuration file opened in binary mode
+        """
+        self.configuration_file = configuration_file
+        self.forti_file = forti_file
+        stat = configuration_file.stat()
+        self.signature = (stat.st_size, stat.st_mtime_ns)
+        # the byte offsets of the start and the end of the current line
+        self.start = self.end = forti_file.tell()
+
+    def __iter__(self) -> Iterator[str]:
+        for line in self.forti_file:
+            self.start, self.end = self.end, self.end + len(line)
+            yield line.decode("UTF-8")
+
+    def blob(self, start: int) -> ConfigBlob | None:
+        """
+        Get the blob from a byte offset up to the end of the current line if it is big enough.
+
+        Args:
+            start: The byte offset of the start of the multiline "set" statement
+
+        Returns:
+            The blob or None if the statement is smaller than MIN_BLOB_SIZE
+        """
+        if self.end - start < MIN_BLOB_SIZE:
+            return None
+
+        return ConfigBlob(self.configuration_file, start, self.end, self.signature)
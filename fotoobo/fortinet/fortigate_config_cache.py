@@ -0,0 +1,193 @@
+"""
+The FortiGate configuration cache stores parsed FortiGate configurations on disk
+"""
+
+import logging
+import os
+import pickle
+import threading
+from hashlib import blake2b
+from pathlib import Path
+
+from fotoobo import __version__
+from fotoobo.helpers.files import create_dir
+
+from .fortigate_config import FortiGateConfig
+
+log = logging.getLogger("fotoobo")
+
+
+class FortiGateConfigCache:
+    """
+    The FortiGateConfigCache class stores parsed FortiGate configurations in a directory.
+
+    Every entry is keyed by the hash of the configuration file content, the parser version and the
+    fotoobo version. So an unchanged configuration file is never parsed twice while a changed file,
+    a new parser version or another fotoobo version (whose classes may have changed) leads to a new
+    entry. An entry which can not be loaded is removed and the configuration is parsed again. The
+    entries are stored in the python pickle format which is much faster to load than parsing the
+    configuration again. As pickle files may execute code when loaded, make sure that only trusted
+    users are able to write to the cache directory.
+
+    The cache is bound by its size. If it grows beyond the maximum size the least recently used
+    entries are removed.
+    """
+
+    SUFFIX = ".pickle"
+
+    def __init__(self, directory: Path, max_size: int = 500) -> None:
+        """
+        Initialize the FortiGate configuration cache.
+
+        Args:
+            directory: The directory to store the cache entries in. It is created if it does not
+                       exist.
+            max_size:  The maximum size of the cache in MB
+        """
+        self.directory = directory.expanduser()
+        self.max_size = max_size
+        self._size: int | None = None  # the cache size as known by this instance
+        create_dir(self.directory)
+
+    def get(self, configuration_file: Path) -> FortiGateConfig | None:
+        """
+        Get the parsed FortiGate configuration for a configuration file from the cache.
+
+        Args:
+            configuration_file: The filename of the FortiGate configuration file
+
+        Returns:
+            The parsed FortiGate configuration object or None if it is not in the cache
+        """
+        return self._load(self._entry(configuration_file))
+
+    def put(self, configuration_file: Path, fortigate_config: FortiGateConfig) -> None:
+        """
+        Put a parsed FortiGate configuration into the cache.
+
+        Args:
+            configuration_file: The filename of the FortiGate configuration file
+            fortigate_config:   The parsed FortiGate configuration object
+        """
+        self._store(self._entry(configuration_file), fortigate_config)
+
+    def parse_configuration_file(self, configuration_file: Path) -> FortiGateConfig:
+        """
+        Get the FortiGate configuration from the cache or parse it if it is not in the cache.
+
+        This method is a drop-in replacement for FortiGateConfig.parse_configuration_file().
+
+        Args:
+            configuration_file: The filename of the FortiGate configuration file
+
+        Returns:
+            The parsed FortiGate configuration object
+        """
+        entry = self._entry(configuration_file)
+        if fortigate_config := self._load(entry):
+            log.debug("Configuration '%s' loaded from cache", configuration_file)
+            return fortigate_config
+
+        fortigate_config = FortiGateConfig.parse_configuration_file(configuration_file)
+        self._store(entry, fortigate_config)
+        return fortigate_config
+
+    def clear(self) -> None:
+        """
+        Remove all the entries from the cache.
+        """
+        for entry in self.directory.glob(f"*{self.SUFFIX}"):
+            entry.unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache is smaller than its maximum size.
+        """
+        entries = []
+        for entry in self.directory.glob(f"*{self.SUFFIX}"):
+            try:
+                entries.append((entry.stat(), entry))
+
+            except FileNotFoundError:  # removed by another process in the meantime
+                continue
+
+        self._size = sum(stat.st_size for stat, _ in entries)
+        for stat, entry in sorted(entries, key=lambda item: item[0].st_mtime):
+            if self._size <= self.max_size * 2**20:
+                break
+
+            log.debug("Remove '%s' from cache", entry.name)
+            entry.unlink(missing_ok=True)
+            self._size -= stat.st_size
+
+    def _entry(self, configuration_file: Path) -> Path:
+        """
+        Get the cache entry for a configuration file.
+
+        Args:
+            configuration_file: The filename of the FortiGate configuration file
+
+        Returns:
+            The filename of the cache entry
+        """
+        digest = blake2b(configuration_file.read_bytes(), digest_size=20)
+        digest.update(FortiGateConfig.PARSER_VERSION.encode())
+        digest.update(__version__.encode())
+        return self.directory / f"{digest.hexdigest()}{self.SUFFIX}"
+
+    @staticmethod
+    def _load(entry: Path) -> FortiGateConfig | None:
+        """
+        Load a cache entry.
+
+        Args:
+            entry: The filename of the cache entry
+
+        Returns:
+            The FortiGate configuration object or None if the entry does not exist or is invalid
+        """
+        try:
+            with entry.open("rb") as cache_file:
+                fortigate_config = pickle.load(cache_file)
+
+            # mark the entry as recently used
+            os.utime(entry)
+
+        except FileNotFoundError:
+            return None
+
+        # an entry of another fotoobo version may raise anything (e.g. an AttributeError or an
+        # ImportError if the pickled classes changed), which is a cache miss as well
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            log.debug("Remove invalid cache entry '%s': %s", entry.name, err)
+            entry.unlink(missing_ok=True)
+            return None
+
+        return fortigate_config if isinstance(fortigate_config, FortiGateConfig) else None
+
+    def _store(self, entry: Path, fortigate_config: FortiGateConfig) -> None:
+        """
+        Store a FortiGate configuration object as cache entry.
+
+        The entry is written to a temporary file first and then renamed, so that concurrent
+        processes never read a partially written entry.
+
+        Args:
+            entry:            The filename of the cache entry
+            fortigate_config: The FortiGate configuration object to store
+        """
+        temp_entry = entry.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with temp_entry.open("wb") as cache_file:
+            pickle.dump(fortigate_config, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_entry, entry)
+
+        # Only scan the cache directory if the size known by this instance is above the maximum.
+        # Other processes may add entries as well, so the size is updated with every scan.
+        if self._size is None:
+            self.evict()
+
+        else:
+            self._size += entry.stat().st_size
+            if self._size > self.max_size * 2**20:
+                self.evict()
@@ -3,14 +3,191 @@ FortiGate configuration checker
 """
 
 import logging
-from typing import Any
+import operator
+import re
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, NamedTuple
 
 from fotoobo.exceptions import GeneralError
 from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_finding import CheckFinding
+from fotoobo.fortinet.fortigate_info import FortiGateInfo
 from fotoobo.helpers.result import Result
 
 log = logging.getLogger("fotoobo")
 
+# the comparisons of the "count" check and of the "filter-info" values
+COUNT_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "gt": operator.gt,
+    "lt": operator.lt,
+}
+INFO_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {"<": operator.lt, ">": operator.gt}
+
+
+class CheckFailure(NamedTuple):
+    """
+    A failed check of a single configuration option
+
+    The failures are turned into messages only when they are reported (see CompiledCheck.describe).
+
+    Attributes:
+        key:      The option which failed (or the comparison of a "count" check, e.g. "eq")
+        expected: The expected value as given in the check
+        actual:   The actual value (None if the option does not exist)
+        vdom:     The VDOM (None if the failure is in the global configuration)
+    """
+
+    key: str
+    expected: str
+    actual: str | None
+    vdom: str | None = None
+
+
+@dataclass
+class CompiledCheck:
+    """
+    A check from a check bundle which is validated and prepared to run against many configurations
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    type: str
+    scope: str
+    path: str
+    checks: dict[str, Any]
+    # get the values to check from a configuration part
+    extract: Callable[[Any, "CompiledCheck"], Any]
+    # evaluate a column of extracted values and return the failures for every value
+    evaluate: Callable[[list[Any], "CompiledCheck"], list[list[CheckFailure]]]
+    # describe a failure as message
+    describe: Callable[[CheckFailure, "CompiledCheck"], str]
+    name: str | None = None
+    ignore_missing: bool = False
+    inverse: bool = False
+    # the comparisons of the "count" check as (key, comparator, value)
+    comparisons: list[tuple[str, Callable[[Any, Any], bool], int]] = field(default_factory=list)
+    # the "filter-info" filters as (info key, comparator, value, value as version number)
+    info_filters: list[tuple[str, Callable[[Any, Any], bool], str, tuple[int, ...] | None]] = field(
+        default_factory=list
+    )
+    config_filters: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class CheckBundle:
+    """
+    A compiled check bundle
+
+    Compile the check bundle once with CheckBundle.compile() and use it to check as many
+    configurations as you like. Invalid checks are reported when the bundle is compiled and are
+    not part of the compiled bundle.
+    """
+
+    checks: list[CompiledCheck] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    @staticmethod
+    def compile(checks: Any) -> "CheckBundle":
+        """
+        Validate the checks from a check bundle and prepare them to run.
+
+        Args:
+            checks: The checks as loaded from the check bundle file
+
+        Returns:
+            The compiled check bundle
+
+        Raises:
+            GeneralError: If there are no checks defined
+        """
+        if not checks:
+            log.error("There are no checks defined")
+            raise GeneralError("There are no checks defined")
+
+        bundle = CheckBundle()
+        for check in checks:
+            try:
+                bundle.checks.append(CheckBundle._compile_check(check))
+
+            except ValueError as err:
+                log.error(str(err))
+                bundle.errors.append(str(err))
+
+        log.debug("Compiled '%s' checks with '%s' errors", len(bundle.checks), len(bundle.errors))
+        return bundle
+
+    @staticmethod
+    def _compile_check(check: dict[str, Any]) -> CompiledCheck:
+        """
+        Validate a single check and prepare it to run.
+
+        Args:
+            check: The check as given in the check bundle
+
+        Returns:
+            The compiled check
+
+        Raises:
+            ValueError: If the check is not valid
+        """
+        name = check.get("name", "unnamed check")
+
+        # check if needed check keys are present
+        if miss := ("type", "scope", "path", "checks") - check.keys():
+            raise ValueError(f"Key(s) '{miss}' missing in '{name}'")
+
+        # check if checks are defined
+        if not check["checks"]:
+            raise ValueError(f"No checks defined in '{name}'")
+
+        if check["type"] not in EXTRACTORS:
+            raise ValueError(f"Check type '{check['type']}' not available in '{name}'")
+
+        if check["scope"] not in ("global", "vdom"):
+            raise ValueError(f"Scope '{check['scope']}' not available in '{name}'")
+
+        compiled = CompiledCheck(
+            type=check["type"],
+            scope=check["scope"],
+            path=check["path"],
+            checks=check["checks"],
+            extract=EXTRACTORS[check["type"]],
+            evaluate=EVALUATORS[check["type"]],
+            describe=DESCRIBERS[check["type"]],
+            name=check.get("name"),
+            ignore_missing=check.get("ignore_missing", False),
+            inverse=check.get("inverse", False),
+            config_filters=check.get("filter-config", {}),
+        )
+
+        if compiled.type == "count":
+            for key, value in compiled.checks.items():
+                if key not in COUNT_OPERATORS:
+                    raise ValueError(f"Count comparison '{key}' not available in '{name}'")
+
+                try:
+                    compiled.comparisons.append((key, COUNT_OPERATORS[key], int(value)))
+
+                except (TypeError, ValueError) as err:
+                    raise ValueError(f"Count '{value}' is not a number in '{name}'") from err
+
+        info_keys = {info_field.name for info_field in fields(FortiGateInfo)}
+        for key, value in check.get("filter-info", {}).items():
+            if key not in info_keys:
+                raise ValueError(f"Unknown filter-info '{key}' in '{name}'")
+
+            value = str(value)
+            if value[:1] in INFO_OPERATORS:
+                compiled.info_filters.append(
+                    (key, INFO_OPERATORS[value[:1]], value[1:], _version(value[1:]))
+                )
+
+            else:
+                compiled.info_filters.append((key, operator.eq, value, None))
+
+        return compiled
+
 
 class FortiGateConfigCheck:
     """The FortiGate configuration check class"""
@@ -21,14 +198,27 @@ class FortiGateConfigCheck:
 
         Args:
             config: The FortiGate configuration
-            checks: The checks to do against the FortiGate configuration
+            checks: The checks to do against the FortiGate configuration. Give a compiled
+                    CheckBundle to check many configurations with the same checks.
         """
-        self.allowed_checks: list[str] = ["count", "exist", "value", "value_in_list"]
+        self.allowed_checks: list[str] = list(EXTRACTORS)
         self.config = config
         self.checks = checks
         self.result = result
+        self.findings: list[CheckFinding] = []
+
+    def add_finding(self, chk: CompiledCheck, failure: CheckFailure) -> None:
+        """
+        Add a failure of a check to the findings and its message to the results.
+
+        Args:
+            chk:     The check which failed
+            failure: The failure
+        """
+        self.findings.append(create_finding(self.config.info.hostname, chk, failure))
+        self.add_message(chk, chk.describe(failure, chk))
 
-    def add_message(self, chk: dict[str, Any], msg: str) -> None:
+    def add_message(self, chk: CompiledCheck, msg: str) -> None:
         """
         Generates a styled message and appends it to the results.
 
@@ -36,187 +226,391 @@ class FortiGateConfigCheck:
             chk: The check which generated the message
             msg: The message to send to the messages list
         """
-        check_name = f" (check_name: [var]{chk['name']}[/])" if "name" in chk else ""
-        message = f"[chk]{chk['type']}[/]: {msg}{check_name}"
+        message = format_message(chk, msg)
         log.info(message)
         self.result.push_message(self.config.info.hostname, message)
 
-    def execute_checks(self) -> Result[Any]:  # pylint: disable=too-many-branches
+    def execute_checks(self) -> Result[Any]:
         """
         Execute the FortiGate configuration checks.
 
         After initializing a FortiGateConfigCheck object you can run this method to actually run
-        the checks and write the results into the results object.
+        the checks and write the results into the results object. The failed checks are also
+        collected as structured findings in self.findings.
         """
-        if not self.checks:
-            log.error("There are no checks defined")
-            raise GeneralError("There are no checks defined")
-
-        for check in self.checks:
-            # applying info filter
-            skip = False
-            for info_filter in check.get("filter-info", []):
-                if str(check["filter-info"]).startswith("<"):
-                    if not getattr(self.config.info, info_filter) < str(
-                        check["filter-info"][info_filter][1:]
-                    ):
-                        log.debug("Skipping check due to filter-info '%s'", info_filter)
-                        skip = True
-
-                elif str(check["filter-info"]).startswith(">"):
-                    if not getattr(self.config.info, info_filter) > str(
-                        check["filter-info"][info_filter][1:]
-                    ):
-                        log.debug("Skipping check due to filter-info '%s'", info_filter)
-                        skip = True
-
-                else:
-                    if not getattr(self.config.info, info_filter) == str(
-                        check["filter-info"][info_filter]
-                    ):
-                        log.debug("Skipping check due to filter-info '%s'", info_filter)
-                        skip = True
-
-            # applying config_filter
-            for conf_filter in check.get("filter-config", []):
-                config = self.config.get_configuration(check["scope"], conf_filter)
-                if not config == check["filter-config"][conf_filter]:
-                    log.debug("Skipping check due to filter-config '%s'", conf_filter)
-                    skip = True
-
-            if skip:
-                continue
-
-            # check if needed check keys are present
-            if miss := ("type", "scope", "path", "checks") - check.keys():
-                log.error("Key(s) '%s' missing in '%s'", miss, check.get("name", "unnamed check"))
+        bundle = (
+            self.checks
+            if isinstance(self.checks, CheckBundle)
+            else CheckBundle.compile(self.checks)
+        )
+
+        for check in bundle.checks:
+            configs = self.get_configurations(self.config, check)
+            if configs is None:
                 continue
 
-            # check if checks are defined
-            if not check["checks"]:
-                log.error("No checks defined in '%s'", check.get("name", "unnamed check"))
-                continue
+            values = [check.extract(config, check) for _, config in configs]
+            for (vdom, _), failures in zip(configs, check.evaluate(values, check)):
+                for failure in failures:
+                    self.add_finding(check, failure._replace(vdom=vdom))
 
-            if not check["type"] in self.allowed_checks:
-                log.error(
-                    "Check type '%s' not available in '%s'",
-                    check.get("type"),
-                    check.get("name", "unnamed check"),
-                )
-                continue
+        return self.result
 
-            if check["scope"] == "global":
-                config = self.config.get_configuration(check["scope"], check["path"])
-                getattr(self, "_check_" + check["type"])(config, check)
+    @staticmethod
+    def get_configurations(
+        config: FortiGateConfig, check: CompiledCheck
+    ) -> list[tuple[str | None, Any]] | None:
+        """
+        Get the configuration parts a check applies to.
 
-            if check["scope"] == "vdom":
-                if self.config.info.vdom == "0":
-                    if check["path"].startswith("/system/"):
-                        config = self.config.get_configuration("global", check["path"])
+        A global check applies to the global configuration. A VDOM check applies to the
+        configuration of every VDOM.
 
-                    else:
-                        config = self.config.get_configuration("vdom", "/root" + check["path"])
+        Args:
+            config: The FortiGate configuration
+            check:  The check to get the configuration parts for
 
-                    getattr(self, "_check_" + check["type"])(config, check)
+        Returns:
+            The VDOM (None for the global configuration) and the configuration of every part or
+            None if the check is skipped due to its filters
+        """
+        if FortiGateConfigCheck._skip_check(config, check):
+            return None
 
-                elif self.config.info.vdom == "1":
-                    for vdom in self.config.get_vdoms():
-                        config = self.config.get_configuration(
-                            check["scope"], vdom + "/" + check["path"]
-                        )
-                        getattr(self, "_check_" + check["type"])(config, check)
+        if check.scope == "global":
+            return [(None, config.get_configuration(check.scope, check.path))]
 
-        return self.result
+        if config.info.vdom == "0":
+            if check.path.startswith("/system/"):
+                return [(None, config.get_configuration("global", check.path))]
 
-    def _check_count(self, config: Any, chk: dict[str, Any]) -> None:
-        """
-        Check the configuration list count.
+            return [("root", config.get_configuration("vdom", "/root" + check.path))]
 
-        Args:
-            config: FortiGate configuration part to check
-            chk:    The check dict to process
-        """
-        if isinstance(config, list):
-            conf_len = len(config)
-            for key, value in chk["checks"].items():
-                # pylint: disable=too-many-boolean-expressions
-                if (
-                    (key == "eq" and not conf_len == int(value))
-                    or (key == "gt" and not conf_len > int(value))
-                    or (key == "lt" and not conf_len < int(value))
-                ):
-                    self.add_message(
-                        chk,
-                        f"count of [var]{chk['path']}[/] is not [var]{key}[/] [var]{value}[/]",
-                    )
-
-        else:
-            log.warning("'%s' is not a configuration list", chk["path"])
-
-    def _check_exist(self, config: Any, chk: dict[str, Any]) -> None:
-        """
-        Check if a configuration option is present (or not) regardless of its value.
+        if config.info.vdom == "1":
+            return [
+                (vdom, config.get_configuration(check.scope, vdom + "/" + check.path))
+                for vdom in config.get_vdoms()
+            ]
 
-        Args:
-            config: FortiGate configuration part to check
-            chk:    The check dict to process
-        """
-        for key, value in chk["checks"].items():
-            if bool(key in config) != value:
-                self.add_message(
-                    chk,
-                    f"key [var]{key}[/] in [var]{chk['path']}[/] is not [var]{value}[/]",
-                )
+        return []
 
-    def _check_value(self, config: Any, chk: dict[str, Any]) -> None:
+    @staticmethod
+    def _skip_check(config: FortiGateConfig, check: CompiledCheck) -> bool:
         """
-        Do the checks for a configuration value. It checks if the configuration option is present
-        and if the value is set as given in the check bundle.
+        Apply the filters of a check to the configuration.
 
         Args:
-            config: FortiGate configuration part to check
-            chk:    The check dict to process
+            config: The FortiGate configuration
+            check:  The check to apply the filters of
+
+        Returns:
+            Whether the check has to be skipped for this configuration (True) or not (False)
         """
-        for key, value in chk["checks"].items():
-            msg_key = f"[var]{key}[/]"
-            msg_path = f"[var]{chk['path']}[/]"
+        skip = False
+        for key, comparator, value, version in check.info_filters:
+            info_value = getattr(config.info, key)
+            info_version = _version(info_value) if version else None
 
-            if key in config:
-                log.debug("Key '%s' in '%s' is '%s'", msg_key, msg_path, config[key])
-                if str(value) != config[key]:
-                    self.add_message(
-                        chk,
-                        f"key {msg_key} in {msg_path} is not [var]{value}[/]",
-                    )
+            # compare version numbers by their numbers (e.g. "7.10.0" is greater than "7.2.0")
+            if version and info_version:
+                matches = comparator(info_version, version)
 
             else:
-                if not chk.get("ignore_missing", False):
-                    self.add_message(chk, f"key {msg_key} does not exist in config")
+                matches = comparator(info_value, value)
 
-    def _check_value_in_list(self, config: Any, chk: dict[str, Any]) -> None:
-        """
-        Do the checks for set configuration. It checks if the configuration option is present in a
-        and configuration list and if the value is set as given in the check bundle.
+            if not matches:
+                log.debug("Skipping check due to filter-info '%s'", key)
+                skip = True
 
-        Args:
-            config: FortiGate configuration part to check
-            chk:    The check dict to process
-        """
-        inverse: bool = chk.get("inverse", False)
-        msg_not = "" if inverse else "not "
-
-        for key, val in chk["checks"].items():
-            msg_key = f"[var]{key}[/]"
-            msg_val = f"[var]{val}[/]"
-            msg_path = f"[var]{chk['path']}[/]"
-            exist = False
-
-            for conf in config:
-                if key in conf and val == conf[key]:
-                    exist = True
-
-            if not exist ^ inverse:
-                self.add_message(
-                    chk,
-                    f"{msg_key}: {msg_val} {msg_not}in {msg_path}",
-                )
+        for conf_filter, value in check.config_filters.items():
+            if not config.get_configuration(check.scope, conf_filter) == value:
+                log.debug("Skipping check due to filter-config '%s'", conf_filter)
+                skip = True
+
+        return skip
+
+
+def format_message(chk: CompiledCheck, msg: str) -> str:
+    """
+    Generates a styled message for a check.
+
+    Args:
+        chk: The check which generated the message
+        msg: The message
+
+    Returns:
+        The styled message
+    """
+    check_name = f" (check_name: [var]{chk.name}[/])" if chk.name is not None else ""
+    return f"[chk]{chk.type}[/]: {msg}{check_name}"
+
+
+def create_finding(host: str, chk: CompiledCheck, failure: CheckFailure) -> CheckFinding:
+    """
+    Create the finding of a host for a failure of a check.
+
+    Args:
+        host:    The hostname of the FortiGate
+        chk:     The check which failed
+        failure: The failure
+
+    Returns:
+        The finding
+    """
+    return CheckFinding(host, chk.name, chk.type, chk.scope, chk.path, *failure)
+
+
+def _extract_count(config: Any, chk: CompiledCheck) -> int | None:
+    """
+    Get the length of a configuration list.
+
+    Args:
+        config: FortiGate configuration part to check
+        chk:    The check to process
+
+    Returns:
+        The length of the configuration list or None if it is no configuration list
+    """
+    if isinstance(config, list):
+        return len(config)
+
+    log.warning("'%s' is not a configuration list", chk.path)
+    return None
+
+
+def _evaluate_count(column: list[int | None], chk: CompiledCheck) -> list[list[CheckFailure]]:
+    """
+    Check the configuration list counts.
+
+    Args:
+        column: The lengths of the configuration lists
+        chk:    The check to process
+
+    Returns:
+        The failures for every length
+    """
+    failures: list[list[CheckFailure]] = [[] for _ in column]
+    for key, comparator, value in chk.comparisons:
+        for index, count in enumerate(column):
+            if count is not None and not comparator(count, value):
+                failures[index].append(CheckFailure(key, str(value), str(count)))
+
+    return failures
+
+
+def _describe_count(failure: CheckFailure, chk: CompiledCheck) -> str:
+    """
+    Describe a failed configuration list count.
+
+    Args:
+        failure: The failure
+        chk:     The check which failed
+
+    Returns:
+        The message
+    """
+    return f"count of [var]{chk.path}[/] is not [var]{failure.key}[/] [var]{failure.expected}[/]"
+
+
+def _extract_exist(config: Any, chk: CompiledCheck) -> list[bool]:
+    """
+    Get whether the configuration options are present.
+
+    Args:
+        config: FortiGate configuration part to check
+        chk:    The check to process
+
+    Returns:
+        Whether the configuration option is present for every option in the check
+    """
+    return [key in config for key in chk.checks]
+
+
+def _evaluate_exist(column: list[list[bool]], chk: CompiledCheck) -> list[list[CheckFailure]]:
+    """
+    Check if configuration options are present (or not) regardless of their values.
+
+    Args:
+        column: Whether the configuration options are present in every configuration part
+        chk:    The check to process
+
+    Returns:
+        The failures for every configuration part
+    """
+    failures: list[list[CheckFailure]] = [[] for _ in column]
+    for position, (key, value) in enumerate(chk.checks.items()):
+        for index, present in enumerate(column):
+            if present[position] != value:
+                failures[index].append(CheckFailure(key, str(value), str(present[position])))
+
+    return failures
+
+
+def _describe_exist(failure: CheckFailure, chk: CompiledCheck) -> str:
+    """
+    Describe a configuration option which is present (or not).
+
+    Args:
+        failure: The failure
+        chk:     The check which failed
+
+    Returns:
+        The message
+    """
+    return f"key [var]{failure.key}[/] in [var]{chk.path}[/] is not [var]{failure.expected}[/]"
+
+
+def _extract_value(config: Any, chk: CompiledCheck) -> list[str | None]:
+    """
+    Get the values of the configuration options.
+
+    Args:
+        config: FortiGate configuration part to check
+        chk:    The check to process
+
+    Returns:
+        The value for every option in the check or None if the option does not exist
+    """
+    values: list[str | None] = []
+    for key in chk.checks:
+        values.append(config[key] if key in config else None)
+        log.debug("Key '%s' in '%s' is '%s'", key, chk.path, values[-1])
+
+    return values
+
+
+def _evaluate_value(column: list[list[str | None]], chk: CompiledCheck) -> list[list[CheckFailure]]:
+    """
+    Do the checks for configuration values. It checks if the configuration option is present
+    and if the value is set as given in the check bundle.
+
+    Args:
+        column: The values of the configuration options in every configuration part
+        chk:    The check to process
+
+    Returns:
+        The failures for every configuration part
+    """
+    failures: list[list[CheckFailure]] = [[] for _ in column]
+    for position, (key, value) in enumerate(chk.checks.items()):
+        expected = str(value)
+        for index, values in enumerate(column):
+            if values[position] is None:
+                if not chk.ignore_missing:
+                    failures[index].append(CheckFailure(key, expected, None))
+
+            elif values[position] != expected:
+                failures[index].append(CheckFailure(key, expected, str(values[position])))
+
+    return failures
+
+
+def _describe_value(failure: CheckFailure, chk: CompiledCheck) -> str:
+    """
+    Describe a configuration value which is wrong or missing.
+
+    Args:
+        failure: The failure
+        chk:     The check which failed
+
+    Returns:
+        The message
+    """
+    if failure.actual is None:
+        return f"key [var]{failure.key}[/] does not exist in config"
+
+    return f"key [var]{failure.key}[/] in [var]{chk.path}[/] is not [var]{failure.expected}[/]"
+
+
+def _extract_value_in_list(config: Any, chk: CompiledCheck) -> list[bool]:
+    """
+    Get whether the configuration values are present in a configuration list.
+
+    Args:
+        config: FortiGate configuration part to check
+        chk:    The check to process
+
+    Returns:
+        Whether the value is in the configuration list for every option in the check
+    """
+    return [
+        any(key in conf and value == conf[key] for conf in config)
+        for key, value in chk.checks.items()
+    ]
+
+
+def _evaluate_value_in_list(
+    column: list[list[bool]], chk: CompiledCheck
+) -> list[list[CheckFailure]]:
+    """
+    Do the checks for set configuration. It checks if the configuration option is present in a
+    and configuration list and if the value is set as given in the check bundle.
+
+    Args:
+        column: Whether the values are in the configuration list of every configuration part
+        chk:    The check to process
+
+    Returns:
+        The failures for every configuration part (the actual value is whether the value is in
+        the configuration list)
+    """
+    failures: list[list[CheckFailure]] = [[] for _ in column]
+    for position, (key, value) in enumerate(chk.checks.items()):
+        for index, exist in enumerate(column):
+            if not exist[position] ^ chk.inverse:
+                failures[index].append(CheckFailure(key, str(value), str(exist[position])))
+
+    return failures
+
+
+def _describe_value_in_list(failure: CheckFailure, chk: CompiledCheck) -> str:
+    """
+    Describe a configuration value which is (not) in a configuration list.
+
+    Args:
+        failure: The failure
+        chk:     The check which failed
+
+    Returns:
+        The message
+    """
+    msg_not = "" if chk.inverse else "not "
+    return f"[var]{failure.key}[/]: [var]{failure.expected}[/] {msg_not}in [var]{chk.path}[/]"
+
+
+# the functions to extract and evaluate the values and to describe the failures for every check
+# type
+EXTRACTORS: dict[str, Callable[[Any, CompiledCheck], Any]] = {
+    "count": _extract_count,
+    "exist": _extract_exist,
+    "value": _extract_value,
+    "value_in_list": _extract_value_in_list,
+}
+EVALUATORS: dict[str, Callable[[list[Any], CompiledCheck], list[list[CheckFailure]]]] = {
+    "count": _evaluate_count,
+    "exist": _evaluate_exist,
+    "value": _evaluate_value,
+    "value_in_list": _evaluate_value_in_list,
+}
+DESCRIBERS: dict[str, Callable[[CheckFailure, CompiledCheck], str]] = {
+    "count": _describe_count,
+    "exist": _describe_exist,
+    "value": _describe_value,
+    "value_in_list": _describe_value_in_list,
+}
+
+
+def _version(value: str) -> tuple[int, ...] | None:
+    """
+    Convert a version number (e.g. "7.2.8") to a tuple of numbers so that it can be compared.
+
+    Args:
+        value: The version number or any other text
+
+    Returns:
+        The version number as tuple of numbers or None if it is no version number
+    """
+    if re.fullmatch(r"\d+(\.\d+)*", value):
+        return tuple(int(part) for part in value.split("."))
+
+    return None
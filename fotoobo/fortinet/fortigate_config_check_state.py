@@ -0,0 +1,122 @@
+"""
+The FortiGate configuration check state stores the check results of FortiGate configuration files
+"""
+
+import json
+import logging
+import os
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any
+
+from .fortigate_config import FortiGateConfig
+from .fortigate_config_check import CheckFailure
+
+log = logging.getLogger("fotoobo")
+
+
+class FortiGateConfigCheckState:
+    """
+    The FortiGateConfigCheckState class stores the check results of FortiGate configuration files.
+
+    Every entry is keyed by the hash of the configuration file content and the hash of the check
+    bundle. So the results of an unchanged configuration file checked with an unchanged check
+    bundle may be replayed instead of parsing and checking the configuration file again.
+
+    The state is a single JSON file. Only the entries used since the state was loaded are saved, so
+    the state does not grow beyond the configuration files checked in the last run.
+    """
+
+    VERSION = 2
+
+    def __init__(self, state_file: Path) -> None:
+        """
+        Initialize the FortiGate configuration check state and load it from the state file.
+
+        Args:
+            state_file: The file to load the state from and to save it to. If it does not exist or
+                        is invalid the state is empty.
+        """
+        self.state_file = state_file.expanduser()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._used: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def key(configuration_file: Path, bundle_file: Path) -> str:
+        """
+        Get the state key for a configuration file and a check bundle file.
+
+        Args:
+            configuration_file: The filename of the FortiGate configuration file
+            bundle_file:        The filename of the check bundle file
+
+        Returns:
+            The state key
+        """
+        digest = blake2b(configuration_file.read_bytes(), digest_size=20)
+        digest.update(FortiGateConfig.PARSER_VERSION.encode())
+        bundle_digest = blake2b(bundle_file.read_bytes(), digest_size=20)
+        return f"{digest.hexdigest()}:{bundle_digest.hexdigest()}"
+
+    def get(self, key: str) -> tuple[str, list[list[CheckFailure] | None]] | None:
+        """
+        Get the check results for a state key.
+
+        Args:
+            key: The state key as returned by key()
+
+        Returns:
+            The hostname and the failures for every check (None if the check does not apply) or
+            None if there are no results for this key
+        """
+        if not (entry := self._entries.get(key)):
+            return None
+
+        self._used[key] = entry
+        return entry["host"], [
+            None if failures is None else [CheckFailure(*failure) for failure in failures]
+            for failures in entry["failures"]
+        ]
+
+    def put(self, key: str, host: str, failures: list[list[CheckFailure] | None]) -> None:
+        """
+        Put the check results for a state key.
+
+        Args:
+            key:      The state key as returned by key()
+            host:     The hostname of the FortiGate
+            failures: The failures for every check (None if the check does not apply)
+        """
+        self._entries[key] = self._used[key] = {"host": host, "failures": failures}
+
+    def save(self) -> None:
+        """
+        Save the entries used since the state was loaded to the state file.
+
+        The state is written to a temporary file first and then renamed, so that a concurrent run
+        never reads a partially written state.
+        """
+        temp_file = self.state_file.with_suffix(f".{os.getpid()}.tmp")
+        temp_file.write_text(
+            json.dumps({"version": self.VERSION, "entries": self._used}), encoding="UTF-8"
+        )
+        os.replace(temp_file, self.state_file)
+        log.debug("Saved '%s' entries to '%s'", len(self._used), self.state_file)
+
+    def _load(self) -> None:
+        """
+        Load the state from the state file.
+        """
+        try:
+            state = json.loads(self.state_file.read_text(encoding="UTF-8"))
+
+        except FileNotFoundError:
+            return
+
+        except (OSError, ValueError) as err:
+            log.warning("Ignore invalid state file '%s': %s", self.state_file, err)
+            return
+
+        if isinstance(state, dict) and state.get("version") == self.VERSION:
+            self._entries = state.get("entries", {})
@@ -0,0 +1,127 @@
+"""
+The compact representation of parsed FortiGate configurations
+"""
+
+import sys
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+# Configurations with more keys than this (e.g. the address objects of a VDOM) stay dicts. Their
+# keys are unique, so there is nothing to share.
+MAX_SCHEMA_KEYS = 64
+
+# Only strings up to this length are interned. Longer values (e.g. certificates) are rarely
+# repeated.
+MAX_INTERN_LENGTH = 64
+
+# The maximum number of shared schemas. When it is reached, the configurations with new keys stay
+# dicts, so a long running process which compacts many different configurations does not grow
+# without limit.
+MAX_SCHEMAS = 10000
+
+# The schemas (the keys and their positions) shared by all the compact configurations. FortiGate
+# configurations use a limited set of options per configuration path, so many configurations
+# (e.g. all the firewall policies of a fleet) share the same schema.
+_SCHEMAS: dict[tuple[str, ...], dict[str, int]] = {}
+
+
+class CompactNode(Mapping[str, Any]):
+    """
+    A read-only configuration with a shared schema
+
+    A plain dict stores its keys and a hash table for every configuration. The CompactNode stores
+    only the tuple of its values. The keys are stored once in a schema which is shared with all the
+    other configurations with the same keys.
+    """
+
+    __slots__ = ("_schema", "_values")
+
+    def __init__(self, schema: dict[str, int], values: tuple[Any, ...]) -> None:
+        """
+        Initialize the compact configuration.
+
+        Args:
+            schema: The position of the value of every key
+            values: The values in the order of the schema
+        """
+        self._schema = schema
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._schema[key]]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._schema
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactNode) and self._schema is other._schema:
+            return self._values == other._values
+
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"CompactNode({dict(self.items())!r})"
+
+
+def compact_configuration(config: Any) -> Any:
+    """
+    Convert a parsed configuration into its compact representation.
+
+    Configurations are converted to CompactNode objects with shared schemas (or to dicts with
+    interned keys if they have too many keys or MAX_SCHEMAS is reached) and short strings are
+    interned, so that repeated keys and values are stored only once.
+
+    Args:
+        config: The parsed configuration (or a part of it)
+
+    Returns:
+        The compact configuration
+    """
+    if isinstance(config, Mapping):
+        keys = tuple(sys.intern(key) for key in config)
+        values = tuple(compact_configuration(value) for value in config.values())
+        if len(keys) > MAX_SCHEMA_KEYS:
+            return dict(zip(keys, values))
+
+        if (schema := _SCHEMAS.get(keys)) is None:
+            if len(_SCHEMAS) >= MAX_SCHEMAS:
+                return dict(zip(keys, values))
+
+            schema = _SCHEMAS[keys] = {key: position for position, key in enumerate(keys)}
+
+        return CompactNode(schema, values)
+
+    if isinstance(config, list):
+        return [compact_configuration(element) for element in config]
+
+    if isinstance(config, str) and len(config) <= MAX_INTERN_LENGTH:
+        return sys.intern(config)
+
+    return config
+
+
+def expand_configuration(config: Any) -> Any:
+    """
+    Convert a compact configuration back into plain dicts and lists.
+
+    Args:
+        config: The compact configuration (or a part of it)
+
+    Returns:
+        The configuration as plain dicts and lists
+    """
+    if isinstance(config, Mapping):
+        return {key: expand_configuration(value) for key, value in config.items()}
+
+    if isinstance(config, list):
+        return [expand_configuration(element) for element in config]
+
+    return config
@@ -0,0 +1,159 @@
+"""
+The FortiGate configuration diff compares the parsed trees of two FortiGate configurations
+"""
+
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+log = logging.getLogger("fotoobo")
+
+
+@dataclass
+class FortiGateConfigDiff:
+    """
+    The differences between two FortiGate configurations
+
+    Every difference is keyed by the scope and the path of the configuration (see
+    FortiGateConfig.get_configuration()). The elements of a configuration list are addressed by
+    their id.
+    """
+
+    # the added configuration parts with their new value
+    added: dict[tuple[str, str], Any] = field(default_factory=dict)
+    # the removed configuration parts with their old value
+    removed: dict[tuple[str, str], Any] = field(default_factory=dict)
+    # the changed configuration values with their old and new value (for a reordered list the old
+    # and new order of the ids)
+    changed: dict[tuple[str, str], tuple[Any, Any]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        """
+        Whether there are any differences (True) or not (False)
+        """
+        return bool(self.added or self.removed or self.changed)
+
+    def lines(self) -> list[str]:
+        """
+        Render the differences as lines of text.
+
+        Added parts are prefixed with "+", removed parts with "-" and changed values with "~".
+
+        Returns:
+            The differences ordered by scope and path
+        """
+        lines = [(key, f"+ {key[0]} {key[1]}") for key in self.added]
+        lines += [(key, f"- {key[0]} {key[1]}") for key in self.removed]
+        lines += [
+            (key, f"~ {key[0]} {key[1]}: {old!r} -> {new!r}")
+            for key, (old, new) in self.changed.items()
+        ]
+        return [line for _, line in sorted(lines, key=lambda item: _sort_key(*item[0]))]
+
+
+def diff_configurations(
+    old: Any, new: Any, scope: str, path: str = "/", diff: FortiGateConfigDiff | None = None
+) -> FortiGateConfigDiff:
+    """
+    Compare two parsed configuration trees.
+
+    The trees are walked top down and every pair of subtrees is compared first. Equal subtrees are
+    skipped without walking them, so mostly the changed branches of the trees are visited. The
+    elements of configuration lists (e.g. the firewall policies) are matched by their id, so an
+    inserted element does not change all the elements after it. The runtime is roughly linear with
+    the size of the changed branches.
+
+    Args:
+        old:   The old configuration tree
+        new:   The new configuration tree
+        scope: The scope of the configuration trees (global|vdom)
+        path:  The path of the configuration trees in the scope
+        diff:  The diff to add the differences to (a new one is created if None)
+
+    Returns:
+        The differences between the configuration trees
+    """
+    diff = diff if diff is not None else FortiGateConfigDiff()
+
+    # walk the trees with an explicit stack to not hit the recursion limit
+    stack: list[tuple[str, Any, Any]] = [(path.rstrip("/"), old, new)] if old != new else []
+    while stack:
+        node_path, old_node, new_node = stack.pop()
+        old_rows, new_rows = _get_rows(old_node), _get_rows(new_node)
+        if old_rows is not None and new_rows is not None:
+            if order := _get_order(old_rows, new_rows):
+                diff.changed[(scope, node_path or "/")] = order
+
+            old_node, new_node = old_rows, new_rows
+
+        if not isinstance(old_node, Mapping) or not isinstance(new_node, Mapping):
+            diff.changed[(scope, node_path or "/")] = (old_node, new_node)
+            continue
+
+        children = []
+        for key, old_child in old_node.items():
+            if key not in new_node:
+                diff.removed[(scope, f"{node_path}/{key}")] = old_child
+
+            elif old_child != new_node[key]:
+                children.append((f"{node_path}/{key}", old_child, new_node[key]))
+
+        for key in new_node:
+            if key not in old_node:
+                diff.added[(scope, f"{node_path}/{key}")] = new_node[key]
+
+        # push the children in reverse order to walk them in the order of the configuration
+        stack.extend(reversed(children))
+
+    return diff
+
+
+def _get_order(old_rows: dict[Any, Any], new_rows: dict[Any, Any]) -> tuple[Any, Any] | None:
+    """
+    Get the order of the elements of a configuration list if it changed.
+
+    Args:
+        old_rows: The elements of the old configuration list by their id
+        new_rows: The elements of the new configuration list by their id
+
+    Returns:
+        The old and new order of the ids in both configuration lists or None if it did not change
+    """
+    old_ids = [key for key in old_rows if key in new_rows]
+    new_ids = [key for key in new_rows if key in old_rows]
+    return (old_ids, new_ids) if old_ids != new_ids else None
+
+
+def _get_rows(node: Any) -> dict[Any, Any] | None:
+    """
+    Key the elements of a configuration list by their id.
+
+    Args:
+        node: The configuration node
+
+    Returns:
+        The elements by their id or None if the node is not a configuration list
+    """
+    if not isinstance(node, list):
+        return None
+
+    try:
+        return {element["id"]: element for element in node}
+
+    except (KeyError, TypeError):  # not all the elements are configurations with an id
+        return None
+
+
+def _sort_key(scope: str, path: str) -> tuple[str, list[tuple[int, str]]]:
+    """
+    Get the key to sort configuration paths naturally (e.g. policy 9 before policy 10).
+
+    Args:
+        scope: The scope of the configuration
+        path:  The path of the configuration
+
+    Returns:
+        The sort key
+    """
+    return scope, [(int(part), "") if part.isdigit() else (-1, part) for part in path.split("/")]
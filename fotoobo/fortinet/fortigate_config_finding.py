@@ -0,0 +1,81 @@
+"""
+The FortiGate configuration check findings are the structured results of the configuration checks
+"""
+
+import logging
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from fotoobo.exceptions import GeneralError
+from fotoobo.helpers.files import save_csv_file, save_json_lines_file, save_parquet_file
+
+log = logging.getLogger("fotoobo")
+
+# the file formats to save the findings in by their file extension
+FINDING_FORMATS = (".csv", ".jsonl", ".ndjson", ".parquet")
+
+
+class CheckFinding(NamedTuple):
+    """
+    A failed configuration check of a host
+
+    Attributes:
+        host:     The hostname of the FortiGate
+        check:    The name of the check (None if the check has no name)
+        type:     The type of the check (e.g. "value")
+        scope:    The scope of the check (global|vdom)
+        path:     The path of the check (e.g. "/system/global")
+        key:      The option which failed (or the comparison of a "count" check, e.g. "eq")
+        expected: The expected value as given in the check
+        actual:   The actual value (None if the option does not exist)
+        vdom:     The VDOM (None if the finding is in the global configuration)
+    """
+
+    host: str
+    check: str | None
+    type: str
+    scope: str
+    path: str
+    key: str
+    expected: str
+    actual: str | None
+    vdom: str | None
+
+
+def save_findings(findings_file: Path, findings: Iterable[CheckFinding]) -> int:
+    """
+    Save the findings to a file with a row for every finding.
+
+    The format is given by the file extension: '.csv', '.jsonl' or '.ndjson' (one json object per
+    line) or '.parquet' (needs the optional package 'pyarrow'). The csv and json lines files may be
+    compressed with an additional '.gz' or '.zst' extension. The findings are written while they
+    are generated, so they do not have to be in memory at the same time.
+
+    Args:
+        findings_file: The file to save the findings in
+        findings:      The findings to save
+
+    Returns:
+        The number of findings saved
+
+    Raises:
+        GeneralError: If the file format is not supported
+    """
+    suffixes = [suffix for suffix in findings_file.suffixes if suffix not in (".gz", ".zst")]
+    file_format = suffixes[-1] if suffixes else ""
+    if file_format not in FINDING_FORMATS:
+        raise GeneralError(
+            f"Unsupported findings file '{findings_file}' (use {', '.join(FINDING_FORMATS)})"
+        )
+
+    if file_format == ".csv":
+        count = save_csv_file(findings_file, CheckFinding._fields, findings)
+
+    elif file_format == ".parquet":
+        count = save_parquet_file(findings_file, list(CheckFinding._fields), findings)
+
+    else:
+        count = save_json_lines_file(findings_file, (finding._asdict() for finding in findings))
+
+    log.debug("Saved '%s' findings to '%s'", count, findings_file)
+    return count
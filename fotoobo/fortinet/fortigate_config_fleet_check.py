@@ -0,0 +1,206 @@
+"""
+FortiGate configuration fleet checker
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_check import (
+    CheckBundle,
+    CheckFailure,
+    CompiledCheck,
+    create_finding,
+    format_message,
+    FortiGateConfigCheck,
+)
+from fotoobo.fortinet.fortigate_config_finding import CheckFinding
+from fotoobo.helpers.result import Result
+
+log = logging.getLogger("fotoobo")
+
+
+@dataclass
+class FleetCheckResult:
+    """
+    The result of a fleet check as a host x check matrix
+    """
+
+    hosts: list[str]
+    checks: list[CompiledCheck]
+    # the failures for every host and check or None if the check does not apply to the host
+    failures: list[list[list[CheckFailure] | None]]
+
+    @property
+    def labels(self) -> list[str]:
+        """
+        The unique labels of the checks (their name or type and path)
+        """
+        labels: list[str] = []
+        for check in self.checks:
+            label = check.name or f"{check.type} {check.scope} {check.path}"
+            number = 1
+            while (unique_label := label if number == 1 else f"{label} ({number})") in labels:
+                number += 1
+
+            labels.append(unique_label)
+
+        return labels
+
+    @property
+    def matrix(self) -> list[list[int | None]]:
+        """
+        The number of failures for every host and check or None if the check does not apply
+        """
+        return [
+            [None if failures is None else len(failures) for failures in host_failures]
+            for host_failures in self.failures
+        ]
+
+    def findings(self) -> Iterator[CheckFinding]:
+        """
+        Generate the findings of all the hosts.
+
+        The findings are generated one after another in the order of the hosts and checks, so they
+        may be saved without keeping them in memory (see save_findings()).
+
+        Yields:
+            The finding for every failure
+        """
+        for host, host_failures in zip(self.hosts, self.failures):
+            for check, failures in zip(self.checks, host_failures):
+                for failure in failures or []:
+                    yield create_finding(host, check, failure)
+
+    def to_result(self) -> Result[dict[str, int | str]]:
+        """
+        Render the fleet check result to a fotoobo result.
+
+        The result holds the messages of every host in the same order as FortiGateConfigCheck
+        generates them. The number of failures for every check is pushed as the result of the host,
+        so the result may be printed or saved as table. A check which does not apply to a host is
+        marked with "-".
+
+        Returns:
+            The fotoobo result
+        """
+        result = Result[dict[str, int | str]]()
+        labels = self.labels
+        for host, host_failures in zip(self.hosts, self.failures):
+            for check, failures in zip(self.checks, host_failures):
+                for failure in failures or []:
+                    styled_message = format_message(check, check.describe(failure, check))
+                    log.info(styled_message)
+                    result.push_message(host, styled_message)
+
+            result.push_result(
+                host,
+                {
+                    label: "-" if failures is None else len(failures)
+                    for label, failures in zip(labels, host_failures)
+                },
+            )
+
+        return result
+
+
+class FortiGateConfigFleetCheck:
+    """
+    The FortiGate configuration fleet check class
+
+    The fleet check runs a check bundle against many FortiGate configurations at once. First the
+    values every check needs are extracted from each configuration into a column per check. So the
+    configurations do not have to be kept in memory. Then every check is evaluated over its whole
+    column at once.
+    """
+
+    def __init__(self, checks: Any) -> None:
+        """
+        Initialize the fleet checker.
+
+        Args:
+            checks: The checks to do against the FortiGate configurations (raw or compiled)
+        """
+        self.bundle = checks if isinstance(checks, CheckBundle) else CheckBundle.compile(checks)
+        self.hosts: list[str] = []
+        # the VDOMs and the extracted values of every check for every host (None if the check does
+        # not apply)
+        self.columns: list[list[list[tuple[str | None, Any]] | None]] = [
+            [] for _ in self.bundle.checks
+        ]
+
+    def add_configuration(self, config: FortiGateConfig) -> None:
+        """
+        Extract the values to check from a FortiGate configuration and add them to the columns.
+
+        Args:
+            config: The FortiGate configuration
+        """
+        self.add_values(config.info.hostname, self.extract(self.bundle, config))
+
+    def add_values(self, host: str, values: list[list[tuple[str | None, Any]] | None]) -> None:
+        """
+        Add the values extracted from the configuration of a host to the columns.
+
+        Args:
+            host:   The hostname of the FortiGate
+            values: The values as returned by extract()
+        """
+        self.hosts.append(host)
+        for column, check_values in zip(self.columns, values):
+            column.append(check_values)
+
+    @staticmethod
+    def extract(
+        bundle: CheckBundle, config: FortiGateConfig
+    ) -> list[list[tuple[str | None, Any]] | None]:
+        """
+        Extract the values to check from a FortiGate configuration.
+
+        Use it to extract the values in worker processes and add them with add_values().
+
+        Args:
+            bundle: The compiled check bundle
+            config: The FortiGate configuration
+
+        Returns:
+            A list of the VDOM and the extracted values for every configuration part for every
+            check. If a check does not apply to the configuration its values are None.
+        """
+        values: list[list[tuple[str | None, Any]] | None] = []
+        for check in bundle.checks:
+            configs = FortiGateConfigCheck.get_configurations(config, check)
+            values.append(
+                None
+                if configs is None
+                else [(vdom, check.extract(conf, check)) for vdom, conf in configs]
+            )
+
+        return values
+
+    def evaluate(self) -> FleetCheckResult:
+        """
+        Evaluate every check over the values of all the hosts.
+
+        Returns:
+            The result as host x check matrix
+        """
+        failures: list[list[list[CheckFailure] | None]] = [[] for _ in self.hosts]
+        for check, column in zip(self.bundle.checks, self.columns):
+            # flatten the values of all the hosts to a single column and evaluate it at once
+            flat_column = [value for values in column if values for _, value in values]
+            flat_failures = iter(check.evaluate(flat_column, check))
+            for host_failures, values in zip(failures, column):
+                host_failures.append(
+                    None
+                    if values is None
+                    else [
+                        failure._replace(vdom=vdom)
+                        for vdom, _ in values
+                        for failure in next(flat_failures)
+                    ]
+                )
+
+        log.debug("Evaluated '%s' checks for '%s' hosts", len(self.bundle.checks), len(self.hosts))
+        return FleetCheckResult(self.hosts, self.bundle.checks, failures)
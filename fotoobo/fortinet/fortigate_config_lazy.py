@@ -0,0 +1,192 @@
+"""
+The lazy VDOM configuration parses the VDOMs of a FortiGate configuration file on first access
+"""
+
+import logging
+import mmap
+import re
+from collections.abc import Iterator, MutableMapping
+from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple
+
+from fotoobo.exceptions import GeneralWarning
+
+log = logging.getLogger("fotoobo")
+
+# the blocks at the top level of a configuration file with VDOMs
+_GLOBAL = re.compile(rb"^config global\r?$", re.MULTILINE)
+_VDOM = re.compile(rb"^config vdom\r?\nedit ([^\r\n]+)", re.MULTILINE)
+
+
+class ConfigurationLayout(NamedTuple):
+    """
+    The layout of a FortiGate configuration file with VDOMs
+
+    Attributes:
+        comments:      The comment lines (with the meta information) of the configuration
+        global_ranges: The byte ranges of the top level blocks outside of the VDOMs (e.g. "config
+                       global")
+        vdom_ranges:   The byte range of the "edit <vdom>" block of every VDOM
+    """
+
+    comments: list[str]
+    global_ranges: list[tuple[int, int]]
+    vdom_ranges: dict[str, tuple[int, int]]
+
+
+def scan_configuration_file(configuration_file: Path) -> ConfigurationLayout:
+    """
+    Scan a FortiGate configuration file with VDOMs for the byte ranges of its blocks.
+
+    In a configuration file with VDOMs the list of the VDOMs comes first, then the global
+    configuration and then the configuration of every VDOM in its own "config vdom" and
+    "edit <vdom>" block. The file is memory mapped and only searched for these blocks, so the
+    scan does not look at the lines inside of them.
+
+    Args:
+        configuration_file: The filename of the FortiGate configuration file
+
+    Returns:
+        The layout of the configuration file
+    """
+    comments: list[str] = []
+    global_ranges: list[tuple[int, int]] = []
+    vdom_ranges: dict[str, tuple[int, int]] = {}
+
+    with configuration_file.open("rb") as forti_file:
+        # an empty file can not be memory mapped
+        if not configuration_file.stat().st_size:
+            return ConfigurationLayout(comments, global_ranges, vdom_ranges)
+
+        with mmap.mmap(forti_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            # the meta information is in the comment lines at the top of the file
+            while (line := buffer.readline()).startswith(b"#"):
+                comments.append(line.decode("UTF-8").strip())
+
+            global_match = _GLOBAL.search(buffer)
+            starts = [
+                (match.start(), match.group(1).strip().strip(b'"').decode("UTF-8"))
+                for match in _VDOM.finditer(buffer, global_match.end() if global_match else 0)
+            ]
+            ends = [start for start, _ in starts[1:]] + [len(buffer)]
+            for (start, name), end in zip(starts, ends):
+                # the range starts at the "edit <vdom>" line after the "config vdom" line
+                vdom_ranges[name] = (buffer.find(b"edit", start), end)
+
+            if global_match:
+                global_ranges.append(
+                    (global_match.start(), starts[0][0] if starts else len(buffer))
+                )
+
+    log.debug("Found '%s' VDOMs in '%s'", len(vdom_ranges), configuration_file)
+    return ConfigurationLayout(comments, global_ranges, vdom_ranges)
+
+
+def read_ranges(configuration_file: Path, ranges: Iterable[tuple[int, int]]) -> list[str]:
+    """
+    Read byte ranges of a configuration file.
+
+    Args:
+        configuration_file: The filename of the FortiGate configuration file
+        ranges:             The byte ranges to read
+
+    Returns:
+        The lines in the byte ranges
+    """
+    lines: list[str] = []
+    with configuration_file.open("rb") as forti_file:
+        for start, end in ranges:
+            forti_file.seek(start)
+            lines += forti_file.read(end - start).decode("UTF-8").splitlines()
+
+    return lines
+
+
+class LazyVdomConfig(MutableMapping[str, Any]):
+    """
+    The VDOM configurations of a FortiGate configuration file which are parsed on first access
+
+    Only the byte range of every VDOM in the configuration file is kept. A VDOM is parsed from its
+    range when it is accessed the first time. Listing the VDOMs (e.g. with get_vdoms()) does not
+    parse them. The configuration file must not change as long as there are VDOMs to parse.
+    """
+
+    def __init__(
+        self,
+        configuration_file: Path,
+        vdom_ranges: dict[str, tuple[int, int]],
+        parser: Callable[[Iterable[str]], Any],
+    ) -> None:
+        """
+        Initialize the lazy VDOM configuration.
+
+        Args:
+            configuration_file: The filename of the FortiGate configuration file
+            vdom_ranges:        The byte range of the "edit <vdom>" block of every VDOM
+            parser:             The parser for the lines of a configuration
+        """
+        self.configuration_file = configuration_file
+        self._ranges = dict(vdom_ranges)
+        self._parser = parser
+        self._vdoms: dict[str, Any] = {}
+        # the VDOM names in the order of the configuration file
+        self._names = dict.fromkeys(vdom_ranges)
+        stat = configuration_file.stat()
+        self._signature = (stat.st_size, stat.st_mtime_ns)
+
+    @property
+    def loaded(self) -> list[str]:
+        """
+        The names of the VDOMs which are parsed
+        """
+        return [name for name in self._names if name in self._vdoms]
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._vdoms:
+            if name not in self._names:
+                raise KeyError(name)
+
+            self._vdoms[name] = self._parse(name)
+
+        return self._vdoms[name]
+
+    def __setitem__(self, name: str, config: Any) -> None:
+        self._names[name] = None
+        self._vdoms[name] = config
+
+    def __delitem__(self, name: str) -> None:
+        del self._names[name]
+        self._vdoms.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"LazyVdomConfig({self.configuration_file}, vdoms={list(self._names)})"
+
+    def _parse(self, name: str) -> Any:
+        """
+        Parse the configuration of a VDOM from its byte range.
+
+        Args:
+            name: The name of the VDOM
+
+        Returns:
+            The configuration of the VDOM
+
+        Raises:
+            GeneralWarning: If the configuration file changed since it was scanned
+        """
+        stat = self.configuration_file.stat()
+        if (stat.st_size, stat.st_mtime_ns) != self._signature:
+            raise GeneralWarning(f"Configuration file {self.configuration_file} has changed")
+
+        log.debug("Parse VDOM '%s' of '%s'", name, self.configuration_file)
+        lines = ["config vdom"] + read_ranges(self.configuration_file, [self._ranges[name]])
+        return self._parser(lines).get("vdom", {}).get(name, {})
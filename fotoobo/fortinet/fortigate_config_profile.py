@@ -0,0 +1,145 @@
+"""
+The FortiGate configuration parse profile records where the parser spends its time
+"""
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Iterable, Iterator
+
+
+@dataclass
+class SectionProfile:
+    """
+    The profile of a top level configuration section (e.g. "firewall policy")
+
+    Attributes:
+        vdom:    The VDOM of the section (None if the section is not in a VDOM, e.g. in the global
+                 configuration or in a configuration without VDOMs)
+        section: The name of the section as in the "config" statement
+        lines:   The number of lines of the section (including the "config" and "end" lines)
+        nodes:   The number of configuration blocks ("config" and "edit") and options ("set")
+        seconds: The time the parser spent on the section (including reading its lines)
+    """
+
+    vdom: str | None
+    section: str
+    lines: int = 0
+    nodes: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class ParseProfile:
+    """
+    The profile of a FortiGate configuration parser run
+
+    Give the lines of the configuration file to record() and parse the recorded lines to profile
+    every top level configuration section. The sections are recognized by their unindented
+    "config" and "end" lines like they are in every FortiGate backup. The profile only costs time
+    if it is used (see FortiGateConfig.parse_configuration_file(..., profile=True)).
+    """
+
+    file: str = ""
+    host: str = ""
+    sections: list[SectionProfile] = field(default_factory=list)
+
+    @property
+    def seconds(self) -> float:
+        """
+        The time the parser spent on all the sections
+        """
+        return sum(section.seconds for section in self.sections)
+
+    def record(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Record the profile of the sections while their lines are parsed.
+
+        The time of a section is taken from its "config" line until the parser asks for the line
+        after its "end" line, so it includes the time the parser spends on its lines.
+
+        Args:
+            lines: The lines of the configuration file
+
+        Yields:
+            The same lines
+        """
+        section: SectionProfile | None = None
+        vdom: str | None = None
+        multiline = False
+        start = 0.0
+        # count in local variables as the attributes of the section are much slower to update
+        line_count = node_count = 0
+        for line in lines:
+            if section is None:
+                if line.startswith("config "):
+                    name = line.strip()[7:]
+                    if name == "global":
+                        vdom = None
+
+                    elif name != "vdom":
+                        section = SectionProfile(vdom, name)
+                        self.sections.append(section)
+                        line_count = node_count = 0
+                        start = perf_counter()
+
+                elif line.startswith("edit "):
+                    vdom = line.strip()[5:].strip('"')
+
+            elif line.startswith("end") and line.strip() == "end" and not multiline:
+                yield line
+                section.lines, section.nodes = line_count + 1, node_count + 1
+                section.seconds += perf_counter() - start
+                section = None
+                continue
+
+            else:
+                stripped = line.strip()
+                if multiline:
+                    # the lines of multiline values (e.g. scripts) may look like statements
+                    multiline = not stripped.endswith('"')
+
+                elif stripped.startswith(("set ", "edit ", "config ")):
+                    node_count += 1
+                    multiline = (
+                        stripped.count('"') % 2 == 1
+                        and not stripped.endswith('"')
+                        and stripped.startswith("set ")
+                    )
+
+            line_count += 1
+            yield line
+
+        # a section which is not closed at the end of the file
+        if section is not None:
+            section.lines, section.nodes = line_count, node_count + 1
+            section.seconds += perf_counter() - start
+
+
+def slowest_sections(profiles: Iterable[ParseProfile], limit: int = 20) -> list[dict[str, Any]]:
+    """
+    Get the sections of many parse profiles which took the most time.
+
+    Args:
+        profiles: The parse profiles
+        limit:    The maximum number of sections to get (0 for all of them)
+
+    Returns:
+        The host, VDOM ("-" if none), section, lines, nodes and seconds of every section ordered by
+        their time (slowest first)
+    """
+    sections = sorted(
+        ((profile.host, section) for profile in profiles for section in profile.sections),
+        key=lambda host_section: host_section[1].seconds,
+        reverse=True,
+    )
+    return [
+        {
+            "host": host,
+            "vdom": section.vdom or "-",
+            "section": section.section,
+            "lines": section.lines,
+            "nodes": section.nodes,
+            "seconds": f"{section.seconds:.4f}",
+        }
+        for host, section in (sections[:limit] if limit else sections)
+    ]
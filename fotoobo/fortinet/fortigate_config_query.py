@@ -0,0 +1,147 @@
+"""
+The FortiGate configuration query selects configuration values by a path and a predicate
+"""
+
+import logging
+import operator
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from fotoobo.exceptions import GeneralError
+
+from .fortigate_config import FortiGateConfig
+from .fortigate_config_check import _version
+
+log = logging.getLogger("fotoobo")
+
+# the comparisons of a predicate (the negated ones are "!=" and "!~")
+QUERY_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "<": operator.lt,
+    ">": operator.gt,
+    "~": lambda value, pattern: re.search(pattern, value) is not None,
+}
+
+# a predicate is "[key] <operator> <value>"
+_PREDICATE = re.compile(
+    r"^(?P<key>[^=!<>~]*?)\s*(?P<operator>==|!=|<=|>=|<|>|!~|~)\s*(?P<value>.*)$"
+)
+
+
+@dataclass
+class ConfigPredicate:
+    """
+    A predicate on the configurations matched by a query
+
+    The predicate is given as "[key] <operator> <value>". Without a key it applies to the matched
+    configuration value itself, with a key to the option with this key of the matched
+    configuration. The operators are "==", "!=", "<", "<=", ">", ">=", "~" (the value is a regular
+    expression which is searched for) and "!~". Values which are numbers or version numbers (e.g.
+    "443" or "7.2.8") are compared by their numbers, all others as text. A list value (e.g. the
+    source addresses of a policy) matches if any of its elements matches ("!=" and "!~" match if
+    none of its elements matches "==" or "~"). Configurations without the value never match.
+
+    Examples:
+        != 443                 : The value is not 443
+        action == deny         : The option "action" of the configuration is "deny"
+        srcaddr ~ ^net_        : Any source address starts with "net_"
+    """
+
+    key: str
+    # the name of the comparison in QUERY_OPERATORS
+    comparison: str
+    value: str
+    negate: bool = False
+
+    @staticmethod
+    def parse(predicate: str) -> "ConfigPredicate":
+        """
+        Parse a predicate.
+
+        Args:
+            predicate: The predicate as "[key] <operator> <value>"
+
+        Returns:
+            The parsed predicate
+
+        Raises:
+            GeneralError: If the predicate is not valid
+        """
+        if not (match := _PREDICATE.match(predicate.strip())):
+            raise GeneralError(f"Invalid predicate '{predicate}'")
+
+        key, comparison, value = match.group("key", "operator", "value")
+        value = value.strip().strip('"')
+        negate = comparison.startswith("!")
+        comparison = {"!=": "==", "!~": "~"}.get(comparison, comparison)
+        if comparison == "~":
+            try:
+                re.compile(value)
+
+            except re.error as err:
+                raise GeneralError(f"Invalid regular expression '{value}': {err}") from err
+
+        return ConfigPredicate(key.strip(), comparison, value, negate)
+
+    def matches(self, config: Any) -> bool:
+        """
+        Apply the predicate to a configuration.
+
+        Args:
+            config: The configuration (or configuration value) matched by the query
+
+        Returns:
+            Whether the configuration matches the predicate (True) or not (False)
+        """
+        if self.key:
+            config = config.get(self.key) if isinstance(config, Mapping) else None
+
+        if config is None or isinstance(config, Mapping):
+            return False
+
+        values = config if isinstance(config, list) else [config]
+        return any(self._compare(str(value)) for value in values) != self.negate
+
+    def _compare(self, value: str) -> bool:
+        """
+        Compare a single value with the value of the predicate.
+
+        Args:
+            value: The configuration value
+
+        Returns:
+            The result of the comparison
+        """
+        comparator = QUERY_OPERATORS[self.comparison]
+        if self.comparison != "~":
+            number, other_number = _version(value), _version(self.value)
+            if number is not None and other_number is not None:
+                return comparator(number, other_number)
+
+        return comparator(value, self.value)
+
+
+def query_configurations(
+    config: FortiGateConfig, scope: str, path: str, predicate: ConfigPredicate | None = None
+) -> list[tuple[str, str, Any]]:
+    """
+    Query a FortiGate configuration for the values matching a path and a predicate.
+
+    Args:
+        config:    The FortiGate configuration
+        scope:     The configuration scope (global|vdom)
+        path:      The path with wildcards (see FortiGateConfig.query_configuration())
+        predicate: The predicate the matched values have to fulfill (all match if None)
+
+    Returns:
+        The hostname, the path and the value of every match
+    """
+    return [
+        (config.info.hostname, match_path, value)
+        for match_path, value in config.query_configuration(scope, path).items()
+        if predicate is None or predicate.matches(value)
+    ]
@@ -0,0 +1,160 @@
+"""
+The FortiGate configuration tokenizer splits a FortiGate configuration into its statements
+"""
+
+import logging
+import mmap
+import re
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO, Iterator, NamedTuple
+
+log = logging.getLogger("fotoobo")
+
+# a word is either quoted (and may contain spaces) or ends at the next whitespace
+_WORD = re.compile(r'"([^"]*)"|(\S+)')
+
+
+class TokenType(Enum):
+    """
+    The types of the statements in a FortiGate configuration
+    """
+
+    CONFIG = b"config"
+    EDIT = b"edit"
+    SET = b"set"
+    UNSET = b"unset"
+    NEXT = b"next"
+    END = b"end"
+    COMMENT = b"#"
+
+
+# map the raw keywords to their token type without creating the enum on every statement
+_TOKEN_TYPES = {token_type.value: token_type for token_type in TokenType}
+
+
+class Token(NamedTuple):
+    """
+    A statement in a FortiGate configuration
+
+    The arguments of the statement are kept as raw bytes and only decoded when they are accessed.
+    So a consumer which is only interested in the structure of a configuration (e.g. to skip a
+    block) never has to decode its values.
+
+    Attributes:
+        type:  The type of the statement
+        start: The byte offset of the statement in the configuration
+        end:   The byte offset after the statement (and its line break) in the configuration
+        data:  The raw arguments of the statement
+    """
+
+    type: TokenType
+    start: int
+    end: int
+    data: bytes
+
+    @property
+    def text(self) -> str:
+        """
+        The decoded arguments of the statement
+        """
+        return self.data.decode("UTF-8")
+
+    @property
+    def words(self) -> list[str]:
+        """
+        The decoded arguments of the statement split into words without quotes
+
+        Examples:
+            config system global        : ["system", "global"]
+            edit "port 1"               : ["port 1"]
+        """
+        return [quoted or word for quoted, word in _WORD.findall(self.text)]
+
+    @property
+    def key(self) -> str:
+        """
+        The name of the option in a "set" or "unset" statement
+        """
+        return self.data.partition(b" ")[0].decode("UTF-8")
+
+    @property
+    def value(self) -> str:
+        """
+        The decoded raw value of a "set" statement (quotes and line breaks are preserved)
+        """
+        return self.data.partition(b" ")[2].decode("UTF-8").strip()
+
+
+def tokenize(config_file: BinaryIO | mmap.mmap) -> Iterator[Token]:
+    """
+    Split a FortiGate configuration into its statements.
+
+    The configuration is scanned line by line as bytes. A "set" statement with an open quote
+    continues on the following lines until a line ends with a quote (e.g. certificates). Empty
+    lines and statements with an unknown keyword are ignored.
+
+    Args:
+        config_file: The FortiGate configuration as binary file object or memory mapped file
+
+    Yields:
+        The tokens of the configuration in the order of the statements
+    """
+    token_types = _TOKEN_TYPES
+    # create the tokens without the python level constructor of the named tuple
+    new_token = tuple.__new__
+    readline = config_file.readline
+    position = 0
+
+    while line := readline():
+        start, position = position, position + len(line)
+        statement = line.strip()
+        if not statement:
+            continue
+
+        # comments are not separated from their content by a space (e.g. "#buildno=1639")
+        if statement[0] == 35:  # b"#"
+            yield new_token(Token, (TokenType.COMMENT, start, position, statement[1:]))
+            continue
+
+        keyword, _, data = statement.partition(b" ")
+        token_type = token_types.get(keyword)
+        if token_type is None:
+            continue
+
+        # an uneven amount of quotes starts a multiline value unless the line ends with a quote and
+        # the value ends with the first line which ends with a quote (as in the parser, see
+        # FortiGateConfig._parse_to_dict())
+        if token_type is TokenType.SET and data.count(b'"') % 2 and not data.endswith(b'"'):
+            lines = [data]
+            while line := readline():
+                position += len(line)
+                lines.append(line.rstrip(b"\r\n"))
+                if line.rstrip().endswith(b'"'):
+                    break
+
+            data = b"\n".join(lines)
+
+        yield new_token(Token, (token_type, start, position, data))
+
+
+def tokenize_file(configuration_file: Path) -> Iterator[Token]:
+    """
+    Split a FortiGate configuration file into its statements.
+
+    The file is memory mapped, so it is scanned as bytes without reading it into memory first.
+
+    Args:
+        configuration_file: The filename of the FortiGate configuration file
+
+    Yields:
+        The tokens of the configuration in the order of the statements
+    """
+    log.debug("Tokenize configuration file '%s'", configuration_file)
+    with configuration_file.open("rb") as forti_file:
+        # an empty file can not be memory mapped
+        if not configuration_file.stat().st_size:
+            return
+
+        with mmap.mmap(forti_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from tokenize(buffer)
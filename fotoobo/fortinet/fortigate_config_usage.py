@@ -0,0 +1,388 @@
+"""
+The FortiGate configuration usage index stores where the configuration objects are used
+"""
+
+import logging
+import sqlite3
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple, TYPE_CHECKING
+
+from fotoobo.exceptions import GeneralWarning
+
+from .fortigate_config import FortiGateConfig
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .fortigate_config_cache import FortiGateConfigCache
+
+log = logging.getLogger("fotoobo")
+
+# a usage as (object name, VDOM or None for the global scope, table, row id, field)
+Usage = tuple[str, str | None, str, str, str]
+
+
+class ObjectUsage(NamedTuple):
+    """
+    A usage of a configuration object
+
+    Attributes:
+        host:   The hostname of the FortiGate
+        vdom:   The VDOM (None if the object is used in the global configuration)
+        table:  The path of the configuration table (e.g. "/firewall/policy")
+        row_id: The id of the configuration in the table (e.g. the id of the policy)
+        field:  The option which references the object (e.g. "srcaddr")
+    """
+
+    host: str
+    vdom: str | None
+    table: str
+    row_id: str
+    field: str
+
+
+def extract_usages(config: FortiGateConfig) -> list[Usage]:
+    """
+    Extract where the objects of a FortiGate configuration are used.
+
+    The objects are the configurations with a name in a configuration table (e.g. the address
+    "net_1" in "/firewall/address"). An object is used by every option with its name as value or
+    as one of its values (e.g. "set srcaddr net_1 net_2" in a policy). The objects of the global
+    configuration (e.g. the interfaces) may be used in every VDOM, the objects of a VDOM only in
+    this VDOM.
+
+    As the parser does not keep the quotes of the values, an object name with spaces is found in
+    a value with many names as long as the name is surrounded by spaces or the ends of the value.
+
+    Args:
+        config: The FortiGate configuration
+
+    Returns:
+        The usages as (object name, VDOM, table, row id, field)
+    """
+    global_nodes = _get_nodes(config.global_config)
+    global_names = _get_names(global_nodes)
+    usages = _get_usages(global_nodes, global_names, None)
+    # in single VDOM mode the VDOM configuration is in the "root" VDOM
+    for vdom in config.vdom_config:
+        nodes = _get_nodes(config.vdom_config[vdom])
+        usages += _get_usages(nodes, global_names | _get_names(nodes), vdom)
+
+    return usages
+
+
+def _get_nodes(config: Any) -> list[tuple[tuple[str, ...], Mapping[str, Any]]]:
+    """
+    Get all the configurations of a configuration tree with their path.
+
+    Args:
+        config: The configuration tree
+
+    Returns:
+        The path (as tuple of its parts) and the configuration of every node
+    """
+    nodes: list[tuple[tuple[str, ...], Mapping[str, Any]]] = []
+    stack: list[tuple[tuple[str, ...], Any]] = [((), config)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, Mapping):
+            nodes.append((path, node))
+            stack.extend((path + (key,), child) for key, child in node.items())
+
+        elif isinstance(node, list):
+            stack.extend(
+                (path + (str(element.get("id")),), element)
+                for element in node
+                if isinstance(element, Mapping)
+            )
+
+    return nodes
+
+
+def _get_names(nodes: list[tuple[tuple[str, ...], Mapping[str, Any]]]) -> set[str]:
+    """
+    Get the names of the objects in a configuration tree.
+
+    A configuration table holds only configurations (no options) and is at least two levels deep
+    (e.g. "/firewall/address"). Its configurations with options (or no options at all, e.g. an
+    empty group) are objects. So the blocks like "/system/global" are no objects.
+
+    Args:
+        nodes: The nodes of the configuration tree (see _get_nodes())
+
+    Returns:
+        The object names
+    """
+    names: set[str] = set()
+    for path, node in nodes:
+        if len(path) < 2 or not all(isinstance(child, Mapping) for child in node.values()):
+            continue
+
+        names.update(
+            key
+            for key, child in node.items()
+            if not child or any(not isinstance(value, (Mapping, list)) for value in child.values())
+        )
+
+    return names
+
+
+def _get_usages(
+    nodes: list[tuple[tuple[str, ...], Mapping[str, Any]]], names: set[str], vdom: str | None
+) -> list[Usage]:
+    """
+    Get the options in a configuration tree which reference an object.
+
+    Args:
+        nodes: The nodes of the configuration tree (see _get_nodes())
+        names: The names of the objects which may be referenced
+        vdom:  The VDOM of the configuration tree (None for the global configuration)
+
+    Returns:
+        The usages as (object name, VDOM, table, row id, field)
+    """
+    # names with spaces can not be found by splitting the values
+    spaced_names = [name for name in names if " " in name]
+    usages: list[Usage] = []
+    for path, node in nodes:
+        if not path:
+            continue
+
+        table, row_id = "/" + "/".join(path[:-1]), path[-1]
+        for field, value in node.items():
+            if not isinstance(value, str) or field == "id":
+                continue
+
+            referenced = names.intersection(value.split())
+            referenced.update(name for name in spaced_names if f" {name} " in f" {value} ")
+            referenced.discard(row_id)
+            usages.extend((name, vdom, table, row_id, field) for name in referenced)
+
+    return usages
+
+
+def _extract_file(
+    file: Path, cache: "FortiGateConfigCache | None" = None
+) -> tuple[str, list[Usage]] | None:
+    """
+    Parse a single FortiGate configuration file and extract its usages.
+
+    This private function is used for multiprocessing. It has to be defined at module level so
+    that it can be sent to the worker processes.
+
+    Args:
+        file:  The FortiGate configuration file
+        cache: The cache to load the parsed configuration from (if any)
+
+    Returns:
+        The hostname and the usages or None if the configuration file could not be parsed
+    """
+    try:
+        config = (
+            cache.parse_configuration_file(file)
+            if cache
+            else FortiGateConfig.parse_configuration_file(file)
+        )
+
+    except GeneralWarning as warn:
+        log.warning(warn.message)
+        return None
+
+    return config.info.hostname, extract_usages(config)
+
+
+class FortiGateConfigUsageIndex:
+    """
+    The FortiGateConfigUsageIndex class is an inverted index of the object usages of FortiGate
+    configuration files.
+
+    The index maps every object name to the options which reference it (see extract_usages()). It
+    is stored in a SQLite database, so a lookup takes milliseconds instead of parsing all the
+    configuration files again.
+
+    The index is updated incrementally. Every configuration file is indexed with its size, its
+    modification time and the hash of its content (and the parser version). Only the files which
+    changed since the last update are parsed again.
+    """
+
+    VERSION = 1
+
+    def __init__(self, index_file: Path | None = None) -> None:
+        """
+        Initialize the FortiGate configuration usage index and open its database.
+
+        Args:
+            index_file: The SQLite database file to store the index in. It is created if it does
+                        not exist. If None, the index is kept in memory only.
+        """
+        self.index_file = index_file.expanduser() if index_file else None
+        self._connection = sqlite3.connect(str(self.index_file) if self.index_file else ":memory:")
+        if self._connection.execute("PRAGMA user_version").fetchone()[0] != self.VERSION:
+            self._create()
+
+    def close(self) -> None:
+        """
+        Close the database of the index.
+        """
+        self._connection.close()
+
+    def update(
+        self,
+        configuration_files: Iterable[Path],
+        workers: int = 1,
+        cache: "FortiGateConfigCache | None" = None,
+    ) -> int:
+        """
+        Update the index with the configuration files which changed since the last update.
+
+        The index holds exactly the given configuration files afterwards. The entries of the indexed
+        configuration files which are not given anymore (e.g. because they have been removed or the
+        index is updated with another directory) are removed.
+
+        Args:
+            configuration_files: The filenames of the FortiGate configuration files
+            workers:             The number of processes to parse the configuration files with
+            cache:               Load the configurations from this cache if possible
+
+        Returns:
+            The number of configuration files which have been parsed
+        """
+        configuration_files = list(configuration_files)
+        changed, touched = self._get_changed(configuration_files)
+        files = [file for file, *_ in changed]
+        if workers > 1 and len(files) > 1:
+            log.debug("Index '%s' files with '%s' workers", len(files), workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                extracted = list(executor.map(_extract_file, files, repeat(cache)))
+
+        else:
+            extracted = [_extract_file(file, cache) for file in files]
+
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE files SET size = ?, mtime = ? WHERE file = ?", touched
+            )
+            for (_, name, *signature), file_usages in zip(changed, extracted):
+                self._remove(name)
+                # a file which can not be parsed is not indexed, so it is parsed again next time
+                if file_usages is not None:
+                    host, usages = file_usages
+                    self._connection.execute(
+                        "INSERT INTO files VALUES (?, ?, ?, ?, ?)",
+                        (name, *signature, host),
+                    )
+                    self._connection.executemany(
+                        "INSERT INTO usages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        ((name, host, *usage) for usage in usages),
+                    )
+
+            names = {str(file.resolve()) for file in configuration_files}
+            for (name,) in self._connection.execute("SELECT file FROM files").fetchall():
+                if name not in names:
+                    log.debug("Remove '%s' from usage index", name)
+                    self._remove(name)
+
+        log.debug("Indexed '%s' changed files", len(changed))
+        return len(changed)
+
+    def _get_changed(
+        self, configuration_files: Iterable[Path]
+    ) -> tuple[list[tuple[Path, str, int, int, str]], list[tuple[int, int, str]]]:
+        """
+        Get the configuration files which changed since they have been indexed.
+
+        A file with the same size and modification time is not read. A file with a new
+        modification time but the same content is not parsed again.
+
+        Args:
+            configuration_files: The filenames of the FortiGate configuration files
+
+        Returns:
+            The changed files as (filename, resolved filename, size, modification time, hash) and
+            the files with the same content as (size, modification time, resolved filename)
+        """
+        indexed = {
+            file: (size, mtime, digest)
+            for file, size, mtime, digest in self._connection.execute(
+                "SELECT file, size, mtime, digest FROM files"
+            )
+        }
+        changed: list[tuple[Path, str, int, int, str]] = []
+        touched: list[tuple[int, int, str]] = []
+        for file in configuration_files:
+            stat, name = file.stat(), str(file.resolve())
+            size, mtime, digest = indexed.get(name, (None, None, None))
+            if (size, mtime) != (stat.st_size, stat.st_mtime_ns):
+                if (new_digest := self._digest(file)) == digest:
+                    touched.append((stat.st_size, stat.st_mtime_ns, name))
+
+                else:
+                    changed.append((file, name, stat.st_size, stat.st_mtime_ns, new_digest))
+
+        return changed, touched
+
+    def lookup(self, name: str) -> list[ObjectUsage]:
+        """
+        Look up where an object is used.
+
+        Args:
+            name: The name of the object
+
+        Returns:
+            The usages of the object ordered by host, VDOM, table, row id and field
+        """
+        return [
+            ObjectUsage(*row)
+            for row in self._connection.execute(
+                "SELECT host, vdom, tbl, row_id, field FROM usages WHERE name = ? "
+                "ORDER BY host, vdom, tbl, row_id, field",
+                (name,),
+            )
+        ]
+
+    def _create(self) -> None:
+        """
+        Create the tables of the index (and drop the tables of an older version).
+        """
+        log.debug("Create usage index in '%s'", self.index_file or "memory")
+        with self._connection:
+            self._connection.executescript(f"""
+                DROP TABLE IF EXISTS files;
+                DROP TABLE IF EXISTS usages;
+                CREATE TABLE files (
+                    file TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, digest TEXT, host TEXT
+                );
+                CREATE TABLE usages (
+                    file TEXT, host TEXT, name TEXT, vdom TEXT, tbl TEXT, row_id TEXT, field TEXT
+                );
+                CREATE INDEX usages_name ON usages (name);
+                CREATE INDEX usages_file ON usages (file);
+                PRAGMA user_version = {self.VERSION};
+                """)
+
+    def _remove(self, file: str) -> None:
+        """
+        Remove a configuration file from the index.
+
+        Args:
+            file: The resolved filename of the configuration file
+        """
+        self._connection.execute("DELETE FROM usages WHERE file = ?", (file,))
+        self._connection.execute("DELETE FROM files WHERE file = ?", (file,))
+
+    @staticmethod
+    def _digest(configuration_file: Path) -> str:
+        """
+        Get the hash of a configuration file and the parser version.
+
+        Args:
+            configuration_file: The filename of the FortiGate configuration file
+
+        Returns:
+            The hash as hex string
+        """
+        digest = blake2b(configuration_file.read_bytes(), digest_size=20)
+        digest.update(FortiGateConfig.PARSER_VERSION.encode())
+        return digest.hexdigest()
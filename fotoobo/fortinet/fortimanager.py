@@ -764,6 +764,25 @@ class FortiManager(Fortinet):  # pylint: disable=too-many-public-methods
 
         return fmg_version
 
+    def is_idempotent(self, method: str, payload: dict[str, Any] | None = None) -> bool:
+        """
+        Check whether an API request may be sent more than once with the same effect.
+
+        All the JSON-RPC requests are HTTP POST requests, so only the JSON-RPC method 'get' is
+        idempotent.
+
+        Args:
+            method:  HTTP request method
+            payload: JSON body of the request
+
+        Returns:
+            True for the JSON-RPC method 'get' and the idempotent HTTP methods
+        """
+        if method.upper() == "POST":
+            return (payload or {}).get("method") == "get"
+
+        return super().is_idempotent(method, payload)
+
     def login(self) -> int:
         """
         Login to the FortiManager.
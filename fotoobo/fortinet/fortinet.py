@@ -3,20 +3,48 @@ This is the Fortinet abstract base class (ABC) which is used to define some glob
 variables and methods.
 """
 
+import asyncio
 import logging
+import random
+import ssl
 from abc import ABC, abstractmethod
-from time import time
+from collections import Counter
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import cache
+from pathlib import Path
+from time import sleep, time
 from typing import Any
 
 import requests
 import urllib3
 
-from fotoobo.exceptions import APIError, GeneralError
+from fotoobo.exceptions import APIConnectionError, APIError, GeneralError
+from fotoobo.fortinet.rate_limit import rate_limiter
+from fotoobo.helpers.files import _import_optional
 
 log = logging.getLogger("fotoobo")
 
+# optional package for the asynchronous API requests
+httpx = _import_optional("httpx")
 
-class Fortinet(ABC):
+# the HTTP status codes which are retried for every request as the device did not process it
+RETRY_STATUS_CODES = (429, 503)
+
+# the HTTP status codes which are only retried for idempotent requests
+RETRY_IDEMPOTENT_STATUS_CODES = (502, 504)
+
+# the connection errors (the reason of the APIConnectionError) which are retried for every request
+# as it has not been sent
+RETRY_CONNECTION_ERRORS = ("Connection timeout", "Connection refused")
+
+# the connection errors which are only retried for idempotent requests as the device may have
+# processed the request
+RETRY_IDEMPOTENT_CONNECTION_ERRORS = ("Read timeout", "Unknown connection error")
+
+
+class Fortinet(ABC):  # pylint: disable=too-many-instance-attributes
     """
     This is the Fortinet abstract base class. All other Fortinet product classes should inherit
     from this class. If there are methods which have to be defined in every subclass it has to be
@@ -28,6 +56,11 @@ class Fortinet(ABC):
     # subclass. Treat this setting as a constant which must not be redefined during runtime.
     ALLOWED_HTTP_METHODS = ["GET", "POST"]
 
+    # The HTTP methods which may be sent more than once with the same effect. They are retried on
+    # all the errors in the RETRY_* constants. Override is_idempotent() if the idempotency depends
+    # on the payload (e.g. with JSON-RPC).
+    IDEMPOTENT_HTTP_METHODS = ["GET", "HEAD", "OPTIONS", "PUT", "DELETE"]
+
     def __init__(self, hostname: str, **kwargs: Any) -> None:
         """
         Set some initial parameters for the Fortinet super class.
@@ -52,6 +85,22 @@ class Fortinet(ABC):
                 disable the warnings in urllib3. This prevents unwanted SSL warnings to be
                 logged.
             timeout: Connection timeout in seconds
+            group: The inventory group of the device
+                The fleet commands limit the number of devices of a group to query at the same
+                time with the setting 'fleet.groups'.
+            retries: The number of times to retry a failed API request (default: 0)
+                Only the requests which failed because of the connection or an overloaded device
+                are retried (see is_idempotent() and the RETRY_* constants).
+            retry_backoff: The base of the exponential backoff between the retries in seconds
+                The delay before the n-th retry is a random time between zero and
+                retry_backoff * 2^(n-1) seconds (default: 0.5). A delay in the header Retry-After
+                of the response is used instead.
+            retry_max_delay: The maximum delay before a retry in seconds (default: 30)
+            rate_limit: The maximum number of API requests per second to the host
+                All the Fortinet objects of the same host share one token bucket (see
+                fotoobo.fortinet.rate_limit). By default the requests are not limited.
+            rate_burst: The number of API requests which may be sent at once after an idle time
+                (default: 1)
         """
         self.api_url: str = ""
         self.hostname: str = hostname
@@ -60,16 +109,30 @@ class Fortinet(ABC):
         self.session.trust_env = False
         self.session.proxies: dict[str, Any] = {"http": None, "https": None}  # type: ignore
 
-        if proxy := kwargs.get("proxy", ""):
+        self.proxy: str = kwargs.get("proxy", "")
+        if proxy := self.proxy:
             self.session.proxies = {"http": f"{proxy}", "https": f"{proxy}"}
 
+        # the httpx client of the asynchronous API requests is created with the first request
+        self.async_client: Any = None
+
         self.ssl_verify: bool | str = kwargs.get("ssl_verify", True)
         if not self.ssl_verify:
             urllib3.disable_warnings(category=urllib3.exceptions.InsecureRequestWarning)
 
         self.timeout = kwargs.get("timeout", 3)
+        self.group: str = kwargs.get("group", "")
         self.type: str = ""
 
+        self.retries: int = kwargs.get("retries", 0)
+        self.retry_backoff: float = kwargs.get("retry_backoff", 0.5)
+        self.retry_max_delay: float = kwargs.get("retry_max_delay", 30.0)
+        # the number of retried API requests by their reason (e.g. "HTTP/503")
+        self.retry_metrics: Counter[str] = Counter()
+
+        self.rate_limit: float | None = kwargs.get("rate_limit")
+        self.rate_burst: int = kwargs.get("rate_burst", 1)
+
     def api(  # pylint: disable=too-many-arguments, too-many-positional-arguments
         self,
         method: str,
@@ -82,6 +145,48 @@ class Fortinet(ABC):
         """
         API request to a Fortinet device.
 
+        The request is retried up to 'retries' times if it failed because of the connection or an
+        overloaded device (see _retry_delay()). The error of a request which has been retried is
+        marked with retried=True, so the fleet tools do not retry it again (see
+        fotoobo.tools.fleet.is_retryable()).
+
+        Args:
+            method:     HTTP request method
+            url:        Rest API URL to request data from
+            headers:    Dictionary with headers (if needed)
+            params:     Dictionary with parameters (if needed)
+            payload:    JSON body for post requests (if needed)
+            timeout:    The requests read timeout
+
+        Returns:
+            Response from the request
+        """
+        attempt = 0
+        while True:
+            try:
+                return self._api_request(method, url, headers, params, payload, timeout)
+
+            except (APIError, APIConnectionError) as err:
+                delay = self._retry_delay(err, attempt, self.is_idempotent(method, payload))
+                if delay is None:
+                    err.retried = attempt > 0
+                    raise
+
+            attempt += 1
+            sleep(delay)
+
+    def _api_request(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None,
+        params: dict[str, str] | None,
+        payload: dict[str, Any] | None,
+        timeout: float | None,
+    ) -> requests.Response:
+        """
+        Send a single API request to a Fortinet device (see api()).
+
         Args:
             method:     HTTP request method
             url:        Rest API URL to request data from
@@ -95,13 +200,16 @@ class Fortinet(ABC):
         """
         full_url = f"{self.api_url}/{url.strip('/')}".strip("/")
         timeout = timeout or self.timeout
-        start = time()
 
         if method.upper() not in self.ALLOWED_HTTP_METHODS:
             error = f"HTTP method '{method.upper()}' is not implemented"
             log.error(error)
             raise NotImplementedError(error)
 
+        if self.rate_limit:
+            rate_limiter(self.hostname, self.https_port, self.rate_limit, self.rate_burst).acquire()
+
+        start = time()
         try:
             response: requests.Response = getattr(self.session, method.lower())(
                 full_url,
@@ -126,11 +234,12 @@ class Fortinet(ABC):
             except (AttributeError, IndexError):
                 pass
 
-            raise GeneralError(f"{error} ({self.hostname})") from err
+            raise APIConnectionError(f"{error} ({self.hostname})", error) from err
 
         except requests.exceptions.ConnectTimeout as err:
             log.debug(err)
-            raise GeneralError(f"Connection timeout ({self.hostname})") from err
+            error = "Connection timeout"
+            raise APIConnectionError(f"{error} ({self.hostname})", error) from err
 
         except requests.exceptions.ConnectionError as err:
             log.debug(err)
@@ -146,11 +255,12 @@ class Fortinet(ABC):
             except (IndexError, AttributeError, TypeError):
                 pass
 
-            raise GeneralError(f"{error} ({self.hostname})") from err
+            raise APIConnectionError(f"{error} ({self.hostname})", error) from err
 
         except requests.exceptions.ReadTimeout as err:
             log.error(err)
-            raise GeneralError(f"Read timeout ({self.hostname})") from err
+            error = "Read timeout"
+            raise APIConnectionError(f"{error} ({self.hostname})", error) from err
 
         log.debug(
             'Request time: [bold green]%2dms[/] "%s %s"',
@@ -168,6 +278,215 @@ class Fortinet(ABC):
 
         return response
 
+    async def api_async(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        method: str,
+        url: str = "",
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+        payload: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """
+        Asynchronous API request to a Fortinet device.
+
+        This is the same request as with api() but with the optional package 'httpx'. Use it to
+        query many devices concurrently in one thread with asyncio. The connection to the device is
+        reused until close_async() is called. The errors are mapped to the same exceptions and they
+        are retried the same way as in api().
+
+        Args:
+            method:     HTTP request method
+            url:        Rest API URL to request data from
+            headers:    Dictionary with headers (if needed)
+            params:     Dictionary with parameters (if needed)
+            payload:    JSON body for post requests (if needed)
+            timeout:    The requests read timeout
+
+        Returns:
+            Response from the request (a httpx.Response which has the same json(), text and
+            status_code as a requests.Response)
+
+        Raises:
+            GeneralError: If httpx is not installed or the request failed
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self._api_request_async(method, url, headers, params, payload, timeout)
+
+            except (APIError, APIConnectionError) as err:
+                delay = self._retry_delay(err, attempt, self.is_idempotent(method, payload))
+                if delay is None:
+                    err.retried = attempt > 0
+                    raise
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _api_request_async(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None,
+        params: dict[str, str] | None,
+        payload: dict[str, Any] | None,
+        timeout: float | None,
+    ) -> Any:
+        """
+        Send a single asynchronous API request to a Fortinet device (see api_async()).
+
+        Args:
+            method:     HTTP request method
+            url:        Rest API URL to request data from
+            headers:    Dictionary with headers (if needed)
+            params:     Dictionary with parameters (if needed)
+            payload:    JSON body for post requests (if needed)
+            timeout:    The requests read timeout
+
+        Returns:
+            Response from the request
+
+        Raises:
+            GeneralError: If httpx is not installed or the request failed
+        """
+        full_url = f"{self.api_url}/{url.strip('/')}".strip("/")
+        timeout = timeout or self.timeout
+
+        if method.upper() not in self.ALLOWED_HTTP_METHODS:
+            error = f"HTTP method '{method.upper()}' is not implemented"
+            log.error(error)
+            raise NotImplementedError(error)
+
+        if httpx is None:
+            raise GeneralError("The asynchronous API requests need the optional package 'httpx'")
+
+        if self.rate_limit:
+            limiter = rate_limiter(self.hostname, self.https_port, self.rate_limit, self.rate_burst)
+            await limiter.acquire_async()
+
+        start = time()
+        if self.async_client is None:
+            proxy = self.proxy
+            if proxy and "://" not in proxy:
+                proxy = f"http://{proxy}"
+
+            self.async_client = httpx.AsyncClient(
+                verify=_ssl_context(self.ssl_verify), proxy=proxy or None, trust_env=False
+            )
+
+        try:
+            response = await self.async_client.request(
+                method.upper(),
+                full_url,
+                headers=headers,
+                json=payload,
+                params=params,
+                timeout=timeout,
+            )
+
+        except httpx.ConnectTimeout as err:
+            log.debug(err)
+            error = "Connection timeout"
+            raise APIConnectionError(f"{error} ({self.hostname})", error) from err
+
+        except httpx.ConnectError as err:
+            log.debug(err)
+            error = _connection_error(err)
+            raise APIConnectionError(f"{error} ({self.hostname})", error) from err
+
+        except httpx.TimeoutException as err:
+            log.error(err)
+            error = "Read timeout"
+            raise APIConnectionError(f"{error} ({self.hostname})", error) from err
+
+        except httpx.TransportError as err:
+            log.debug(err)
+            error = "Unknown connection error"
+            raise APIConnectionError(f"{error} ({self.hostname})", error) from err
+
+        log.debug(
+            'Request time: [bold green]%2dms[/] "%s %s"',
+            ((time() - start) * 1000),
+            method.upper(),
+            full_url,
+        )
+
+        try:
+            response.raise_for_status()
+
+        except httpx.HTTPStatusError as err:
+            log.debug(err)
+            raise APIError(err) from err
+
+        return response
+
+    async def close_async(self) -> None:
+        """
+        Close the connection of the asynchronous API requests.
+
+        Call it in the same event loop as the requests (e.g. before asyncio.run() returns).
+        """
+        if self.async_client is not None:
+            await self.async_client.aclose()
+            self.async_client = None
+
+    def is_idempotent(
+        self, method: str, payload: dict[str, Any] | None = None  # pylint: disable=unused-argument
+    ) -> bool:
+        """
+        Check whether an API request may be sent more than once with the same effect.
+
+        A request which is not idempotent is only retried if it has not been processed by the
+        device (see RETRY_STATUS_CODES and RETRY_CONNECTION_ERRORS).
+
+        Args:
+            method:  HTTP request method
+            payload: JSON body of the request
+
+        Returns:
+            True if the HTTP method is in IDEMPOTENT_HTTP_METHODS
+        """
+        return method.upper() in self.IDEMPOTENT_HTTP_METHODS
+
+    def _retry_delay(
+        self, err: APIError | APIConnectionError, attempt: int, idempotent: bool
+    ) -> float | None:
+        """
+        Get the delay before the retry of a failed API request and count the retry.
+
+        The delay is a random time between zero and retry_backoff * 2^attempt seconds (exponential
+        backoff with full jitter, so that many clients which failed at the same time do not retry
+        at the same time). If the device gives the delay in the header Retry-After it is used
+        instead. The delay never exceeds retry_max_delay.
+
+        Args:
+            err:        The error of the failed request
+            attempt:    The number of retries so far
+            idempotent: Whether the request is idempotent (see is_idempotent())
+
+        Returns:
+            The delay in seconds or None if the request is not retried
+        """
+        if attempt >= self.retries or (reason := retry_reason(err, idempotent)) is None:
+            return None
+
+        delay = random.uniform(0, self.retry_backoff * 2**attempt)
+        if (after := retry_after(err)) is not None:
+            delay = after
+
+        delay = min(delay, self.retry_max_delay)
+        self.retry_metrics[reason] += 1
+        log.info(
+            "Retry %s of %s to '%s' in %.2fs after '%s'",
+            attempt + 1,
+            self.retries,
+            self.hostname,
+            delay,
+            reason,
+        )
+        return delay
+
     @staticmethod
     def get_vendor() -> str:
         """
@@ -183,3 +502,130 @@ class Fortinet(ABC):
         """
         Gets the version of the corresponding system(s)
         """
+
+
+@cache
+def _ssl_context(ssl_verify: bool | str) -> ssl.SSLContext:
+    """
+    Get the SSL context of the asynchronous API requests.
+
+    Creating an SSL context loads the CA certificates, which blocks the event loop for tens of
+    milliseconds. So all the devices with the same ssl_verify setting share one SSL context.
+
+    Args:
+        ssl_verify: Check the certificates with the CA certificates of requests (True), not at all
+                    (False) or with a CA bundle file or directory (like requests does it)
+
+    Returns:
+        The SSL context
+    """
+    if ssl_verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context
+
+    if isinstance(ssl_verify, str):
+        if Path(ssl_verify).is_dir():
+            return ssl.create_default_context(capath=ssl_verify)
+
+        return ssl.create_default_context(cafile=ssl_verify)
+
+    return ssl.create_default_context(cafile=requests.utils.DEFAULT_CA_BUNDLE_PATH)
+
+
+def retry_reason(err: APIError | APIConnectionError, idempotent: bool) -> str | None:
+    """
+    Get the reason to retry a failed API request.
+
+    Args:
+        err:        The error of the failed request
+        idempotent: Whether the request is idempotent
+
+    Returns:
+        The reason (e.g. "HTTP/503" or "Connection timeout") or None if it is not retried
+    """
+    if isinstance(err, APIError):
+        if err.code in RETRY_STATUS_CODES or (
+            idempotent and err.code in RETRY_IDEMPOTENT_STATUS_CODES
+        ):
+            return f"HTTP/{err.code}"
+
+        return None
+
+    if err.reason in RETRY_CONNECTION_ERRORS or (
+        idempotent and err.reason in RETRY_IDEMPOTENT_CONNECTION_ERRORS
+    ):
+        return err.reason
+
+    return None
+
+
+def retry_after(err: APIError | APIConnectionError) -> float | None:
+    """
+    Get the delay from the header Retry-After of the response of a failed API request.
+
+    Args:
+        err: The error of the failed request
+
+    Returns:
+        The delay in seconds or None if there is no valid header Retry-After
+    """
+    headers = getattr(getattr(err.__cause__, "response", None), "headers", None)
+    if not isinstance(headers, Mapping) or not (value := headers.get("Retry-After")):
+        return None
+
+    try:
+        return max(float(value), 0.0)
+
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _connection_error(err: BaseException) -> str:
+    """
+    Get the error description of a connection error of an asynchronous API request.
+
+    httpx gives the SSL and socket errors only as text or as the cause of its own error. So they
+    are searched in the chain of the error to describe them the same way as in Fortinet.api().
+
+    Args:
+        err: The connection error
+
+    Returns:
+        The error description
+    """
+    messages = []
+    cause: BaseException | None = err
+    while cause is not None:
+        if isinstance(cause, ConnectionRefusedError):
+            return "Connection refused"
+
+        messages.append(str(cause))
+        cause = cause.__cause__ or cause.__context__
+
+    message = " ".join(messages)
+    if "unable to get local issuer certificate" in message:
+        return "Unable to get local issuer certificate"
+
+    if "SSL" in message:
+        return "Unknown SSL error"
+
+    if "Name or service not known" in message:
+        return "Name or service not known"
+
+    if "Connection refused" in message:
+        return "Connection refused"
+
+    return "Unknown connection error"
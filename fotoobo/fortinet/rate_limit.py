@@ -0,0 +1,102 @@
+"""
+The token bucket rate limiter of the API requests to the Fortinet devices
+"""
+
+import asyncio
+import logging
+import threading
+from time import monotonic, sleep
+
+log = logging.getLogger("fotoobo")
+
+
+class TokenBucket:
+    """
+    The token bucket of a host
+
+    The bucket holds at most 'burst' tokens and is refilled with 'rate' tokens per second. Every
+    API request takes a token and waits until it is available. A request reserves its token even
+    if the bucket is empty (the tokens go negative) and then waits for its turn, so the waiting
+    requests are served in their order and the host gets exactly 'rate' requests per second
+    however many threads or coroutines are waiting. The reservation is locked, so the bucket may be
+    shared by the threads and the event loop.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initialize the token bucket with all its tokens.
+
+        Args:
+            rate:  The number of requests per second
+            burst: The number of requests which may be sent at once after an idle time
+        """
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = monotonic()
+        # the total time the requests waited for a token
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserve a token.
+
+        Returns:
+            The time in seconds to wait until the token is available
+        """
+        with self._lock:
+            now = monotonic()
+            self.tokens = min(self.tokens + (now - self.updated) * self.rate, self.burst) - 1
+            self.updated = now
+            delay = max(-self.tokens / self.rate, 0.0)
+            self.waited += delay
+
+        return delay
+
+    def acquire(self) -> None:
+        """
+        Take a token and wait until it is available.
+        """
+        if delay := self.reserve():
+            log.debug("Rate limit: wait %.3fs", delay)
+            sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """
+        Take a token and wait until it is available without blocking the event loop.
+        """
+        if delay := self.reserve():
+            log.debug("Rate limit: wait %.3fs", delay)
+            await asyncio.sleep(delay)
+
+
+# the token buckets of the hosts by hostname and port (see rate_limiter())
+_buckets: dict[tuple[str, int], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def rate_limiter(hostname: str, port: int, rate: float, burst: int = 1) -> TokenBucket:
+    """
+    Get the token bucket of a host.
+
+    All the Fortinet objects of the same host share its token bucket, so the limit holds for all of
+    them together (e.g. for the FortiGates which are queried through the same cluster IP). The
+    bucket keeps the settings it has been created with. The inventory gives all the devices of a
+    host the same settings (see Inventory._resolve_rate_limits()).
+
+    Args:
+        hostname: The hostname of the host
+        port:     The port of the host
+        rate:     The number of requests per second (if the bucket is created)
+        burst:    The number of requests which may be sent at once after an idle time (if the
+                  bucket is created)
+
+    Returns:
+        The token bucket of the host
+    """
+    with _buckets_lock:
+        if (bucket := _buckets.get((hostname, port))) is None:
+            bucket = _buckets[(hostname, port)] = TokenBucket(rate, burst)
+
+        return bucket
@@ -17,7 +17,7 @@ from fotoobo.helpers.files import load_yaml_file
 
 
 @dataclass(eq=False, order=False)
-class Config:
+class Config:  # pylint: disable=too-many-instance-attributes
     """
     This is the configuration dataclass for the global configuration options.
     First all the configuration options must be initialized.
@@ -31,6 +31,8 @@ class Config:
     no_logo: bool = False
     cli_info: dict[str, Any] = field(default_factory=dict)
     vault: dict[str, str] = field(default_factory=dict)
+    fgt_config_cache: dict[str, Any] = field(default_factory=dict)
+    fleet: dict[str, Any] = field(default_factory=dict)
 
     def load_configuration(  # pylint: disable=too-many-branches
         self, config_file: Path | None = None
@@ -120,5 +122,41 @@ class Config:
                     ):
                         raise GeneralError(f"Missing vault configuration: {missing}")
 
+                self.fgt_config_cache = loaded_config.get("fgt_config_cache", {}) or {}
+                if not isinstance(self.fgt_config_cache, dict):
+                    raise GeneralError("Setting fgt_config_cache has to be a dictionary")
+                if self.fgt_config_cache and not self.fgt_config_cache.get("directory", ""):
+                    raise GeneralError("Missing fgt_config_cache configuration: directory")
+
+                self.fleet = loaded_config.get("fleet", {}) or {}
+                self._validate_fleet()
+
+    def _validate_fleet(self) -> None:
+        """
+        Validate the settings of the section 'fleet'.
+
+        Raises:
+            GeneralError: If a setting is invalid
+        """
+        if not isinstance(self.fleet, dict):
+            raise GeneralError("Setting fleet has to be a dictionary")
+        if self.fleet.get("transport", "threads") not in ("threads", "asyncio"):
+            raise GeneralError("Setting fleet.transport has to be 'threads' or 'asyncio'")
+        workers = self.fleet.get("workers", 1)
+        if not isinstance(workers, int) or workers < 1:
+            raise GeneralError("Setting fleet.workers has to be a positive number")
+        groups = self.fleet.get("groups", {})
+        if not isinstance(groups, dict) or not all(
+            isinstance(workers, int) and workers > 0 for workers in groups.values()
+        ):
+            raise GeneralError("Setting fleet.groups has to be a dictionary of positive numbers")
+        for setting in ("timeout", "deadline", "backoff"):
+            value = self.fleet.get(setting, 1)
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                raise GeneralError(f"Setting fleet.{setting} has to be a positive number")
+        retries = self.fleet.get("retries", 0)
+        if isinstance(retries, bool) or not isinstance(retries, int) or retries < 0:
+            raise GeneralError("Setting fleet.retries has to be zero or a positive number")
+
 
 config = Config()
@@ -2,21 +2,119 @@
 Some helper functions for file manipulation.
 """
 
+import csv
+import gzip
+import importlib
+import io
 import json
 import logging
 import re
+from collections.abc import Mapping
 from ftplib import FTP, FTP_TLS
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import Any, cast, IO, Iterable, Iterator
 from zipfile import ZIP_DEFLATED, ZipFile
 
 import yaml
 
-from fotoobo.exceptions import GeneralError
+from fotoobo.exceptions import GeneralError, GeneralWarning
 
 log = logging.getLogger("fotoobo")
 
 
+def _import_optional(name: str) -> ModuleType | None:
+    """
+    Import an optional package.
+
+    Args:
+        name: The name of the package
+
+    Returns:
+        The package or None if it is not installed
+    """
+    try:
+        return importlib.import_module(name)
+
+    except ImportError:
+        return None
+
+
+# optional packages for faster json encoding, zstandard compression and parquet files
+orjson = _import_optional("orjson")
+zstd = _import_optional("zstandard")
+pyarrow = _import_optional("pyarrow")
+parquet = _import_optional("pyarrow.parquet")
+
+
+class FileText:
+    """
+    A text in a byte range of a file which is only read when it is used
+
+    Use it to keep big texts (e.g. certificates) out of memory. The text is read from the file
+    every time it is converted with str() and compares equal to the same text as str. The file must
+    not change as long as the text is used.
+    """
+
+    __slots__ = ("file", "start", "end", "signature")
+
+    def __init__(
+        self, file: Path, start: int, end: int, signature: tuple[int, int] | None = None
+    ) -> None:
+        """
+        Initialize the file text.
+
+        Args:
+            file:      The file with the text
+            start:     The byte offset of the text in the file
+            end:       The byte offset after the text in the file
+            signature: The size and modification time (in ns) of the file. If None, it is taken
+                       from the file.
+        """
+        self.file = file
+        self.start = start
+        self.end = end
+        if signature is None:
+            stat = file.stat()
+            signature = (stat.st_size, stat.st_mtime_ns)
+
+        self.signature = signature
+
+    def read(self) -> str:
+        """
+        Read the text from the file.
+
+        Returns:
+            The text
+
+        Raises:
+            GeneralWarning: If the file changed since the text was referenced
+        """
+        stat = self.file.stat()
+        if (stat.st_size, stat.st_mtime_ns) != self.signature:
+            raise GeneralWarning(f"File {self.file} has changed")
+
+        with self.file.open("rb") as in_file:
+            in_file.seek(self.start)
+            return in_file.read(self.end - self.start).decode("UTF-8")
+
+    def __str__(self) -> str:
+        return self.read()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (FileText, str)):
+            return str(self) == str(other)
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.file}, {self.start}, {self.end})"
+
+
 def create_dir(directory: Path) -> None:
     """
     Try to create a given directory if it does not exist.
@@ -119,6 +217,9 @@ def load_json_file(json_file: Path) -> list[Any] | dict[str, Any] | None:
     """
     Loads the content of a json file into a list or dict.
 
+    Files with the extension '.gz' or '.zst' are decompressed. If the orjson package is installed
+    it is used to decode the json data as it is much faster than the json module.
+
     Args:
         json_file: The path to the json file to load
 
@@ -127,12 +228,30 @@ def load_json_file(json_file: Path) -> list[Any] | dict[str, Any] | None:
     """
     content = None
     if json_file.is_file():
-        with json_file.open(encoding="UTF-8") as in_file:
-            content = json.load(in_file)
+        with _open_binary(json_file, "rb") as in_file:
+            content = _json_loads(in_file.read())
 
     return content
 
 
+def load_json_lines_file(json_file: Path) -> Iterator[Any]:
+    """
+    Loads the content of a json lines file (one json document per line) item by item.
+
+    Files with the extension '.gz' or '.zst' are decompressed.
+
+    Args:
+        json_file: The path to the json lines file to load
+
+    Yields:
+        The json data of every line
+    """
+    with _open_binary(json_file, "rb") as in_file:
+        for line in in_file:
+            if line.strip():
+                yield _json_loads(line)
+
+
 def load_yaml_file(yaml_file: Path) -> list[Any] | dict[str, Any] | None:
     """
     Loads the content of a yaml file into a list or dict.
@@ -150,21 +269,58 @@ def load_yaml_file(yaml_file: Path) -> list[Any] | dict[str, Any] | None:
     return content
 
 
-def save_json_file(json_file: Path, data: list[Any] | dict[Any, Any]) -> bool:
+def save_csv_file(csv_file: Path, header: Iterable[str], rows: Iterable[Iterable[Any]]) -> int:
+    """
+    Saves rows to a csv file.
+
+    The rows are written one after another, so they do not have to be in memory at the same time
+    (e.g. when they are generated). None is written as empty field. Files with the extension '.gz'
+    (gzip) or '.zst' (zstandard) are compressed.
+
+    Args:
+        csv_file: The file to write the rows into
+        header:   The column names
+        rows:     The rows to save
+
+    Returns:
+        The number of rows saved (without the header)
+    """
+    count = 0
+    with io.TextIOWrapper(_open_binary(csv_file, "wb"), encoding="UTF-8", newline="") as out_file:
+        writer = csv.writer(out_file)
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+
+    return count
+
+
+def save_json_file(
+    json_file: Path, data: list[Any] | dict[Any, Any], compact: bool = False
+) -> bool:
     """
     Saves the content of a list or dict to a json file.
 
+    Files with the extension '.gz' (gzip) or '.zst' (zstandard) are compressed.
+
     Args:
         json_file: The file to write the data into
         data:      The data to save
+        compact:   Save the data without indentation. If the orjson package is installed it is
+                   used to encode the json data as it is much faster than the json module.
 
     Returns:
         True if data was valid
     """
     status = True
     if isinstance(data, (list, dict)):
-        with json_file.open("w", encoding="UTF-8") as out_file:
-            json.dump(data, out_file, indent=4)
+        with _open_binary(json_file, "wb") as out_file:
+            out_file.write(
+                _json_dumps(data)
+                if compact
+                else json.dumps(data, indent=4, default=_json_default).encode("UTF-8")
+            )
 
     else:
         status = False
@@ -172,6 +328,72 @@ def save_json_file(json_file: Path, data: list[Any] | dict[Any, Any]) -> bool:
     return status
 
 
+def save_json_lines_file(json_file: Path, items: Iterable[Any]) -> int:
+    """
+    Saves items to a json lines file (one compact json document per line).
+
+    The items are written one after another, so they do not have to be in memory at the same
+    time (e.g. when they are generated). Files with the extension '.gz' (gzip) or '.zst'
+    (zstandard) are compressed.
+
+    Args:
+        json_file: The file to write the items into
+        items:     The items to save
+
+    Returns:
+        The number of items saved
+    """
+    count = 0
+    with _open_binary(json_file, "wb") as out_file:
+        for item in items:
+            out_file.write(_json_dumps(item) + b"\n")
+            count += 1
+
+    return count
+
+
+def save_parquet_file(
+    parquet_file: Path, columns: list[str], rows: Iterable[Iterable[Any]], batch_size: int = 10000
+) -> int:
+    """
+    Saves rows to a parquet file with a text column for every column name.
+
+    The rows are converted to columns and written in batches, so only one batch has to be in
+    memory at the same time. The values are saved as text and None as null. This needs the
+    optional package 'pyarrow'.
+
+    Args:
+        parquet_file: The file to write the rows into
+        columns:      The column names
+        rows:         The rows to save
+        batch_size:   The number of rows to write at once (one row group per batch)
+
+    Returns:
+        The number of rows saved
+
+    Raises:
+        GeneralError: If pyarrow is not installed
+    """
+    if pyarrow is None or parquet is None:
+        raise GeneralError(f"Install the package 'pyarrow' to save {parquet_file}")
+
+    count = 0
+    schema = pyarrow.schema([(column, pyarrow.string()) for column in columns])
+    rows = iter(rows)
+    with parquet.ParquetWriter(str(parquet_file), schema) as writer:
+        while batch := list(islice(rows, batch_size)):
+            values = [[None if value is None else str(value) for value in row] for row in batch]
+            writer.write_batch(
+                pyarrow.RecordBatch.from_arrays(
+                    [pyarrow.array(column, pyarrow.string()) for column in zip(*values)],
+                    schema=schema,
+                )
+            )
+            count += len(batch)
+
+    return count
+
+
 def save_txt_file(file: Path, data: str) -> bool:
     """
     Saves the content of any data object to a text file.
@@ -210,3 +432,89 @@ def save_yaml_file(yaml_file: Path, data: list[Any] | dict[str, Any]) -> bool:
         status = False
 
     return status
+
+
+def _open_binary(file: Path, mode: str) -> IO[bytes]:
+    """
+    Open a file in binary mode and (de)compress it depending on its extension.
+
+    Args:
+        file: The file to open
+        mode: The mode to open the file with ("rb" or "wb")
+
+    Returns:
+        The file object
+
+    Raises:
+        GeneralError: If a zstandard compressed file is opened and zstandard is not installed
+    """
+    if file.suffix == ".gz":
+        # json data is very repetitive, so the fastest level compresses almost as good as the best
+        return cast(IO[bytes], gzip.open(file, mode, compresslevel=1))
+
+    if file.suffix == ".zst":
+        if zstd is None:
+            raise GeneralError(f"Install the package 'zstandard' to open {file}")
+
+        return cast(IO[bytes], zstd.open(file, mode))
+
+    return file.open(mode)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """
+    Encode data to compact json.
+
+    Args:
+        data: The data to encode
+
+    Returns:
+        The json data
+    """
+    if orjson is not None:
+        return cast(
+            bytes, orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        )
+
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode("UTF-8")
+
+
+def _json_default(data: Any) -> Any:
+    """
+    Convert data which is not json serializable by default.
+
+    Mappings which are no dict (e.g. compact or lazy FortiGate configurations) are encoded as
+    json objects and file texts as strings.
+
+    Args:
+        data: The data to convert
+
+    Returns:
+        The json serializable data
+
+    Raises:
+        TypeError: If the data can not be converted
+    """
+    if isinstance(data, Mapping):
+        return dict(data)
+
+    if isinstance(data, FileText):
+        return str(data)
+
+    raise TypeError(f"Object of type {type(data).__name__} is not JSON serializable")
+
+
+def _json_loads(data: bytes) -> Any:
+    """
+    Decode json data.
+
+    Args:
+        data: The json data
+
+    Returns:
+        The decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
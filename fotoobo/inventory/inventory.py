@@ -13,6 +13,7 @@ from fotoobo.fortinet.forticlientems import FortiClientEMS
 from fotoobo.fortinet.forticloudasset import FortiCloudAsset
 from fotoobo.fortinet.fortigate import FortiGate
 from fotoobo.fortinet.fortimanager import FortiManager
+from fotoobo.fortinet.fortinet import Fortinet
 from fotoobo.helpers.config import config
 from fotoobo.helpers.files import load_yaml_file
 from fotoobo.helpers.vault import Client
@@ -54,6 +55,9 @@ class Inventory:
             self._load_data_from_vault(config.vault)
             self._replace_with_vault_data()
 
+        # Give all the devices of the same host the same rate limit settings
+        self._resolve_rate_limits()
+
         # Create object for FortiGates
         self.fortigates = {
             name: asset for (name, asset) in self.assets.items() if isinstance(asset, FortiGate)
@@ -224,6 +228,38 @@ class Inventory:
                         except KeyError:
                             log.warning("Vault attribute '%s.%s' not found", name, attribute)
 
+    def _resolve_rate_limits(self) -> None:
+        """
+        Resolve the rate limit settings of the devices which share a host.
+
+        All the devices with the same hostname and port share the token bucket of the host (see
+        fotoobo.fortinet.rate_limit). If they have different settings the strictest ones (the lowest
+        rate_limit and rate_burst) are used for all of them and a warning is logged once per host.
+        """
+        hosts: dict[tuple[str, int], list[Fortinet]] = {}
+        for asset in self.assets.values():
+            if isinstance(asset, Fortinet):
+                hosts.setdefault((asset.hostname, asset.https_port), []).append(asset)
+
+        for (hostname, port), devices in hosts.items():
+            settings = {(device.rate_limit, device.rate_burst) for device in devices}
+            limited = {(rate, burst) for rate, burst in settings if rate}
+            if len(settings) == 1 or not limited:
+                continue
+
+            rate_limit = min(rate for rate, _ in limited)
+            rate_burst = min(burst for _, burst in limited)
+            log.warning(
+                "Different rate limits for '%s:%s', use %s/s (burst %s) for all its devices",
+                hostname,
+                port,
+                rate_limit,
+                rate_burst,
+            )
+            for device in devices:
+                device.rate_limit = rate_limit
+                device.rate_burst = rate_burst
+
     def _set_globals(self, data: dict[str, Any]) -> None:
         """
         Set some defaults for device types
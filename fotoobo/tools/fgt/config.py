@@ -3,15 +3,30 @@ FortiGate configuration check utility
 """
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import typer
+from rich.markup import escape
 
 from fotoobo.exceptions import GeneralError, GeneralWarning
 from fotoobo.fortinet.fortigate_config import FortiGateConfig
-from fotoobo.fortinet.fortigate_config_check import FortiGateConfigCheck
+from fotoobo.fortinet.fortigate_config_cache import FortiGateConfigCache
+from fotoobo.fortinet.fortigate_config_check import CheckBundle, CheckFailure
+from fotoobo.fortinet.fortigate_config_check_state import FortiGateConfigCheckState
+from fotoobo.fortinet.fortigate_config_diff import FortiGateConfigDiff
+from fotoobo.fortinet.fortigate_config_finding import save_findings
+from fotoobo.fortinet.fortigate_config_fleet_check import (
+    FleetCheckResult,
+    FortiGateConfigFleetCheck,
+)
+from fotoobo.fortinet.fortigate_config_profile import ParseProfile
+from fotoobo.fortinet.fortigate_config_query import ConfigPredicate, query_configurations
+from fotoobo.fortinet.fortigate_config_usage import FortiGateConfigUsageIndex, ObjectUsage
 from fotoobo.fortinet.fortigate_info import FortiGateInfo
+from fotoobo.helpers.config import config as fotoobo_config
 from fotoobo.helpers.files import load_yaml_file
 from fotoobo.helpers.result import Result
 
@@ -19,14 +34,40 @@ app = typer.Typer(no_args_is_help=True, rich_markup_mode="rich")
 log = logging.getLogger("fotoobo")
 
 
-def check(config: Path, bundles: Path) -> Result[list[str]]:
+def check(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    config: Path,
+    bundles: Path,
+    workers: int = 1,
+    state_file: Path | None = None,
+    findings_file: Path | None = None,
+    profiles: list[ParseProfile] | None = None,
+) -> Result[dict[str, int | str]]:
     """
     The FortiGate configuration check
 
+    The values to check are extracted from every configuration file and then every check is
+    evaluated over the values of all the files at once (see FortiGateConfigFleetCheck). Besides the
+    messages the result holds the number of failures for every host and check.
+
+    If a state file is given the check is incremental. The results of every configuration file are
+    stored in the state file and only the configuration files which changed since the last run (or
+    all of them if the check bundle changed) are parsed and checked again. The results of the
+    unchanged configuration files are replayed from the state.
+
+    If a findings file is given every failed check is also saved as a structured finding (host,
+    check, type, scope, path, key, expected, actual, VDOM) to it (see save_findings()).
+
+    If a list of profiles is given the configuration files are parsed with profiling (and without
+    the cache) and the profile of every parsed file is appended to it.
+
     Args:
-        config:  The configuration to check (either a file or directory)
-                 in case it's a directory all .conf files in it will be checked.
-        bundles: The check bundle to check the configuration against
+        config:        The configuration to check (either a file or directory)
+                       in case it's a directory all .conf files in it will be checked.
+        bundles:       The check bundle to check the configuration against
+        workers:       The number of processes to parse and check the configuration files with
+        state_file:    The file to store the check results in for incremental checks
+        findings_file: The file to save the findings in (.csv, .jsonl, .ndjson or .parquet)
+        profiles:      The list to append the parse profiles to (default: do not profile)
 
     Raises:
         GeneralWarning: GeneralWarning
@@ -40,7 +81,7 @@ def check(config: Path, bundles: Path) -> Result[list[str]]:
 
     elif config.is_dir():
         log.debug("Given config is a directory")
-        files = [file for file in config.iterdir() if file.suffix == ".conf"]
+        files = sorted(file for file in config.iterdir() if file.suffix == ".conf")
 
     else:
         log.error("No valid configuration file")
@@ -51,45 +92,200 @@ def check(config: Path, bundles: Path) -> Result[list[str]]:
 
     bundles = Path(bundles)
     if bundles.is_file():
-        checks = load_yaml_file(bundles)
+        # validate the checks only once for all the configuration files
+        bundle = CheckBundle.compile(load_yaml_file(bundles))
 
     else:
         log.error("No valid bundle file")
         raise GeneralError("No valid bundle file")
 
-    total_results: int = 0
-    result = Result[list[str]]()
+    # the results are in the order of the files so that the result is deterministic
+    hosts_results = [
+        file_result
+        for file_result in (
+            _check_files_incremental(files, bundles, bundle, workers, state_file, profiles)
+            if state_file
+            else _check_files(files, bundle, workers, profiles)
+        )
+        if file_result is not None
+    ]
+    fleet_result = FleetCheckResult(
+        [host for host, _ in hosts_results],
+        bundle.checks,
+        [failures for _, failures in hosts_results],
+    )
+    if findings_file:
+        save_findings(findings_file, fleet_result.findings())
+
+    result = fleet_result.to_result()
+    # the invalid checks are not part of the bundle, so report them instead of dropping them
+    for error in bundle.errors:
+        result.push_message("fotoobo", f"Invalid check: {error}", level="error")
+
+    for host, failures in zip(fleet_result.hosts, fleet_result.matrix):
+        log.info("All checks for '%s' done with '%s' messages", host, sum(filter(None, failures)))
+
+    total_results = sum(sum(filter(None, failures)) for failures in fleet_result.matrix)
+    log.info("All checks done with '%s' messages", total_results)
 
-    for file in files:
-        try:
-            fortigate_config = FortiGateConfig.parse_configuration_file(file)
-            conf_check = FortiGateConfigCheck(fortigate_config, checks, result)
+    if total_results == 0:
+        result.push_message("fotoobo", "There were no errors in the configuration file(s)")
 
-        except GeneralWarning as warn:
-            log.warning(warn.message)
-            continue
+    return result
 
-        conf_check.execute_checks()
 
-        num_results = len(result.get_messages(fortigate_config.info.hostname))
-        log.info("All checks in '%s' done with '%s' messages", file.name, num_results)
-        total_results += num_results
+def _check_files_incremental(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    files: list[Path],
+    bundle_file: Path,
+    bundle: CheckBundle,
+    workers: int,
+    state_file: Path,
+    profiles: list[ParseProfile] | None = None,
+) -> list[tuple[str, list[list[CheckFailure] | None]] | None]:
+    """
+    Parse and check the FortiGate configuration files which are not in the state.
 
-    log.info("All checks done with '%s' messages", total_results)
+    Args:
+        files:       The FortiGate configuration files to check
+        bundle_file: The check bundle file
+        bundle:      The compiled check bundle
+        workers:     The number of processes to parse the configuration files with
+        state_file:  The file to store the check results in
+        profiles:    The list to append the parse profiles of the changed files to (if any)
 
-    if total_results == 0:
-        result.push_message("fotoobo", "There were no errors in the configuration file(s)")
+    Returns:
+        The hostname and the failures for every check (None if the check does not apply) for
+        every configuration file or None if the configuration file could not be parsed
+    """
+    state = FortiGateConfigCheckState(state_file)
+    keys = [FortiGateConfigCheckState.key(file, bundle_file) for file in files]
+    file_results = [state.get(key) for key in keys]
+    changed_files = [file for file, file_result in zip(files, file_results) if file_result is None]
+    log.debug("Check '%s' changed of '%s' files", len(changed_files), len(files))
+    checked_results = iter(_check_files(changed_files, bundle, workers, profiles))
+    file_results = [file_result or next(checked_results) for file_result in file_results]
+    for key, file_result in zip(keys, file_results):
+        if file_result is not None:
+            state.put(key, *file_result)
+
+    state.save()
+    return file_results
+
+
+def _check_files(
+    files: list[Path],
+    bundle: CheckBundle,
+    workers: int,
+    profiles: list[ParseProfile] | None = None,
+) -> list[tuple[str, list[list[CheckFailure] | None]] | None]:
+    """
+    Parse and check FortiGate configuration files.
 
-    return result
+    Args:
+        files:    The FortiGate configuration files to check
+        bundle:   The compiled check bundle
+        workers:  The number of processes to parse the configuration files with
+        profiles: The list to append the parse profiles to (if any)
+
+    Returns:
+        The hostname and the failures for every check (None if the check does not apply) for
+        every configuration file or None if the configuration file could not be parsed
+    """
+    if not files:
+        return []
+
+    # a cached configuration is not parsed, so there would be nothing to profile
+    profile = profiles is not None
+    cache = None if profile else _get_cache()
+    if workers > 1:
+        log.debug("Check '%s' files with '%s' workers", len(files), workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            file_values = list(
+                executor.map(_extract_file, files, repeat(bundle), repeat(cache), repeat(profile))
+            )
+
+    else:
+        file_values = [_extract_file(file, bundle, cache, profile) for file in files]
+
+    fleet_check = FortiGateConfigFleetCheck(bundle)
+    for values in file_values:
+        if values is not None:
+            host, host_values, parse_profile = values
+            fleet_check.add_values(host, host_values)
+            if profiles is not None and parse_profile is not None:
+                profiles.append(parse_profile)
+
+    fleet_result = fleet_check.evaluate()
+    failures = iter(fleet_result.failures)
+    return [None if values is None else (values[0], next(failures)) for values in file_values]
+
+
+def _extract_file(
+    file: Path,
+    bundle: CheckBundle,
+    cache: FortiGateConfigCache | None = None,
+    profile: bool = False,
+) -> tuple[str, list[list[tuple[str | None, Any]] | None], ParseProfile | None] | None:
+    """
+    Parse a single FortiGate configuration file and extract the values to check from it.
+
+    This private function is used for multiprocessing. It has to be defined at module level so
+    that it can be sent to the worker processes.
+
+    Args:
+        file:    The FortiGate configuration file to check
+        bundle:  The compiled check bundle
+        cache:   The cache to load the parsed configuration from (if any)
+        profile: Record the parse profile
+
+    Returns:
+        The hostname of the FortiGate, the values to check and the parse profile (if any) or None
+        if the configuration file could not be parsed
+    """
+    try:
+        fortigate_config = (
+            cache.parse_configuration_file(file)
+            if cache
+            else FortiGateConfig.parse_configuration_file(file, profile=profile)
+        )
 
+    except GeneralWarning as warn:
+        log.warning(warn.message)
+        return None
 
-def get(config: Path, scope: str = "", path: str = "") -> Result[FortiGateInfo]:
+    return (
+        fortigate_config.info.hostname,
+        FortiGateConfigFleetCheck.extract(bundle, fortigate_config),
+        fortigate_config.profile,
+    )
+
+
+def _get_cache() -> FortiGateConfigCache | None:
+    """
+    Get the FortiGate configuration cache if it is configured in the fotoobo configuration.
+
+    Returns:
+        The FortiGate configuration cache or None if there is no cache configured
+    """
+    if not fotoobo_config.fgt_config_cache:
+        return None
+
+    return FortiGateConfigCache(
+        Path(fotoobo_config.fgt_config_cache["directory"]),
+        int(fotoobo_config.fgt_config_cache.get("max_size", 500)),
+    )
+
+
+def get(config: Path, scope: str = "", path: str = "", workers: int = 1) -> Result[FortiGateInfo]:
     """
     The FortiGate get configuration utility.
 
     Args:
-        config: The configuration to get the information from (either a file or directory)
-                In case it's a directory all .conf files in it will be checked.
+        config:  The configuration to get the information from (either a file or directory)
+                 In case it's a directory all .conf files in it will be checked.
+        scope:   The configuration scope (global|vdom)
+        path:    The configuration path
+        workers: The number of processes to parse the configuration files with
 
     Returns:
         Configuration as result object
@@ -111,21 +307,31 @@ def get(config: Path, scope: str = "", path: str = "") -> Result[FortiGateInfo]:
 
     result = Result[Any]()
 
-    for file in files:
-        conf = FortiGateConfig.parse_configuration_file(file)
+    # without a cache only the requested part of the configurations is parsed
+    configs = FortiGateConfig.parse_configuration_files(
+        files, workers, processes=True, cache=_get_cache(), scope=scope, path=path
+    )
+    for conf in configs.values():
         output = conf.get_configuration(scope, path)
         result.push_result(conf.info.hostname, output)
 
     return result
 
 
-def info(config: Path) -> Result[FortiGateInfo]:
+def info(
+    config: Path, workers: int = 1, profiles: list[ParseProfile] | None = None
+) -> Result[FortiGateInfo]:
     """
     The FortiGate configuration information utility.
 
+    If a list of profiles is given the whole configuration files are parsed with profiling (and
+    without the cache) and the profile of every file is appended to it.
+
     Args:
-        config: The configuration to get the information from (either a file or directory)
-                In case it's a directory all .conf files in it will be checked.
+        config:   The configuration to get the information from (either a file or directory)
+                  In case it's a directory all .conf files in it will be checked.
+        workers:  The number of processes to parse the configuration files with
+        profiles: The list to append the parse profiles to (default: do not profile)
 
     Returns:
         FortiGate information as result object
@@ -147,8 +353,251 @@ def info(config: Path) -> Result[FortiGateInfo]:
 
     result = Result[FortiGateInfo]()
 
-    for file in files:
-        conf = FortiGateConfig.parse_configuration_file(file)
+    if profiles is not None:
+        configs = FortiGateConfig.parse_configuration_files(
+            files, workers, processes=True, profile=True
+        )
+        profiles.extend(conf.profile for conf in configs.values() if conf.profile)
+
+    else:
+        # the information is in the global configuration, so the VDOMs are never parsed
+        configs = FortiGateConfig.parse_configuration_files(
+            files, workers, processes=True, cache=_get_cache(), lazy=True
+        )
+
+    for conf in configs.values():
         result.push_result(conf.info.hostname, conf.info)
 
     return result
+
+
+def diff(old: Path, new: Path, scope: str = "", path: str = "/") -> Result[FortiGateConfigDiff]:
+    """
+    The FortiGate configuration diff utility.
+
+    Args:
+        old:   The old FortiGate configuration file
+        new:   The new FortiGate configuration file
+        scope: Only compare the configuration in this scope (global|vdom). If empty, both scopes
+               are compared.
+        path:  Only compare the configuration at this path in the scope
+
+    Returns:
+        The differences as result object and as messages (one message per difference)
+
+    Raises:
+        GeneralWarning: GeneralWarning
+    """
+    for file in (old, new):
+        if not file.is_file():
+            log.warning("There is no configuration file '%s'", file)
+            raise GeneralWarning(f"There is no configuration file '{file}'")
+
+    # without a cache only the requested part of the configurations is parsed
+    cache = _get_cache()
+    old_config, new_config = (
+        (
+            cache.parse_configuration_file(file)
+            if cache
+            else FortiGateConfig.parse_configuration_file(file, scope or None, path)
+        )
+        for file in (old, new)
+    )
+
+    config_diff = old_config.diff(new_config, scope, path)
+    result = Result[FortiGateConfigDiff]()
+    host = new_config.info.hostname
+    for line in config_diff.lines():
+        result.push_message(host, escape(line))
+
+    if not config_diff:
+        result.push_message(host, "There are no differences in the configuration files")
+
+    result.push_result(host, config_diff)
+    return result
+
+
+def query(
+    config: Path, scope: str, path: str, predicate: str = "", workers: int = 1
+) -> Iterator[tuple[str, str, Any]]:
+    """
+    The FortiGate configuration query utility.
+
+    The configuration files are parsed (or loaded from the cache) on a process pool and queried
+    in the worker processes, so only the matching values are sent back. The matches are streamed
+    in the order of the files as soon as the file is queried.
+
+    Args:
+        config:    The configuration to query (either a file or directory)
+                   In case it's a directory all .conf files in it will be queried.
+        scope:     The configuration scope (global|vdom)
+        path:      The configuration path with wildcards (see FortiGateConfig.query_configuration())
+        predicate: The predicate the matching values have to fulfill (see ConfigPredicate). If
+                   empty, all the values at the path match.
+        workers:   The number of processes to parse and query the configuration files with
+
+    Returns:
+        An iterator over the hostname, the path and the value of every match
+
+    Raises:
+        GeneralWarning: GeneralWarning
+    """
+    files: list[Path] = []
+    if config.is_file():
+        files.append(config)
+
+    elif config.is_dir():
+        log.debug("Given config is a directory")
+        files = sorted(
+            file for file in config.iterdir() if file.is_file() and file.suffix == ".conf"
+        )
+
+    if not files:
+        log.warning("There are no configuration files")
+        raise GeneralWarning("There are no configuration files")
+
+    # parse the predicate before the first file so that an invalid predicate fails early
+    config_predicate = ConfigPredicate.parse(predicate) if predicate else None
+    return _query_files(files, scope, path, config_predicate, workers)
+
+
+def _query_files(
+    files: list[Path],
+    scope: str,
+    path: str,
+    predicate: ConfigPredicate | None,
+    workers: int,
+) -> Iterator[tuple[str, str, Any]]:
+    """
+    Query FortiGate configuration files one after another or on a process pool.
+
+    Args:
+        files:     The FortiGate configuration files to query
+        scope:     The configuration scope (global|vdom)
+        path:      The configuration path with wildcards
+        predicate: The predicate the matching values have to fulfill
+        workers:   The number of processes to parse and query the configuration files with
+
+    Yields:
+        The hostname, the path and the value of every match
+    """
+    cache = _get_cache()
+    if workers > 1:
+        log.debug("Query '%s' files with '%s' workers", len(files), workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from (
+                row
+                for rows in executor.map(
+                    _query_file,
+                    files,
+                    repeat(scope),
+                    repeat(path),
+                    repeat(predicate),
+                    repeat(cache),
+                )
+                for row in rows
+            )
+
+    else:
+        for file in files:
+            yield from _query_file(file, scope, path, predicate, cache)
+
+
+def _query_file(
+    file: Path,
+    scope: str,
+    path: str,
+    predicate: ConfigPredicate | None,
+    cache: FortiGateConfigCache | None = None,
+) -> list[tuple[str, str, Any]]:
+    """
+    Parse a single FortiGate configuration file and query it.
+
+    This private function is used for multiprocessing. It has to be defined at module level so
+    that it can be sent to the worker processes.
+
+    Args:
+        file:      The FortiGate configuration file to query
+        scope:     The configuration scope (global|vdom)
+        path:      The configuration path with wildcards
+        predicate: The predicate the matching values have to fulfill
+        cache:     The cache to load the parsed configuration from (if any)
+
+    Returns:
+        The hostname, the path and the value of every match or an empty list if the configuration
+        file could not be parsed
+    """
+    # without a cache only the part of the configuration up to the first wildcard is parsed
+    path_list = [part for part in path.strip("/").split("/") if part]
+    prefix = "/" + "/".join(path_list[: path_list.index("*")] if "*" in path_list else path_list)
+    try:
+        fortigate_config = (
+            cache.parse_configuration_file(file)
+            if cache
+            else FortiGateConfig.parse_configuration_file(file, scope, prefix)
+        )
+
+    except GeneralWarning as warn:
+        log.warning(warn.message)
+        return []
+
+    return query_configurations(fortigate_config, scope, path, predicate)
+
+
+def usage(
+    config: Path, name: str, index_file: Path | None = None, workers: int = 1
+) -> Result[list[ObjectUsage]]:
+    """
+    The FortiGate configuration object usage utility.
+
+    The usages of the objects of all the configuration files are stored in an index (see
+    FortiGateConfigUsageIndex). If an index file is given, the index is kept and only the
+    configuration files which changed since the last run are parsed again.
+
+    Args:
+        config:     The configuration to search (either a file or directory)
+                    In case it's a directory all .conf files in it will be searched.
+        name:       The name of the object (e.g. a firewall address)
+        index_file: The file to store the index in. If None, the index is built in memory.
+        workers:    The number of processes to parse the configuration files with
+
+    Returns:
+        The usages of the object for every host as result object
+
+    Raises:
+        GeneralWarning: GeneralWarning
+    """
+    files: list[Path] = []
+    if config.is_file():
+        files.append(config)
+
+    elif config.is_dir():
+        log.debug("Given config is a directory")
+        files = sorted(
+            file for file in config.iterdir() if file.is_file() and file.suffix == ".conf"
+        )
+
+    if not files:
+        log.warning("There are no configuration files")
+        raise GeneralWarning("There are no configuration files")
+
+    index = FortiGateConfigUsageIndex(index_file)
+    try:
+        index.update(files, workers, _get_cache())
+        usages = index.lookup(name)
+
+    finally:
+        index.close()
+
+    hosts_usages: dict[str, list[ObjectUsage]] = {}
+    for object_usage in usages:
+        hosts_usages.setdefault(object_usage.host, []).append(object_usage)
+
+    result = Result[list[ObjectUsage]]()
+    for host, host_usages in hosts_usages.items():
+        result.push_result(host, host_usages)
+
+    if not usages:
+        result.push_message("fotoobo", f"Object '{escape(name)}' is not used")
+
+    return result
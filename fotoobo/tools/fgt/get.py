@@ -2,72 +2,91 @@
 FortiGate get version utility
 """
 
-import concurrent.futures
+import asyncio
 import logging
 
-from rich.progress import Progress
-
-from fotoobo.exceptions import GeneralError, GeneralWarning
 from fotoobo.fortinet.fortigate import FortiGate
 from fotoobo.helpers.config import config
 from fotoobo.helpers.result import Result
 from fotoobo.inventory import Inventory
+from fotoobo.tools.fleet import FleetError, FleetRunner
 
 log = logging.getLogger("fotoobo")
 
 
-def version(host: str | None = None) -> Result[str]:
+def version(host: str | None = None, workers: int | None = None) -> Result[str]:
     """
     FortiGate get version.
 
-    Get the version(s) of one ore more FortiGates.
+    Get the version(s) of one ore more FortiGates. With the setting 'fleet.transport: asyncio' the
+    FortiGates are queried with asynchronous API requests in one thread (needs the optional package
+    'httpx'), otherwise on a thread pool.
 
     Args:
-        host: The host from the inventory to get the version. If you omit host, it will run over
-              all FortiGates in the inventory.
+        host:    The host from the inventory to get the version. If you omit host, it will run over
+                 all FortiGates in the inventory.
+        workers: The maximum number of FortiGates to query at the same time (see
+                 fotoobo.tools.fleet.fleet_concurrency())
 
     Returns:
         The Result object with all the results
     """
+    inventory = Inventory(config.inventory_file)
+    fgts = inventory.get(host, "fortigate")
+    runner = FleetRunner[str]("getting FortiGate versions...", workers, handle=_push_version)
+    if config.fleet.get("transport") == "asyncio":
+        return asyncio.run(runner.run_async(_get_single_version_async, fgts))
 
-    def _get_single_version(name: str, fgt: FortiGate) -> tuple[str, str]:
-        """
-        Get the version from a FortiGate.
+    return runner.run(_get_single_version, fgts)
 
-        This private method is used for multithreading. It only queries one single FortiGate for its
-        version number status and returns it.
 
-        Args:
-            name: The name of the FortiGate (as defined in the inventory)
-            fgt:  The FortiGate object to query
+def _get_single_version(name: str, fgt: FortiGate) -> str:
+    """
+    Get the version from a FortiGate.
 
-        Returns:
-            name:   The name of the FortiGate (as defined in the inventory)
-            status: The HA status of the FortiGate (fgt)
-        """
-        log.debug("Getting FortiGate version for '%s'", name)
-        try:
-            fortigate_version = fgt.get_version()
+    Args:
+        name: The name of the FortiGate (as defined in the inventory)
+        fgt:  The FortiGate object to query
 
-        except (GeneralWarning, GeneralError) as exception:
-            fortigate_version = f"unknown due to {exception.message}"
+    Returns:
+        The version of the FortiGate (fgt)
+    """
+    log.debug("Getting FortiGate version for '%s'", name)
+    return fgt.get_version()
 
-        return name, fortigate_version
 
-    inventory = Inventory(config.inventory_file)
-    fgts = inventory.get(host, "fortigate")
-    result = Result[str]()
+async def _get_single_version_async(name: str, fgt: FortiGate) -> str:
+    """
+    Get the version from a FortiGate with an asynchronous API request and close its connection.
 
-    with Progress() as progress:
-        task = progress.add_task("getting FortiGate versions...", total=len(fgts))
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = []
-            for name, fgt in fgts.items():
-                futures.append(executor.submit(_get_single_version, name, fgt))
+    Args:
+        name: The name of the FortiGate (as defined in the inventory)
+        fgt:  The FortiGate object to query
+
+    Returns:
+        The version of the FortiGate (fgt)
+    """
+    log.debug("Getting FortiGate version for '%s'", name)
+    try:
+        return await fgt.get_version_async()
+
+    finally:
+        await fgt.close_async()
 
-            for future in concurrent.futures.as_completed(futures):
-                name, fortigate_version = future.result()
-                result.push_result(name, fortigate_version)
-                progress.update(task, advance=1)
 
-    return result
+def _push_version(
+    result: Result[str], name: str, fortigate_version: str | None, error: FleetError | None
+) -> None:
+    """
+    Push the version of a FortiGate into the Result.
+
+    Args:
+        result:            The Result object
+        name:              The name of the FortiGate
+        fortigate_version: The version of the FortiGate
+        error:             The error of the query
+    """
+    if error:
+        fortigate_version = f"unknown due to {error.message}"
+
+    result.push_result(name, fortigate_version or "")
@@ -2,17 +2,15 @@
 FortiGate backup utility
 """
 
-import concurrent.futures
 import json
 import logging
 
-from rich.progress import Progress
-
-from fotoobo.exceptions import APIError, GeneralError
+from fotoobo.exceptions import APIError
 from fotoobo.fortinet.fortigate import FortiGate
 from fotoobo.helpers.config import config
 from fotoobo.helpers.result import Result
 from fotoobo.inventory import Inventory
+from fotoobo.tools.fleet import FleetError, FleetRunner
 
 log = logging.getLogger("fotoobo")
 
@@ -20,6 +18,7 @@ log = logging.getLogger("fotoobo")
 def backup(
     host: str | None = None,
     timeout: int = 60,
+    workers: int | None = None,
 ) -> Result[str]:
     """
     Create a FortiGate configuration backup into a file and optionally upload it to an FTP server.
@@ -28,15 +27,16 @@ def backup(
         host:    The host from the inventory to get the backup. If no host is given all FortiGate
                  devices in the inventory are backed up.
         timeout: Timeout in seconds to wait for each FortiGate to
+        workers: The maximum number of FortiGates to back up at the same time (see
+                 fotoobo.tools.fleet.fleet_concurrency())
 
     Returns:
         The Result object with all the results
     """
-    result = Result[str]()
     inventory = Inventory(config.inventory_file)
     fgts = inventory.get(host, "fortigate")
 
-    def _get_single_backup(name: str, fgt: FortiGate) -> tuple[str, str]:
+    def _get_single_backup(name: str, fgt: FortiGate) -> str:
         """Get the configuration backup from a single FortiGate.
 
         This private method is used for multithreading. It only queries one single FortiGate for its
@@ -47,43 +47,42 @@ def backup(
             fgt:  The FortiGate object to query
 
         Returns:
-            name: The name of the FortiGate (as defined in the inventory)
-            data: The configuration backup of the FortiGate (fgt)
+            The configuration backup of the FortiGate (fgt)
         """
         log.debug("Backup FortiGate '%s'", name)
-        data: str = ""
-
-        try:
-            data = fgt.backup(timeout=timeout)
-            if data.startswith("#config-version"):
-                message = f"Config backup for '{name}' succeeded"
-                log.info(message)
-                result.push_message(name, message)
-
-            else:
-                data_json = json.loads(data)
-                message = f"Backup '{name}' failed with error '{data_json['http_status']}'"
-                log.error(message)
-                result.push_message(name, message, level="error")
-
-        except GeneralError as err:
-            result.push_message(name, err.message, level="error")
-
-        except APIError as err:
-            result.push_message(name, f"{name} returned {err.message}", level="error")
-
-        return name, data
-
-    with Progress() as progress:
-        task = progress.add_task("Download FortiGate backups...", total=len(fgts))
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = []
-            for name, fgt in fgts.items():
-                futures.append(executor.submit(_get_single_backup, name, fgt))
-
-            for future in concurrent.futures.as_completed(futures):
-                name, configuration_backup = future.result()
-                result.push_result(name, configuration_backup)
-                progress.update(task, advance=1)
-
-    return result
+        return fgt.backup(timeout=timeout)
+
+    runner = FleetRunner[str]("Download FortiGate backups...", workers, handle=_push_backup)
+    return runner.run(_get_single_backup, fgts)
+
+
+def _push_backup(
+    result: Result[str], name: str, data: str | None, error: FleetError | None
+) -> None:
+    """
+    Push the configuration backup of a FortiGate and its message into the Result.
+
+    Args:
+        result: The Result object
+        name:   The name of the FortiGate
+        data:   The configuration backup of the FortiGate
+        error:  The error of the backup
+    """
+    if isinstance(error, APIError):
+        result.push_message(name, f"{name} returned {error.message}", level="error")
+
+    elif error:
+        result.push_message(name, error.message, level="error")
+
+    elif data and data.startswith("#config-version"):
+        message = f"Config backup for '{name}' succeeded"
+        log.info(message)
+        result.push_message(name, message)
+
+    else:
+        data_json = json.loads(data or "")
+        message = f"Backup '{name}' failed with error '{data_json['http_status']}'"
+        log.error(message)
+        result.push_message(name, message, level="error")
+
+    result.push_result(name, data or "")
@@ -2,20 +2,18 @@
 FortiGate check hamaster utility
 """
 
-import concurrent.futures
 import logging
 
-from rich.progress import Progress
-
 from fotoobo.fortinet.fortigate import FortiGate
 from fotoobo.helpers.config import config
 from fotoobo.helpers.result import Result
 from fotoobo.inventory import Inventory
+from fotoobo.tools.fleet import FleetError, FleetRunner
 
 log = logging.getLogger("fotoobo")
 
 
-def hamaster(host: str) -> Result[str]:  # pylint: disable=too-many-locals
+def hamaster(host: str, workers: int | None = None) -> Result[str]:
     """FortiGate check hamaster.
 
     This method first gets all the devices from a FortiManager to find all the managed FortiGates
@@ -24,14 +22,16 @@ def hamaster(host: str) -> Result[str]:  # pylint: disable=too-many-locals
     search for the devices we found in Fortimanager in our inventory to connect to to them.
 
     Args:
-        host: The FortiManager host from the inventory to get the device list from. If you omit
-              host, it will run over the default FortiManager (fmg).
+        host:    The FortiManager host from the inventory to get the device list from. If you omit
+                 host, it will run over the default FortiManager (fmg).
+        workers: The maximum number of FortiGates to query at the same time (see
+                 fotoobo.tools.fleet.fleet_concurrency())
 
     Returns:
         The Result object with all the results
     """
 
-    def _get_single_status(name: str, fgt: FortiGate) -> tuple[str, str]:
+    def _get_single_status(name: str, fgt: FortiGate) -> str:
         """Get the HA master status from a FortiGate.
 
         This private method is used for multithreading. It only queries one single FortiGate for its
@@ -42,9 +42,9 @@ def hamaster(host: str) -> Result[str]:  # pylint: disable=too-many-locals
             fgt:  The FortiGate object to query
 
         Returns:
-            name:   The name of the FortiGate (as defined in the inventory)
-            status: The HA status of the FortiGate (fgt)
+            The HA status of the FortiGate (fgt)
         """
+        log.debug("Getting HA status for '%s'", name)
         response = fgt.api("get", "/monitor/system/ha-checksums")
         ha_checksums = response.json()
         status: str = "is not the expected master"
@@ -54,7 +54,7 @@ def hamaster(host: str) -> Result[str]:  # pylint: disable=too-many-locals
                 if node["is_root_master"] == 1:
                     status = "ok"
 
-        return name, status
+        return status
 
     inventory = Inventory(config.inventory_file)
     fmg = inventory.get_item(host, "fortimanager")
@@ -72,7 +72,7 @@ def hamaster(host: str) -> Result[str]:  # pylint: disable=too-many-locals
     fmg.login()
     response = fmg.api("post", payload=payload)
     fmg.logout()
-    result = Result[str]()
+    runner = FleetRunner[str]("Getting FortiGate HA status...", workers, handle=_push_status)
     fgts: dict[str, FortiGate] = {}
 
     for device in response.json()["result"][0]["data"]:
@@ -96,18 +96,29 @@ def hamaster(host: str) -> Result[str]:  # pylint: disable=too-many-locals
             # There is a KeyError if a designated cluster master is not defined in the inventory
             except KeyError:
                 log.debug("Device '%s' not found in inventory", expected_master)
-                result.push_result(expected_master, "not found in inventory")
+                runner.result.push_result(expected_master, "not found in inventory")
+
+    return runner.run(_get_single_status, fgts)
+
 
-    with Progress() as progress:
-        task = progress.add_task("Getting FortiGate HA status...", total=len(fgts))
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = []
-            for name, fgt in fgts.items():
-                futures.append(executor.submit(_get_single_status, name, fgt))
+def _push_status(
+    result: Result[str], name: str, status: str | None, error: FleetError | None
+) -> None:
+    """
+    Push the HA master status of a FortiGate into the Result.
 
-            for future in concurrent.futures.as_completed(futures):
-                name, status = future.result()
-                result.push_result(name, status)
-                progress.update(task, advance=1)
+    Args:
+        result: The Result object
+        name:   The name of the FortiGate
+        status: The HA master status of the FortiGate
+        error:  The error of the query
+
+    Raises:
+        APIError:       If the API request of the query failed
+        GeneralError:   If the query of the FortiGate failed
+        GeneralWarning: If the query of the FortiGate failed with a warning
+    """
+    if error:
+        raise error
 
-    return result
+    result.push_result(name, status or "")
@@ -0,0 +1,733 @@
+"""
+The fleet executor queries the devices of a fleet concurrently with a configurable concurrency
+limit, per device timeouts, a deadline and retries
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterator, TypeVar
+
+from rich.progress import Progress
+
+from fotoobo.exceptions import APIConnectionError, APIError, GeneralError, GeneralWarning
+from fotoobo.fortinet.fortinet import (
+    retry_after,
+    RETRY_CONNECTION_ERRORS,
+    RETRY_IDEMPOTENT_CONNECTION_ERRORS,
+    retry_reason,
+)
+from fotoobo.helpers.config import config
+from fotoobo.helpers.result import Result
+
+log = logging.getLogger("fotoobo")
+
+T = TypeVar("T")
+
+# the errors of a query which are returned instead of raised
+FleetError = APIError | GeneralError | GeneralWarning
+
+# a query of a device as (name, value, error) where either the value or the error is None
+FleetQuery = tuple[str, T | None, FleetError | None]
+
+# the queries of a device as the time in seconds of the last query, the value or the error and
+# whether any of the queries failed because of the connection or an overloaded device
+_Attempts = tuple[float, T | None, FleetError | None, bool]
+
+# the number of devices to query at the same time if it is not configured (by transport)
+DEFAULT_WORKERS = {"threads": 10, "asyncio": 100}
+
+# the adaptive limit is decreased if a round took this many times longer than the fastest round
+LATENCY_FACTOR = 2.0
+
+# the HTTP status codes of devices which are overloaded
+OVERLOAD_STATUS_CODES = (429, 503)
+
+
+class FleetConcurrency:  # pylint: disable=too-many-instance-attributes
+    """
+    The concurrency limit of the fleet tools
+
+    A device is only queried if there is a free slot. There are at most 'workers' slots at the same
+    time and at most 'groups[group]' slots for the devices of an inventory group (e.g. 5 for the
+    branches behind small WAN links). The inventory group of a device is given with the option
+    'group' in the inventory.
+
+    With adaptive=True the limit adapts to the observed latency and errors like the congestion
+    window of TCP. It starts at 1 and doubles after every round of 'limit' successful queries until
+    it is decreased the first time. Then it grows by one per round. It is halved if a query fails
+    with a transient connection error or an overloaded device (HTTP/429 or HTTP/503, see
+    is_overload()) or if the mean latency of a round is more than LATENCY_FACTOR times the one of
+    the fastest round. The queries which were started before the limit has been decreased do not
+    decrease it again. The limit never exceeds 'workers'.
+
+    The slots are taken and given back by the fleet executor (see fleet_map()) in one thread, so
+    they are not locked.
+    """
+
+    def __init__(
+        self, workers: int = 10, groups: dict[str, int] | None = None, adaptive: bool = False
+    ) -> None:
+        """
+        Initialize the concurrency limit.
+
+        Args:
+            workers:  The maximum number of devices to query at the same time
+            groups:   The maximum number of devices to query at the same time by inventory group
+            adaptive: Adapt the limit to the observed latency and errors
+        """
+        self.workers = max(workers, 1)
+        self.groups = groups or {}
+        self.adaptive = adaptive
+        self.limit = 1 if adaptive else self.workers
+        self.active = 0
+        self.group_active: dict[str, int] = {}
+        # the state of the adaptive limit (the epoch is increased with every decrease)
+        self._epoch = 0
+        self._slow_start = True
+        self._round: list[float] = []
+        self._fastest_round = float("inf")
+
+    def can_acquire(self, group: str = "") -> bool:
+        """
+        Check whether there is a free slot for a device.
+
+        Args:
+            group: The inventory group of the device
+
+        Returns:
+            True if the device may be queried now
+        """
+        if self.active >= self.limit:
+            return False
+
+        return group not in self.groups or self.group_active.get(group, 0) < self.groups[group]
+
+    def acquire(self, group: str = "") -> int:
+        """
+        Take a slot (check with can_acquire() first).
+
+        Args:
+            group: The inventory group of the device
+
+        Returns:
+            The epoch of the adaptive limit to give back with the slot
+        """
+        self.active += 1
+        self.group_active[group] = self.group_active.get(group, 0) + 1
+        return self._epoch
+
+    def release(self, group: str, epoch: int, seconds: float, failed: bool = False) -> None:
+        """
+        Give a slot back and adapt the limit.
+
+        Args:
+            group:   The inventory group of the device
+            epoch:   The epoch of the adaptive limit when the slot was taken
+            seconds: The time the device has been queried
+            failed:  Whether the query failed because of the connection or an overloaded device
+        """
+        self.active -= 1
+        self.group_active[group] -= 1
+        if not self.adaptive or epoch != self._epoch:
+            return
+
+        if failed:
+            self._decrease("failed query")
+            return
+
+        self._round.append(seconds)
+        if len(self._round) < self.limit:
+            return
+
+        mean = sum(self._round) / len(self._round)
+        if mean > self._fastest_round * LATENCY_FACTOR:
+            self._decrease(f"mean latency {mean:.3f}s")
+            return
+
+        self._fastest_round = min(self._fastest_round, mean)
+        self._round = []
+        self.limit = min(self.limit * 2 if self._slow_start else self.limit + 1, self.workers)
+        log.debug("Increase fleet concurrency to '%s'", self.limit)
+
+    def _decrease(self, reason: str) -> None:
+        """
+        Halve the adaptive limit and start a new epoch.
+
+        Args:
+            reason: The reason for the log
+        """
+        self.limit = max(self.limit // 2, 1)
+        self._slow_start = False
+        self._round = []
+        self._epoch += 1
+        log.debug("Decrease fleet concurrency to '%s' (%s)", self.limit, reason)
+
+
+def fleet_concurrency(workers: int | None = None) -> FleetConcurrency:
+    """
+    Get the concurrency limit of a fleet tool from the configuration (section 'fleet').
+
+    Args:
+        workers: The maximum number of devices to query at the same time. If None, it is taken from
+                 the setting 'fleet.workers' or from DEFAULT_WORKERS for the configured transport.
+
+    Returns:
+        The concurrency limit
+    """
+    transport = config.fleet.get("transport", "threads")
+    return FleetConcurrency(
+        workers or config.fleet.get("workers") or DEFAULT_WORKERS[transport],
+        config.fleet.get("groups"),
+        config.fleet.get("adaptive", False),
+    )
+
+
+def is_overload(err: Exception) -> bool:
+    """
+    Check whether an error means that a device (or the network to it) is overloaded.
+
+    Only the transient connection errors (timeouts, refused and dropped connections) count. The
+    errors which do not go away by waiting (e.g. an unknown hostname or an invalid certificate) do
+    not.
+
+    Args:
+        err: The error of the query
+
+    Returns:
+        True for the transient connection errors and the HTTP status codes in
+        OVERLOAD_STATUS_CODES
+    """
+    if isinstance(err, APIError):
+        return err.code in OVERLOAD_STATUS_CODES
+
+    if isinstance(err, APIConnectionError):
+        return err.reason in RETRY_CONNECTION_ERRORS + RETRY_IDEMPOTENT_CONNECTION_ERRORS
+
+    return False
+
+
+def is_retryable(err: Exception) -> bool:
+    """
+    Check whether the query of a device may be retried by the fleet tools.
+
+    A query may send any API requests, so only the errors of the requests which have not been
+    processed by the device are retried (see retry_reason() for requests which are not idempotent).
+    The errors of the requests which have already been retried by Fortinet.api() (option 'retries'
+    in the inventory) are not retried again, so the two retry layers do not multiply.
+
+    Args:
+        err: The error of the query
+
+    Returns:
+        True if the query may be retried
+    """
+    if not isinstance(err, (APIError, APIConnectionError)) or err.retried:
+        return False
+
+    return retry_reason(err, idempotent=False) is not None
+
+
+@dataclass
+class RetryPolicy:
+    """
+    The retry policy of the fleet tools
+
+    A device is queried up to 'attempts' times if the error of its query is retryable. The delay
+    before the n-th retry is 'backoff' * 2^(n-1) seconds or the delay in the header Retry-After of
+    the response. A device is not retried after its timeout or the deadline.
+
+    Attributes:
+        attempts: The maximum number of queries of a device (1 for no retries)
+        backoff:  The delay in seconds before the first retry
+        retry_on: Check whether an error is retryable (see is_retryable() for the default)
+    """
+
+    attempts: int = 1
+    backoff: float = 1.0
+    retry_on: Callable[[Exception], bool] = is_retryable
+
+    def delay(self, attempt: int, err: Exception, expires: float) -> float | None:
+        """
+        Get the delay before the next query of a device.
+
+        Args:
+            attempt: The number of the failed query (starting at 1)
+            err:     The error of the failed query
+            expires: The time (perf_counter) when the device times out
+
+        Returns:
+            The delay in seconds or None if the device is not retried
+        """
+        delay = self.backoff * 2.0 ** (attempt - 1)
+        if (
+            isinstance(err, (APIError, APIConnectionError))
+            and (after := retry_after(err)) is not None
+        ):
+            delay = after
+
+        if attempt >= self.attempts or not self.retry_on(err) or perf_counter() + delay >= expires:
+            return None
+
+        return delay
+
+
+def retry_policy() -> RetryPolicy:
+    """
+    Get the retry policy of a fleet tool from the configuration (settings 'fleet.retries' and
+    'fleet.backoff').
+
+    Returns:
+        The retry policy
+    """
+    return RetryPolicy(config.fleet.get("retries", 0) + 1, config.fleet.get("backoff", 1.0))
+
+
+def fleet_map(  # pylint: disable=too-many-arguments, too-many-locals
+    func: Callable[[str, Any], T],
+    devices: dict[str, Any],
+    concurrency: FleetConcurrency,
+    *,
+    timeout: float | None = None,
+    deadline: float | None = None,
+    retry: RetryPolicy | None = None,
+) -> Iterator[FleetQuery[T]]:
+    """
+    Query the devices of a fleet on a thread pool.
+
+    The devices are started in their order as soon as the concurrency limit allows it. A device of
+    a group which reached its limit is skipped until a slot of its group is free, so it does not
+    block the devices of the other groups.
+
+    A thread can not be stopped. So a device which exceeds its timeout is given up: its error is
+    yielded at once but it keeps its slot until its thread returns (e.g. with the read timeout of
+    its API request). At the deadline all the devices which are not done are given up and the
+    thread pool is shut down without waiting for them. The same happens if the iteration is
+    interrupted (e.g. with Ctrl-C).
+
+    Args:
+        func:        The function to query a single device with its name and the device object
+        devices:     The devices to query by their name (as defined in the inventory)
+        concurrency: The concurrency limit
+        timeout:     The maximum time in seconds to query a device (including its retries)
+        deadline:    The maximum time in seconds to query all the devices
+        retry:       The retry policy (no retries if None)
+
+    Yields:
+        The name with the value of func or its error (APIError, GeneralError or GeneralWarning) of
+        every device as soon as it is done. Other exceptions are raised.
+    """
+    pending = list(devices.items())
+    running: dict[Future[_Attempts[T]], _Running] = {}
+    expires = perf_counter() + deadline if deadline else float("inf")
+    executor = ThreadPoolExecutor(max_workers=concurrency.workers)
+    try:
+        while pending or any(not run.given_up for run in running.values()):
+            if perf_counter() >= expires:
+                for run in running.values():
+                    if not run.given_up:
+                        yield run.name, None, _deadline_error(run.name, deadline)
+
+                for name, _ in pending:
+                    yield name, None, _deadline_error(name, deadline)
+
+                return
+
+            while (index := _next_device(pending, concurrency)) is not None:
+                name, device = pending.pop(index)
+                group = getattr(device, "group", "")
+                epoch = concurrency.acquire(group)
+                device_expires = min(perf_counter() + (timeout or float("inf")), expires)
+                future = executor.submit(_query, func, name, device, retry, device_expires)
+                running[future] = _Running(name, group, epoch, device_expires)
+
+            next_expiry = min(
+                [expires] + [run.expires for run in running.values() if not run.given_up]
+            )
+            done, _ = wait(
+                running,
+                timeout=None if next_expiry == float("inf") else next_expiry - perf_counter(),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                run = running.pop(future)
+                seconds, value, error, overloaded = future.result()
+                concurrency.release(run.group, run.epoch, seconds, overloaded)
+                if not run.given_up:
+                    yield run.name, value, error
+
+            for run in running.values():
+                if not run.given_up and run.expires < expires and perf_counter() >= run.expires:
+                    run.given_up = True
+                    yield run.name, None, GeneralError(f"Timeout after {timeout}s ({run.name})")
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def fleet_map_async(  # pylint: disable=too-many-arguments
+    func: Callable[[str, Any], Awaitable[T]],
+    devices: dict[str, Any],
+    concurrency: FleetConcurrency,
+    *,
+    timeout: float | None = None,
+    deadline: float | None = None,
+    retry: RetryPolicy | None = None,
+) -> AsyncIterator[FleetQuery[T]]:
+    """
+    Query the devices of a fleet concurrently in the event loop.
+
+    This is the same as fleet_map() but with a coroutine function to query a device (e.g. with the
+    asynchronous API requests of the Fortinet devices). A device which exceeds its timeout or the
+    deadline is cancelled.
+
+    Args:
+        func:        The coroutine function to query a single device with its name and object
+        devices:     The devices to query by their name (as defined in the inventory)
+        concurrency: The concurrency limit
+        timeout:     The maximum time in seconds to query a device (including its retries)
+        deadline:    The maximum time in seconds to query all the devices
+        retry:       The retry policy (no retries if None)
+
+    Yields:
+        The name with the value of func or its error (APIError, GeneralError or GeneralWarning) of
+        every device as soon as it is done. Other exceptions are raised.
+    """
+    condition = asyncio.Condition()
+    expires = perf_counter() + deadline if deadline else float("inf")
+
+    async def _query_async(name: str, device: Any) -> FleetQuery[T]:
+        group = getattr(device, "group", "")
+        try:
+            async with condition:
+                await asyncio.wait_for(
+                    condition.wait_for(lambda: concurrency.can_acquire(group)),
+                    _remaining(expires),
+                )
+                epoch = concurrency.acquire(group)
+
+        except asyncio.TimeoutError:
+            return name, None, _deadline_error(name, deadline)
+
+        start = perf_counter()
+        device_expires = min(start + (timeout or float("inf")), expires)
+        try:
+            seconds, value, error, overloaded = await asyncio.wait_for(
+                _query_attempts_async(func, name, device, retry, device_expires),
+                _remaining(device_expires),
+            )
+
+        except asyncio.TimeoutError:
+            seconds, value, overloaded = perf_counter() - start, None, True
+            if device_expires < expires:
+                error = GeneralError(f"Timeout after {timeout}s ({name})")
+
+            else:
+                error = _deadline_error(name, deadline)
+
+        async with condition:
+            concurrency.release(group, epoch, seconds, overloaded)
+            condition.notify_all()
+
+        return name, value, error
+
+    for future in asyncio.as_completed(
+        [_query_async(name, device) for name, device in devices.items()]
+    ):
+        yield await future
+
+
+class FleetRunner(Generic[T]):
+    """
+    The runner of the fleet tools
+
+    It queries the devices with fleet_map() (or with fleet_map_async() in run_async()), shows the
+    progress and streams the query of every device into its Result as soon as it is done. The
+    limits are taken from the arguments or else from the configuration (section 'fleet'). Give it
+    a handle function to push the queries into the Result the way the tool needs it.
+    """
+
+    def __init__(
+        self,
+        description: str,
+        workers: int | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        handle: Callable[[Result[T], str, T | None, FleetError | None], None] | None = None,
+    ) -> None:
+        """
+        Initialize the fleet runner.
+
+        Args:
+            description: The description of the progress
+            workers:     The maximum number of devices to query at the same time (see
+                         fleet_concurrency())
+            timeout:     The maximum time in seconds to query a device (setting 'fleet.timeout')
+            deadline:    The maximum time in seconds to query all the devices (setting
+                         'fleet.deadline')
+            handle:      The function to push the query of a device into the Result. By default
+                         the value is pushed as result and the error as error message.
+        """
+        self.description = description
+        self.concurrency = fleet_concurrency(workers)
+        self.timeout = timeout or config.fleet.get("timeout")
+        self.deadline = deadline or config.fleet.get("deadline")
+        self.retry = retry_policy()
+        self.handle = handle or push_query
+        self.result = Result[T]()
+
+    def run(self, func: Callable[[str, Any], T], devices: dict[str, Any]) -> Result[T]:
+        """
+        Query the devices on a thread pool.
+
+        Args:
+            func:    The function to query a single device with its name and the device object
+            devices: The devices to query by their name (e.g. from Inventory.get())
+
+        Returns:
+            The Result object with all the results
+        """
+        with Progress() as progress:
+            task = progress.add_task(self.description, total=len(devices))
+            try:
+                for name, value, error in fleet_map(
+                    func,
+                    devices,
+                    self.concurrency,
+                    timeout=self.timeout,
+                    deadline=self.deadline,
+                    retry=self.retry,
+                ):
+                    self.handle(self.result, name, value, error)
+                    progress.update(task, advance=1)
+
+            except KeyboardInterrupt:
+                log.warning("Cancelled after %s of %s devices", self.result.total, len(devices))
+                raise
+
+        _log_retries(devices)
+        return self.result
+
+    async def run_async(
+        self, func: Callable[[str, Any], Awaitable[T]], devices: dict[str, Any]
+    ) -> Result[T]:
+        """
+        Query the devices concurrently in the event loop.
+
+        Args:
+            func:    The coroutine function to query a single device with its name and object
+            devices: The devices to query by their name (e.g. from Inventory.get())
+
+        Returns:
+            The Result object with all the results
+        """
+        with Progress() as progress:
+            task = progress.add_task(self.description, total=len(devices))
+            try:
+                async for name, value, error in fleet_map_async(
+                    func,
+                    devices,
+                    self.concurrency,
+                    timeout=self.timeout,
+                    deadline=self.deadline,
+                    retry=self.retry,
+                ):
+                    self.handle(self.result, name, value, error)
+                    progress.update(task, advance=1)
+
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                log.warning("Cancelled after %s of %s devices", self.result.total, len(devices))
+                raise
+
+        _log_retries(devices)
+        return self.result
+
+
+def push_query(result: Result[T], name: str, value: T | None, error: FleetError | None) -> None:
+    """
+    Push the query of a device into a Result (the default handle of the FleetRunner).
+
+    Args:
+        result: The Result object
+        name:   The name of the device
+        value:  The value of the query
+        error:  The error of the query
+    """
+    if error:
+        result.push_message(name, error.message, level="error")
+        return
+
+    result.push_result(name, value)  # type: ignore[arg-type]
+
+
+def _log_retries(devices: dict[str, Any]) -> None:
+    """
+    Log the number of retried API requests of the devices by their reason (see Fortinet.api()).
+
+    Args:
+        devices: The devices by their name
+    """
+    retries: Counter[str] = Counter()
+    for device in devices.values():
+        if isinstance(metrics := getattr(device, "retry_metrics", None), Counter):
+            retries.update(metrics)
+
+    if retries:
+        log.info(
+            "Retried %s API requests (%s)",
+            retries.total(),
+            ", ".join(f"{reason}: {count}" for reason, count in retries.most_common()),
+        )
+
+
+@dataclass
+class _Running:
+    """
+    A device which is queried on the thread pool
+
+    Attributes:
+        name:     The name of the device
+        group:    The inventory group of the device
+        epoch:    The epoch of the adaptive limit when its slot was taken
+        expires:  The time (perf_counter) when the device times out
+        given_up: Whether the device is given up because of its timeout
+    """
+
+    name: str
+    group: str
+    epoch: int
+    expires: float
+    given_up: bool = False
+
+
+def _deadline_error(name: str, deadline: float | None) -> GeneralError:
+    """
+    Get the error of a device which is not done at the deadline.
+
+    Args:
+        name:     The name of the device
+        deadline: The deadline in seconds
+
+    Returns:
+        The error
+    """
+    return GeneralError(f"Deadline of {deadline}s exceeded ({name})")
+
+
+def _next_device(pending: list[tuple[str, Any]], concurrency: FleetConcurrency) -> int | None:
+    """
+    Get the next device which may be queried now.
+
+    Args:
+        pending:     The devices which are not queried yet as (name, device)
+        concurrency: The concurrency limit
+
+    Returns:
+        The position of the device in pending or None if no device may be queried now
+    """
+    if concurrency.active >= concurrency.limit:
+        return None
+
+    for index, (_, device) in enumerate(pending):
+        if concurrency.can_acquire(getattr(device, "group", "")):
+            return index
+
+    return None
+
+
+def _query(
+    func: Callable[[str, Any], T],
+    name: str,
+    device: Any,
+    retry: RetryPolicy | None,
+    expires: float,
+) -> _Attempts[T]:
+    """
+    Query a single device on the thread pool and retry it with the retry policy.
+
+    Args:
+        func:    The function to query the device
+        name:    The name of the device
+        device:  The device object
+        retry:   The retry policy
+        expires: The time (perf_counter) when the device times out
+
+    Returns:
+        The time in seconds of the last query, the value of func or its error and whether any of
+        the queries failed because of the connection or an overloaded device
+    """
+    overloaded, attempt = False, 1
+    while True:
+        start = perf_counter()
+        try:
+            value = func(name, device)
+            return perf_counter() - start, value, None, overloaded
+
+        except (APIError, GeneralError, GeneralWarning) as err:
+            overloaded = overloaded or is_overload(err)
+            delay = retry.delay(attempt, err, expires) if retry else None
+            if delay is None:
+                return perf_counter() - start, None, err, overloaded
+
+            log.debug("Retry '%s' in %.1fs after: %s", name, delay, err.message)
+            time.sleep(delay)
+            attempt += 1
+
+
+async def _query_attempts_async(
+    func: Callable[[str, Any], Awaitable[T]],
+    name: str,
+    device: Any,
+    retry: RetryPolicy | None,
+    expires: float,
+) -> _Attempts[T]:
+    """
+    Query a single device in the event loop and retry it with the retry policy.
+
+    Args:
+        func:    The coroutine function to query the device
+        name:    The name of the device
+        device:  The device object
+        retry:   The retry policy
+        expires: The time (perf_counter) when the device times out
+
+    Returns:
+        The time in seconds of the last query, the value of func or its error and whether any of
+        the queries failed because of the connection or an overloaded device
+    """
+    overloaded, attempt = False, 1
+    while True:
+        start = perf_counter()
+        try:
+            value = await func(name, device)
+            return perf_counter() - start, value, None, overloaded
+
+        except (APIError, GeneralError, GeneralWarning) as err:
+            overloaded = overloaded or is_overload(err)
+            delay = retry.delay(attempt, err, expires) if retry else None
+            if delay is None:
+                return perf_counter() - start, None, err, overloaded
+
+            log.debug("Retry '%s' in %.1fs after: %s", name, delay, err.message)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def _remaining(expires: float) -> float | None:
+    """
+    Get the time until an expiry.
+
+    Args:
+        expires: The expiry (perf_counter) or infinity for none
+
+    Returns:
+        The remaining time in seconds (at least 0) or None if there is no expiry
+    """
+    if expires == float("inf"):
+        return None
+
+    return max(expires - perf_counter(), 0.0)
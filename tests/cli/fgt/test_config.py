@@ -29,4 +29,4 @@ def test_cli_app_fgt_config_help(help_args_with_none: str) -> None:
     arguments, options, commands = parse_help_output(result.stdout)
     assert not arguments
     assert options == {"-h", "--help"}
-    assert set(commands) == {"check", "get", "info"}
+    assert set(commands) == {"check", "diff", "get", "info", "query", "usage"}
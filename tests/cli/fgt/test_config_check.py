@@ -2,6 +2,7 @@
 Testing the cli fgt config check.
 """
 
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
@@ -33,7 +34,18 @@ def test_cli_app_fgt_config_check_help(help_args_with_none: str) -> None:
     assert "Usage: root fgt config check" in result.stdout
     arguments, options, commands = parse_help_output(result.stdout)
     assert set(arguments) == {"configuration", "bundles"}
-    assert options == {"-h", "--help", "--smtp"}
+    assert options == {
+        "-h",
+        "--help",
+        "--smtp",
+        "-w",
+        "--workers",
+        "-m",
+        "--matrix",
+        "--state",
+        "--findings",
+        "--profile",
+    }
     assert not commands
 
 
@@ -166,6 +178,158 @@ def test_cli_app_fgt_config_check_dir() -> None:
     assert result.exit_code == 0
 
 
+def test_cli_app_fgt_config_check_workers() -> None:
+    """
+    Test cli options and commands for fgt config check with more than one worker.
+    """
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "-c",
+            "tests/fotoobo.yaml",
+            "fgt",
+            "config",
+            "check",
+            "--workers",
+            "2",
+            "tests/data",
+            "tests/data/fortigate_checks.yaml",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+
+
+def test_cli_app_fgt_config_check_matrix() -> None:
+    """
+    Test fgt config check with the host x check matrix as output.
+    """
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "-c",
+            "tests/fotoobo.yaml",
+            "fgt",
+            "config",
+            "check",
+            "--matrix",
+            "tests/data/fortigate_config_vdom.conf",
+            "tests/data/fortigate_checks.yaml",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert "Failures per host and check" in result.stdout
+
+
+def test_cli_app_fgt_config_check_matrix_invalid_check(monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that fgt config check prints the invalid checks together with the matrix.
+    """
+
+    # Arrange
+    monkeypatch.setattr(
+        "fotoobo.tools.fgt.config.load_yaml_file",
+        Mock(
+            return_value=[
+                {
+                    "type": "count",
+                    "scope": "vdom",
+                    "path": "/root/leaf_81/leaf_82",
+                    "checks": {"eq": 100},
+                },
+                {"type": "typo", "scope": "vdom", "path": "/system/global", "checks": {"a": 1}},
+            ]
+        ),
+    )
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "-c",
+            "tests/fotoobo.yaml",
+            "fgt",
+            "config",
+            "check",
+            "--matrix",
+            "tests/data/fortigate_config_single.conf",
+            "tests/data/fortigate_checks.yaml",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert "Invalid check: Check type 'typo' not available" in result.stdout
+    assert "Failures per host and check" in result.stdout
+
+
+def test_cli_app_fgt_config_check_state(function_dir: Path) -> None:
+    """
+    Test fgt config check with a state file for incremental checks.
+    """
+
+    # Arrange
+    state_file = function_dir / "state.json"
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "-c",
+            "tests/fotoobo.yaml",
+            "fgt",
+            "config",
+            "check",
+            "--state",
+            str(state_file),
+            "tests/data/fortigate_config_vdom.conf",
+            "tests/data/fortigate_checks.yaml",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert state_file.is_file()
+
+
+def test_cli_app_fgt_config_check_findings(function_dir: Path) -> None:
+    """
+    Test fgt config check with a findings file.
+    """
+
+    # Arrange
+    findings_file = function_dir / "findings.csv"
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "-c",
+            "tests/fotoobo.yaml",
+            "fgt",
+            "config",
+            "check",
+            "--findings",
+            str(findings_file),
+            "tests/data/fortigate_config_vdom.conf",
+            "tests/data/fortigate_checks.yaml",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert findings_file.read_text(encoding="UTF-8").startswith(
+        "host,check,type,scope,path,key,expected,actual,vdom"
+    )
+
+
 def test_cli_app_fgt_config_check_invalid_bundle_file() -> None:
     """
     Test cli options and commands for fgt config check with an invalid check bundle file.
@@ -186,3 +350,28 @@ def test_cli_app_fgt_config_check_invalid_bundle_file() -> None:
             ],
             catch_exceptions=False,
         )
+
+
+def test_cli_app_fgt_config_check_profile() -> None:
+    """
+    Test fgt config check with the parse profile.
+    """
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "-c",
+            "tests/fotoobo.yaml",
+            "fgt",
+            "config",
+            "check",
+            "--profile",
+            "tests/data/fortigate_config_vdom.conf",
+            "tests/data/fortigate_checks.yaml",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert "Slowest sections of 1 file(s)" in result.stdout
@@ -0,0 +1,81 @@
+"""
+Testing the cli fgt config diff.
+"""
+
+import pytest
+from typer.testing import CliRunner
+
+from fotoobo.cli.main import app
+from fotoobo.exceptions.exceptions import GeneralWarning
+from tests.helper import parse_help_output
+
+runner = CliRunner()
+
+
+def test_cli_app_fgt_config_diff_help(help_args_with_none: str) -> None:
+    """
+    Test cli help for fgt config diff help.
+    """
+
+    # Arrange
+    args = ["-c", "tests/fotoobo.yaml", "fgt", "config", "diff"]
+    args.append(help_args_with_none)
+    args = list(filter(None, args))
+
+    # Act
+    result = runner.invoke(app, args)
+
+    # Assert
+    assert result.exit_code in [0, 2]
+    assert "Usage: root fgt config diff" in result.stdout
+    arguments, options, commands = parse_help_output(result.stdout)
+    assert set(arguments) == {"old", "new", "scope", "path"}
+    assert options == {"-h", "--help"}
+    assert not commands
+
+
+def test_cli_app_fgt_config_diff() -> None:
+    """
+    Test fgt config diff.
+    """
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "-c",
+            "tests/fotoobo.yaml",
+            "fgt",
+            "config",
+            "diff",
+            "tests/data/fortigate_config_single.conf",
+            "tests/data/fortigate_config_vdom.conf",
+            "vdom",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert "+ vdom /vdom_n" in result.stdout
+
+
+def test_cli_app_fgt_config_diff_nonexist_config_file() -> None:
+    """
+    Test fgt config diff with a nonexisting configuration file.
+    """
+
+    # Act & Assert
+    with pytest.raises(GeneralWarning, match=r"There is no configuration file"):
+        runner.invoke(
+            app,
+            [
+                "-c",
+                "tests/fotoobo.yaml",
+                "fgt",
+                "config",
+                "diff",
+                "tests/data/fortigate_config_single.conf",
+                "tests/data/fortigate_config_nonexist.conf",
+            ],
+            catch_exceptions=False,
+        )
@@ -30,7 +30,7 @@ def test_cli_app_fgt_config_info_help(help_args_with_none: str) -> None:
     assert "Usage: root fgt config info" in result.stdout
     arguments, options, commands = parse_help_output(result.stdout)
     assert set(arguments) == {"configuration"}
-    assert options == {"-h", "--help", "-l", "--list"}
+    assert options == {"-h", "--help", "-l", "--list", "--profile"}
     assert not commands
 
 
@@ -57,6 +57,31 @@ def test_cli_app_fgt_config_info(file: str) -> None:
     assert "FGT999" in result.stdout
 
 
+def test_cli_app_fgt_config_info_profile() -> None:
+    """
+    Test fgt config info with the parse profile.
+    """
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "-c",
+            "tests/fotoobo.yaml",
+            "fgt",
+            "config",
+            "info",
+            "--profile",
+            "tests/data/fortigate_config_vdom.conf",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert "FGT999" in result.stdout
+    assert "Slowest sections of 1 file(s)" in result.stdout
+
+
 def test_cli_app_fgt_config_info_empty_config() -> None:
     """
     Test cli options and commands for fgt config info with an empty configuration.
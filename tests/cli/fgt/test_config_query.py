@@ -0,0 +1,111 @@
+"""
+Testing the cli fgt config query.
+"""
+
+import pytest
+from typer.testing import CliRunner
+
+from fotoobo.cli.main import app
+from fotoobo.exceptions.exceptions import GeneralError, GeneralWarning
+from tests.helper import parse_help_output
+
+runner = CliRunner()
+
+
+def test_cli_app_fgt_config_query_help(help_args_with_none: str) -> None:
+    """
+    Test cli help for fgt config query help.
+    """
+
+    # Arrange
+    args = ["-c", "tests/fotoobo.yaml", "fgt", "config", "query"]
+    args.append(help_args_with_none)
+    args = list(filter(None, args))
+
+    # Act
+    result = runner.invoke(app, args)
+
+    # Assert
+    assert result.exit_code in [0, 2]
+    assert "Usage: root fgt config query" in result.stdout
+    arguments, options, commands = parse_help_output(result.stdout)
+    assert set(arguments) == {"config", "scope", "path", "predicate"}
+    assert options == {"-h", "--help", "-w", "--workers"}
+    assert not commands
+
+
+@pytest.mark.parametrize("workers", ("1", "2"))
+def test_cli_app_fgt_config_query(workers: str) -> None:
+    """
+    Test fgt config query.
+    """
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "-c",
+            "tests/fotoobo.yaml",
+            "fgt",
+            "config",
+            "query",
+            "tests/data",
+            "vdom",
+            "/*/leaf_81/leaf_82/*",
+            "id > 1",
+            "--workers",
+            workers,
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert result.stdout.count('/root/leaf_81/leaf_82/2\t{"option_1": "value_1", "id": 2}') == 2
+    assert "/root/leaf_81/leaf_82/1" not in result.stdout
+
+
+def test_cli_app_fgt_config_query_invalid_predicate() -> None:
+    """
+    Test fgt config query with an invalid predicate.
+    """
+
+    # Act & Assert
+    with pytest.raises(GeneralError, match=r"Invalid predicate"):
+        runner.invoke(
+            app,
+            [
+                "-c",
+                "tests/fotoobo.yaml",
+                "fgt",
+                "config",
+                "query",
+                "tests/data/fortigate_config_vdom.conf",
+                "global",
+                "/system/global/option_1",
+                "value_1",
+            ],
+            catch_exceptions=False,
+        )
+
+
+def test_cli_app_fgt_config_query_noexist_config_file() -> None:
+    """
+    Test fgt config query with a nonexisting configuration file.
+    """
+
+    # Act & Assert
+    with pytest.raises(GeneralWarning, match=r"There are no configuration files"):
+        runner.invoke(
+            app,
+            [
+                "-c",
+                "tests/fotoobo.yaml",
+                "fgt",
+                "config",
+                "query",
+                "tests/data/nonexist.conf",
+                "global",
+                "/",
+            ],
+            catch_exceptions=False,
+        )
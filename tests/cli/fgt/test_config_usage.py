@@ -0,0 +1,95 @@
+"""
+Testing the cli fgt config usage.
+"""
+
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from fotoobo.cli.main import app
+from tests.helper import parse_help_output
+
+runner = CliRunner()
+
+
+def test_cli_app_fgt_config_usage_help(help_args_with_none: str) -> None:
+    """
+    Test cli help for fgt config usage help.
+    """
+
+    # Arrange
+    args = ["-c", "tests/fotoobo.yaml", "fgt", "config", "usage"]
+    args.append(help_args_with_none)
+    args = list(filter(None, args))
+
+    # Act
+    result = runner.invoke(app, args)
+
+    # Assert
+    assert result.exit_code in [0, 2]
+    assert "Usage: root fgt config usage" in result.stdout
+    arguments, options, commands = parse_help_output(result.stdout)
+    assert set(arguments) == {"config", "name"}
+    assert options == {"-h", "--help", "--index", "-w", "--workers"}
+    assert not commands
+
+
+def test_cli_app_fgt_config_usage(function_dir: Path) -> None:
+    """
+    Test fgt config usage.
+    """
+
+    # Arrange
+    conf_file = function_dir / "fortigate.conf"
+    conf_file.write_text(
+        "#config-version=FGT999-7.2.8-FW-build1639-240313:opmode=0:vdom=0:user=admin\n"
+        'config system global\nset hostname "FGT_1"\nend\n'
+        'config firewall address\nedit "net_1"\nset subnet 10.0.0.0/8\nnext\nend\n'
+        'config firewall policy\nedit 1\nset srcaddr "net_1"\nnext\nend\n',
+        encoding="UTF-8",
+    )
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "-c",
+            "tests/fotoobo.yaml",
+            "fgt",
+            "config",
+            "usage",
+            str(conf_file),
+            "net_1",
+            "--index",
+            str(function_dir / "usage.sqlite"),
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert "Usages of 'net_1'" in result.stdout
+    assert "/firewall/policy" in result.stdout
+
+
+def test_cli_app_fgt_config_usage_not_used() -> None:
+    """
+    Test fgt config usage with an object which is not used.
+    """
+
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "-c",
+            "tests/fotoobo.yaml",
+            "fgt",
+            "config",
+            "usage",
+            "tests/data/fortigate_config_vdom.conf",
+            "name_1",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert "Object 'name_1' is not used" in result.stdout
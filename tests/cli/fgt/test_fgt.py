@@ -60,6 +60,8 @@ def test_cli_app_fgt_backup_help(help_args: str) -> None:
         "-f",
         "--smtp",
         "-s",
+        "--workers",
+        "-w",
         "-h",
         "--help",
     }
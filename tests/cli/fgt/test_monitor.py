@@ -57,5 +57,7 @@ def test_cli_app_fgt_monitor_hamaster_help(help_args: str) -> None:
         "--smtp",
         "-t",
         "--template",
+        "-w",
+        "--workers",
     }
     assert not commands
@@ -4,12 +4,13 @@ Test the FortiGate class.
 
 # mypy: disable-error-code=attr-defined
 
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pytest import MonkeyPatch
 
-from fotoobo.exceptions import GeneralWarning
+from fotoobo.exceptions import APIError, GeneralWarning
 from fotoobo.fortinet.fortigate import FortiGate
 from tests.helper import ResponseMock
 
@@ -130,3 +131,60 @@ class TestFortiGate:
         with pytest.raises(GeneralWarning) as err:
             FortiGate("dummy_hostname", "").get_version()
         assert "HTTP/404 Resource Not Found" in str(err.value)
+
+    @staticmethod
+    def test_api_async(monkeypatch: MonkeyPatch) -> None:
+        """
+        Test the FortiGate api_async method.
+        """
+
+        # Arrange
+        api_mock = AsyncMock(return_value=ResponseMock(json={"key": "value"}, status_code=200))
+        monkeypatch.setattr("fotoobo.fortinet.fortinet.Fortinet.api_async", api_mock)
+        fortigate = FortiGate("dummy_hostname", "token")
+
+        # Act
+        response = asyncio.run(fortigate.api_async("get", "dummy", headers={"key": "value"}))
+
+        # Assert
+        assert response.json() == {"key": "value"}
+        api_mock.assert_awaited_with(
+            "get",
+            "dummy",
+            payload=None,
+            params=None,
+            timeout=None,
+            headers={"Authorization": "Bearer token", "key": "value"},
+        )
+
+    @staticmethod
+    def test_get_version_async(monkeypatch: MonkeyPatch) -> None:
+        """
+        Test get version with an asynchronous request.
+        """
+
+        # Arrange
+        api_mock = AsyncMock(return_value=ResponseMock(json={"version": "v1.1.1"}, status_code=200))
+        monkeypatch.setattr("fotoobo.fortinet.fortigate.FortiGate.api_async", api_mock)
+
+        # Act & Assert
+        assert asyncio.run(FortiGate("dummy_hostname", "").get_version_async()) == "v1.1.1"
+        api_mock.assert_awaited_with("get", "monitor/system/status")
+
+    @staticmethod
+    def test_get_version_async_api_error(monkeypatch: MonkeyPatch) -> None:
+        """
+        Test get version with an asynchronous request and http error.
+        """
+
+        # Arrange
+        monkeypatch.setattr(
+            "fotoobo.fortinet.fortigate.FortiGate.api_async",
+            AsyncMock(
+                side_effect=APIError(ResponseMock(status_code=404).raise_for_status.side_effect)
+            ),
+        )
+
+        # Act & Assert
+        with pytest.raises(GeneralWarning, match=r"HTTP/404 Resource Not Found"):
+            asyncio.run(FortiGate("dummy_hostname", "").get_version_async())
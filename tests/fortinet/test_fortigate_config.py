@@ -2,11 +2,14 @@
 Test the FortiGate config class.
 """
 
+import sys
+from io import StringIO
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from fotoobo.exceptions import GeneralWarning
 from fotoobo.fortinet.fortigate_config import FortiGateConfig
 
 
@@ -83,9 +86,6 @@ class TestFortiGateConfigGeneral:
         Test the _parse_to_dict method with empty file.
         """
 
-        # Arrange
-        FortiGateConfig._config_path = []  # only needed as long as _config_path is not thread-safe
-
         # Act
         with conf_file_empty.open(encoding="UTF-8") as forti_file:
             config = FortiGateConfig._parse_to_dict(forti_file)
@@ -93,6 +93,40 @@ class TestFortiGateConfigGeneral:
         # Assert
         assert not config
 
+    @staticmethod
+    def test_parse_to_dict_deeply_nested() -> None:
+        """
+        Test the _parse_to_dict method with a nesting depth beyond the python recursion limit.
+        """
+
+        # Arrange
+        depth = sys.getrecursionlimit() + 100
+        config_file = StringIO("config leaf\n" * depth + "set option value\n" + "end\n" * depth)
+
+        # Act
+        config = FortiGateConfig._parse_to_dict(config_file)
+
+        # Assert
+        for _ in range(depth):
+            config = config["leaf"]
+
+        assert config == {"option": "value"}
+
+    @staticmethod
+    def test_parse_to_dict_unclosed_blocks() -> None:
+        """
+        Test the _parse_to_dict method with blocks which are not closed at the end of the file.
+        """
+
+        # Arrange
+        config_file = StringIO("config vdom\nedit root\nconfig leaf_1 leaf_2\nset option value\n")
+
+        # Act
+        config = FortiGateConfig._parse_to_dict(config_file)
+
+        # Assert
+        assert config == {"vdom": {"root": {"leaf_1": {"leaf_2": {"option": "value"}}}}}
+
 
 class TestFortiGateConfigSingle:
     """
@@ -186,9 +220,6 @@ class TestFortiGateConfigSingle:
         Test the _parse_to_dict method with dummy file.
         """
 
-        # Arrange
-        FortiGateConfig._config_path = []  # only needed as long as _config_path is not thread-safe
-
         # Act
         with conf_file_single.open(encoding="UTF-8") as forti_file:
             config = FortiGateConfig._parse_to_dict(forti_file)
@@ -353,9 +384,6 @@ class TestFortiGateConfigVDOM:
         Test the _parse_to_dict method with dummy file.
         """
 
-        # Arrange
-        FortiGateConfig._config_path = []  # only needed as long as _config_path is not thread-safe
-
         # Act
         with conf_file_vdom.open(encoding="UTF-8") as forti_file:
             config = FortiGateConfig._parse_to_dict(forti_file)
@@ -475,3 +503,432 @@ class TestFortiGateConfigVDOM:
         assert config.get_configuration("vdom", "/root/leaf_1/option_1") == "value_1"
         assert config.get_configuration("vdom", "/vdom_n/leaf_n/option_n") == "value_n"
         assert config.get_configuration("vdom", "/vdom_z/leaf_z/option_z") == "value_z"
+
+
+class TestFortiGateConfigParallel:
+    """
+    Test parsing many FortiGate configurations at once.
+    """
+
+    # pylint: disable=redefined-outer-name
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "workers,processes",
+        (
+            pytest.param(1, False, id="sequential"),
+            pytest.param(4, False, id="threads"),
+            pytest.param(2, True, id="processes"),
+        ),
+    )
+    def test_parse_configuration_files(
+        workers: int, processes: bool, conf_file_single: Path, conf_file_vdom: Path
+    ) -> None:
+        """
+        Test the parse_configuration_files method.
+        """
+
+        # Arrange
+        files = [conf_file_vdom, conf_file_single] * 4
+
+        # Act
+        configs = FortiGateConfig.parse_configuration_files(files, workers, processes)
+
+        # Assert
+        assert list(configs) == [conf_file_vdom, conf_file_single]
+        assert configs[conf_file_single].vdom_config["root"]["leaf_n"]["option_n"] == "value_n"
+        assert configs[conf_file_vdom].vdom_config["vdom_z"]["leaf_z"]["option_z"] == "value_z"
+
+    @staticmethod
+    @pytest.mark.parametrize("workers", (1, 2))
+    def test_parse_configuration_files_invalid(
+        workers: int, conf_file_single: Path, conf_file_empty: Path
+    ) -> None:
+        """
+        Test the parse_configuration_files method with a file which can not be parsed.
+        """
+
+        # Act & Assert
+        with pytest.raises(GeneralWarning, match=r"There is no info in"):
+            FortiGateConfig.parse_configuration_files([conf_file_single, conf_file_empty], workers)
+
+        configs = FortiGateConfig.parse_configuration_files(
+            [conf_file_single, conf_file_empty], workers, skip_invalid=True
+        )
+        assert list(configs) == [conf_file_single]
+
+
+class TestFortiGateConfigSelective:
+    """
+    Test parsing only parts of a FortiGate configuration.
+    """
+
+    # pylint: disable=protected-access, redefined-outer-name
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "scope,path",
+        (
+            pytest.param("global", "/", id="global"),
+            pytest.param("global", "/system/global/option_2", id="global option"),
+            pytest.param("global", "/leaf_1", id="global not system"),
+            pytest.param("vdom", "/", id="vdom"),
+            pytest.param("vdom", "/root/leaf_1", id="vdom root"),
+            pytest.param("vdom", "/root/leaf_81/leaf_82", id="vdom list"),
+            pytest.param("vdom", "/root/leaf_41/leaf_42/leaf_43", id="vdom nested"),
+            pytest.param("vdom", "/vdom_z/leaf_z/option_z", id="vdom option"),
+            pytest.param("vdom", "/not_a_vdom", id="vdom not found"),
+            pytest.param("invalid", "/", id="invalid scope"),
+        ),
+    )
+    @pytest.mark.parametrize(
+        "file",
+        (
+            pytest.param(Path("tests/data/fortigate_config_single.conf"), id="single"),
+            pytest.param(Path("tests/data/fortigate_config_vdom.conf"), id="vdom"),
+        ),
+    )
+    def test_parse_configuration_file_selective(file: Path, scope: str, path: str) -> None:
+        """
+        Test that a selectively parsed configuration returns the same as a fully parsed one.
+        """
+
+        # Arrange
+        full_config = FortiGateConfig.parse_configuration_file(file)
+
+        # Act
+        config = FortiGateConfig.parse_configuration_file(file, scope, path)
+
+        # Assert
+        assert config.get_configuration(scope, path) == full_config.get_configuration(scope, path)
+        assert config.info.vdom == full_config.info.vdom
+
+    @staticmethod
+    def test_parse_configuration_file_selective_skips(conf_file_vdom: Path) -> None:
+        """
+        Test that the blocks which are not selected are not parsed.
+        """
+
+        # Act
+        config = FortiGateConfig.parse_configuration_file(conf_file_vdom, "vdom", "/vdom_n")
+
+        # Assert
+        assert list(config.vdom_config) == ["vdom_n"]
+        assert config.global_config == {
+            "system": {"global": config.global_config["system"]["global"]}
+        }
+
+    @staticmethod
+    def test_parse_to_dict_skipped_multiline() -> None:
+        """
+        Test that the lines of a multiline string in a skipped block are not parsed.
+        """
+
+        # Arrange
+        config_file = StringIO(
+            'config leaf_1\nset option "multiline\nend\nnext\n"\nend\n'
+            "config leaf_2\nset option value\nend\n"
+        )
+
+        # Act
+        config = FortiGateConfig._parse_to_dict(config_file, [["leaf_2"]])
+
+        # Assert
+        assert config == {"leaf_2": {"option": "value"}}
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "block_path,expected",
+        (
+            pytest.param(["a"], True, id="on the way"),
+            pytest.param(["a", "b"], True, id="exact"),
+            pytest.param(["a", "b", "c"], True, id="inside"),
+            pytest.param(["a", "c"], False, id="sibling"),
+            pytest.param(["b"], False, id="other"),
+        ),
+    )
+    def test_is_selected(block_path: list[str], expected: bool) -> None:
+        """
+        Test the _is_selected method.
+        """
+
+        # Act & Assert
+        assert FortiGateConfig._is_selected(block_path, [["x"], ["a", "b"]]) == expected
+
+
+class TestFortiGateConfigIndex:
+    """
+    Test the path index and the wildcard queries of a FortiGate configuration.
+    """
+
+    # pylint: disable=redefined-outer-name
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "scope,path",
+        (
+            pytest.param("global", "/", id="global"),
+            pytest.param("global", "", id="empty path"),
+            pytest.param("global", "/system/global", id="global config"),
+            pytest.param("global", "/system/global/option_2", id="global option"),
+            pytest.param("global", "system//global/", id="not normalized"),
+            pytest.param("global", "/system/not_found", id="global not found"),
+            pytest.param("vdom", "/root/leaf_81/leaf_82", id="vdom list"),
+            pytest.param("vdom", "/root/leaf_81/leaf_82/1", id="vdom list element"),
+            pytest.param("vdom", "/root/leaf_81/leaf_83/name_1/option_1", id="vdom option"),
+            pytest.param("vdom", "/vdom_z/leaf_z", id="vdom"),
+            pytest.param("invalid", "/", id="invalid scope"),
+        ),
+    )
+    def test_get_configuration_indexed(conf_file_vdom: Path, scope: str, path: str) -> None:
+        """
+        Test that get_configuration returns the same with and without the path index.
+        """
+
+        # Arrange
+        config = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+        expected = config.get_configuration(scope, path)
+
+        # Act
+        config.build_index()
+
+        # Assert
+        assert config.get_configuration(scope, path) == expected
+
+    @staticmethod
+    @pytest.mark.parametrize("index", (False, True), ids=("walk", "indexed"))
+    @pytest.mark.parametrize(
+        "scope,path,expected",
+        (
+            pytest.param(
+                "vdom",
+                "/root/leaf_81/leaf_82/*/option_1",
+                {
+                    "/root/leaf_81/leaf_82/1/option_1": "value_1",
+                    "/root/leaf_81/leaf_82/2/option_1": "value_1",
+                },
+                id="list wildcard",
+            ),
+            pytest.param(
+                "vdom",
+                "/root/leaf_81/leaf_82/2",
+                {"/root/leaf_81/leaf_82/2": {"option_1": "value_1", "id": 2}},
+                id="list element",
+            ),
+            pytest.param(
+                "vdom",
+                "/root/leaf_81/leaf_83/*",
+                {
+                    "/root/leaf_81/leaf_83/name_1": {"option_1": "value_1"},
+                    "/root/leaf_81/leaf_83/name_2": {"option_1": "value_1"},
+                },
+                id="prefix",
+            ),
+            pytest.param(
+                "global",
+                "/system/global/option_1",
+                {"/system/global/option_1": "value_1"},
+                id="option",
+            ),
+            pytest.param("vdom", "/*/not_found/*", {}, id="not found"),
+            pytest.param("vdom", "/root/leaf_81/leaf_82/3", {}, id="list element not found"),
+        ),
+    )
+    def test_query_configuration(
+        conf_file_vdom: Path, index: bool, scope: str, path: str, expected: dict[str, Any]
+    ) -> None:
+        """
+        Test the query_configuration method with and without the path index.
+        """
+
+        # Arrange
+        config = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+        if index:
+            config.build_index()
+
+        # Act
+        result = config.query_configuration(scope, path)
+
+        # Assert
+        assert result == expected
+
+    @staticmethod
+    def test_query_configuration_root(conf_file_vdom: Path) -> None:
+        """
+        Test that a query without a path returns the whole scope.
+        """
+
+        # Arrange
+        config = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+
+        # Act
+        result = config.query_configuration("vdom", "/")
+
+        # Assert
+        assert result == {"/": config.vdom_config}
+
+
+class TestFortiGateConfigCompact:
+    """
+    Test the compact representation of the FortiGateConfig class.
+    """
+
+    # pylint: disable=redefined-outer-name
+
+    @staticmethod
+    @pytest.mark.parametrize("index", (False, True))
+    def test_compact(conf_file_vdom: Path, index: bool) -> None:
+        """
+        Test that the compact configuration returns the same configurations.
+        """
+
+        # Arrange
+        config = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+        compact_config = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+        if index:
+            compact_config.build_index()
+
+        # Act
+        compact_config.compact()
+
+        # Assert
+        for scope, path in (
+            ("global", "/system/global"),
+            ("vdom", "/root/leaf_81/leaf_82"),
+            ("vdom", "/root/leaf_81/leaf_83/name_1/option_1"),
+        ):
+            assert compact_config.get_configuration(scope, path) == config.get_configuration(
+                scope, path
+            )
+
+        assert compact_config.query_configuration("vdom", "/*/system") == (
+            config.query_configuration("vdom", "/*/system")
+        )
+        assert not config.diff(compact_config)
+
+    @staticmethod
+    def test_compact_save_configuration_file(conf_file_vdom: Path, function_dir: Path) -> None:
+        """
+        Test that a compact configuration is saved as plain json configuration file.
+        """
+
+        # Arrange
+        config = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+        config.compact()
+
+        # Act
+        config.save_configuration_file(function_dir / "config.json")
+
+        # Assert
+        loaded_config = FortiGateConfig.load_configuration_file(function_dir / "config.json")
+        assert loaded_config.vdom_config == config.vdom_config
+        assert isinstance(loaded_config.vdom_config["root"], dict)
+
+
+class TestFortiGateConfigDiff:
+    """
+    Test the diff of the FortiGateConfig class.
+    """
+
+    # pylint: disable=redefined-outer-name
+
+    @staticmethod
+    def test_diff(conf_file_vdom: Path) -> None:
+        """
+        Test the differences between two configurations in both scopes.
+        """
+
+        # Arrange
+        old = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+        new = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+        new.global_config["system"]["global"]["option_1"] = "value_new"
+        new.vdom_config["root"]["leaf_81"]["leaf_82"].insert(0, {"id": 3, "option_1": "value_1"})
+        del new.vdom_config["vdom_n"]
+
+        # Act
+        diff = old.diff(new)
+
+        # Assert
+        assert diff.added == {("vdom", "/root/leaf_81/leaf_82/3"): {"id": 3, "option_1": "value_1"}}
+        assert list(diff.removed) == [("vdom", "/vdom_n")]
+        assert diff.changed == {("global", "/system/global/option_1"): ("value_1", "value_new")}
+
+    @staticmethod
+    def test_diff_path(conf_file_vdom: Path) -> None:
+        """
+        Test that only the differences in the given scope and path are returned.
+        """
+
+        # Arrange
+        old = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+        new = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+        new.global_config["system"]["global"]["option_1"] = "value_new"
+        new.vdom_config["root"]["leaf_1"]["option_1"] = "value_new"
+
+        # Act
+        diff = old.diff(new, "vdom", "/root/leaf_1")
+
+        # Assert
+        assert not diff.added
+        assert not diff.removed
+        assert list(diff.changed) == [("vdom", "/root/leaf_1/option_1")]
+
+
+class TestFortiGateConfigJson:
+    """
+    Test saving and loading the FortiGateConfig class as compact and compressed json.
+    """
+
+    # pylint: disable=redefined-outer-name
+
+    @staticmethod
+    @pytest.mark.parametrize("filename", ("config.json", "config.json.gz"))
+    def test_save_configuration_file_compact(
+        conf_file_vdom: Path, function_dir: Path, filename: str
+    ) -> None:
+        """
+        Test that a configuration is saved as compact json and loaded again.
+        """
+
+        # Arrange
+        config = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+
+        # Act
+        config.save_configuration_file(function_dir / filename, compact=True)
+
+        # Assert
+        loaded_config = FortiGateConfig.load_configuration_file(function_dir / filename)
+        assert loaded_config.global_config == config.global_config
+        assert loaded_config.vdom_config == config.vdom_config
+        assert loaded_config.info.__dict__ == config.info.__dict__
+
+    @staticmethod
+    def test_save_configuration_files(
+        conf_file_single: Path, conf_file_vdom: Path, function_dir: Path
+    ) -> None:
+        """
+        Test that many configurations are saved to a json lines file and loaded again.
+        """
+
+        # Arrange
+        configs = [
+            FortiGateConfig.parse_configuration_file(conf_file_single),
+            FortiGateConfig.parse_configuration_file(conf_file_vdom),
+        ]
+
+        # Act
+        count = FortiGateConfig.save_configuration_files(
+            iter(configs), function_dir / "configs.jsonl.gz"
+        )
+
+        # Assert
+        assert count == 2
+        loaded_configs = list(
+            FortiGateConfig.load_configuration_files(function_dir / "configs.jsonl.gz")
+        )
+        assert [loaded.info.hostname for loaded in loaded_configs] == [
+            config.info.hostname for config in configs
+        ]
+        assert [loaded.vdom_config for loaded in loaded_configs] == [
+            config.vdom_config for config in configs
+        ]
@@ -0,0 +1,92 @@
+"""
+Test the FortiGate config blobs.
+"""
+
+# pylint: disable=redefined-outer-name
+
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+
+from fotoobo.exceptions import GeneralWarning
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_blob import ConfigBlob
+
+CERTIFICATE = "-----BEGIN CERTIFICATE-----\n" + "A" * 64 + "\n" * 2 + "B" * 64 * 20 + "\n"
+
+
+@pytest.fixture
+def conf_file_blobs(function_dir: Path) -> Path:
+    """
+    A FortiGate configuration file with a certificate and a multiline comment.
+    """
+
+    conf_file = function_dir / "fortigate_config_blobs.conf"
+    conf_file.write_bytes(
+        b"#config-version=FGT999-7.2.8-FW-build1639-240313:opmode=0:vdom=0:user=admin\r\n"
+        b"config system global\r\n    set hostname FGT_1\r\nend\r\n"
+        b"config vpn certificate local\r\n"
+        b'    edit "certificate_1"\r\n'
+        b'        set certificate "'
+        + CERTIFICATE.replace("\n", "\r\n").encode()
+        + b'-----END CERTIFICATE-----"\r\n'
+        b'        set comments "first line\r\n  second line"\r\n'
+        b"    next\r\nend\r\n"
+    )
+    return conf_file
+
+
+@pytest.mark.parametrize("scope", (None, "vdom"))
+def test_parse_configuration_file_blobs(conf_file_blobs: Path, scope: str | None) -> None:
+    """
+    Test that the big multiline values are parsed as blobs with the same value.
+    """
+
+    # Act
+    config = FortiGateConfig.parse_configuration_file(conf_file_blobs, scope, blobs=True)
+
+    # Assert
+    certificate = config.vdom_config["root"]["vpn"]["certificate"]["local"]["certificate_1"]
+    assert isinstance(certificate["certificate"], ConfigBlob)
+    assert certificate["comments"] == "first line\nsecond line"
+    assert str(certificate["certificate"]).startswith("-----BEGIN CERTIFICATE-----\nAAAA")
+    assert (
+        config.vdom_config == FortiGateConfig.parse_configuration_file(conf_file_blobs).vdom_config
+    )
+
+
+def test_blob_pickle_and_save(conf_file_blobs: Path, function_dir: Path) -> None:
+    """
+    Test that the blobs are pickled as references and saved as strings.
+    """
+
+    # Arrange
+    config = FortiGateConfig.parse_configuration_file(conf_file_blobs, blobs=True)
+
+    # Act
+    pickled_config = pickle.loads(pickle.dumps(config))
+    config.save_configuration_file(function_dir / "config.json")
+
+    # Assert
+    assert pickled_config.vdom_config == config.vdom_config
+    loaded_config = FortiGateConfig.load_configuration_file(function_dir / "config.json")
+    certificate = loaded_config.vdom_config["root"]["vpn"]["certificate"]["local"]["certificate_1"]
+    assert isinstance(certificate["certificate"], str)
+    assert loaded_config.vdom_config == config.vdom_config
+
+
+def test_blob_changed_file(conf_file_blobs: Path) -> None:
+    """
+    Test that a blob is not read from a changed configuration file.
+    """
+
+    # Arrange
+    config = FortiGateConfig.parse_configuration_file(conf_file_blobs, blobs=True)
+    blob = config.vdom_config["root"]["vpn"]["certificate"]["local"]["certificate_1"]["certificate"]
+    os.utime(conf_file_blobs, ns=(0, 0))
+
+    # Act & Assert
+    with pytest.raises(GeneralWarning, match=r"has changed"):
+        str(blob)
@@ -0,0 +1,217 @@
+"""
+Test the FortiGate config cache class.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from fotoobo.exceptions import GeneralWarning
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_cache import FortiGateConfigCache
+
+
+@pytest.fixture
+def conf_file_single() -> Path:
+    """
+    The configuration file with a FortiGate config with single VDOM mode.
+    """
+
+    return Path("tests/data/fortigate_config_single.conf")
+
+
+class TestFortiGateConfigCache:
+    """
+    Test the FortiGateConfigCache class.
+    """
+
+    # pylint: disable=redefined-outer-name
+
+    @staticmethod
+    def test_parse_configuration_file(
+        function_dir: Path, conf_file_single: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that a configuration is parsed only once.
+        """
+
+        # Arrange
+        cache = FortiGateConfigCache(function_dir / "cache")
+        assert cache.get(conf_file_single) is None
+
+        # Act
+        config = cache.parse_configuration_file(conf_file_single)
+        monkeypatch.setattr(
+            "fotoobo.fortinet.fortigate_config.FortiGateConfig.parse_configuration_file",
+            Mock(side_effect=AssertionError("configuration has been parsed again")),
+        )
+        cached_config = cache.parse_configuration_file(conf_file_single)
+
+        # Assert
+        assert len(list((function_dir / "cache").iterdir())) == 1
+        assert cached_config.vdom_config == config.vdom_config
+        assert cached_config.global_config == config.global_config
+        assert cached_config.info.__dict__ == config.info.__dict__
+
+    @staticmethod
+    def test_parse_configuration_file_changed(function_dir: Path, conf_file_single: Path) -> None:
+        """
+        Test that a changed configuration file is parsed again.
+        """
+
+        # Arrange
+        cache = FortiGateConfigCache(function_dir / "cache")
+        file = function_dir / "fortigate.conf"
+        file.write_text(conf_file_single.read_text(encoding="UTF-8"), encoding="UTF-8")
+        cache.parse_configuration_file(file)
+
+        # Act
+        with file.open("a", encoding="UTF-8") as config_file:
+            config_file.write("config leaf_new\n    set option_new value_new\nend\n")
+
+        config = cache.parse_configuration_file(file)
+
+        # Assert
+        assert config.get_configuration("vdom", "/root/leaf_new/option_new") == "value_new"
+        assert len(list((function_dir / "cache").iterdir())) == 2
+
+    @staticmethod
+    def test_parser_version(
+        function_dir: Path, conf_file_single: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the cache entries of another parser version are not used.
+        """
+
+        # Arrange
+        cache = FortiGateConfigCache(function_dir / "cache")
+        cache.put(conf_file_single, FortiGateConfig())
+
+        # Act
+        monkeypatch.setattr(FortiGateConfig, "PARSER_VERSION", "0")
+
+        # Assert
+        assert cache.get(conf_file_single) is None
+
+    @staticmethod
+    def test_entry_without_profile(
+        function_dir: Path, conf_file_single: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the entries of the parser version without the parse profile are not used.
+        """
+
+        # Arrange
+        cache = FortiGateConfigCache(function_dir / "cache")
+        monkeypatch.setattr(FortiGateConfig, "PARSER_VERSION", "2")
+        old_config = FortiGateConfig.parse_configuration_file(conf_file_single)
+        del old_config.profile
+        cache.put(conf_file_single, old_config)
+        monkeypatch.undo()
+
+        # Act
+        config = cache.parse_configuration_file(conf_file_single)
+
+        # Assert
+        assert config.profile is None
+        assert len(list((function_dir / "cache").iterdir())) == 2
+
+    @staticmethod
+    def test_fotoobo_version(
+        function_dir: Path, conf_file_single: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the cache entries of another fotoobo version are not used.
+        """
+
+        # Arrange
+        cache = FortiGateConfigCache(function_dir / "cache")
+        cache.put(conf_file_single, FortiGateConfig())
+
+        # Act
+        monkeypatch.setattr("fotoobo.fortinet.fortigate_config_cache.__version__", "0.0.0")
+
+        # Assert
+        assert cache.get(conf_file_single) is None
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "content",
+        (
+            pytest.param(b"invalid", id="invalid"),
+            pytest.param(b"cfotoobo.fortinet.fortigate_config\nRemovedClass\n.", id="class"),
+            pytest.param(b"cfotoobo.removed_module\nRemovedClass\n.", id="module"),
+        ),
+    )
+    def test_invalid_entry(function_dir: Path, conf_file_single: Path, content: bytes) -> None:
+        """
+        Test that a cache entry which can not be loaded is removed.
+        """
+
+        # Arrange
+        cache = FortiGateConfigCache(function_dir / "cache")
+        cache.put(conf_file_single, FortiGateConfig())
+        entry = next((function_dir / "cache").iterdir())
+        entry.write_bytes(content)
+
+        # Act
+        config = cache.get(conf_file_single)
+
+        # Assert
+        assert config is None
+        assert not entry.exists()
+
+    @staticmethod
+    def test_invalid_configuration(function_dir: Path) -> None:
+        """
+        Test that a configuration which can not be parsed is not cached.
+        """
+
+        # Arrange
+        cache = FortiGateConfigCache(function_dir / "cache")
+
+        # Act & Assert
+        with pytest.raises(GeneralWarning, match=r"There is no info in"):
+            cache.parse_configuration_file(Path("tests/data/fortigate_config_empty.conf"))
+
+        assert not list((function_dir / "cache").iterdir())
+
+    @staticmethod
+    def test_evict(function_dir: Path) -> None:
+        """
+        Test that the least recently used entries are removed.
+        """
+
+        # Arrange
+        cache = FortiGateConfigCache(function_dir / "cache", max_size=1)
+        for number in range(3):
+            entry = function_dir / "cache" / f"{number}{FortiGateConfigCache.SUFFIX}"
+            entry.write_bytes(b"0" * 2**19)
+            os.utime(entry, (number, number))
+
+        # Act
+        cache.evict()
+
+        # Assert
+        assert sorted(entry.name for entry in (function_dir / "cache").iterdir()) == [
+            "1.pickle",
+            "2.pickle",
+        ]
+
+    @staticmethod
+    def test_clear(function_dir: Path, conf_file_single: Path) -> None:
+        """
+        Test that all entries are removed.
+        """
+
+        # Arrange
+        cache = FortiGateConfigCache(function_dir / "cache")
+        cache.put(conf_file_single, FortiGateConfig())
+
+        # Act
+        cache.clear()
+
+        # Assert
+        assert not list((function_dir / "cache").iterdir())
@@ -4,6 +4,8 @@ Test the FortiGate config check class.
 
 # pylint: disable=redefined-outer-name
 
+import pickle
+import re
 from pathlib import Path
 from typing import Any
 
@@ -11,7 +13,8 @@ import pytest
 
 from fotoobo.exceptions import GeneralError
 from fotoobo.fortinet.fortigate_config import FortiGateConfig
-from fotoobo.fortinet.fortigate_config_check import FortiGateConfigCheck
+from fotoobo.fortinet.fortigate_config_check import CheckBundle, FortiGateConfigCheck
+from fotoobo.fortinet.fortigate_config_finding import CheckFinding
 from fotoobo.helpers.files import load_yaml_file
 from fotoobo.helpers.result import Result
 
@@ -91,6 +94,56 @@ class TestFortiGateConfigCheck:
         # Assert
         assert len(result.get_messages(config.info.hostname)) == 2
 
+    @staticmethod
+    def test_check_config_findings(config_vdom: FortiGateConfig) -> None:
+        """
+        Test the structured findings of a configuration check.
+        """
+
+        # Arrange
+        checks = [
+            {
+                "name": "check_value",
+                "type": "value",
+                "scope": "vdom",
+                "path": "/leaf_81/leaf_83/name_1",
+                "checks": {"option_1": "wrong", "option_99": "missing"},
+            }
+        ]
+        conf_check = FortiGateConfigCheck(config_vdom, checks, Result[Any]())
+
+        # Act
+        conf_check.execute_checks()
+
+        # Assert
+        assert conf_check.findings[:2] == [
+            CheckFinding(
+                "HOSTNAME UNKNOWN",
+                "check_value",
+                "value",
+                "vdom",
+                "/leaf_81/leaf_83/name_1",
+                "option_1",
+                "wrong",
+                "value_1",
+                "root",
+            ),
+            CheckFinding(
+                "HOSTNAME UNKNOWN",
+                "check_value",
+                "value",
+                "vdom",
+                "/leaf_81/leaf_83/name_1",
+                "option_99",
+                "missing",
+                None,
+                "root",
+            ),
+        ]
+        assert len(conf_check.findings) == len(
+            conf_check.result.get_messages(config_vdom.info.hostname)
+        )
+
     # start generic tests for config_check with invalid check definition
 
     @staticmethod
@@ -346,3 +399,153 @@ class TestFortiGateConfigCheck:
 
         # Assert
         assert len(result.get_messages(config_vdom.info.hostname)) == expected_messages_count
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "filter_info,expected_messages_count",
+        (
+            pytest.param({"os_version": "9.9.9"}, 1, id="equal"),
+            pytest.param({"os_version": "9.9"}, 0, id="not equal"),
+            pytest.param({"os_version": ">9.10.0"}, 0, id="greater by version number"),
+            pytest.param({"os_version": "<9.10.0"}, 1, id="less by version number"),
+            pytest.param({"os_version": ">10"}, 0, id="greater with less parts"),
+            pytest.param({"model": ">FGT100"}, 1, id="greater by text"),
+            pytest.param({"model": "<FGT100"}, 0, id="less by text"),
+            pytest.param({"os_version": ">9.9.8", "vdom": "0"}, 0, id="many filters"),
+        ),
+    )
+    def test_check_config_filter_info(
+        filter_info: dict[str, str], expected_messages_count: int, config_vdom: FortiGateConfig
+    ) -> None:
+        """
+        Test that the checks are filtered by the meta information of the configuration.
+        """
+
+        # Arrange
+        checks = [
+            {
+                "type": "exist",
+                "scope": "global",
+                "path": "/system/global",
+                "filter-info": filter_info,
+                "checks": {"option_99": True},
+            }
+        ]
+        result = Result[Any]()
+
+        # Act
+        FortiGateConfigCheck(config_vdom, checks, result).execute_checks()
+
+        # Assert
+        assert len(result.get_messages(config_vdom.info.hostname)) == expected_messages_count
+
+
+class TestCheckBundle:
+    """
+    Test the CheckBundle class.
+    """
+
+    @staticmethod
+    def test_compile(checks_file: Path) -> None:
+        """
+        Test that a valid check bundle compiles without errors.
+        """
+
+        # Act
+        bundle = CheckBundle.compile(load_yaml_file(checks_file))
+
+        # Assert
+        assert len(bundle.checks) == len(load_yaml_file(checks_file))  # type: ignore
+        assert not bundle.errors
+        assert bundle.checks[0].comparisons[0][2] == 1
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "check,error",
+        (
+            pytest.param({"type": "count"}, r"Key\(s\) '.*' missing in 'unnamed check'", id="keys"),
+            pytest.param(
+                {"type": "count", "scope": "vdom", "path": "/", "checks": {}, "name": "my_check"},
+                r"No checks defined in 'my_check'",
+                id="no checks",
+            ),
+            pytest.param(
+                {"type": "dummy", "scope": "vdom", "path": "/", "checks": {"eq": 1}},
+                r"Check type 'dummy' not available",
+                id="type",
+            ),
+            pytest.param(
+                {"type": "count", "scope": "dummy", "path": "/", "checks": {"eq": 1}},
+                r"Scope 'dummy' not available",
+                id="scope",
+            ),
+            pytest.param(
+                {"type": "count", "scope": "vdom", "path": "/", "checks": {"ge": 1}},
+                r"Count comparison 'ge' not available",
+                id="count comparison",
+            ),
+            pytest.param(
+                {"type": "count", "scope": "vdom", "path": "/", "checks": {"eq": "one"}},
+                r"Count 'one' is not a number",
+                id="count value",
+            ),
+            pytest.param(
+                {
+                    "type": "exist",
+                    "scope": "vdom",
+                    "path": "/",
+                    "checks": {"option_1": True},
+                    "filter-info": {"dummy": "1"},
+                },
+                r"Unknown filter-info 'dummy'",
+                id="filter-info",
+            ),
+        ),
+    )
+    def test_compile_errors(check: dict[str, Any], error: str) -> None:
+        """
+        Test that invalid checks are reported when the bundle is compiled.
+        """
+
+        # Act
+        bundle = CheckBundle.compile([check])
+
+        # Assert
+        assert not bundle.checks
+        assert len(bundle.errors) == 1
+        assert re.match(error, bundle.errors[0])
+
+    @staticmethod
+    def test_compile_empty() -> None:
+        """
+        Test that an empty check bundle can not be compiled.
+        """
+
+        # Act & Assert
+        with pytest.raises(GeneralError, match=r"There are no checks defined"):
+            CheckBundle.compile([])
+
+    @staticmethod
+    def test_compile_reuse(
+        checks_file: Path, config_vdom: FortiGateConfig, conf_file_single: Path
+    ) -> None:
+        """
+        Test that a compiled check bundle checks many configurations like the raw checks.
+        """
+
+        # Arrange
+        bundle = pickle.loads(pickle.dumps(CheckBundle.compile(load_yaml_file(checks_file))))
+        config_single = FortiGateConfig.parse_configuration_file(conf_file_single)
+        raw_results = [Result[Any](), Result[Any]()]
+        compiled_results = [Result[Any](), Result[Any]()]
+
+        # Act
+        for config, raw_result, compiled_result in zip(
+            (config_vdom, config_single), raw_results, compiled_results
+        ):
+            FortiGateConfigCheck(config, load_yaml_file(checks_file), raw_result).execute_checks()
+            FortiGateConfigCheck(config, bundle, compiled_result).execute_checks()
+
+        # Assert
+        for raw_result, compiled_result in zip(raw_results, compiled_results):
+            assert compiled_result.messages == raw_result.messages
@@ -0,0 +1,102 @@
+"""
+Test the FortiGate config check state class.
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+from fotoobo.fortinet.fortigate_config_check import CheckFailure
+from fotoobo.fortinet.fortigate_config_check_state import FortiGateConfigCheckState
+
+
+class TestFortiGateConfigCheckState:
+    """
+    Test the FortiGateConfigCheckState class.
+    """
+
+    @staticmethod
+    def test_put_save_get(function_dir: Path) -> None:
+        """
+        Test that saved check results are loaded again.
+        """
+
+        # Arrange
+        state = FortiGateConfigCheckState(function_dir / "state.json")
+        key = FortiGateConfigCheckState.key(
+            Path("tests/data/fortigate_config_single.conf"),
+            Path("tests/data/fortigate_checks.yaml"),
+        )
+        assert state.get(key) is None
+
+        # Act
+        state.put(key, "fortigate", [[CheckFailure("key", "1", None, "root")], None, []])
+        state.save()
+
+        # Assert
+        assert FortiGateConfigCheckState(function_dir / "state.json").get(key) == (
+            "fortigate",
+            [[CheckFailure("key", "1", None, "root")], None, []],
+        )
+
+    @staticmethod
+    def test_key_changed(function_dir: Path) -> None:
+        """
+        Test that the key changes with the configuration file and the check bundle file.
+        """
+
+        # Arrange
+        config_file = function_dir / "fortigate.conf"
+        bundle_file = function_dir / "checks.yaml"
+        shutil.copy("tests/data/fortigate_config_single.conf", config_file)
+        shutil.copy("tests/data/fortigate_checks.yaml", bundle_file)
+        key = FortiGateConfigCheckState.key(config_file, bundle_file)
+
+        # Act
+        with config_file.open("a", encoding="UTF-8") as file:
+            file.write("\n")
+
+        config_key = FortiGateConfigCheckState.key(config_file, bundle_file)
+        with bundle_file.open("a", encoding="UTF-8") as file:
+            file.write("\n")
+
+        bundle_key = FortiGateConfigCheckState.key(config_file, bundle_file)
+
+        # Assert
+        assert len({key, config_key, bundle_key}) == 3
+
+    @staticmethod
+    def test_save_used_entries_only(function_dir: Path) -> None:
+        """
+        Test that only the entries used since the state was loaded are saved.
+        """
+
+        # Arrange
+        state = FortiGateConfigCheckState(function_dir / "state.json")
+        state.put("used", "fortigate_1", [])
+        state.put("unused", "fortigate_2", [])
+        state.save()
+        state = FortiGateConfigCheckState(function_dir / "state.json")
+
+        # Act
+        state.get("used")
+        state.save()
+
+        # Assert
+        entries = json.loads((function_dir / "state.json").read_text(encoding="UTF-8"))["entries"]
+        assert list(entries) == ["used"]
+
+    @staticmethod
+    def test_invalid_state_file(function_dir: Path) -> None:
+        """
+        Test that an invalid state file is ignored.
+        """
+
+        # Arrange
+        (function_dir / "state.json").write_text("no json", encoding="UTF-8")
+
+        # Act
+        state = FortiGateConfigCheckState(function_dir / "state.json")
+
+        # Assert
+        assert state.get("key") is None
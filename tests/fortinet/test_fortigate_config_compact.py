@@ -0,0 +1,137 @@
+"""
+Test the compact representation of FortiGate configurations.
+"""
+
+import pickle
+from typing import Any
+
+import pytest
+from pytest import MonkeyPatch
+
+from fotoobo.fortinet.fortigate_config_compact import (
+    compact_configuration,
+    CompactNode,
+    expand_configuration,
+    MAX_SCHEMA_KEYS,
+)
+
+
+@pytest.fixture
+def config() -> dict[str, Any]:
+    """
+    A parsed configuration with a configuration list.
+    """
+
+    return {
+        "system": {"global": {"hostname": "fortigate", "admin-sport": 443}},
+        "firewall": {
+            "policy": [
+                {"id": 1, "action": "accept", "srcintf": ["port1"]},
+                {"id": 2, "action": "accept", "srcintf": ["port2"]},
+            ]
+        },
+    }
+
+
+class TestCompactConfiguration:
+    """
+    Test the compact configuration.
+    """
+
+    # pylint: disable=redefined-outer-name
+
+    @staticmethod
+    def test_compact_configuration(config: dict[str, Any]) -> None:
+        """
+        Test that the compact configuration equals the plain configuration.
+        """
+
+        # Act
+        compact = compact_configuration(config)
+
+        # Assert
+        assert isinstance(compact, CompactNode)
+        assert compact == config
+        assert config == compact
+        assert compact["firewall"]["policy"][1]["srcintf"] == ["port2"]
+        assert "system" in compact
+        assert "missing" not in compact
+        assert compact.get("missing") is None
+        assert len(compact) == 2
+        assert list(compact) == ["system", "firewall"]
+
+    @staticmethod
+    def test_compact_configuration_shared(config: dict[str, Any]) -> None:
+        """
+        Test that configurations with the same keys share their schema and that short values are
+        interned.
+        """
+
+        # Act
+        policies = compact_configuration(config)["firewall"]["policy"]
+
+        # Assert
+        # pylint: disable=protected-access
+        assert policies[0]._schema is policies[1]._schema
+        assert policies[0]["action"] is policies[1]["action"]
+
+    @staticmethod
+    def test_compact_configuration_many_keys() -> None:
+        """
+        Test that configurations with many keys stay dicts.
+        """
+
+        # Arrange
+        config = {
+            f"address_{number}": {"subnet": "0.0.0.0"} for number in range(MAX_SCHEMA_KEYS + 1)
+        }
+
+        # Act
+        compact = compact_configuration(config)
+
+        # Assert
+        assert isinstance(compact, dict)
+        assert isinstance(compact["address_1"], CompactNode)
+
+    @staticmethod
+    def test_compact_configuration_max_schemas(monkeypatch: MonkeyPatch) -> None:
+        """
+        Test that configurations with new keys stay dicts when the schemas are full.
+        """
+
+        # Arrange
+        monkeypatch.setattr("fotoobo.fortinet.fortigate_config_compact._SCHEMAS", {})
+        monkeypatch.setattr("fotoobo.fortinet.fortigate_config_compact.MAX_SCHEMAS", 2)
+        configs = [{"id": 1}, {"name": "dummy"}, {"action": "accept"}, {"id": 2}]
+
+        # Act
+        compact = [compact_configuration(config) for config in configs]
+
+        # Assert
+        assert [type(config) for config in compact] == [CompactNode, CompactNode, dict, CompactNode]
+        assert compact == configs
+
+    @staticmethod
+    def test_expand_configuration(config: dict[str, Any]) -> None:
+        """
+        Test that the expanded configuration consists of plain dicts and lists again.
+        """
+
+        # Act
+        expanded = expand_configuration(compact_configuration(config))
+
+        # Assert
+        assert expanded == config
+        assert isinstance(expanded["firewall"]["policy"][0], dict)
+
+    @staticmethod
+    def test_pickle(config: dict[str, Any]) -> None:
+        """
+        Test that the compact configuration can be pickled (e.g. to send it to a worker process).
+        """
+
+        # Act
+        compact = pickle.loads(pickle.dumps(compact_configuration(config)))
+
+        # Assert
+        assert compact == config
@@ -0,0 +1,101 @@
+"""
+Test the FortiGate config diff.
+"""
+
+from typing import Any
+
+import pytest
+
+from fotoobo.fortinet.fortigate_config_diff import diff_configurations, FortiGateConfigDiff
+
+
+@pytest.mark.parametrize(
+    "old,new,expected",
+    (
+        pytest.param({"a": {"b": 1}}, {"a": {"b": 1}}, FortiGateConfigDiff(), id="equal"),
+        pytest.param(
+            {"a": {"b": 1, "c": 2}},
+            {"a": {"b": 1, "d": 3}},
+            FortiGateConfigDiff(added={("vdom", "/a/d"): 3}, removed={("vdom", "/a/c"): 2}),
+            id="added and removed",
+        ),
+        pytest.param(
+            {"a": {"b": "x"}},
+            {"a": {"b": {"c": "x"}}},
+            FortiGateConfigDiff(changed={("vdom", "/a/b"): ("x", {"c": "x"})}),
+            id="changed type",
+        ),
+        pytest.param(
+            {"policy": [{"id": 1, "a": "x"}, {"id": 2, "a": "x"}]},
+            {"policy": [{"id": 5, "a": "x"}, {"id": 1, "a": "x"}, {"id": 2, "a": "y"}]},
+            FortiGateConfigDiff(
+                added={("vdom", "/policy/5"): {"id": 5, "a": "x"}},
+                changed={("vdom", "/policy/2/a"): ("x", "y")},
+            ),
+            id="list with inserted element",
+        ),
+        pytest.param(
+            {"policy": [{"id": 1}, {"id": 2}, {"id": 3}]},
+            {"policy": [{"id": 2}, {"id": 1}]},
+            FortiGateConfigDiff(
+                removed={("vdom", "/policy/3"): {"id": 3}},
+                changed={("vdom", "/policy"): ([1, 2], [2, 1])},
+            ),
+            id="reordered list",
+        ),
+        pytest.param(
+            {"member": ["a", "b"]},
+            {"member": ["b", "a"]},
+            FortiGateConfigDiff(changed={("vdom", "/member"): (["a", "b"], ["b", "a"])}),
+            id="list of values",
+        ),
+    ),
+)
+def test_diff_configurations(old: Any, new: Any, expected: FortiGateConfigDiff) -> None:
+    """
+    Test the differences of two configuration trees.
+    """
+
+    # Act
+    diff = diff_configurations(old, new, "vdom")
+
+    # Assert
+    assert diff == expected
+
+
+def test_diff_configurations_path() -> None:
+    """
+    Test that the differences are keyed by the given path.
+    """
+
+    # Act
+    diff = diff_configurations({"a": 1}, {"a": 2}, "global", "/system/global/")
+
+    # Assert
+    assert diff.changed == {("global", "/system/global/a"): (1, 2)}
+
+
+def test_lines() -> None:
+    """
+    Test that the differences are rendered in the natural order of their paths.
+    """
+
+    # Arrange
+    diff = FortiGateConfigDiff(
+        added={("vdom", "/root/policy/10"): {}, ("global", "/system/b"): "x"},
+        removed={("vdom", "/root/policy/9"): {}},
+        changed={("global", "/system/a"): ("x", "y")},
+    )
+
+    # Act
+    lines = diff.lines()
+
+    # Assert
+    assert lines == [
+        "~ global /system/a: 'x' -> 'y'",
+        "+ global /system/b",
+        "- vdom /root/policy/9",
+        "+ vdom /root/policy/10",
+    ]
+    assert diff
+    assert not FortiGateConfigDiff()
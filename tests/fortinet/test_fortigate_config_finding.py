@@ -0,0 +1,96 @@
+"""
+Test the FortiGate config check findings.
+"""
+
+import csv
+from pathlib import Path
+
+import pytest
+from pytest import MonkeyPatch
+
+from fotoobo.exceptions import GeneralError
+from fotoobo.fortinet.fortigate_config_finding import CheckFinding, save_findings
+from fotoobo.helpers.files import load_json_lines_file
+
+FINDINGS = [
+    CheckFinding(
+        "fgt_1", "check_1", "value", "vdom", "/system/dns", "primary", "1.1.1.1", None, "root"
+    ),
+    CheckFinding("fgt_2", None, "count", "global", "/system/admin", "eq", "1", "2", None),
+]
+
+
+def test_save_findings_csv(function_dir: Path) -> None:
+    """
+    Test saving the findings to a csv file.
+    """
+
+    # Act
+    count = save_findings(function_dir / "findings.csv", iter(FINDINGS))
+
+    # Assert
+    assert count == 2
+    with (function_dir / "findings.csv").open(encoding="UTF-8", newline="") as csv_file:
+        assert list(csv.reader(csv_file)) == [
+            list(CheckFinding._fields),
+            ["fgt_1", "check_1", "value", "vdom", "/system/dns", "primary", "1.1.1.1", "", "root"],
+            ["fgt_2", "", "count", "global", "/system/admin", "eq", "1", "2", ""],
+        ]
+
+
+@pytest.mark.parametrize("filename", ("findings.jsonl", "findings.ndjson.gz"))
+def test_save_findings_json_lines(function_dir: Path, filename: str) -> None:
+    """
+    Test saving the findings to a (compressed) json lines file.
+    """
+
+    # Act
+    count = save_findings(function_dir / filename, FINDINGS)
+
+    # Assert
+    assert count == 2
+    assert [
+        CheckFinding(**finding) for finding in load_json_lines_file(function_dir / filename)
+    ] == FINDINGS
+
+
+def test_save_findings_parquet(function_dir: Path) -> None:
+    """
+    Test saving the findings to a parquet file.
+    """
+
+    # Arrange
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    # Act
+    count = save_findings(function_dir / "findings.parquet", FINDINGS)
+
+    # Assert
+    assert count == 2
+    assert parquet.read_table(function_dir / "findings.parquet").to_pylist() == [
+        finding._asdict() for finding in FINDINGS
+    ]
+
+
+def test_save_findings_parquet_missing(function_dir: Path, monkeypatch: MonkeyPatch) -> None:
+    """
+    Test saving the findings to a parquet file when pyarrow is not installed.
+    """
+
+    # Arrange
+    monkeypatch.setattr("fotoobo.helpers.files.pyarrow", None)
+
+    # Act & Assert
+    with pytest.raises(GeneralError, match=r"Install the package 'pyarrow'"):
+        save_findings(function_dir / "findings.parquet", FINDINGS)
+
+
+@pytest.mark.parametrize("filename", ("findings.txt", "findings"))
+def test_save_findings_unsupported(function_dir: Path, filename: str) -> None:
+    """
+    Test saving the findings to a file with an unsupported format.
+    """
+
+    # Act & Assert
+    with pytest.raises(GeneralError, match=r"Unsupported findings file"):
+        save_findings(function_dir / filename, FINDINGS)
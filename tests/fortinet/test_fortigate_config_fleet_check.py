@@ -0,0 +1,167 @@
+"""
+Test the FortiGate config fleet check class.
+"""
+
+# pylint: disable=redefined-outer-name
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_check import FortiGateConfigCheck
+from fotoobo.fortinet.fortigate_config_fleet_check import FortiGateConfigFleetCheck
+from fotoobo.helpers.files import load_yaml_file
+from fotoobo.helpers.result import Result
+
+
+@pytest.fixture
+def configs() -> list[FortiGateConfig]:
+    """
+    The FortiGate configurations of a fleet with single and multiple VDOM mode.
+    """
+
+    configs = []
+    for number, file in enumerate(("fortigate_config_single.conf", "fortigate_config_vdom.conf")):
+        config = FortiGateConfig.parse_configuration_file(Path("tests/data") / file)
+        config.info.hostname = f"fortigate_{number}"
+        configs.append(config)
+
+    return configs
+
+
+@pytest.fixture
+def checks() -> list[dict[str, Any]]:
+    """
+    The checks of the check bundle file and some checks which fail or are filtered.
+    """
+
+    return load_yaml_file(Path("tests/data/fortigate_checks.yaml")) + [  # type: ignore
+        {
+            "type": "value",
+            "scope": "vdom",
+            "path": "/leaf_81/leaf_83/name_1",
+            "checks": {"option_1": "wrong", "option_2": "missing"},
+        },
+        {
+            "type": "exist",
+            "scope": "global",
+            "path": "/system/global",
+            "filter-info": {"vdom": "1"},
+            "checks": {"option_99": True},
+        },
+        {
+            "type": "count",
+            "scope": "vdom",
+            "path": "/leaf_81/leaf_82",
+            "checks": {"eq": 100, "lt": 0},
+        },
+    ]
+
+
+class TestFortiGateConfigFleetCheck:
+    """
+    Test the FortiGateConfigFleetCheck class.
+    """
+
+    @staticmethod
+    def test_evaluate_messages(
+        configs: list[FortiGateConfig], checks: list[dict[str, Any]]
+    ) -> None:
+        """
+        Test that the fleet check generates the same messages as the check of every configuration.
+        """
+
+        # Arrange
+        expected = Result[Any]()
+        for config in configs:
+            FortiGateConfigCheck(config, checks, expected).execute_checks()
+
+        fleet_check = FortiGateConfigFleetCheck(checks)
+
+        # Act
+        for config in configs:
+            fleet_check.add_configuration(config)
+
+        result = fleet_check.evaluate().to_result()
+
+        # Assert
+        assert result.messages == expected.messages
+        assert result.get_messages("fortigate_1")
+
+    @staticmethod
+    def test_evaluate_findings(
+        configs: list[FortiGateConfig], checks: list[dict[str, Any]]
+    ) -> None:
+        """
+        Test that the fleet check generates the same findings as the check of every configuration.
+        """
+
+        # Arrange
+        expected = []
+        for config in configs:
+            config_check = FortiGateConfigCheck(config, checks, Result[Any]())
+            config_check.execute_checks()
+            expected += config_check.findings
+
+        fleet_check = FortiGateConfigFleetCheck(checks)
+
+        # Act
+        for config in configs:
+            fleet_check.add_configuration(config)
+
+        findings = list(fleet_check.evaluate().findings())
+
+        # Assert
+        assert findings == expected
+        assert {finding.vdom for finding in findings} > {None}
+
+    @staticmethod
+    def test_evaluate_matrix(configs: list[FortiGateConfig], checks: list[dict[str, Any]]) -> None:
+        """
+        Test the host x check matrix of the fleet check.
+        """
+
+        # Arrange
+        fleet_check = FortiGateConfigFleetCheck(checks)
+        for config in configs:
+            fleet_check.add_values(
+                config.info.hostname, FortiGateConfigFleetCheck.extract(fleet_check.bundle, config)
+            )
+
+        # Act
+        fleet_result = fleet_check.evaluate()
+
+        # Assert
+        assert fleet_result.hosts == ["fortigate_0", "fortigate_1"]
+        assert fleet_result.matrix == [
+            [0, 0, 0, 0, 0, 2, None, 2],
+            [0, 0, 0, 2, 0, 6, 1, 2],
+        ]
+
+    @staticmethod
+    def test_to_result_table(configs: list[FortiGateConfig], checks: list[dict[str, Any]]) -> None:
+        """
+        Test that the failures are pushed as result of every host with unique check labels.
+        """
+
+        # Arrange
+        fleet_check = FortiGateConfigFleetCheck(checks + [checks[-1]])
+        fleet_check.add_configuration(configs[0])
+
+        # Act
+        result = fleet_check.evaluate().to_result()
+
+        # Assert
+        assert result.get_result("fortigate_0") == {
+            "count vdom /leaf_81/leaf_82": 0,
+            "exist global /system/global": 0,
+            "value_everything_ok": 0,
+            "check_if_value_in_list": 0,
+            "exist vdom /system/vdom_setting": 0,
+            "value vdom /leaf_81/leaf_83/name_1": 2,
+            "exist global /system/global (2)": "-",
+            "count vdom /leaf_81/leaf_82 (2)": 2,
+            "count vdom /leaf_81/leaf_82 (3)": 2,
+        }
@@ -0,0 +1,175 @@
+"""
+Test the lazy VDOM configuration.
+"""
+
+import os
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+from fotoobo.exceptions import GeneralWarning
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_lazy import (
+    LazyVdomConfig,
+    read_ranges,
+    scan_configuration_file,
+)
+
+
+@pytest.fixture
+def conf_file_vdom() -> Path:
+    """
+    The configuration file with a FortiGate config with VDOMs enabled.
+    """
+
+    return Path("tests/data/fortigate_config_vdom.conf")
+
+
+def test_scan_configuration_file(conf_file_vdom: Path) -> None:
+    """
+    Test the layout of a configuration file with VDOMs.
+    """
+
+    # pylint: disable=redefined-outer-name
+
+    # Act
+    layout = scan_configuration_file(conf_file_vdom)
+
+    # Assert
+    assert layout.comments[0].startswith("#config-version=FGT999-9.9.9")
+    assert list(layout.vdom_ranges) == ["root", "vdom_n", "vdom_z"]
+    assert read_ranges(conf_file_vdom, [layout.vdom_ranges["vdom_n"]])[:2] == [
+        "edit vdom_n",
+        "config system vdom_setting",
+    ]
+    assert read_ranges(conf_file_vdom, layout.global_ranges)[0] == "config global"
+
+
+def test_scan_configuration_file_empty() -> None:
+    """
+    Test the layout of an empty configuration file.
+    """
+
+    # Act
+    layout = scan_configuration_file(Path("tests/data/fortigate_config_empty.conf"))
+
+    # Assert
+    assert layout == ([], [], {})
+
+
+class TestLazyVdomConfig:
+    """
+    Test the LazyVdomConfig class.
+    """
+
+    # pylint: disable=redefined-outer-name
+
+    @staticmethod
+    def test_parse_on_access(conf_file_vdom: Path) -> None:
+        """
+        Test that the VDOMs are only parsed when they are accessed.
+        """
+
+        # Arrange
+        config = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+
+        # Act
+        lazy_config = FortiGateConfig.parse_configuration_file(conf_file_vdom, lazy=True)
+
+        # Assert
+        assert isinstance(lazy_config.vdom_config, LazyVdomConfig)
+        assert lazy_config.get_vdoms() == config.get_vdoms()
+        assert lazy_config.info.__dict__ == config.info.__dict__
+        assert lazy_config.global_config == config.global_config
+        assert not lazy_config.vdom_config.loaded
+        assert lazy_config.get_configuration("vdom", "/vdom_n/leaf_n") == {"option_n": "value_n"}
+        assert lazy_config.vdom_config.loaded == ["vdom_n"]
+        assert lazy_config.vdom_config == config.vdom_config
+
+    @staticmethod
+    def test_parse_single_vdom() -> None:
+        """
+        Test that a configuration without VDOMs is parsed as a whole.
+        """
+
+        # Act
+        config = FortiGateConfig.parse_configuration_file(
+            Path("tests/data/fortigate_config_single.conf"), lazy=True
+        )
+
+        # Assert
+        assert isinstance(config.vdom_config, dict)
+        assert config.get_configuration("vdom", "/root/leaf_81/leaf_82")
+
+    @staticmethod
+    def test_parse_no_info() -> None:
+        """
+        Test that a configuration file without meta information is not parsed.
+        """
+
+        # Act & Assert
+        with pytest.raises(GeneralWarning, match=r"There is no info in"):
+            FortiGateConfig.parse_configuration_file(
+                Path("tests/data/fortigate_config_empty.conf"), lazy=True
+            )
+
+    @staticmethod
+    def test_set_and_delete(conf_file_vdom: Path) -> None:
+        """
+        Test that VDOMs may be replaced, added and deleted.
+        """
+
+        # Arrange
+        config = FortiGateConfig.parse_configuration_file(conf_file_vdom, lazy=True)
+
+        # Act
+        config.vdom_config["vdom_n"] = {"leaf": {}}
+        config.vdom_config["vdom_new"] = {}
+        del config.vdom_config["root"]
+
+        # Assert
+        assert config.get_vdoms() == ["vdom_n", "vdom_z", "vdom_new"]
+        assert config.vdom_config["vdom_n"] == {"leaf": {}}
+        assert "root" not in config.vdom_config
+        with pytest.raises(KeyError):
+            config.vdom_config["root"]  # pylint: disable=pointless-statement
+
+    @staticmethod
+    def test_pickle(conf_file_vdom: Path) -> None:
+        """
+        Test that a lazy configuration can be sent to another process without parsing its VDOMs.
+        """
+
+        # Arrange
+        config = FortiGateConfig.parse_configuration_file(conf_file_vdom, lazy=True)
+
+        # Act
+        loaded_config = pickle.loads(pickle.dumps(config))
+
+        # Assert
+        assert not loaded_config.vdom_config.loaded
+        assert (
+            loaded_config.vdom_config
+            == FortiGateConfig.parse_configuration_file(conf_file_vdom).vdom_config
+        )
+
+    @staticmethod
+    def test_changed_file(conf_file_vdom: Path, function_dir: Path) -> None:
+        """
+        Test that the VDOMs are not parsed from a file which changed.
+        """
+
+        # Arrange
+        file = function_dir / "fortigate.conf"
+        shutil.copy(conf_file_vdom, file)
+        config = FortiGateConfig.parse_configuration_file(file, lazy=True)
+        with file.open("a", encoding="UTF-8") as conf_file:
+            conf_file.write("\n")
+
+        os.utime(file, ns=(0, 0))
+
+        # Act & Assert
+        with pytest.raises(GeneralWarning, match=r"has changed"):
+            config.get_configuration("vdom", "/root")
@@ -0,0 +1,131 @@
+"""
+Test the FortiGate config parse profile.
+"""
+
+from pathlib import Path
+
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_profile import (
+    ParseProfile,
+    SectionProfile,
+    slowest_sections,
+)
+
+LINES = [
+    "#config-version=FGT999-7.2.8-FW-build1639-240313:opmode=0:vdom=1:user=admin\n",
+    "config vdom\n",
+    "edit root\n",
+    "next\n",
+    "end\n",
+    "config global\n",
+    "config system global\n",
+    "    set hostname FGT_1\n",
+    "end\n",
+    "end\n",
+    "config vdom\n",
+    "edit root\n",
+    "config system auto-script\n",
+    '    edit "script_1"\n',
+    '        set script "config system global\n',
+    "set timezone 1\n",
+    'end"\n',
+    "    next\n",
+    "end\n",
+    "config firewall policy\n",
+    "    edit 1\n",
+    "        set name policy_1\n",
+    "    next\n",
+]
+
+
+def test_record() -> None:
+    """
+    Test that the sections are recorded with their VDOM, lines and nodes.
+    """
+
+    # Arrange
+    profile = ParseProfile()
+
+    # Act
+    lines = list(profile.record(LINES))
+
+    # Assert
+    assert lines == LINES
+    assert [
+        (section.vdom, section.section, section.lines, section.nodes)
+        for section in profile.sections
+    ] == [
+        (None, "system global", 3, 2),
+        ("root", "system auto-script", 7, 3),
+        ("root", "firewall policy", 4, 3),
+    ]
+    assert profile.seconds == sum(section.seconds for section in profile.sections)
+
+
+def test_slowest_sections() -> None:
+    """
+    Test that the slowest sections of many profiles are ordered by their time.
+    """
+
+    # Arrange
+    profiles = [
+        ParseProfile("file_1", "fgt_1", [SectionProfile(None, "system global", 5, 4, 0.1)]),
+        ParseProfile(
+            "file_2",
+            "fgt_2",
+            [
+                SectionProfile("root", "firewall policy", 100, 50, 0.5),
+                SectionProfile("root", "firewall address", 10, 5, 0.01),
+            ],
+        ),
+    ]
+
+    # Act
+    sections = slowest_sections(profiles, limit=2)
+
+    # Assert
+    assert sections == [
+        {
+            "host": "fgt_2",
+            "vdom": "root",
+            "section": "firewall policy",
+            "lines": 100,
+            "nodes": 50,
+            "seconds": "0.5000",
+        },
+        {
+            "host": "fgt_1",
+            "vdom": "-",
+            "section": "system global",
+            "lines": 5,
+            "nodes": 4,
+            "seconds": "0.1000",
+        },
+    ]
+    assert len(slowest_sections(profiles, limit=0)) == 3
+
+
+def test_parse_configuration_file_profile() -> None:
+    """
+    Test that the parser records the profile only if it is asked to.
+    """
+
+    # Arrange
+    file = Path("tests/data/fortigate_config_vdom.conf")
+
+    # Act
+    config = FortiGateConfig.parse_configuration_file(file, profile=True)
+
+    # Assert
+    assert config.profile is not None
+    assert config.profile.file == str(file)
+    assert config.profile.host == "HOSTNAME UNKNOWN"
+    assert {section.vdom for section in config.profile.sections} == {
+        None,
+        "root",
+        "vdom_n",
+        "vdom_z",
+    }
+    unprofiled_config = FortiGateConfig.parse_configuration_file(file)
+    assert unprofiled_config.profile is None
+    assert unprofiled_config.vdom_config == config.vdom_config
@@ -0,0 +1,103 @@
+"""
+Test the FortiGate config query.
+"""
+
+# pylint: disable=redefined-outer-name
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from fotoobo.exceptions import GeneralError
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_query import ConfigPredicate, query_configurations
+
+
+@pytest.fixture
+def conf_file_vdom() -> Path:
+    """
+    The configuration file with a FortiGate config with VDOMs enabled.
+    """
+
+    return Path("tests/data/fortigate_config_vdom.conf")
+
+
+@pytest.mark.parametrize(
+    "predicate,expected",
+    (
+        pytest.param("!= 443", ConfigPredicate("", "==", "443", True), id="negated"),
+        pytest.param("action==deny", ConfigPredicate("action", "==", "deny"), id="with key"),
+        pytest.param(
+            'srcaddr !~ "^net_"', ConfigPredicate("srcaddr", "~", "^net_", True), id="quoted"
+        ),
+        pytest.param("admin-sport <= 8443", ConfigPredicate("admin-sport", "<=", "8443"), id="le"),
+    ),
+)
+def test_parse(predicate: str, expected: ConfigPredicate) -> None:
+    """
+    Test parsing predicates.
+    """
+
+    # Act & Assert
+    assert ConfigPredicate.parse(predicate) == expected
+
+
+@pytest.mark.parametrize(
+    "predicate,error",
+    (
+        pytest.param("443", r"Invalid predicate", id="no operator"),
+        pytest.param("~ (", r"Invalid regular expression", id="invalid regular expression"),
+    ),
+)
+def test_parse_invalid(predicate: str, error: str) -> None:
+    """
+    Test parsing invalid predicates.
+    """
+
+    # Act & Assert
+    with pytest.raises(GeneralError, match=error):
+        ConfigPredicate.parse(predicate)
+
+
+@pytest.mark.parametrize(
+    "predicate,config,expected",
+    (
+        pytest.param("!= 443", "8443", True, id="not equal"),
+        pytest.param("!= 443", "443", False, id="equal"),
+        pytest.param("> 9", "10", True, id="numbers"),
+        pytest.param("< 7.10.0", "7.2.8", True, id="version numbers"),
+        pytest.param("> b", "a", False, id="text"),
+        pytest.param("~ ^net_", ["all", "net_1"], True, id="any element of a list"),
+        pytest.param("!= all", ["all", "net_1"], False, id="no element of a list"),
+        pytest.param("action == deny", {"action": "deny"}, True, id="key"),
+        pytest.param("action != deny", {"name": "x"}, False, id="missing key"),
+        pytest.param("== x", {"name": "x"}, False, id="configuration"),
+    ),
+)
+def test_matches(predicate: str, config: Any, expected: bool) -> None:
+    """
+    Test applying predicates to configurations.
+    """
+
+    # Act & Assert
+    assert ConfigPredicate.parse(predicate).matches(config) is expected
+
+
+def test_query_configurations(conf_file_vdom: Path) -> None:
+    """
+    Test querying a configuration with a predicate.
+    """
+
+    # Arrange
+    config = FortiGateConfig.parse_configuration_file(conf_file_vdom)
+
+    # Act
+    rows = query_configurations(
+        config, "vdom", "/*/leaf_81/leaf_82/*", ConfigPredicate.parse("id >= 2")
+    )
+
+    # Assert
+    assert rows == [
+        ("HOSTNAME UNKNOWN", "/root/leaf_81/leaf_82/2", {"option_1": "value_1", "id": 2})
+    ]
@@ -0,0 +1,216 @@
+"""
+Test the FortiGate config tokenizer.
+"""
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_tokenizer import (
+    Token,
+    tokenize,
+    tokenize_file,
+    TokenType,
+)
+
+CONFIG = (
+    b"#config-version=FGT999-7.2.8-FW-build1639-240313:opmode=0:vdom=0:user=admin\n"
+    b"\n"
+    b"config system global\n"
+    b'    set hostname "dummy host"\n'
+    b"    unset timezone\n"
+    b"end\n"
+    b"config firewall address\n"
+    b'    edit "host 1"\n'
+    b'        set comment "first line\n'
+    b"second line\n"
+    b'last line"\n'
+    b"        purge\n"
+    b"    next\n"
+    b"end\n"
+)
+
+
+class TestTokenize:
+    """
+    Test the tokenize function.
+    """
+
+    @staticmethod
+    def test_tokenize() -> None:
+        """
+        Test that every known statement becomes a token of the right type.
+        """
+
+        # Act
+        tokens = list(tokenize(BytesIO(CONFIG)))
+
+        # Assert
+        assert [token.type for token in tokens] == [
+            TokenType.COMMENT,
+            TokenType.CONFIG,
+            TokenType.SET,
+            TokenType.UNSET,
+            TokenType.END,
+            TokenType.CONFIG,
+            TokenType.EDIT,
+            TokenType.SET,
+            TokenType.NEXT,
+            TokenType.END,
+        ]
+        assert tokens[1].words == ["system", "global"]
+        assert tokens[2].key == "hostname"
+        assert tokens[2].value == '"dummy host"'
+        assert tokens[3].key == "timezone"
+        assert tokens[6].words == ["host 1"]
+
+    @staticmethod
+    def test_tokenize_offsets() -> None:
+        """
+        Test that the byte offsets of the tokens point to their statements.
+        """
+
+        # Act
+        tokens = list(tokenize(BytesIO(CONFIG)))
+
+        # Assert
+        assert CONFIG[tokens[1].start : tokens[1].end] == b"config system global\n"
+        assert CONFIG[tokens[6].start : tokens[6].end] == b'    edit "host 1"\n'
+        assert tokens[-1].end == len(CONFIG)
+
+    @staticmethod
+    def test_tokenize_multiline() -> None:
+        """
+        Test that a quoted value continues on the following lines until the quote is closed.
+        """
+
+        # Act
+        token = list(tokenize(BytesIO(CONFIG)))[7]
+
+        # Assert
+        assert token.type == TokenType.SET
+        assert token.key == "comment"
+        assert token.value == '"first line\nsecond line\nlast line"'
+        assert CONFIG[token.start : token.end].endswith(b'last line"\n')
+
+    @staticmethod
+    def test_tokenize_multiline_like_parser(function_dir: Path) -> None:
+        """
+        Test that the multiline values start and end on the same lines as in the parser, also if
+        they contain quotes.
+        """
+
+        # Arrange
+        file = function_dir / "fortigate.conf"
+        file.write_bytes(
+            b"#config-version=FGT999-7.2.8-FW-build1639-240313:opmode=0:vdom=0:user=admin\n"
+            b"config system auto-script\n"
+            b'    edit "script 1"\n'
+            b'        set script "diagnose sys top\n'
+            b'echo "hello\n'
+            b'echo "x"\n'
+            b'        set comment "echo "x"\n'
+            b"        set interval 10\n"
+            b"    next\n"
+            b"end\n"
+        )
+        config = FortiGateConfig.parse_configuration_file(file)
+        options = config.global_config["system"]["auto-script"]["script 1"]
+
+        # Act
+        tokens = [token for token in tokenize_file(file) if token.type is TokenType.SET]
+
+        # Assert
+        assert [token.key for token in tokens] == list(options)
+        assert tokens[0].value.strip('"') == options["script"]
+        assert tokens[1].value == '"echo "x"'
+
+    @staticmethod
+    def test_tokenize_comment() -> None:
+        """
+        Test that the comment token holds the comment without its hash sign.
+        """
+
+        # Act
+        token = next(tokenize(BytesIO(CONFIG)))
+
+        # Assert
+        assert token.text.startswith("config-version=FGT999-7.2.8")
+
+    @staticmethod
+    def test_tokenize_lazy() -> None:
+        """
+        Test that the arguments of a token are kept as raw bytes.
+        """
+
+        # Arrange
+        statement = '    set comment "Grüezi"\r\n'.encode()
+
+        # Act
+        token = next(tokenize(BytesIO(statement)))
+
+        # Assert
+        assert token == Token(TokenType.SET, 0, len(statement), 'comment "Grüezi"'.encode())
+        assert token.value == '"Grüezi"'
+
+
+class TestTokenizeFile:
+    """
+    Test the tokenize_file function.
+    """
+
+    @staticmethod
+    def test_tokenize_file(function_dir: Path) -> None:
+        """
+        Test that a memory mapped file is tokenized like its content.
+        """
+
+        # Arrange
+        file = function_dir / "fortigate.conf"
+        file.write_bytes(CONFIG)
+
+        # Act
+        tokens = list(tokenize_file(file))
+
+        # Assert
+        assert tokens == list(tokenize(BytesIO(CONFIG)))
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "file",
+        (
+            pytest.param(Path("tests/data/fortigate_config_single.conf"), id="single"),
+            pytest.param(Path("tests/data/fortigate_config_vdom.conf"), id="vdom"),
+        ),
+    )
+    def test_tokenize_file_statements(file: Path) -> None:
+        """
+        Test that the tokens of the test configurations point to their statements.
+        """
+
+        # Arrange
+        content = file.read_bytes()
+        keywords = tuple(token_type.value for token_type in TokenType)
+        statements = [line for line in content.splitlines() if line.strip().startswith(keywords)]
+
+        # Act
+        tokens = list(tokenize_file(file))
+
+        # Assert
+        assert len(tokens) == len(statements)
+        for token in tokens:
+            assert content[token.start : token.end].strip().startswith(token.type.value)
+
+    @staticmethod
+    def test_tokenize_file_empty() -> None:
+        """
+        Test that an empty file has no tokens.
+        """
+
+        # Act
+        tokens = list(tokenize_file(Path("tests/data/fortigate_config_empty.conf")))
+
+        # Assert
+        assert not tokens
@@ -0,0 +1,218 @@
+"""
+Test the FortiGate config usage index.
+"""
+
+# pylint: disable=redefined-outer-name
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from fotoobo.fortinet.fortigate_config import FortiGateConfig
+from fotoobo.fortinet.fortigate_config_usage import (
+    extract_usages,
+    FortiGateConfigUsageIndex,
+    ObjectUsage,
+)
+
+
+@pytest.fixture
+def config() -> FortiGateConfig:
+    """
+    A FortiGate configuration with objects which are used in the global and the VDOM scope.
+    """
+
+    return FortiGateConfig(
+        {
+            "system": {
+                "global": {"hostname": "FGT_1", "management-vdom": "root"},
+                "interface": {"port1": {"vdom": "root"}, "port 2": {"vdom": "root"}},
+            }
+        },
+        {
+            "root": {
+                "firewall": {
+                    "address": {"net_1": {"subnet": "10.0.0.0/8"}, "all": {}},
+                    "addrgrp": {"group_1": {"member": "net_1 all", "comment": "net_1"}},
+                    "policy": [
+                        {"id": 1, "srcintf": "port 2", "srcaddr": "group_1", "dstaddr": "all"},
+                        {"id": 2, "srcintf": "port1", "srcaddr": "net_1", "action": "accept"},
+                    ],
+                }
+            }
+        },
+        {"vdom": "1"},
+    )
+
+
+@pytest.fixture
+def conf_files(function_dir: Path) -> list[Path]:
+    """
+    Copies of the FortiGate configuration files in a temporary directory.
+    """
+
+    files = []
+    for name in ("fortigate_config_single.conf", "fortigate_config_vdom.conf"):
+        shutil.copy(Path("tests/data") / name, function_dir / name)
+        files.append(function_dir / name)
+
+    return files
+
+
+def test_extract_usages(config: FortiGateConfig) -> None:
+    """
+    Test extracting the usages of the objects of a configuration.
+    """
+
+    # Act
+    usages = extract_usages(config)
+
+    # Assert
+    assert sorted(usages) == [
+        ("all", "root", "/firewall/addrgrp", "group_1", "member"),
+        ("all", "root", "/firewall/policy", "1", "dstaddr"),
+        ("group_1", "root", "/firewall/policy", "1", "srcaddr"),
+        ("net_1", "root", "/firewall/addrgrp", "group_1", "comment"),
+        ("net_1", "root", "/firewall/addrgrp", "group_1", "member"),
+        ("net_1", "root", "/firewall/policy", "2", "srcaddr"),
+        ("port 2", "root", "/firewall/policy", "1", "srcintf"),
+        ("port1", "root", "/firewall/policy", "2", "srcintf"),
+    ]
+
+
+def test_extract_usages_no_objects(config: FortiGateConfig) -> None:
+    """
+    Test that the blocks like "system global" are no objects and do not reference themselves.
+    """
+
+    # Arrange
+    config.vdom_config["root"]["firewall"]["policy"][0]["comments"] = "global interface port1"
+
+    # Act
+    usages = extract_usages(config)
+
+    # Assert
+    assert ("port1", "root", "/firewall/policy", "1", "comments") in usages
+    assert not [usage for usage in usages if usage[0] in ("global", "interface", "root")]
+
+
+def test_update_and_lookup(conf_files: list[Path], function_dir: Path) -> None:
+    """
+    Test that the usage index is built and the usages are looked up.
+    """
+
+    # Arrange
+    index = FortiGateConfigUsageIndex(function_dir / "usage.sqlite")
+
+    # Act
+    indexed = index.update(conf_files)
+
+    # Assert
+    assert indexed == 2
+    assert index.lookup("name_1") == []
+    assert index.lookup("nonexist") == []
+    index.close()
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_update_incremental(conf_files: list[Path], function_dir: Path, workers: int) -> None:
+    """
+    Test that only the changed configuration files are parsed again.
+    """
+
+    # Arrange
+    index_file = function_dir / "usage.sqlite"
+    index = FortiGateConfigUsageIndex(index_file)
+    index.update(conf_files, workers)
+    index.close()
+    os.utime(conf_files[0], ns=(0, 0))
+    with conf_files[1].open("a", encoding="UTF-8") as conf_file:
+        conf_file.write(
+            "config vdom\nedit root\nconfig firewall address\nedit net_1\nnext\nend\n"
+            "config firewall policy\nedit 1\nset srcaddr net_1\nnext\nend\nend\n"
+        )
+
+    # Act
+    index = FortiGateConfigUsageIndex(index_file)
+    indexed = index.update(conf_files, workers)
+
+    # Assert
+    assert indexed == 1
+    assert index.update(conf_files, workers) == 0
+    assert index.lookup("net_1") == [
+        ObjectUsage("HOSTNAME UNKNOWN", "root", "/firewall/policy", "1", "srcaddr")
+    ]
+    index.close()
+
+
+def test_update_removed_file(conf_files: list[Path]) -> None:
+    """
+    Test that the usages of removed configuration files are removed from the index.
+    """
+
+    # Arrange
+    index = FortiGateConfigUsageIndex()
+    with conf_files[1].open("a", encoding="UTF-8") as conf_file:
+        conf_file.write(
+            "config vdom\nedit root\nconfig firewall address\nedit net_1\nnext\nend\n"
+            "config firewall policy\nedit 1\nset srcaddr net_1\nnext\nend\nend\n"
+        )
+
+    index.update(conf_files)
+    assert index.lookup("net_1")
+    conf_files[1].unlink()
+
+    # Act
+    indexed = index.update(conf_files[:1])
+
+    # Assert
+    assert indexed == 0
+    assert not index.lookup("net_1")
+    index.close()
+
+
+def test_update_other_files(conf_files: list[Path]) -> None:
+    """
+    Test that the usages of the configuration files which are not given anymore are removed from
+    the index, even if the files still exist (e.g. if the index is updated with another directory).
+    """
+
+    # Arrange
+    index = FortiGateConfigUsageIndex()
+    with conf_files[1].open("a", encoding="UTF-8") as conf_file:
+        conf_file.write(
+            "config vdom\nedit root\nconfig firewall address\nedit net_1\nnext\nend\n"
+            "config firewall policy\nedit 1\nset srcaddr net_1\nnext\nend\nend\n"
+        )
+
+    index.update(conf_files[1:])
+    assert index.lookup("net_1")
+
+    # Act
+    indexed = index.update(conf_files[:1])
+
+    # Assert
+    assert indexed == 1
+    assert conf_files[1].is_file()
+    assert not index.lookup("net_1")
+    index.close()
+
+
+def test_update_invalid_file(function_dir: Path) -> None:
+    """
+    Test that a configuration file which can not be parsed is not indexed.
+    """
+
+    # Arrange
+    conf_file = function_dir / "fortigate_config_empty.conf"
+    shutil.copy("tests/data/fortigate_config_empty.conf", conf_file)
+    index = FortiGateConfigUsageIndex()
+
+    # Act
+    index.update([conf_file])
+
+    # Assert
+    assert index.update([conf_file]) == 1
+    index.close()
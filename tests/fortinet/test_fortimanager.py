@@ -917,6 +917,24 @@ class TestFortiManager:
             verify=True,
         )
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        "method, payload, expected",
+        (
+            pytest.param("post", {"method": "get"}, True, id="get"),
+            pytest.param("post", {"method": "delete"}, False, id="delete"),
+            pytest.param("post", None, False, id="no payload"),
+            pytest.param("get", None, True, id="http get"),
+        ),
+    )
+    def test_is_idempotent(method: str, payload: dict[str, Any] | None, expected: bool) -> None:
+        """
+        Test that only the JSON-RPC method 'get' is idempotent.
+        """
+
+        # Act & Assert
+        assert FortiManager("host", "", "").is_idempotent(method, payload) == expected
+
     @staticmethod
     def test_login(monkeypatch: MonkeyPatch) -> None:
         """
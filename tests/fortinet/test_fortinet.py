@@ -4,6 +4,9 @@ Test the Fortinet class.
 
 # mypy: disable-error-code=attr-defined
 
+import asyncio
+import ssl
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
@@ -11,8 +14,8 @@ import requests
 from pytest import MonkeyPatch
 from urllib3.exceptions import NewConnectionError, SSLError
 
-from fotoobo.exceptions import APIError, GeneralError
-from fotoobo.fortinet.fortinet import Fortinet
+from fotoobo.exceptions import APIConnectionError, APIError, GeneralError
+from fotoobo.fortinet.fortinet import _connection_error, _ssl_context, Fortinet
 from tests.helper import ResponseMock
 
 
@@ -29,11 +32,36 @@ class FortinetTestClass(Fortinet):
         return "0.0.0"
 
 
+def request_async(fortinet: Fortinet, *args: Any, **kwargs: Any) -> Any:
+    """
+    Do an asynchronous API request in a new event loop and close the connection afterwards.
+    """
+
+    async def request() -> Any:
+        try:
+            return await fortinet.api_async(*args, **kwargs)
+
+        finally:
+            await fortinet.close_async()
+
+    return asyncio.run(request())
+
+
+def mock_async_client(fortinet: Fortinet, handler: Any) -> None:
+    """
+    Give the Fortinet object a httpx client which answers the requests with the handler.
+    """
+    httpx = pytest.importorskip("httpx")
+    fortinet.async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
 class TestFortinet:
     """
     Test the Fortinet class.
     """
 
+    # pylint: disable=too-many-public-methods
+
     @staticmethod
     def test_get_vendor() -> None:
         """
@@ -181,10 +209,11 @@ class TestFortinet:
         )
 
         # Act & Assert
-        with pytest.raises(GeneralError) as err:
+        with pytest.raises(APIConnectionError) as err:
             FortinetTestClass("dummy").api(method, "url")
 
         assert "Unknown connection error" in str(err.value)
+        assert err.value.reason == "Unknown connection error"
 
     @staticmethod
     @pytest.mark.parametrize(
@@ -223,10 +252,11 @@ class TestFortinet:
         )
 
         # Act & Assert
-        with pytest.raises(GeneralError) as err:
+        with pytest.raises(APIConnectionError) as err:
             FortinetTestClass("dummy").api(method, "url")
 
         assert expected in str(err.value)
+        assert err.value.reason == expected
 
     @staticmethod
     @pytest.mark.parametrize(
@@ -306,3 +336,334 @@ class TestFortinet:
             FortinetTestClass("dummy").api(method, "url")
 
         assert expected in str(err.value)
+
+    @staticmethod
+    def test_api_async() -> None:
+        """
+        Test the asynchronous api request.
+        """
+
+        # Arrange
+        requests_sent = []
+
+        def handler(request: Any) -> Any:
+            requests_sent.append(request)
+            return httpx.Response(200, json={"version": "v1.1.1"})
+
+        httpx = pytest.importorskip("httpx")
+        fortinet = FortinetTestClass("dummy")
+        fortinet.api_url = "https://dummy/api/v2"
+        mock_async_client(fortinet, handler)
+
+        # Act
+        response = request_async(
+            fortinet, "post", "url", headers={"key": "value"}, params={"vdom": "root"}, payload={}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"version": "v1.1.1"}
+        assert requests_sent[0].method == "POST"
+        assert str(requests_sent[0].url) == "https://dummy/api/v2/url?vdom=root"
+        assert requests_sent[0].headers["key"] == "value"
+        assert fortinet.async_client is None
+
+    @staticmethod
+    def test_api_async_unknown_method() -> None:
+        """
+        Test the asynchronous api request with unknown method.
+        """
+
+        # Act & Assert
+        with pytest.raises(NotImplementedError, match=r"HTTP method 'DUMMY' is not implemented"):
+            request_async(FortinetTestClass("dummy"), "dummy", "url")
+
+    @staticmethod
+    def test_api_async_no_httpx(monkeypatch: MonkeyPatch) -> None:
+        """
+        Test the asynchronous api request without the optional package httpx.
+        """
+
+        # Arrange
+        monkeypatch.setattr("fotoobo.fortinet.fortinet.httpx", None)
+
+        # Act & Assert
+        with pytest.raises(GeneralError, match=r"optional package 'httpx'"):
+            request_async(FortinetTestClass("dummy"), "get", "url")
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "error, message, expected",
+        (
+            pytest.param(
+                "ConnectTimeout", "", r"Connection timeout \(dummy\)", id="connect timeout"
+            ),
+            pytest.param(
+                "ConnectError",
+                "[Errno -2] Name or service not known",
+                r"Name or service not known \(dummy\)",
+                id="unknown hostname",
+            ),
+            pytest.param("ReadTimeout", "", r"Read timeout \(dummy\)", id="read timeout"),
+            pytest.param(
+                "RemoteProtocolError",
+                "Server disconnected",
+                r"Unknown connection error \(dummy\)",
+                id="unknown error",
+            ),
+        ),
+    )
+    def test_api_async_errors(error: str, message: str, expected: str) -> None:
+        """
+        Test the asynchronous api request with connection errors.
+        """
+
+        # Arrange
+        httpx = pytest.importorskip("httpx")
+        fortinet = FortinetTestClass("dummy")
+
+        def handler(request: Any) -> Any:
+            raise getattr(httpx, error)(message, request=request)
+
+        mock_async_client(fortinet, handler)
+
+        # Act & Assert
+        with pytest.raises(APIConnectionError, match=expected):
+            request_async(fortinet, "get", "url")
+
+    @staticmethod
+    def test_api_async_http_error() -> None:
+        """
+        Test the asynchronous api request with http errors.
+        """
+
+        # Arrange
+        httpx = pytest.importorskip("httpx")
+        fortinet = FortinetTestClass("dummy")
+        fortinet.api_url = "https://dummy/api/v2"
+        mock_async_client(fortinet, lambda request: httpx.Response(404, json={}))
+
+        # Act & Assert
+        with pytest.raises(APIError, match=r"HTTP/404 Resource Not Found"):
+            request_async(fortinet, "get", "url")
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "method, side_effect, calls, expected",
+        (
+            pytest.param(
+                "get",
+                [requests.exceptions.ConnectTimeout(), ResponseMock(status_code=200)],
+                2,
+                {"Connection timeout": 1},
+                id="connection timeout",
+            ),
+            pytest.param(
+                "post",
+                [ResponseMock(status_code=503), ResponseMock(status_code=200)],
+                2,
+                {"HTTP/503": 1},
+                id="overloaded post",
+            ),
+            pytest.param(
+                "get",
+                [requests.exceptions.ReadTimeout()] * 3,
+                3,
+                {"Read timeout": 2},
+                id="all retries",
+            ),
+            pytest.param(
+                "post",
+                [requests.exceptions.ReadTimeout(), ResponseMock(status_code=200)],
+                1,
+                {},
+                id="read timeout post",
+            ),
+            pytest.param(
+                "post",
+                [ResponseMock(status_code=502), ResponseMock(status_code=200)],
+                1,
+                {},
+                id="bad gateway post",
+            ),
+            pytest.param(
+                "get",
+                [ResponseMock(status_code=404), ResponseMock(status_code=200)],
+                1,
+                {},
+                id="not found",
+            ),
+        ),
+    )
+    def test_api_retry(
+        method: str,
+        side_effect: list[Any],
+        calls: int,
+        expected: dict[str, int],
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """
+        Test that only the failed requests which are safe to send again are retried.
+        """
+
+        # Arrange
+        request_mock = Mock(side_effect=side_effect)
+        monkeypatch.setattr(f"fotoobo.fortinet.fortinet.requests.Session.{method}", request_mock)
+        monkeypatch.setattr("fotoobo.fortinet.fortinet.sleep", Mock())
+        fortinet = FortinetTestClass("dummy", retries=2)
+
+        # Act
+        try:
+            fortinet.api(method, "url")
+
+        except (APIError, GeneralError):
+            pass
+
+        # Assert
+        assert request_mock.call_count == calls
+        assert fortinet.retry_metrics == expected
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "headers, expected",
+        (
+            pytest.param({}, [0.5, 1.0, 2.0], id="backoff"),
+            pytest.param({"Retry-After": "7"}, [7.0, 7.0, 7.0], id="retry after"),
+            pytest.param({"Retry-After": "120"}, [30.0, 30.0, 30.0], id="max delay"),
+            pytest.param(
+                {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, [0.0, 0.0, 0.0], id="date"
+            ),
+            pytest.param({"Retry-After": "dummy"}, [0.5, 1.0, 2.0], id="invalid"),
+        ),
+    )
+    def test_api_retry_delay(
+        headers: dict[str, str], expected: list[float], monkeypatch: MonkeyPatch
+    ) -> None:
+        """
+        Test the delays of the retries with the upper limit of the jitter.
+        """
+
+        # Arrange
+        monkeypatch.setattr(
+            "fotoobo.fortinet.fortinet.requests.Session.get",
+            Mock(return_value=ResponseMock(status_code=429, headers=headers)),
+        )
+        sleep_mock = Mock()
+        monkeypatch.setattr("fotoobo.fortinet.fortinet.sleep", sleep_mock)
+        monkeypatch.setattr("fotoobo.fortinet.fortinet.random.uniform", lambda low, high: high)
+
+        # Act
+        with pytest.raises(APIError):
+            FortinetTestClass("dummy", retries=3).api("get", "url")
+
+        # Assert
+        assert [call.args[0] for call in sleep_mock.call_args_list] == expected
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "rate_limit, calls",
+        (pytest.param(None, 0, id="unlimited"), pytest.param(5, 1, id="limited")),
+    )
+    def test_api_rate_limit(rate_limit: float | None, calls: int, monkeypatch: MonkeyPatch) -> None:
+        """
+        Test that the api requests take a token of the rate limiter of their host.
+        """
+
+        # Arrange
+        limiter_mock = Mock()
+        monkeypatch.setattr("fotoobo.fortinet.fortinet.rate_limiter", limiter_mock)
+        monkeypatch.setattr(
+            "fotoobo.fortinet.fortinet.requests.Session.get",
+            Mock(return_value=ResponseMock(status_code=200)),
+        )
+
+        # Act
+        FortinetTestClass("dummy", rate_limit=rate_limit, rate_burst=2).api("get", "url")
+
+        # Assert
+        assert limiter_mock.return_value.acquire.call_count == calls
+        if calls:
+            limiter_mock.assert_called_once_with("dummy", 443, 5, 2)
+
+    @staticmethod
+    def test_api_async_retry() -> None:
+        """
+        Test that the asynchronous api requests are retried.
+        """
+
+        # Arrange
+        httpx = pytest.importorskip("httpx")
+        responses = [httpx.Response(503, json={}), httpx.Response(200, json={})]
+        fortinet = FortinetTestClass("dummy", retries=1, retry_backoff=0)
+        fortinet.api_url = "https://dummy/api/v2"
+        mock_async_client(fortinet, lambda request: responses.pop(0))
+
+        # Act
+        response = request_async(fortinet, "get", "url")
+
+        # Assert
+        assert response.status_code == 200
+        assert fortinet.retry_metrics == {"HTTP/503": 1}
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    (
+        pytest.param(
+            OSError("[SSL: CERTIFICATE_VERIFY_FAILED] unable to get local issuer certificate"),
+            "Unable to get local issuer certificate",
+            id="unknown cert",
+        ),
+        pytest.param(
+            OSError("[SSL: WRONG_VERSION_NUMBER] wrong version number"),
+            "Unknown SSL error",
+            id="unknown ssl error",
+        ),
+        pytest.param(
+            OSError("[Errno -2] Name or service not known"),
+            "Name or service not known",
+            id="unknown hostname",
+        ),
+        pytest.param(OSError("Something went wrong"), "Unknown connection error", id="unknown"),
+    ),
+)
+def test_connection_error(error: OSError, expected: str) -> None:
+    """
+    Test the description of the connection errors of the asynchronous api requests.
+    """
+
+    # Act & Assert
+    assert _connection_error(error) == expected
+
+
+def test_connection_error_refused() -> None:
+    """
+    Test the description of a refused connection which is the cause of another error.
+    """
+
+    # Arrange
+    error = OSError("All connection attempts failed")
+    error.__cause__ = ConnectionRefusedError(111, "Connect call failed")
+
+    # Act & Assert
+    assert _connection_error(error) == "Connection refused"
+
+
+@pytest.mark.parametrize(
+    "ssl_verify, verify_mode",
+    (
+        pytest.param(True, ssl.CERT_REQUIRED, id="verify"),
+        pytest.param(False, ssl.CERT_NONE, id="no verify"),
+    ),
+)
+def test_ssl_context(ssl_verify: bool, verify_mode: ssl.VerifyMode) -> None:
+    """
+    Test the shared SSL context of the asynchronous api requests.
+    """
+
+    # Act
+    context = _ssl_context(ssl_verify)
+
+    # Assert
+    assert context.verify_mode == verify_mode
+    assert context is _ssl_context(ssl_verify)
@@ -0,0 +1,148 @@
+"""
+Test the token bucket rate limiter.
+"""
+
+import asyncio
+import threading
+from time import monotonic
+from unittest.mock import Mock
+
+import pytest
+from pytest import MonkeyPatch
+
+from fotoobo.fortinet.rate_limit import rate_limiter, TokenBucket
+from tests.fortinet.test_fortinet import FortinetTestClass
+
+
+class TestTokenBucket:
+    """
+    Test the TokenBucket class.
+    """
+
+    @staticmethod
+    def test_reserve(monkeypatch: MonkeyPatch) -> None:
+        """
+        Test that the burst is sent at once and the other requests wait for their turn.
+        """
+
+        # Arrange
+        monkeypatch.setattr("fotoobo.fortinet.rate_limit.monotonic", Mock(return_value=100.0))
+        bucket = TokenBucket(10, burst=2)
+
+        # Act
+        delays = [bucket.reserve() for _ in range(4)]
+
+        # Assert
+        assert delays == pytest.approx([0.0, 0.0, 0.1, 0.2])
+        assert bucket.waited == pytest.approx(0.3)
+
+    @staticmethod
+    def test_reserve_refill(monkeypatch: MonkeyPatch) -> None:
+        """
+        Test that the bucket is refilled with the rate but not above the burst.
+        """
+
+        # Arrange
+        clock = Mock(return_value=100.0)
+        monkeypatch.setattr("fotoobo.fortinet.rate_limit.monotonic", clock)
+        bucket = TokenBucket(10, burst=2)
+        for _ in range(2):
+            bucket.reserve()
+
+        # Act
+        clock.return_value = 100.1
+        after_one_token = bucket.reserve()
+        clock.return_value = 200.0
+        after_idle = [bucket.reserve() for _ in range(3)]
+
+        # Assert
+        assert after_one_token == pytest.approx(0.0)
+        assert after_idle == pytest.approx([0.0, 0.0, 0.1])
+
+    @staticmethod
+    def test_acquire_threads() -> None:
+        """
+        Test that concurrent threads get exactly the rate.
+        """
+
+        # Arrange
+        bucket = TokenBucket(200)
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(21)]
+        start = monotonic()
+
+        # Act
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert 0.09 < monotonic() - start < 0.5
+
+    @staticmethod
+    def test_acquire_async() -> None:
+        """
+        Test that concurrent coroutines get exactly the rate.
+        """
+
+        # Arrange
+        bucket = TokenBucket(200)
+
+        async def acquire_all() -> None:
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(21)))
+
+        start = monotonic()
+
+        # Act
+        asyncio.run(acquire_all())
+
+        # Assert
+        assert 0.09 < monotonic() - start < 0.5
+
+
+@pytest.fixture(autouse=True)
+def buckets(monkeypatch: MonkeyPatch) -> None:
+    """
+    Give every test its own token buckets of the hosts.
+    """
+
+    monkeypatch.setattr("fotoobo.fortinet.rate_limit._buckets", {})
+
+
+def test_rate_limiter() -> None:
+    """
+    Test that the token bucket is shared by hostname and port.
+    """
+
+    # Act
+    bucket = rate_limiter("dummy", 443, 10)
+
+    # Assert
+    assert rate_limiter("dummy", 443, 10) is bucket
+    assert rate_limiter("dummy", 8443, 10) is not bucket
+
+
+def test_rate_limiter_settings(monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that two Fortinet objects of the same host with different rates share the bucket with the
+    rate of the first one.
+    """
+
+    # Arrange
+    monkeypatch.setattr("fotoobo.fortinet.rate_limit.monotonic", Mock(return_value=100.0))
+    monkeypatch.setattr("fotoobo.fortinet.fortinet.requests.Session.get", Mock())
+    sleep_mock = Mock()
+    monkeypatch.setattr("fotoobo.fortinet.rate_limit.sleep", sleep_mock)
+    slow = FortinetTestClass("dummy", rate_limit=1)
+    fast = FortinetTestClass("dummy", rate_limit=10, rate_burst=2)
+
+    # Act
+    slow.api("get", "url")
+    fast.api("get", "url")
+    fast.api("get", "url")
+
+    # Assert
+    bucket = rate_limiter("dummy", 443, 10, 2)
+    assert (bucket.rate, bucket.burst) == (1, 1)
+    assert [args[0] for args, _ in sleep_mock.call_args_list] == pytest.approx([1.0, 2.0])
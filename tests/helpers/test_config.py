@@ -190,3 +190,104 @@ class TestConfig:
         else:
             with pytest.raises(GeneralError, match=r"Missing vault configuration:.*"):
                 test_config.load_configuration(Path("tests/fotoobo.yaml"))
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "fgt_config_cache,expected",
+        (
+            pytest.param(
+                "cache", r"Setting fgt_config_cache has to be a dictionary", id="not a dict"
+            ),
+            pytest.param(
+                {"max_size": 10},
+                r"Missing fgt_config_cache configuration: directory",
+                id="missing directory",
+            ),
+            pytest.param({"directory": "cache", "max_size": 10}, None, id="valid"),
+            pytest.param(None, None, id="empty"),
+        ),
+    )
+    def test_config_fgt_config_cache(
+        fgt_config_cache: Any, expected: str | None, monkeypatch: MonkeyPatch
+    ) -> None:
+        """
+        Test the fgt_config_cache part of the configuration.
+        """
+
+        # Arrange
+        test_config = Config()
+        monkeypatch.setattr(
+            "fotoobo.helpers.config.load_yaml_file",
+            Mock(return_value={"fgt_config_cache": fgt_config_cache}),
+        )
+
+        # Act & Assert
+        if expected:
+            with pytest.raises(GeneralError, match=expected):
+                test_config.load_configuration(Path("tests/fotoobo.yaml"))
+
+        else:
+            test_config.load_configuration(Path("tests/fotoobo.yaml"))
+            assert test_config.fgt_config_cache == (fgt_config_cache or {})
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "fleet,expected",
+        (
+            pytest.param("fleet", r"Setting fleet has to be a dictionary", id="not a dict"),
+            pytest.param(
+                {"transport": "dummy"},
+                r"Setting fleet.transport has to be 'threads' or 'asyncio'",
+                id="unknown transport",
+            ),
+            pytest.param(
+                {"workers": 0},
+                r"Setting fleet.workers has to be a positive number",
+                id="invalid workers",
+            ),
+            pytest.param(
+                {"groups": {"branch": "5"}},
+                r"Setting fleet.groups has to be a dictionary of positive numbers",
+                id="invalid groups",
+            ),
+            pytest.param(
+                {"deadline": "300"},
+                r"Setting fleet.deadline has to be a positive number",
+                id="invalid deadline",
+            ),
+            pytest.param(
+                {"retries": -1},
+                r"Setting fleet.retries has to be zero or a positive number",
+                id="invalid retries",
+            ),
+            pytest.param({"transport": "asyncio"}, None, id="valid"),
+            pytest.param(
+                {"workers": 50, "groups": {"branch": 5}, "adaptive": True}, None, id="valid limits"
+            ),
+            pytest.param(
+                {"timeout": 60, "deadline": 600, "retries": 2, "backoff": 0.5},
+                None,
+                id="valid runner",
+            ),
+            pytest.param(None, None, id="empty"),
+        ),
+    )
+    def test_config_fleet(fleet: Any, expected: str | None, monkeypatch: MonkeyPatch) -> None:
+        """
+        Test the fleet part of the configuration.
+        """
+
+        # Arrange
+        test_config = Config()
+        monkeypatch.setattr(
+            "fotoobo.helpers.config.load_yaml_file", Mock(return_value={"fleet": fleet})
+        )
+
+        # Act & Assert
+        if expected:
+            with pytest.raises(GeneralError, match=expected):
+                test_config.load_configuration(Path("tests/fotoobo.yaml"))
+
+        else:
+            test_config.load_configuration(Path("tests/fotoobo.yaml"))
+            assert test_config.fleet == (fleet or {})
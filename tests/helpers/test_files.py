@@ -6,20 +6,25 @@ Test_files helper module.
 
 import os
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import Mock
 
 import pytest
 from pytest import MonkeyPatch
 
-from fotoobo.exceptions import GeneralError
+from fotoobo.exceptions import GeneralError, GeneralWarning
 from fotoobo.helpers.files import (
     create_dir,
     file_to_ftp,
     file_to_zip,
+    FileText,
     load_json_file,
+    load_json_lines_file,
     load_yaml_file,
+    save_csv_file,
     save_json_file,
+    save_json_lines_file,
     save_txt_file,
     save_yaml_file,
 )
@@ -150,6 +155,25 @@ def test_file_to_zip_invalid_level(zip_level: int) -> None:
 # Start testing the json file_helper functions
 
 
+def test_save_csv_file(function_dir: Path) -> None:
+    """
+    Test the save_csv_file function.
+    """
+
+    # Act
+    count = save_csv_file(
+        function_dir / "test.csv", ("a", "b"), ([number, None] for number in (1, 2))
+    )
+
+    # Assert
+    assert count == 2
+    assert (function_dir / "test.csv").read_text(encoding="UTF-8").splitlines() == [
+        "a,b",
+        "1,",
+        "2,",
+    ]
+
+
 def test_save_json_file_dict(json_test_file: Path, test_data_dict: dict[str, Any]) -> None:
     """
     Test the save_json_file function.
@@ -318,6 +342,106 @@ def test_load_json_file_non_exist(json_test_file: Path) -> None:
 # Start testing the yaml file_helper functions
 
 
+@pytest.mark.parametrize("filename", ("test.json", "test.json.gz"))
+@pytest.mark.parametrize("use_orjson", (True, False))
+def test_save_json_file_compact(
+    function_dir: Path,
+    test_data_dict: dict[str, Any],
+    filename: str,
+    use_orjson: bool,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """
+    Test the save_json_file function with compact and compressed json with and without orjson.
+    """
+
+    # Arrange
+    if not use_orjson:
+        monkeypatch.setattr("fotoobo.helpers.files.orjson", None)
+
+    # Act
+    save_json_file(function_dir / filename, test_data_dict, compact=True)
+
+    # Assert
+    assert load_json_file(function_dir / filename) == test_data_dict
+    if filename == "test.json":
+        assert "\n" not in (function_dir / filename).read_text(encoding="UTF-8")
+
+
+def test_save_json_file_mapping(json_test_file: Path) -> None:
+    """
+    Test the save_json_file function with nested mappings which are no dicts.
+    """
+
+    # Arrange
+    data = {"key1": MappingProxyType({"key2": "value2"})}
+
+    # Act
+    save_json_file(json_test_file, data)
+
+    # Assert
+    assert load_json_file(json_test_file) == {"key1": {"key2": "value2"}}
+
+
+def test_save_json_file_zstd_missing(function_dir: Path, monkeypatch: MonkeyPatch) -> None:
+    """
+    Test the save_json_file function with a zstandard file when zstandard is not installed.
+    """
+
+    # Arrange
+    monkeypatch.setattr("fotoobo.helpers.files.zstd", None)
+
+    # Act & Assert
+    with pytest.raises(GeneralError, match=r"Install the package 'zstandard'"):
+        save_json_file(function_dir / "test.json.zst", {}, compact=True)
+
+
+@pytest.mark.parametrize("filename", ("test.jsonl", "test.jsonl.gz"))
+def test_save_json_lines_file(function_dir: Path, filename: str) -> None:
+    """
+    Test the save_json_lines_file and the load_json_lines_file function.
+    """
+
+    # Arrange
+    items = ({"number": number} for number in range(3))
+
+    # Act
+    count = save_json_lines_file(function_dir / filename, items)
+
+    # Assert
+    assert count == 3
+    assert list(load_json_lines_file(function_dir / filename)) == [
+        {"number": 0},
+        {"number": 1},
+        {"number": 2},
+    ]
+
+
+def test_file_text(function_dir: Path) -> None:
+    """
+    Test the FileText class.
+    """
+
+    # Arrange
+    file = function_dir / "text.txt"
+    file.write_text("some text in a file")
+
+    # Act
+    text = FileText(file, 5, 12)
+    save_json_file(function_dir / "text.json", {"text": text})
+
+    # Assert
+    assert str(text) == "text in"
+    assert text == "text in"
+    assert text == FileText(file, 5, 12)
+    assert text != 5
+    assert hash(text) == hash("text in")
+    assert load_json_file(function_dir / "text.json") == {"text": "text in"}
+    file.write_text("some other text in a file")
+    with pytest.raises(GeneralWarning, match=r"has changed"):
+        text.read()
+
+
 def test_save_yaml_file_dict(yaml_test_file: Path, test_data_dict: dict[str, Any]) -> None:
     """
     Test the save_yaml_file function.
@@ -10,6 +10,7 @@ import pytest
 from pytest import MonkeyPatch
 
 from fotoobo.exceptions import GeneralWarning
+from fotoobo.fortinet.fortigate import FortiGate
 from fotoobo.helpers.config import config
 from fotoobo.inventory.inventory import Inventory
 
@@ -211,3 +212,53 @@ class TestInventory:
         # Assert
         assert inventory.assets["test_fgt_1"].token == "secret_token"
         assert inventory.assets["test_fgt_1"].dummy == "VAULT"  # because key not in vault_data
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "settings, expected, warnings",
+        (
+            pytest.param([{}, {}], [(None, 1), (None, 1)], 0, id="not limited"),
+            pytest.param(
+                [{"rate_limit": 5}, {"rate_limit": 5}], [(5, 1), (5, 1)], 0, id="same settings"
+            ),
+            pytest.param(
+                [{"rate_limit": 5, "rate_burst": 2}, {"rate_limit": 10}, {}],
+                [(5, 1), (5, 1), (5, 1)],
+                1,
+                id="different settings",
+            ),
+            pytest.param(
+                [{"rate_limit": 5}, {"rate_limit": 10, "https_port": 8443}],
+                [(5, 1), (10, 1)],
+                0,
+                id="different hosts",
+            ),
+        ),
+    )
+    def test_resolve_rate_limits(
+        settings: list[dict[str, Any]],
+        expected: list[tuple[float | None, int]],
+        warnings: int,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """
+        Test Inventory._resolve_rate_limits() method.
+        """
+
+        # Arrange
+        inventory = Inventory(Path("tests/data/inventory.yaml"))
+        inventory.assets = {
+            f"fgt_{index}": FortiGate("dummy", "dummy", **setting)
+            for index, setting in enumerate(settings)
+        }
+        warning_mock = Mock()
+        monkeypatch.setattr("fotoobo.inventory.inventory.log.warning", warning_mock)
+
+        # Act
+        inventory._resolve_rate_limits()  # pylint: disable=protected-access
+
+        # Assert
+        assert [
+            (asset.rate_limit, asset.rate_burst) for asset in inventory.assets.values()
+        ] == expected
+        assert warning_mock.call_count == warnings
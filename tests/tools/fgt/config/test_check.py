@@ -0,0 +1,202 @@
+"""
+Test fgt tools config check.
+"""
+
+import shutil
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from pytest import MonkeyPatch
+
+from fotoobo.exceptions.exceptions import GeneralError, GeneralWarning
+from fotoobo.fortinet.fortigate_config_profile import ParseProfile
+from fotoobo.helpers.files import load_json_lines_file
+from fotoobo.tools.fgt.config import _extract_file, check
+
+
+@pytest.mark.parametrize(
+    "file,expected",
+    (
+        pytest.param(Path("tests/data/fortigate_config_single.conf"), 0, id="single"),
+        pytest.param(Path("tests/data/fortigate_config_vdom.conf"), 2, id="vdom"),
+    ),
+)
+def test_check(file: Path, expected: int) -> None:
+    """
+    Test the check utility.
+    """
+
+    # Act
+    result = check(file, Path("tests/data/fortigate_checks.yaml"))
+
+    # Assert
+    assert len(result.get_messages("HOSTNAME UNKNOWN")) == expected
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_check_dir(workers: int) -> None:
+    """
+    Test the check utility with a directory and with more than one worker.
+    """
+
+    # Act
+    result = check(Path("tests/data"), Path("tests/data/fortigate_checks.yaml"), workers)
+
+    # Assert
+    messages = result.get_messages("HOSTNAME UNKNOWN")
+    assert len(messages) == 2
+    assert (
+        messages
+        == check(Path("tests/data"), Path("tests/data/fortigate_checks.yaml")).messages[
+            "HOSTNAME UNKNOWN"
+        ]
+    )
+
+
+def test_check_no_files_in_dir() -> None:
+    """
+    Test the check utility with a directory without configuration files.
+    """
+
+    # Act & Assert
+    with pytest.raises(GeneralWarning, match=r"There are no configuration files"):
+        check(Path("tests/"), Path("tests/data/fortigate_checks.yaml"))
+
+
+def test_check_invalid_bundle_file() -> None:
+    """
+    Test the check utility with an invalid check bundle file.
+    """
+
+    # Act & Assert
+    with pytest.raises(GeneralError, match=r"No valid bundle file"):
+        check(Path("tests/data/fortigate_config_single.conf"), Path("tests/data/nonexist.yaml"))
+
+
+def test_check_invalid_check(monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that the invalid checks of the bundle are reported as errors.
+    """
+
+    # Arrange
+    monkeypatch.setattr(
+        "fotoobo.tools.fgt.config.load_yaml_file",
+        Mock(
+            return_value=[
+                {"type": "exist", "scope": "vdom", "path": "/system/global", "checks": {"a": 1}},
+                {"type": "typo", "scope": "vdom", "path": "/system/global", "checks": {"a": 1}},
+            ]
+        ),
+    )
+
+    # Act
+    result = check(
+        Path("tests/data/fortigate_config_single.conf"), Path("tests/data/fortigate_checks.yaml")
+    )
+
+    # Assert
+    assert {
+        "message": "Invalid check: Check type 'typo' not available in 'unnamed check'",
+        "level": "error",
+    } in result.get_messages("fotoobo")
+
+
+def test_check_matrix() -> None:
+    """
+    Test that the check utility returns the number of failures for every check.
+    """
+
+    # Act
+    result = check(
+        Path("tests/data/fortigate_config_vdom.conf"), Path("tests/data/fortigate_checks.yaml")
+    )
+
+    # Assert
+    assert result.get_result("HOSTNAME UNKNOWN") == {
+        "count vdom /leaf_81/leaf_82": 0,
+        "exist global /system/global": 0,
+        "value_everything_ok": 0,
+        "check_if_value_in_list": 2,
+        "exist vdom /system/vdom_setting": 0,
+    }
+
+
+def test_check_state(function_dir: Path, monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that the check utility only checks the configuration files which changed since the last
+    run when a state file is given.
+    """
+
+    # Arrange
+    config_dir = function_dir / "configs"
+    config_dir.mkdir()
+    shutil.copy("tests/data/fortigate_config_single.conf", config_dir)
+    shutil.copy("tests/data/fortigate_config_vdom.conf", config_dir)
+    state_file = function_dir / "state.json"
+    bundle_file = Path("tests/data/fortigate_checks.yaml")
+    expected = check(config_dir, bundle_file, state_file=state_file)
+    with (config_dir / "fortigate_config_single.conf").open("a", encoding="UTF-8") as file:
+        file.write("\n")
+
+    extract_file = Mock(side_effect=_extract_file)
+    monkeypatch.setattr("fotoobo.tools.fgt.config._extract_file", extract_file)
+
+    # Act
+    result = check(config_dir, bundle_file, state_file=state_file)
+
+    # Assert
+    extract_file.assert_called_once()
+    assert extract_file.call_args.args[0].name == "fortigate_config_single.conf"
+    assert result.messages == expected.messages
+    assert result.all_results() == expected.all_results()
+
+
+def test_check_findings(function_dir: Path) -> None:
+    """
+    Test that the check utility saves the findings (also the ones replayed from the state).
+    """
+
+    # Arrange
+    state_file = function_dir / "state.json"
+    check(
+        Path("tests/data/fortigate_config_vdom.conf"),
+        Path("tests/data/fortigate_checks.yaml"),
+        state_file=state_file,
+    )
+
+    # Act
+    check(
+        Path("tests/data/fortigate_config_vdom.conf"),
+        Path("tests/data/fortigate_checks.yaml"),
+        state_file=state_file,
+        findings_file=function_dir / "findings.jsonl",
+    )
+
+    # Assert
+    findings = list(load_json_lines_file(function_dir / "findings.jsonl"))
+    assert [(finding["check"], finding["vdom"]) for finding in findings] == [
+        ("check_if_value_in_list", "vdom_n"),
+        ("check_if_value_in_list", "vdom_z"),
+    ]
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_check_profile(workers: int) -> None:
+    """
+    Test that the check utility appends the parse profile of every parsed file.
+    """
+
+    # Arrange
+    profiles: list[ParseProfile] = []
+
+    # Act
+    check(
+        Path("tests/data/fortigate_config_vdom.conf"),
+        Path("tests/data/fortigate_checks.yaml"),
+        workers,
+        profiles=profiles,
+    )
+
+    # Assert
+    assert [profile.file for profile in profiles] == ["tests/data/fortigate_config_vdom.conf"]
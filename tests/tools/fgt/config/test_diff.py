@@ -0,0 +1,59 @@
+"""
+Test fgt tools config diff.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from fotoobo.exceptions.exceptions import GeneralWarning
+from fotoobo.tools.fgt.config import diff
+
+
+def test_diff() -> None:
+    """
+    Test the diff utility.
+    """
+
+    # Act
+    result = diff(
+        Path("tests/data/fortigate_config_single.conf"),
+        Path("tests/data/fortigate_config_vdom.conf"),
+        "vdom",
+        "/root",
+    )
+
+    # Assert
+    assert [message["message"] for message in result.get_messages("HOSTNAME UNKNOWN")] == [
+        "- vdom /root/leaf_n",
+        "- vdom /root/leaf_z",
+        "+ vdom /root/system",
+    ]
+    assert list(result.get_result("HOSTNAME UNKNOWN").added) == [("vdom", "/root/system")]
+
+
+def test_diff_no_differences() -> None:
+    """
+    Test the diff utility with equal configuration files.
+    """
+
+    # Act
+    result = diff(
+        Path("tests/data/fortigate_config_vdom.conf"), Path("tests/data/fortigate_config_vdom.conf")
+    )
+
+    # Assert
+    assert result.get_messages("HOSTNAME UNKNOWN") == [
+        {"message": "There are no differences in the configuration files", "level": "info"}
+    ]
+    assert not result.get_result("HOSTNAME UNKNOWN")
+
+
+def test_diff_nonexist_config_file() -> None:
+    """
+    Test the diff utility with a nonexisting configuration file.
+    """
+
+    # Act & Assert
+    with pytest.raises(GeneralWarning, match=r"There is no configuration file"):
+        diff(Path("tests/data/fortigate_config_vdom.conf"), Path("tests/data/nonexist.conf"))
@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from fotoobo.exceptions.exceptions import GeneralWarning
+from fotoobo.fortinet.fortigate_config_profile import ParseProfile
 from fotoobo.tools.fgt.config import info
 
 
@@ -29,6 +30,23 @@ def test_info(file: Path) -> None:
     assert infos.get_result("HOSTNAME UNKNOWN").buildno == "8303"
 
 
+def test_info_profile() -> None:
+    """
+    Test the info utility with the parse profiles.
+    """
+
+    # Arrange
+    profiles: list[ParseProfile] = []
+
+    # Act
+    infos = info(Path("tests/data/fortigate_config_vdom.conf"), profiles=profiles)
+
+    # Assert
+    assert infos.get_result("HOSTNAME UNKNOWN").buildno == "8303"
+    assert len(profiles) == 1
+    assert profiles[0].sections
+
+
 @pytest.mark.parametrize(
     "file",
     (
@@ -54,3 +72,37 @@ def test_info_no_files_in_dir() -> None:
     # Act & Assert
     with pytest.raises(GeneralWarning, match=r"There are no configuration files"):
         info(Path("tests/"))
+
+
+def test_info_workers() -> None:
+    """
+    Test the info utility with more than one worker.
+    """
+
+    # Act
+    infos = info(Path("tests/data/fortigate_config_single.conf"), workers=2)
+
+    # Assert
+    assert infos.get_result("HOSTNAME UNKNOWN").buildno == "8303"
+
+
+def test_info_cache(function_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test the info utility with a configured configuration cache.
+    """
+
+    # Arrange
+    monkeypatch.setattr(
+        "fotoobo.helpers.config.config.fgt_config_cache", {"directory": str(function_dir)}
+    )
+
+    # Act
+    infos = info(Path("tests/data/fortigate_config_single.conf"))
+    cached_infos = info(Path("tests/data/fortigate_config_single.conf"))
+
+    # Assert
+    assert len(list(function_dir.iterdir())) == 1
+    assert (
+        cached_infos.get_result("HOSTNAME UNKNOWN").__dict__
+        == infos.get_result("HOSTNAME UNKNOWN").__dict__
+    )
@@ -0,0 +1,52 @@
+"""
+Test fgt tools config query.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from fotoobo.exceptions.exceptions import GeneralWarning
+from fotoobo.tools.fgt.config import query
+
+
+def test_query() -> None:
+    """
+    Test the query utility over a directory of configuration files.
+    """
+
+    # Act
+    rows = list(query(Path("tests/data"), "global", "/system/global/*", "== value_2"))
+
+    # Assert
+    assert rows == [
+        ("HOSTNAME UNKNOWN", "/system/global/option_2", "value_2"),
+        ("HOSTNAME UNKNOWN", "/system/global/option_2", "value_2"),
+    ]
+
+
+def test_query_without_predicate() -> None:
+    """
+    Test the query utility without a predicate.
+    """
+
+    # Act
+    rows = list(
+        query(Path("tests/data/fortigate_config_vdom.conf"), "vdom", "/root/leaf_81/leaf_82/*/id")
+    )
+
+    # Assert
+    assert rows == [
+        ("HOSTNAME UNKNOWN", "/root/leaf_81/leaf_82/1/id", 1),
+        ("HOSTNAME UNKNOWN", "/root/leaf_81/leaf_82/2/id", 2),
+    ]
+
+
+def test_query_nonexist_config_file() -> None:
+    """
+    Test the query utility with a nonexisting configuration file.
+    """
+
+    # Act & Assert
+    with pytest.raises(GeneralWarning, match=r"There are no configuration files"):
+        query(Path("tests/data/nonexist.conf"), "global", "/")
@@ -0,0 +1,61 @@
+"""
+Test fgt tools config usage.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from fotoobo.exceptions.exceptions import GeneralWarning
+from fotoobo.fortinet.fortigate_config_usage import ObjectUsage
+from fotoobo.tools.fgt.config import usage
+
+
+def test_usage(function_dir: Path) -> None:
+    """
+    Test the usage utility.
+    """
+
+    # Arrange
+    conf_file = function_dir / "fortigate.conf"
+    conf_file.write_text(
+        "#config-version=FGT999-7.2.8-FW-build1639-240313:opmode=0:vdom=0:user=admin\n"
+        'config system global\nset hostname "FGT_1"\nend\n'
+        'config firewall address\nedit "net_1"\nset subnet 10.0.0.0/8\nnext\nend\n'
+        'config firewall policy\nedit 1\nset srcaddr "net_1"\nnext\nend\n',
+        encoding="UTF-8",
+    )
+
+    # Act
+    result = usage(function_dir, "net_1", function_dir / "usage.sqlite")
+
+    # Assert
+    assert result.all_results() == {
+        "FGT_1": [ObjectUsage("FGT_1", "root", "/firewall/policy", "1", "srcaddr")]
+    }
+    assert (function_dir / "usage.sqlite").is_file()
+
+
+def test_usage_not_used() -> None:
+    """
+    Test the usage utility with an object which is not used.
+    """
+
+    # Act
+    result = usage(Path("tests/data/fortigate_config_vdom.conf"), "name_1")
+
+    # Assert
+    assert not result.all_results()
+    assert result.get_messages("fotoobo") == [
+        {"message": "Object 'name_1' is not used", "level": "info"}
+    ]
+
+
+def test_usage_nonexist_config_file() -> None:
+    """
+    Test the usage utility with a nonexisting configuration file.
+    """
+
+    # Act & Assert
+    with pytest.raises(GeneralWarning, match=r"There are no configuration files"):
+        usage(Path("tests/data/nonexist.conf"), "name_1")
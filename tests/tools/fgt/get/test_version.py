@@ -3,7 +3,7 @@ Test fgt tools get version.
 """
 
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pytest import MonkeyPatch
@@ -76,3 +76,33 @@ def test_version_no_fortigates(monkeypatch: MonkeyPatch) -> None:
     # Act & Assert
     with pytest.raises(GeneralWarning, match=r"no asset of type 'fortigate' .* was found.*"):
         version("")
+
+
+@pytest.mark.parametrize(
+    "side_effect, expected",
+    (
+        pytest.param(None, "1.1.1", id="version"),
+        pytest.param(GeneralError("dummy message"), "unknown due to dummy message", id="error"),
+    ),
+)
+def test_version_asyncio(side_effect: Any, expected: str, monkeypatch: MonkeyPatch) -> None:
+    """
+    Test get version with the asyncio transport.
+    """
+
+    # Arrange
+    monkeypatch.setattr("fotoobo.tools.fgt.get.config.fleet", {"transport": "asyncio"})
+    monkeypatch.setattr(
+        "fotoobo.fortinet.fortigate.FortiGate.get_version_async",
+        AsyncMock(return_value="1.1.1", side_effect=side_effect),
+    )
+    close_mock = AsyncMock()
+    monkeypatch.setattr("fotoobo.fortinet.fortigate.FortiGate.close_async", close_mock)
+
+    # Act
+    result = version("")
+
+    # Assert
+    assert len(result.results) == 3
+    assert result.get_result("test_fgt_2") == expected
+    assert close_mock.await_count == 3
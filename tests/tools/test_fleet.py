@@ -0,0 +1,552 @@
+"""
+Test the fleet executor.
+"""
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+import requests
+from pytest import MonkeyPatch
+
+from fotoobo.exceptions import APIConnectionError, APIError, GeneralError, GeneralWarning
+from fotoobo.fortinet.fortigate import FortiGate
+from fotoobo.tools.fleet import (
+    fleet_concurrency,
+    fleet_map,
+    fleet_map_async,
+    FleetConcurrency,
+    FleetRunner,
+    is_overload,
+    RetryPolicy,
+)
+from tests.helper import ResponseMock
+
+
+class ConcurrencyProbe:
+    """
+    Query devices and record how many of them ("*") and of their groups are queried at the same
+    time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the probe"""
+        self.lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.max_active: dict[str, int] = {}
+
+    def _enter(self, group: str) -> None:
+        """Record the start of a query"""
+        with self.lock:
+            for key in ("*", group):
+                self.active[key] = self.active.get(key, 0) + 1
+                self.max_active[key] = max(self.max_active.get(key, 0), self.active[key])
+
+    def _exit(self, group: str) -> None:
+        """Record the end of a query"""
+        with self.lock:
+            for key in ("*", group):
+                self.active[key] -= 1
+
+    def query(self, name: str, device: Any) -> str:
+        """Query a device on a thread"""
+        self._enter(device.group)
+        time.sleep(0.01)
+        self._exit(device.group)
+        return f"value of {name}"
+
+    async def query_async(self, name: str, device: Any) -> str:
+        """Query a device in the event loop"""
+        self._enter(device.group)
+        await asyncio.sleep(0.01)
+        self._exit(device.group)
+        return f"value of {name}"
+
+
+def get_devices() -> dict[str, Any]:
+    """
+    Get 12 devices of which 6 are in the group "branch".
+    """
+    return {f"device_{number}": Mock(group="branch" if number % 2 else "") for number in range(12)}
+
+
+class TestFleetConcurrency:
+    """
+    Test the FleetConcurrency class.
+    """
+
+    @staticmethod
+    def test_limit() -> None:
+        """
+        Test the limit of all the devices and the limit of a group.
+        """
+
+        # Arrange
+        concurrency = FleetConcurrency(3, {"branch": 1})
+
+        # Act
+        epoch = concurrency.acquire("branch")
+
+        # Assert
+        assert not concurrency.can_acquire("branch")
+        assert concurrency.can_acquire("other")
+        concurrency.acquire("")
+        concurrency.acquire("")
+        assert not concurrency.can_acquire("")
+        concurrency.release("branch", epoch, 1.0)
+        assert concurrency.can_acquire("branch")
+        assert concurrency.active == 2
+
+    @staticmethod
+    def test_adaptive_slow_start() -> None:
+        """
+        Test that the adaptive limit doubles per round until it reaches the workers.
+        """
+
+        # Arrange
+        concurrency = FleetConcurrency(6, adaptive=True)
+        limits = [concurrency.limit]
+
+        # Act
+        for _ in range(4):
+            epochs = [concurrency.acquire() for _ in range(concurrency.limit)]
+            for epoch in epochs:
+                concurrency.release("", epoch, 1.0)
+
+            limits.append(concurrency.limit)
+
+        # Assert
+        assert limits == [1, 2, 4, 6, 6]
+
+    @staticmethod
+    def test_adaptive_failure() -> None:
+        """
+        Test that a failed query halves the adaptive limit only once for the running queries.
+        """
+
+        # Arrange
+        concurrency = FleetConcurrency(8, adaptive=True)
+        concurrency.limit = 8
+        epochs = [concurrency.acquire() for _ in range(8)]
+
+        # Act
+        for epoch in epochs[:4]:
+            concurrency.release("", epoch, 1.0, failed=True)
+
+        # Assert
+        assert concurrency.limit == 4
+        for epoch in epochs[4:]:
+            concurrency.release("", epoch, 1.0)
+
+        assert concurrency.limit == 4
+        epochs = [concurrency.acquire() for _ in range(4)]
+        for epoch in epochs:
+            concurrency.release("", epoch, 1.0)
+
+        assert concurrency.limit == 5
+
+    @staticmethod
+    def test_adaptive_latency() -> None:
+        """
+        Test that a round with a much longer latency than the fastest round halves the limit.
+        """
+
+        # Arrange
+        concurrency = FleetConcurrency(8, adaptive=True)
+        concurrency.release("", concurrency.acquire(), 1.0)
+        assert concurrency.limit == 2
+
+        # Act
+        epochs = [concurrency.acquire() for _ in range(2)]
+        for epoch in epochs:
+            concurrency.release("", epoch, 3.0)
+
+        # Assert
+        assert concurrency.limit == 1
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    (
+        pytest.param(
+            APIConnectionError("Connection timeout (dummy)", "Connection timeout"),
+            True,
+            id="connection error",
+        ),
+        pytest.param(
+            APIConnectionError("Read timeout (dummy)", "Read timeout"), True, id="read timeout"
+        ),
+        pytest.param(
+            APIConnectionError("Name or service not known (dummy)", "Name or service not known"),
+            False,
+            id="dns error",
+        ),
+        pytest.param(
+            APIConnectionError("Unknown SSL error (dummy)", "Unknown SSL error"),
+            False,
+            id="ssl error",
+        ),
+        pytest.param(GeneralError("Connection timeout (dummy)"), False, id="general error"),
+        pytest.param(APIError(ResponseMock(status_code=503).raise_for_status.side_effect), True),
+        pytest.param(APIError(ResponseMock(status_code=404).raise_for_status.side_effect), False),
+        pytest.param(GeneralWarning("dummy"), False, id="warning"),
+    ),
+)
+def test_is_overload(error: Exception, expected: bool) -> None:
+    """
+    Test which errors mean that a device is overloaded.
+    """
+
+    # Act & Assert
+    assert is_overload(error) == expected
+
+
+@pytest.mark.parametrize(
+    "workers, fleet, expected",
+    (
+        pytest.param(None, {}, 10, id="default"),
+        pytest.param(None, {"transport": "asyncio"}, 100, id="default asyncio"),
+        pytest.param(None, {"workers": 50, "groups": {"branch": 5}}, 50, id="configured"),
+        pytest.param(20, {"workers": 50}, 20, id="option"),
+    ),
+)
+def test_fleet_concurrency(
+    workers: int | None, fleet: dict[str, Any], expected: int, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Test the concurrency limit from the configuration.
+    """
+
+    # Arrange
+    monkeypatch.setattr("fotoobo.tools.fleet.config.fleet", fleet)
+
+    # Act
+    concurrency = fleet_concurrency(workers)
+
+    # Assert
+    assert concurrency.workers == expected
+    assert concurrency.groups == fleet.get("groups", {})
+
+
+def test_fleet_map() -> None:
+    """
+    Test querying the devices on a thread pool with the limits of all devices and of a group.
+    """
+
+    # Arrange
+    probe = ConcurrencyProbe()
+
+    # Act
+    queries = list(fleet_map(probe.query, get_devices(), FleetConcurrency(4, {"branch": 1})))
+
+    # Assert
+    assert len(queries) == 12
+    assert ("device_1", "value of device_1", None) in queries
+    assert probe.max_active["*"] == 4
+    assert probe.max_active["branch"] == 1
+
+
+def test_fleet_map_errors() -> None:
+    """
+    Test that the errors of fotoobo are returned and the others are raised.
+    """
+
+    # Arrange
+    devices = {"device_1": Mock(group=""), "device_2": Mock(group="")}
+
+    def query(name: str, _: Any) -> str:
+        if name == "device_1":
+            raise GeneralError("dummy error")
+
+        return name
+
+    # Act
+    queries = dict(
+        (name, error) for name, _, error in fleet_map(query, devices, FleetConcurrency())
+    )
+
+    # Assert
+    assert isinstance(queries["device_1"], GeneralError)
+    assert queries["device_2"] is None
+    with pytest.raises(ValueError):
+        list(fleet_map(Mock(side_effect=ValueError), devices, FleetConcurrency()))
+
+
+def test_fleet_map_async() -> None:
+    """
+    Test querying the devices in the event loop with the limits of all devices and of a group.
+    """
+
+    # Arrange
+    probe = ConcurrencyProbe()
+
+    async def query_all() -> list[Any]:
+        concurrency = FleetConcurrency(4, {"branch": 1})
+        return [
+            query async for query in fleet_map_async(probe.query_async, get_devices(), concurrency)
+        ]
+
+    # Act
+    queries = asyncio.run(query_all())
+
+    # Assert
+    assert len(queries) == 12
+    assert ("device_1", "value of device_1", None) in queries
+    assert probe.max_active["*"] == 4
+    assert probe.max_active["branch"] == 1
+
+
+def slow_query(name: str, _: Any) -> str:
+    """
+    Query a device which takes 0.5s for "slow" and 0.01s for the others.
+    """
+    time.sleep(0.5 if name == "slow" else 0.01)
+    return name
+
+
+async def slow_query_async(name: str, _: Any) -> str:
+    """
+    Query a device which takes 0.5s for "slow" and 0.01s for the others in the event loop.
+    """
+    await asyncio.sleep(0.5 if name == "slow" else 0.01)
+    return name
+
+
+@pytest.mark.parametrize(
+    "side_effect, calls, expected",
+    (
+        pytest.param(
+            [
+                APIConnectionError("Connection timeout", "Connection timeout"),
+                APIConnectionError("Connection timeout", "Connection timeout"),
+                "1.0",
+            ],
+            3,
+            None,
+            id="retried",
+        ),
+        pytest.param(
+            [APIConnectionError("Connection timeout", "Connection timeout")] * 3,
+            3,
+            GeneralError,
+            id="attempts",
+        ),
+        pytest.param([GeneralWarning("dummy"), "1.0"], 1, GeneralWarning, id="not retryable"),
+        pytest.param(
+            [APIConnectionError("Read timeout", "Read timeout"), "1.0"],
+            1,
+            GeneralError,
+            id="maybe processed",
+        ),
+        pytest.param(
+            [APIConnectionError("Name or service not known", "Name or service not known"), "1.0"],
+            1,
+            GeneralError,
+            id="dns",
+        ),
+        pytest.param([GeneralError("Connection timeout"), "1.0"], 1, GeneralError, id="general"),
+    ),
+)
+def test_fleet_map_retry(side_effect: list[Any], calls: int, expected: type | None) -> None:
+    """
+    Test the retries of a device.
+    """
+
+    # Arrange
+    query = Mock(side_effect=side_effect)
+
+    # Act
+    queries = list(
+        fleet_map(
+            query, {"device": Mock(group="")}, FleetConcurrency(), retry=RetryPolicy(3, 0.001)
+        )
+    )
+
+    # Assert
+    assert query.call_count == calls
+    _, _, error = queries[0]
+    assert error is None if expected is None else isinstance(error, expected)
+
+
+@pytest.mark.parametrize(
+    "retries, fleet_retries, calls",
+    (
+        pytest.param(0, 0, 1, id="no retries"),
+        pytest.param(0, 3, 4, id="fleet retries"),
+        pytest.param(2, 0, 3, id="api retries"),
+        pytest.param(2, 3, 3, id="both"),
+    ),
+)
+def test_fleet_map_retry_api(
+    retries: int, fleet_retries: int, calls: int, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Test that the API requests which have been retried by Fortinet.api() are not retried again
+    by the fleet, so the retries of the two layers do not multiply.
+    """
+
+    # Arrange
+    request_mock = Mock(side_effect=requests.exceptions.ConnectTimeout())
+    monkeypatch.setattr("fotoobo.fortinet.fortinet.requests.Session.get", request_mock)
+    monkeypatch.setattr("fotoobo.fortinet.fortinet.sleep", Mock())
+    fortigate = FortiGate("dummy", "dummy_token")
+    fortigate.retries = retries
+
+    # Act
+    queries: list[Any] = list(
+        fleet_map(
+            lambda _, device: device.api("get", "url"),
+            {"dummy": fortigate},
+            FleetConcurrency(),
+            retry=RetryPolicy(fleet_retries + 1, 0.001),
+        )
+    )
+
+    # Assert
+    assert request_mock.call_count == calls
+    assert queries[0][2].message == "Connection timeout (dummy)"
+
+
+def test_fleet_map_timeout() -> None:
+    """
+    Test that a device is given up after its timeout without waiting for it.
+    """
+
+    # Arrange
+    devices = {"slow": Mock(group=""), "fast": Mock(group="")}
+    start = time.perf_counter()
+
+    # Act
+    queries: list[Any] = list(fleet_map(slow_query, devices, FleetConcurrency(), timeout=0.1))
+
+    # Assert
+    assert time.perf_counter() - start < 0.4
+    assert queries[0] == ("fast", "fast", None)
+    assert queries[1][0] == "slow"
+    assert queries[1][2].message == "Timeout after 0.1s (slow)"
+
+
+def test_fleet_map_deadline() -> None:
+    """
+    Test that the devices which are not done at the deadline are given up.
+    """
+
+    # Arrange
+    devices = {"slow": Mock(group=""), "fast": Mock(group="")}
+
+    # Act
+    queries: list[Any] = list(fleet_map(slow_query, devices, FleetConcurrency(1), deadline=0.1))
+
+    # Assert
+    assert [name for name, _, _ in queries] == ["slow", "fast"]
+    assert all(error.message.startswith("Deadline of 0.1s exceeded") for _, _, error in queries)
+
+
+@pytest.mark.parametrize(
+    "limits, expected",
+    (
+        pytest.param({"timeout": 0.1}, "Timeout after 0.1s (slow)", id="timeout"),
+        pytest.param({"deadline": 0.1}, "Deadline of 0.1s exceeded (slow)", id="deadline"),
+    ),
+)
+def test_fleet_map_async_limits(limits: dict[str, Any], expected: str) -> None:
+    """
+    Test that a device is cancelled after its timeout or the deadline in the event loop.
+    """
+
+    # Arrange
+    devices = {"slow": Mock(group=""), "fast": Mock(group="")}
+
+    async def query_all() -> list[Any]:
+        return [
+            query
+            async for query in fleet_map_async(
+                slow_query_async, devices, FleetConcurrency(), **limits
+            )
+        ]
+
+    # Act
+    queries = asyncio.run(query_all())
+
+    # Assert
+    assert queries[0] == ("fast", "fast", None)
+    assert queries[1][2].message == expected
+
+
+class TestFleetRunner:
+    """
+    Test the FleetRunner class.
+    """
+
+    @staticmethod
+    def test_run(monkeypatch: MonkeyPatch) -> None:
+        """
+        Test that the queries are pushed into the Result with the settings of the configuration.
+        """
+
+        # Arrange
+        monkeypatch.setattr("fotoobo.tools.fleet.config.fleet", {"timeout": 0.1})
+        devices = {"slow": Mock(group=""), "fast": Mock(group="")}
+        runner = FleetRunner[str]("dummy")
+
+        # Act
+        result = runner.run(slow_query, devices)
+
+        # Assert
+        assert result.all_results() == {"fast": "fast"}
+        assert result.get_messages("slow")[0]["message"] == "Timeout after 0.1s (slow)"
+
+    @staticmethod
+    def test_run_async() -> None:
+        """
+        Test that the queries are pushed into the Result with the handle function.
+        """
+
+        # Arrange
+        handle = Mock()
+        runner = FleetRunner[str]("dummy", handle=handle)
+
+        # Act
+        result = asyncio.run(runner.run_async(slow_query_async, {"fast": Mock(group="")}))
+
+        # Assert
+        handle.assert_called_once_with(result, "fast", "fast", None)
+
+    @staticmethod
+    def test_run_cancelled() -> None:
+        """
+        Test that the runner is cancelled with Ctrl-C.
+        """
+
+        # Arrange
+        runner = FleetRunner[str]("dummy")
+
+        # Act & Assert
+        with pytest.raises(KeyboardInterrupt):
+            runner.run(Mock(side_effect=KeyboardInterrupt), {"device": Mock(group="")})
+
+    @staticmethod
+    def test_run_retries(monkeypatch: MonkeyPatch) -> None:
+        """
+        Test that the retried API requests of all the devices are logged.
+        """
+
+        # Arrange
+        log_mock = Mock()
+        monkeypatch.setattr("fotoobo.tools.fleet.log.info", log_mock)
+        devices = {
+            "device_1": Mock(group="", retry_metrics=Counter({"HTTP/503": 2})),
+            "device_2": Mock(group="", retry_metrics=Counter({"HTTP/503": 1, "Read timeout": 1})),
+        }
+
+        # Act
+        FleetRunner[str]("dummy").run(lambda name, _: name, devices)
+
+        # Assert
+        log_mock.assert_called_once_with(
+            "Retried %s API requests (%s)", 4, "HTTP/503: 3, Read timeout: 1"
+        )